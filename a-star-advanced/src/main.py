@@ -8,6 +8,9 @@ import heapq
 import logging
 import logging.handlers
 import math
+import time
+from array import array
+from collections import OrderedDict
 from pathlib import Path
 from typing import Callable, Dict, List, Optional, Tuple
 
@@ -20,6 +23,23 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Direction order shared by jump point search and the JPS+ distance table
+DIRECTIONS = (
+    (1, 0),
+    (-1, 0),
+    (0, 1),
+    (0, -1),
+    (1, 1),
+    (1, -1),
+    (-1, 1),
+    (-1, -1),
+)
+DIRECTION_INDEX = {direction: index for index, direction in enumerate(DIRECTIONS)}
+
+# HPA* border key (kind, cx, cy) and transition (cell_a, cell_b, cost)
+BorderKey = Tuple[str, int, int]
+Transition = Tuple[int, int, float]
+
 
 class Heuristic:
     """Implements various heuristic functions for A* algorithm."""
@@ -178,6 +198,8 @@ class GridGraph:
         self.straight_cost = movement_cost.get("straight", 1.0)
         self.diagonal_cost = movement_cost.get("diagonal", math.sqrt(2))
 
+        self._jump_table: Optional[array] = None
+
     def is_valid(self, node: Tuple[int, int]) -> bool:
         """Check if node is valid and walkable.
 
@@ -228,10 +250,874 @@ class GridGraph:
 
         return neighbors
 
+    def supports_jump_points(self) -> bool:
+        """Check whether jump point search is valid on this graph.
+
+        Jump point pruning relies on 8-connected movement with uniform
+        costs where a diagonal step is no cheaper than a straight step and
+        strictly cheaper than two of them.
+
+        Returns:
+            True if JPS and JPS+ return optimal paths on this graph.
+        """
+        return (
+            self.allow_diagonal
+            and 0 < self.straight_cost <= self.diagonal_cost
+            and self.diagonal_cost < 2 * self.straight_cost
+        )
+
+    def padded_walkable(self) -> np.ndarray:
+        """Get walkability mask surrounded by a one-cell blocked border.
+
+        The border lets jump scans run without bounds checks. Cell (x, y)
+        maps to row y + 1, column x + 1 of the result.
+
+        Returns:
+            Boolean array of shape (height + 2, width + 2).
+        """
+        padded = np.zeros((self.height + 2, self.width + 2), dtype=bool)
+        padded[1:-1, 1:-1] = np.asarray(self.grid) == 0
+        return padded
+
+    def jump_table(self, rebuild: bool = False) -> array:
+        """Get precomputed JPS+ jump distances, building them on first use.
+
+        For every cell of the padded grid and every direction in
+        DIRECTIONS the table stores the number of steps to the next jump
+        point (positive) or the negated number of free steps before a wall
+        (zero or negative). Entries are laid out node-major: the distance
+        for padded index i and direction d is at ``i * 8 + d``.
+
+        The table is cached; call clear_jump_table() or pass
+        ``rebuild=True`` after changing the grid.
+
+        Args:
+            rebuild: Recompute the table even if one is cached.
+
+        Returns:
+            Flat array of jump distances.
+        """
+        if self._jump_table is None or rebuild:
+            start_time = time.perf_counter()
+            self._jump_table = self._build_jump_table()
+            logger.info(
+                f"Built JPS+ jump table for {self.width}x{self.height} grid "
+                f"in {time.perf_counter() - start_time:.3f}s"
+            )
+        return self._jump_table
+
+    def clear_jump_table(self) -> None:
+        """Drop the cached JPS+ jump table so the next use rebuilds it.
+
+        Call this after changing cells of the grid.
+        """
+        self._jump_table = None
+
+    def _build_jump_table(self) -> array:
+        """Compute JPS+ jump distances with row/column sweeps.
+
+        Each direction is swept against its travel order so that the
+        distance of a cell derives from the already computed distance of
+        the next cell along the direction; every sweep step is vectorized
+        across the orthogonal axis.
+
+        Returns:
+            Flat array of jump distances (see jump_table()).
+        """
+        free = self.padded_walkable()
+        rows, cols = free.shape
+        blocked = ~free
+        distances = np.zeros((len(DIRECTIONS), rows, cols), dtype=np.int32)
+
+        def shifted(mask: np.ndarray, dx: int, dy: int) -> np.ndarray:
+            # Value of mask at (x + dx, y + dy); outside the array is blocked
+            out = np.zeros_like(mask)
+            ys = slice(max(0, -dy), rows - max(0, dy))
+            xs = slice(max(0, -dx), cols - max(0, dx))
+            ys_src = slice(max(0, dy), rows - max(0, -dy))
+            xs_src = slice(max(0, dx), cols - max(0, -dx))
+            out[ys, xs] = mask[ys_src, xs_src]
+            return out
+
+        def extend(next_free, next_jump, next_distance):
+            return np.where(
+                ~next_free,
+                0,
+                np.where(
+                    next_jump,
+                    1,
+                    np.where(
+                        next_distance > 0, next_distance + 1, next_distance - 1
+                    ),
+                ),
+            )
+
+        # Straight directions: a cell is a jump point when a side cell is
+        # blocked and the cell diagonally ahead on that side is free
+        for index, (dx, dy) in enumerate(DIRECTIONS[:4]):
+            px, py = dy, dx
+            jump = free & (
+                (shifted(blocked, px, py) & shifted(free, px + dx, py + dy))
+                | (shifted(blocked, -px, -py) & shifted(free, dx - px, dy - py))
+            )
+            table = distances[index]
+            if dx:
+                order = range(cols - 2, 0, -1) if dx > 0 else range(1, cols - 1)
+                for x in order:
+                    table[:, x] = extend(
+                        free[:, x + dx], jump[:, x + dx], table[:, x + dx]
+                    )
+            else:
+                order = range(rows - 2, 0, -1) if dy > 0 else range(1, rows - 1)
+                for y in order:
+                    table[y] = extend(free[y + dy], jump[y + dy], table[y + dy])
+
+        # Diagonal directions: a cell is a jump point when it has a forced
+        # neighbour or a straight component direction reaches a jump point
+        for index, (dx, dy) in enumerate(DIRECTIONS[4:], start=4):
+            forced = free & (
+                (shifted(blocked, -dx, 0) & shifted(free, -dx, dy))
+                | (shifted(blocked, 0, -dy) & shifted(free, dx, -dy))
+            )
+            jump = (
+                forced
+                | (distances[DIRECTION_INDEX[(dx, 0)]] > 0)
+                | (distances[DIRECTION_INDEX[(0, dy)]] > 0)
+            )
+            table = distances[index]
+            xs = slice(1, cols - 1)
+            xs_next = slice(1 + dx, cols - 1 + dx)
+            order = range(rows - 2, 0, -1) if dy > 0 else range(1, rows - 1)
+            for y in order:
+                table[y, xs] = extend(
+                    free[y + dy, xs_next],
+                    jump[y + dy, xs_next],
+                    table[y + dy, xs_next],
+                )
+
+        table = array("i")
+        table.frombytes(
+            np.ascontiguousarray(
+                np.moveaxis(distances, 0, -1), dtype=np.int32
+            ).tobytes()
+        )
+        return table
+
+
+def generate_open_map(
+    width: int,
+    height: int,
+    obstacle_ratio: float = 0.2,
+    max_block_size: int = 8,
+    seed: Optional[int] = None,
+) -> np.ndarray:
+    """Generate an open map with scattered rectangular obstacles.
+
+    Args:
+        width: Grid width.
+        height: Grid height.
+        obstacle_ratio: Target fraction of blocked cells (default: 0.2).
+        max_block_size: Maximum side length of an obstacle block.
+        seed: Optional random seed.
+
+    Returns:
+        2D numpy array where 0 = walkable, 1 = obstacle.
+
+    Raises:
+        ValueError: If parameters are invalid.
+    """
+    if width < 1 or height < 1:
+        raise ValueError("Grid dimensions must be positive")
+    if not 0.0 <= obstacle_ratio < 1.0:
+        raise ValueError("obstacle_ratio must be in [0, 1)")
+    if max_block_size < 1:
+        raise ValueError("max_block_size must be at least 1")
+
+    rng = np.random.default_rng(seed)
+    grid = np.zeros((height, width), dtype=np.int8)
+    target = int(obstacle_ratio * width * height)
+
+    while int(grid.sum()) < target:
+        block_w = int(rng.integers(1, max_block_size + 1))
+        block_h = int(rng.integers(1, max_block_size + 1))
+        x = int(rng.integers(0, width))
+        y = int(rng.integers(0, height))
+        grid[y : y + block_h, x : x + block_w] = 1
+
+    return grid
+
+
+def generate_maze(
+    width: int, height: int, seed: Optional[int] = None
+) -> np.ndarray:
+    """Generate a perfect maze with one-cell corridors.
+
+    Corridors run through odd coordinates and are carved with an
+    iterative depth-first backtracker, so every corridor cell is
+    reachable from (1, 1).
+
+    Args:
+        width: Grid width (at least 3).
+        height: Grid height (at least 3).
+        seed: Optional random seed.
+
+    Returns:
+        2D numpy array where 0 = walkable, 1 = obstacle.
+
+    Raises:
+        ValueError: If dimensions are too small.
+    """
+    if width < 3 or height < 3:
+        raise ValueError("Maze dimensions must be at least 3x3")
+
+    rng = np.random.default_rng(seed)
+    grid = np.ones((height, width), dtype=np.int8)
+    grid[1, 1] = 0
+    stack = [(1, 1)]
+
+    while stack:
+        x, y = stack[-1]
+        candidates = [
+            (x + dx, y + dy, x + dx // 2, y + dy // 2)
+            for dx, dy in ((2, 0), (-2, 0), (0, 2), (0, -2))
+            if 0 < x + dx < width - 1
+            and 0 < y + dy < height - 1
+            and grid[y + dy, x + dx] == 1
+        ]
+        if not candidates:
+            stack.pop()
+            continue
+        nx, ny, wx, wy = candidates[int(rng.integers(len(candidates)))]
+        grid[wy, wx] = 0
+        grid[ny, nx] = 0
+        stack.append((nx, ny))
+
+    return grid
+
+
+class HierarchicalPathfinder:
+    """Hierarchical path-finding (HPA*) over a static GridGraph.
+
+    The grid is split into square clusters. Entrances on cluster borders
+    become abstract nodes, linked across borders by single steps and
+    inside clusters by precomputed shortest distances. A query connects
+    start and goal to the entrances of their clusters with local searches
+    and combines them with abstract routes between the two clusters, which
+    are kept in an LRU cache keyed on (start cluster, goal cluster).
+    Abstract hops are refined into cells with memoized local searches.
+
+    Paths are near-optimal: they are restricted to pass through entrance
+    cells. Every crossing between clusters, including diagonal squeezes,
+    is covered by an entrance, so a path is found whenever one exists.
+    """
+
+    # Entrances of this length or longer get a transition at each end
+    ENTRANCE_SPLIT = 6
+
+    def __init__(
+        self,
+        graph: GridGraph,
+        cluster_size: int = 16,
+        cache_size: int = 1024,
+    ) -> None:
+        """Initialize hierarchy and precompute the abstract graph.
+
+        Args:
+            graph: GridGraph instance to abstract.
+            cluster_size: Side length of square clusters (default: 16).
+            cache_size: Maximum number of cached cluster-pair routes;
+                0 disables caching (default: 1024).
+
+        Raises:
+            ValueError: If cluster_size or cache_size is invalid.
+        """
+        if cluster_size < 2:
+            raise ValueError("cluster_size must be at least 2")
+        if cache_size < 0:
+            raise ValueError("cache_size must be non-negative")
+
+        self.graph = graph
+        self.cluster_size = cluster_size
+        self.cache_size = cache_size
+        self.clusters_x = -(-graph.width // cluster_size)
+        self.clusters_y = -(-graph.height // cluster_size)
+
+        self._row_stride = graph.width + 2
+        self._walkable = bytearray(graph.padded_walkable().ravel().tobytes())
+        moves = DIRECTIONS if graph.allow_diagonal else DIRECTIONS[:4]
+        self._steps = [
+            (
+                dx,
+                dy,
+                dx + dy * self._row_stride,
+                graph.diagonal_cost if dx and dy else graph.straight_cost,
+            )
+            for dx, dy in moves
+        ]
+
+        self._edges: Dict[int, Dict[int, float]] = {}
+        self._border_pairs: Dict[BorderKey, List[Transition]] = {}
+        self._cluster_nodes: Dict[Tuple[int, int], List[int]] = {}
+        self._segments: Dict[Tuple[int, int], Dict[Tuple[int, int], List[int]]] = {}
+        self._routes: "OrderedDict[Tuple, Dict[str, any]]" = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+        start_time = time.perf_counter()
+        borders = set()
+        for cy in range(self.clusters_y):
+            for cx in range(self.clusters_x):
+                borders.update(self._borders_of((cx, cy)))
+        for key in borders:
+            self._set_border(key, self._compute_border(key))
+        for cy in range(self.clusters_y):
+            for cx in range(self.clusters_x):
+                self._build_cluster((cx, cy))
+        self.build_seconds = time.perf_counter() - start_time
+
+        logger.info(
+            f"Built HPA* hierarchy: {self.clusters_x}x{self.clusters_y} "
+            f"clusters, {len(self._edges)} abstract nodes, "
+            f"{self.build_seconds:.3f}s"
+        )
+
+    def _index(self, node: Tuple[int, int]) -> int:
+        """Convert (x, y) to a padded flat index."""
+        return (node[1] + 1) * self._row_stride + node[0] + 1
+
+    def _node(self, index: int) -> Tuple[int, int]:
+        """Convert a padded flat index to (x, y)."""
+        y, x = divmod(index, self._row_stride)
+        return (x - 1, y - 1)
+
+    def _cluster_of(self, index: int) -> Tuple[int, int]:
+        """Get the cluster containing a padded flat index."""
+        y, x = divmod(index, self._row_stride)
+        return ((x - 1) // self.cluster_size, (y - 1) // self.cluster_size)
+
+    def _borders_of(self, cluster: Tuple[int, int]) -> List[BorderKey]:
+        """List border keys touching a cluster.
+
+        Keys are ("v", cx, cy) between (cx, cy) and (cx+1, cy), ("h", cx, cy)
+        between (cx, cy) and (cx, cy+1), ("d", cx, cy) at the corner between
+        (cx, cy) and (cx+1, cy+1), and ("a", cx, cy) at the corner between
+        (cx+1, cy) and (cx, cy+1). Corner keys are listed for all four
+        corners of the cluster.
+
+        Args:
+            cluster: Cluster coordinates (cx, cy).
+
+        Returns:
+            Border keys whose both clusters exist.
+        """
+        cx, cy = cluster
+        candidates = [
+            ("v", cx, cy),
+            ("v", cx - 1, cy),
+            ("h", cx, cy),
+            ("h", cx, cy - 1),
+        ]
+        if self.graph.allow_diagonal:
+            # Corner checks read cells of all four clusters around a corner
+            candidates += [
+                (kind, bx, by)
+                for kind in ("d", "a")
+                for bx in (cx - 1, cx)
+                for by in (cy - 1, cy)
+            ]
+        return [
+            key
+            for key in candidates
+            if 0 <= key[1]
+            and 0 <= key[2]
+            and key[1] + (key[0] != "h") < self.clusters_x
+            and key[2] + (key[0] != "v") < self.clusters_y
+        ]
+
+    def _border_clusters(
+        self, key: BorderKey
+    ) -> Tuple[Tuple[int, int], Tuple[int, int]]:
+        """Get the two clusters separated by a border key."""
+        kind, cx, cy = key
+        if kind == "v":
+            return (cx, cy), (cx + 1, cy)
+        if kind == "h":
+            return (cx, cy), (cx, cy + 1)
+        if kind == "d":
+            return (cx, cy), (cx + 1, cy + 1)
+        return (cx + 1, cy), (cx, cy + 1)
+
+    def _compute_border(self, key: BorderKey) -> List[Transition]:
+        """Find transitions across a border.
+
+        Straight crossings are grouped into maximal entrances; short ones
+        get one transition in the middle, long ones one at each end.
+        Diagonal crossings that no straight crossing next to them can
+        replace get their own transition.
+
+        Args:
+            key: Border key (see _borders_of()).
+
+        Returns:
+            List of (cell_a, cell_b, cost) transitions.
+        """
+        kind, cx, cy = key
+        walk = self._walkable
+        stride = self._row_stride
+        size = self.cluster_size
+        straight = self.graph.straight_cost
+        diagonal = self.graph.diagonal_cost
+
+        if kind in ("d", "a"):
+            x1 = (cx + 1) * size - 1
+            y1 = (cy + 1) * size - 1
+            top_left = self._index((x1, y1))
+            if kind == "d":
+                a, b = top_left, top_left + stride + 1
+                sides = (top_left + 1, top_left + stride)
+            else:
+                a, b = top_left + 1, top_left + stride
+                sides = (top_left, top_left + stride + 1)
+            if walk[a] and walk[b] and not walk[sides[0]] and not walk[sides[1]]:
+                return [(a, b, diagonal)]
+            return []
+
+        if kind == "v":
+            x = (cx + 1) * size - 1
+            start = cy * size
+            stop = min(start + size, self.graph.height)
+            side_a = [self._index((x, y)) for y in range(start, stop)]
+            offset = 1
+        else:
+            y = (cy + 1) * size - 1
+            start = cx * size
+            stop = min(start + size, self.graph.width)
+            side_a = [self._index((x, y)) for x in range(start, stop)]
+            offset = stride
+        side_b = [cell + offset for cell in side_a]
+        crossing = [bool(walk[a] and walk[b]) for a, b in zip(side_a, side_b)]
+
+        transitions = []
+        i = 0
+        while i < len(crossing):
+            if not crossing[i]:
+                i += 1
+                continue
+            j = i
+            while j + 1 < len(crossing) and crossing[j + 1]:
+                j += 1
+            if j - i + 1 < self.ENTRANCE_SPLIT:
+                picks = [(i + j) // 2]
+            else:
+                picks = [i, j]
+            for k in picks:
+                transitions.append((side_a[k], side_b[k], straight))
+            i = j + 1
+
+        if self.graph.allow_diagonal:
+            for i in range(len(crossing) - 1):
+                if crossing[i] or crossing[i + 1]:
+                    continue
+                if walk[side_a[i]] and walk[side_b[i + 1]]:
+                    transitions.append((side_a[i], side_b[i + 1], diagonal))
+                if walk[side_a[i + 1]] and walk[side_b[i]]:
+                    transitions.append((side_a[i + 1], side_b[i], diagonal))
+
+        return transitions
+
+    def _set_border(self, key: BorderKey, transitions: List[Transition]) -> None:
+        """Replace the inter-cluster edges of a border."""
+        edges = self._edges
+        for a, b, _ in self._border_pairs.pop(key, []):
+            edges[a].pop(b, None)
+            edges[b].pop(a, None)
+        for a, b, cost in transitions:
+            edges.setdefault(a, {})[b] = cost
+            edges.setdefault(b, {})[a] = cost
+        if transitions:
+            self._border_pairs[key] = transitions
+
+    def _local_search(
+        self,
+        source: int,
+        cluster: Tuple[int, int],
+        targets: Optional[set] = None,
+    ) -> Tuple[Dict[int, float], Dict[int, int], int]:
+        """Run Dijkstra's algorithm restricted to one cluster.
+
+        Args:
+            source: Padded flat index to search from.
+            cluster: Cluster the search may not leave.
+            targets: Optional indices; the search stops once all are settled.
+
+        Returns:
+            Tuple of (distances, parents, settled node count). Distances of
+            targets are final; other entries may be tentative when the
+            search stopped early.
+        """
+        cx, cy = cluster
+        size = self.cluster_size
+        x_lo = cx * size + 1
+        x_hi = min((cx + 1) * size, self.graph.width) + 1
+        y_lo = cy * size + 1
+        y_hi = min((cy + 1) * size, self.graph.height) + 1
+        walk = self._walkable
+        stride = self._row_stride
+        steps = self._steps
+
+        dist = {source: 0.0}
+        parent: Dict[int, int] = {}
+        heap = [(0.0, source)]
+        remaining = set(targets) if targets else None
+        settled = 0
+
+        while heap:
+            d, u = heapq.heappop(heap)
+            if d > dist[u]:
+                continue
+            settled += 1
+            if remaining is not None:
+                remaining.discard(u)
+                if not remaining:
+                    break
+            uy, ux = divmod(u, stride)
+            for dx, dy, step, cost in steps:
+                if x_lo <= ux + dx < x_hi and y_lo <= uy + dy < y_hi:
+                    v = u + step
+                    if walk[v]:
+                        nd = d + cost
+                        if nd < dist.get(v, math.inf):
+                            dist[v] = nd
+                            parent[v] = u
+                            heapq.heappush(heap, (nd, v))
+
+        return dist, parent, settled
+
+    @staticmethod
+    def _trace(parent: Dict[int, int], source: int, target: int) -> List[int]:
+        """Follow parents from target back to source; returns source..target."""
+        path = [target]
+        while target != source:
+            target = parent[target]
+            path.append(target)
+        path.reverse()
+        return path
+
+    def _build_cluster(self, cluster: Tuple[int, int]) -> None:
+        """Recompute the abstract nodes and intra-cluster edges of a cluster."""
+        edges = self._edges
+        old_nodes = self._cluster_nodes.pop(cluster, [])
+        for u in old_nodes:
+            for v in [v for v in edges.get(u, {}) if self._cluster_of(v) == cluster]:
+                del edges[u][v]
+                del edges[v][u]
+        self._segments.pop(cluster, None)
+
+        nodes = set()
+        for key in self._borders_of(cluster):
+            for a, b, _ in self._border_pairs.get(key, []):
+                for node in (a, b):
+                    if self._cluster_of(node) == cluster:
+                        nodes.add(node)
+        nodes = sorted(nodes)
+
+        for i, u in enumerate(nodes):
+            targets = set(nodes[i + 1 :])
+            if not targets:
+                break
+            dist, _, _ = self._local_search(u, cluster, targets)
+            for v in targets:
+                if v in dist:
+                    edges[u][v] = dist[v]
+                    edges[v][u] = dist[v]
+
+        # Border edges of this cluster only end at its old or new entrances
+        for node in set(old_nodes).union(nodes):
+            if node in edges and not edges[node]:
+                del edges[node]
+        if nodes:
+            self._cluster_nodes[cluster] = nodes
+
+    def _cluster_routes(
+        self, source_cluster: Tuple[int, int], target_cluster: Tuple[int, int]
+    ) -> Tuple[Dict[str, any], bool]:
+        """Get abstract routes between the entrances of two clusters.
+
+        Runs A* on the abstract graph from every entrance of the source
+        cluster until all entrances of the target cluster are settled. The
+        heuristic is the octile distance to the target cluster rectangle,
+        which is zero at every target, so settled distances are exact.
+        Results are cached with LRU eviction.
+
+        Args:
+            source_cluster: Cluster of the start node.
+            target_cluster: Cluster of the goal node.
+
+        Returns:
+            Tuple of (routes, cache_hit). Routes hold per-entrance distances
+            and parents, the clusters touched by the searches and the
+            number of settled abstract nodes.
+        """
+        key = (source_cluster, target_cluster)
+        routes = self._routes.get(key)
+        if routes is not None:
+            self._routes.move_to_end(key)
+            self.cache_hits += 1
+            return routes, True
+        self.cache_misses += 1
+
+        targets = self._cluster_nodes.get(target_cluster, [])
+        edges = self._edges
+        routes = {"dist": {}, "parent": {}, "clusters": set(), "settled": 0}
+
+        size = self.cluster_size
+        stride = self._row_stride
+        x_lo = target_cluster[0] * size + 1
+        x_hi = min(x_lo + size, self.graph.width + 1) - 1
+        y_lo = target_cluster[1] * size + 1
+        y_hi = min(y_lo + size, self.graph.height + 1) - 1
+        straight = self.graph.straight_cost
+        diagonal = min(self.graph.diagonal_cost, 2 * straight)
+        if not self.graph.allow_diagonal:
+            diagonal = 2 * straight
+
+        def to_target(index: int) -> float:
+            y, x = divmod(index, stride)
+            dx = x_lo - x if x < x_lo else (x - x_hi if x > x_hi else 0)
+            dy = y_lo - y if y < y_lo else (y - y_hi if y > y_hi else 0)
+            if dx < dy:
+                dx, dy = dy, dx
+            return straight * (dx - dy) + diagonal * dy
+
+        bounds: Dict[int, float] = {}
+
+        for source in self._cluster_nodes.get(source_cluster, []):
+            dist = {source: 0.0}
+            parent: Dict[int, int] = {}
+            heap = [(0.0, 0.0, source)]
+            remaining = set(targets)
+            while heap and remaining:
+                _, d, u = heapq.heappop(heap)
+                if d > dist[u]:
+                    continue
+                routes["settled"] += 1
+                remaining.discard(u)
+                for v, cost in edges[u].items():
+                    nd = d + cost
+                    if nd < dist.get(v, math.inf):
+                        dist[v] = nd
+                        parent[v] = u
+                        h = bounds.get(v)
+                        if h is None:
+                            h = bounds[v] = to_target(v)
+                        heapq.heappush(heap, (nd + h, nd, v))
+            routes["dist"][source] = {
+                t: dist[t] for t in targets if t in dist and t not in remaining
+            }
+            routes["parent"][source] = parent
+            routes["clusters"].update(self._cluster_of(node) for node in dist)
+
+        if self.cache_size:
+            self._routes[key] = routes
+            if len(self._routes) > self.cache_size:
+                self._routes.popitem(last=False)
+
+        return routes, False
+
+    def _segment(self, u: int, v: int) -> List[int]:
+        """Refine an intra-cluster abstract edge into cells (memoized)."""
+        cluster = self._cluster_of(u)
+        memo = self._segments.setdefault(cluster, {})
+        path = memo.get((u, v))
+        if path is None:
+            _, parent, _ = self._local_search(u, cluster, {v})
+            path = self._trace(parent, u, v)
+            memo[(u, v)] = path
+            memo[(v, u)] = path[::-1]
+        return path
+
+    def search(
+        self, start: Tuple[int, int], goal: Tuple[int, int]
+    ) -> Dict[str, any]:
+        """Find a path using the hierarchy.
+
+        Args:
+            start: Start node coordinates (x, y).
+            goal: Goal node coordinates (x, y).
+
+        Returns:
+            Dictionary containing path, cost, nodes_explored, path_length
+            and found (as AStar.search), plus cache_hit.
+
+        Raises:
+            ValueError: If start or goal nodes are invalid.
+        """
+        if not self.graph.is_valid(start):
+            raise ValueError(f"Start node {start} is not valid")
+        if not self.graph.is_valid(goal):
+            raise ValueError(f"Goal node {goal} is not valid")
+
+        source = self._index((int(start[0]), int(start[1])))
+        target = self._index((int(goal[0]), int(goal[1])))
+        source_cluster = self._cluster_of(source)
+        target_cluster = self._cluster_of(target)
+        source_nodes = self._cluster_nodes.get(source_cluster, [])
+        target_nodes = self._cluster_nodes.get(target_cluster, [])
+
+        source_targets = set(source_nodes)
+        if source_cluster == target_cluster:
+            source_targets.add(target)
+        start_dist, start_parent, explored = self._local_search(
+            source, source_cluster, source_targets
+        )
+        goal_dist, goal_parent, goal_explored = self._local_search(
+            target, target_cluster, set(target_nodes)
+        )
+        explored += goal_explored
+
+        best_cost = start_dist.get(target, math.inf)
+        best_pair = None
+        cache_hit = False
+        if source_nodes and target_nodes:
+            routes, cache_hit = self._cluster_routes(source_cluster, target_cluster)
+            if not cache_hit:
+                explored += routes["settled"]
+            for a in source_nodes:
+                if a not in start_dist:
+                    continue
+                to_entrance = start_dist[a]
+                for b, between in routes["dist"][a].items():
+                    if b in goal_dist:
+                        total = to_entrance + between + goal_dist[b]
+                        if total < best_cost:
+                            best_cost = total
+                            best_pair = (a, b)
+
+        if best_cost == math.inf:
+            return {
+                "path": [],
+                "cost": float("inf"),
+                "nodes_explored": explored,
+                "path_length": 0,
+                "found": False,
+                "cache_hit": cache_hit,
+            }
+
+        if best_pair is None:
+            cells = self._trace(start_parent, source, target)
+        else:
+            a, b = best_pair
+            cells = self._trace(start_parent, source, a)
+            hops = self._trace(routes["parent"][a], a, b)
+            for u, v in zip(hops, hops[1:]):
+                if self._cluster_of(u) == self._cluster_of(v):
+                    cells.extend(self._segment(u, v)[1:])
+                else:
+                    cells.append(v)
+            cells.extend(self._trace(goal_parent, target, b)[-2::-1])
+
+        path = [self._node(cell) for cell in cells]
+        return {
+            "path": path,
+            "cost": best_cost,
+            "nodes_explored": explored,
+            "path_length": len(path),
+            "found": True,
+            "cache_hit": cache_hit,
+        }
+
+    def invalidate_cells(self, cells: List[Tuple[int, int]]) -> None:
+        """Update the hierarchy after grid cells changed.
+
+        Only the clusters containing the cells, and neighbours whose shared
+        entrances changed, are rebuilt. Cached routes whose searches touched
+        a rebuilt cluster are evicted, and the graph's cached JPS+ jump
+        table is cleared.
+
+        Args:
+            cells: Changed node coordinates (x, y); values are read from
+                graph.grid.
+        """
+        changed = set()
+        for x, y in cells:
+            x, y = int(x), int(y)
+            if not (0 <= x < self.graph.width and 0 <= y < self.graph.height):
+                raise ValueError(f"Cell {(x, y)} is out of bounds")
+            self._walkable[self._index((x, y))] = int(self.graph.grid[y, x] == 0)
+            changed.add((x // self.cluster_size, y // self.cluster_size))
+        self.graph.clear_jump_table()
+
+        rebuilt = set(changed)
+        for key in {key for cluster in changed for key in self._borders_of(cluster)}:
+            transitions = self._compute_border(key)
+            if transitions != self._border_pairs.get(key, []):
+                self._set_border(key, transitions)
+                rebuilt.update(self._border_clusters(key))
+
+        for cluster in rebuilt:
+            self._build_cluster(cluster)
+
+        stale = [
+            key
+            for key, routes in self._routes.items()
+            if not routes["clusters"].isdisjoint(rebuilt)
+            or key[0] in rebuilt
+            or key[1] in rebuilt
+        ]
+        for key in stale:
+            del self._routes[key]
+
+        logger.info(
+            f"Invalidated {len(cells)} cells: rebuilt {len(rebuilt)} clusters, "
+            f"evicted {len(stale)} cached routes"
+        )
+
+    def set_cells(self, cells: List[Tuple[int, int]], value: int) -> None:
+        """Set grid cells and update the hierarchy.
+
+        Args:
+            cells: Node coordinates (x, y) to change.
+            value: New cell value (0 = walkable, 1 = obstacle).
+        """
+        for x, y in cells:
+            self.graph.grid[y, x] = value
+        self.invalidate_cells(cells)
+
+    def cache_info(self) -> Dict[str, int]:
+        """Get route cache statistics.
+
+        Returns:
+            Dictionary with hits, misses, size and max_size.
+        """
+        return {
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "size": len(self._routes),
+            "max_size": self.cache_size,
+        }
+
+    def stats(self) -> Dict[str, any]:
+        """Get hierarchy size statistics.
+
+        Returns:
+            Dictionary with cluster counts, abstract node and edge counts
+            and build time.
+        """
+        return {
+            "clusters": self.clusters_x * self.clusters_y,
+            "cluster_size": self.cluster_size,
+            "abstract_nodes": len(self._edges),
+            "abstract_edges": sum(len(n) for n in self._edges.values()) // 2,
+            "build_seconds": self.build_seconds,
+        }
+
 
 class AStar:
     """Implements A* pathfinding algorithm."""
 
+    MODES = ("astar", "jps", "jps_plus")
+    JPS_HEURISTICS = ("octile", "diagonal")
+
     def __init__(self, config_path: str = "config.yaml") -> None:
         """Initialize A* algorithm with configuration.
 
@@ -301,9 +1187,41 @@ class AStar:
         self.allow_diagonal = astar_config.get("allow_diagonal", True)
         self.bidirectional = astar_config.get("bidirectional", False)
         self.movement_cost = astar_config.get("movement_cost", {})
+        self.mode = astar_config.get("mode", "astar")
+
+        hpa_config = self.config.get("hpa", {})
+        self.cluster_size = hpa_config.get("cluster_size", 16)
+        self.cache_size = hpa_config.get("cache_size", 1024)
 
         self.heuristic = Heuristic.get_heuristic(self.heuristic_name)
 
+        if self.mode not in self.MODES:
+            raise ValueError(
+                f"Unknown mode: {self.mode}. "
+                f"Choose from {', '.join(self.MODES)}"
+            )
+        if self.mode != "astar":
+            self._validate_jump_mode(self.mode)
+
+    def _validate_jump_mode(self, mode: str) -> None:
+        """Check that configuration allows a jump point search mode.
+
+        Args:
+            mode: Search mode ('jps' or 'jps_plus').
+
+        Raises:
+            ValueError: If the heuristic or bidirectional setting is not
+                supported by jump point search.
+        """
+        if self.heuristic_name.lower() not in self.JPS_HEURISTICS:
+            raise ValueError(
+                f"Mode {mode} requires heuristic "
+                f"{' or '.join(self.JPS_HEURISTICS)}, "
+                f"got {self.heuristic_name}"
+            )
+        if self.bidirectional:
+            raise ValueError(f"Mode {mode} does not support bidirectional search")
+
     def _reconstruct_path(
         self,
         came_from: Dict[Tuple[int, int], Tuple[int, int]],
@@ -325,11 +1243,34 @@ class AStar:
         path.reverse()
         return path
 
+    def build_hierarchy(
+        self,
+        graph: GridGraph,
+        cluster_size: Optional[int] = None,
+        cache_size: Optional[int] = None,
+    ) -> HierarchicalPathfinder:
+        """Precompute an HPA* hierarchy for repeated queries on a graph.
+
+        Args:
+            graph: GridGraph instance.
+            cluster_size: Cluster side length (default: from config).
+            cache_size: Route cache capacity (default: from config).
+
+        Returns:
+            HierarchicalPathfinder for use with search().
+        """
+        return HierarchicalPathfinder(
+            graph,
+            cluster_size=cluster_size or self.cluster_size,
+            cache_size=self.cache_size if cache_size is None else cache_size,
+        )
+
     def search(
         self,
         graph: GridGraph,
         start: Tuple[int, int],
         goal: Tuple[int, int],
+        hierarchy: Optional[HierarchicalPathfinder] = None,
     ) -> Dict[str, any]:
         """Run A* search algorithm.
 
@@ -337,6 +1278,9 @@ class AStar:
             graph: GridGraph instance.
             start: Start node coordinates (x, y).
             goal: Goal node coordinates (x, y).
+            hierarchy: Optional hierarchy from build_hierarchy(); when given,
+                the query is answered on the abstract graph (near-optimal)
+                instead of by the configured mode.
 
         Returns:
             Dictionary containing:
@@ -347,13 +1291,43 @@ class AStar:
                 - found: Whether path was found
 
         Raises:
-            ValueError: If start or goal nodes are invalid.
+            ValueError: If start or goal nodes are invalid, or the hierarchy
+                was built for a different graph.
         """
         if not graph.is_valid(start):
             raise ValueError(f"Start node {start} is not valid")
         if not graph.is_valid(goal):
             raise ValueError(f"Goal node {goal} is not valid")
 
+        if hierarchy is not None:
+            if hierarchy.graph is not graph:
+                raise ValueError("Hierarchy was built for a different graph")
+            return hierarchy.search(start, goal)
+
+        return self._dispatch(graph, start, goal, self.mode)
+
+    def _dispatch(
+        self,
+        graph: GridGraph,
+        start: Tuple[int, int],
+        goal: Tuple[int, int],
+        mode: str,
+    ) -> Dict[str, any]:
+        """Run the search variant selected by mode.
+
+        Args:
+            graph: GridGraph instance.
+            start: Start node coordinates (x, y).
+            goal: Goal node coordinates (x, y).
+            mode: One of MODES.
+
+        Returns:
+            Dictionary with path information.
+        """
+        if mode == "jps":
+            return self._jump_point_search(graph, start, goal, use_table=False)
+        if mode == "jps_plus":
+            return self._jump_point_search(graph, start, goal, use_table=True)
         if self.bidirectional:
             return self._bidirectional_search(graph, start, goal)
         else:
@@ -428,6 +1402,448 @@ class AStar:
             "found": False,
         }
 
+    @staticmethod
+    def _successor_directions(
+        walkable: bytearray, index: int, dx: int, dy: int, row_stride: int
+    ) -> List[Tuple[int, int]]:
+        """Get natural and forced directions after arriving at a node.
+
+        Args:
+            walkable: Padded walkability mask (see GridGraph.padded_walkable).
+            index: Padded flat index of the node.
+            dx: Arrival direction x component (0 for the start node).
+            dy: Arrival direction y component (0 for the start node).
+            row_stride: Width of the padded grid.
+
+        Returns:
+            Directions worth jumping in from this node.
+        """
+        if not dx and not dy:
+            return list(DIRECTIONS)
+
+        if dx and dy:
+            directions = [(dx, 0), (0, dy), (dx, dy)]
+            sx = dx
+            sy = dy * row_stride
+            if not walkable[index - sx] and walkable[index - sx + sy]:
+                directions.append((-dx, dy))
+            if not walkable[index - sy] and walkable[index + sx - sy]:
+                directions.append((dx, -dy))
+            return directions
+
+        directions = [(dx, dy)]
+        step = dx + dy * row_stride
+        side = row_stride if dx else 1
+        for sign in (1, -1):
+            if not walkable[index + sign * side] and walkable[
+                index + sign * side + step
+            ]:
+                directions.append(
+                    (dx, sign) if dx else (sign, dy)
+                )
+        return directions
+
+    @staticmethod
+    def _jump_straight(
+        walkable: bytearray, index: int, step: int, side: int, goal: int
+    ) -> int:
+        """Scan in a straight line for the next jump point.
+
+        Args:
+            walkable: Padded walkability mask.
+            index: Padded flat index to scan from.
+            step: Index offset of one move in the scan direction.
+            side: Index offset to a side cell (perpendicular to step).
+            goal: Padded flat index of the goal.
+
+        Returns:
+            Index of the jump point, or -1 if the scan hits a wall.
+        """
+        while True:
+            index += step
+            if not walkable[index]:
+                return -1
+            if index == goal:
+                return index
+            if (not walkable[index + side] and walkable[index + side + step]) or (
+                not walkable[index - side] and walkable[index - side + step]
+            ):
+                return index
+
+    def _jump(
+        self,
+        walkable: bytearray,
+        index: int,
+        dx: int,
+        dy: int,
+        goal: int,
+        row_stride: int,
+    ) -> int:
+        """Jump from a node in a direction until a jump point is found.
+
+        Args:
+            walkable: Padded walkability mask.
+            index: Padded flat index to jump from.
+            dx: Direction x component.
+            dy: Direction y component.
+            goal: Padded flat index of the goal.
+            row_stride: Width of the padded grid.
+
+        Returns:
+            Index of the jump point, or -1 if the jump hits a wall.
+        """
+        sx = dx
+        sy = dy * row_stride
+        if not dx or not dy:
+            return self._jump_straight(
+                walkable, index, sx + sy, row_stride if dx else 1, goal
+            )
+
+        step = sx + sy
+        while True:
+            index += step
+            if not walkable[index]:
+                return -1
+            if index == goal:
+                return index
+            if (not walkable[index - sx] and walkable[index - sx + sy]) or (
+                not walkable[index - sy] and walkable[index + sx - sy]
+            ):
+                return index
+            if (
+                self._jump_straight(walkable, index, sx, row_stride, goal) >= 0
+                or self._jump_straight(walkable, index, sy, 1, goal) >= 0
+            ):
+                return index
+
+    @staticmethod
+    def _table_jump(
+        table: array,
+        index: int,
+        dx: int,
+        dy: int,
+        position: Tuple[int, int],
+        goal: Tuple[int, int],
+        row_stride: int,
+    ) -> int:
+        """Look up a JPS+ jump with goal-bounded targets.
+
+        A precomputed jump may pass the goal, so the goal is checked
+        against the reach of the move: a straight move whose free run
+        covers the goal returns the goal itself, and a diagonal move that
+        crosses the goal's row or column stops at that crossing so a
+        straight move can reach the goal from there.
+
+        Args:
+            table: JPS+ jump distance table.
+            index: Padded flat index to jump from.
+            dx: Direction x component.
+            dy: Direction y component.
+            position: Node coordinates (x, y).
+            goal: Goal coordinates (x, y).
+            row_stride: Width of the padded grid.
+
+        Returns:
+            Index of the successor, or -1 if there is none.
+        """
+        distance = table[index * 8 + DIRECTION_INDEX[(dx, dy)]]
+        reach = distance if distance > 0 else -distance
+        step = dx + dy * row_stride
+        off_x = goal[0] - position[0]
+        off_y = goal[1] - position[1]
+
+        if dx and dy:
+            if off_x * dx > 0 and off_y * dy > 0:
+                steps = min(abs(off_x), abs(off_y))
+                if steps <= reach:
+                    return index + steps * step
+        elif dx:
+            if off_y == 0 and 0 < off_x * dx <= reach:
+                return index + off_x * dx * step
+        elif off_x == 0 and 0 < off_y * dy <= reach:
+            return index + off_y * dy * step
+
+        return index + distance * step if distance > 0 else -1
+
+    def _jump_point_search(
+        self,
+        graph: GridGraph,
+        start: Tuple[int, int],
+        goal: Tuple[int, int],
+        use_table: bool = False,
+    ) -> Dict[str, any]:
+        """Run Jump Point Search (JPS) or JPS+.
+
+        Only jump points are pushed to the open set; straight and diagonal
+        runs between them are expanded back into single steps when the
+        path is reconstructed. JPS scans the grid during the search, while
+        JPS+ reads precomputed jump distances from GridGraph.jump_table().
+
+        Args:
+            graph: GridGraph instance.
+            start: Start node coordinates (x, y).
+            goal: Goal node coordinates (x, y).
+            use_table: Whether to use precomputed JPS+ distances.
+
+        Returns:
+            Dictionary with path information.
+
+        Raises:
+            ValueError: If the graph does not allow jump point search.
+        """
+        mode = "jps_plus" if use_table else "jps"
+        self._validate_jump_mode(mode)
+        if not graph.supports_jump_points():
+            raise ValueError(
+                f"Mode {mode} requires diagonal movement with "
+                f"straight <= diagonal < 2 * straight costs"
+            )
+
+        start = (int(start[0]), int(start[1]))
+        goal = (int(goal[0]), int(goal[1]))
+        row_stride = graph.width + 2
+        walkable = bytearray(graph.padded_walkable().ravel().tobytes())
+        table = graph.jump_table() if use_table else None
+        straight_cost = graph.straight_cost
+        diagonal_cost = graph.diagonal_cost
+
+        start_index = (start[1] + 1) * row_stride + start[0] + 1
+        goal_index = (goal[1] + 1) * row_stride + goal[0] + 1
+
+        came_from: Dict[int, int] = {}
+        g_score: Dict[int, float] = {start_index: 0.0}
+        open_set = [(self.heuristic(start, goal), 0.0, start_index)]
+
+        nodes_explored = 0
+
+        logger.info(f"Starting {mode} search from {start} to {goal}")
+
+        while open_set:
+            _, current_g, current = heapq.heappop(open_set)
+            if current_g > g_score[current]:
+                continue
+
+            if current == goal_index:
+                path = self._expand_jump_path(came_from, current, row_stride)
+                logger.info(
+                    f"Path found: length={len(path)}, "
+                    f"cost={current_g:.2f}, "
+                    f"nodes_explored={nodes_explored}"
+                )
+                return {
+                    "path": path,
+                    "cost": current_g,
+                    "nodes_explored": nodes_explored,
+                    "path_length": len(path),
+                    "found": True,
+                }
+
+            nodes_explored += 1
+
+            y, x = divmod(current, row_stride)
+            position = (x - 1, y - 1)
+            parent = came_from.get(current)
+            if parent is None:
+                dx = dy = 0
+            else:
+                parent_y, parent_x = divmod(parent, row_stride)
+                dx = (x > parent_x) - (x < parent_x)
+                dy = (y > parent_y) - (y < parent_y)
+
+            for ndx, ndy in self._successor_directions(
+                walkable, current, dx, dy, row_stride
+            ):
+                if use_table:
+                    successor = self._table_jump(
+                        table, current, ndx, ndy, position, goal, row_stride
+                    )
+                else:
+                    successor = self._jump(
+                        walkable, current, ndx, ndy, goal_index, row_stride
+                    )
+                if successor < 0:
+                    continue
+
+                succ_y, succ_x = divmod(successor, row_stride)
+                steps = max(abs(succ_x - x), abs(succ_y - y))
+                tentative_g = current_g + steps * (
+                    diagonal_cost if ndx and ndy else straight_cost
+                )
+
+                if successor not in g_score or tentative_g < g_score[successor]:
+                    came_from[successor] = current
+                    g_score[successor] = tentative_g
+                    f = tentative_g + self.heuristic(
+                        (succ_x - 1, succ_y - 1), goal
+                    )
+                    heapq.heappush(open_set, (f, tentative_g, successor))
+
+        logger.warning(f"No path found from {start} to {goal}")
+        return {
+            "path": [],
+            "cost": float("inf"),
+            "nodes_explored": nodes_explored,
+            "path_length": 0,
+            "found": False,
+        }
+
+    @staticmethod
+    def _expand_jump_path(
+        came_from: Dict[int, int], current: int, row_stride: int
+    ) -> List[Tuple[int, int]]:
+        """Reconstruct a cell-by-cell path from jump point predecessors.
+
+        Args:
+            came_from: Mapping of padded indices to their predecessors.
+            current: Padded flat index of the final node.
+            row_stride: Width of the padded grid.
+
+        Returns:
+            List of nodes (x, y) from start to current.
+        """
+        jump_points = [current]
+        while current in came_from:
+            current = came_from[current]
+            jump_points.append(current)
+        jump_points.reverse()
+
+        y, x = divmod(jump_points[0], row_stride)
+        path = [(x - 1, y - 1)]
+        for index in jump_points[1:]:
+            target_y, target_x = divmod(index, row_stride)
+            dx = (target_x > x) - (target_x < x)
+            dy = (target_y > y) - (target_y < y)
+            while (x, y) != (target_x, target_y):
+                x += dx
+                y += dy
+                path.append((x - 1, y - 1))
+        return path
+
+    def compare_modes(
+        self,
+        graph: GridGraph,
+        queries: List[Tuple[Tuple[int, int], Tuple[int, int]]],
+        modes: Optional[List[str]] = None,
+        hierarchy: Optional[HierarchicalPathfinder] = None,
+    ) -> Dict[str, any]:
+        """Benchmark search modes on the same queries.
+
+        The JPS+ table is built before timing and reported separately as
+        preprocess time. When a hierarchy is given, an "hpa" entry is added
+        with its build time as preprocess time, timings for a cold and a
+        repeated (cached) pass over the queries, and the worst cost ratio
+        against the first exact mode.
+
+        Args:
+            graph: GridGraph instance.
+            queries: List of (start, goal) pairs.
+            modes: Modes to compare (default: all MODES).
+            hierarchy: Optional hierarchy from build_hierarchy().
+
+        Returns:
+            Dictionary containing per-mode timing data and whether all
+            successful exact modes agree on path costs.
+        """
+        modes = list(modes) if modes is not None else list(self.MODES)
+        for mode in modes:
+            if mode not in self.MODES:
+                raise ValueError(
+                    f"Unknown mode: {mode}. Choose from {', '.join(self.MODES)}"
+                )
+
+        logger.info(
+            f"Comparing modes {modes} on {len(queries)} queries, "
+            f"grid {graph.width}x{graph.height}"
+        )
+
+        results = {
+            "grid_size": (graph.width, graph.height),
+            "num_queries": len(queries),
+            "modes": {},
+        }
+        costs: Dict[str, List[float]] = {}
+
+        for mode in modes:
+            try:
+                preprocess_time = 0.0
+                if mode == "jps_plus":
+                    start_time = time.perf_counter()
+                    graph.jump_table(rebuild=True)
+                    preprocess_time = time.perf_counter() - start_time
+
+                mode_costs = []
+                nodes_explored = 0
+                start_time = time.perf_counter()
+                for start, goal in queries:
+                    result = self._dispatch(graph, start, goal, mode)
+                    mode_costs.append(result["cost"])
+                    nodes_explored += result["nodes_explored"]
+                elapsed = time.perf_counter() - start_time
+
+                costs[mode] = mode_costs
+                results["modes"][mode] = {
+                    "time_seconds": elapsed,
+                    "time_milliseconds": elapsed * 1000,
+                    "preprocess_seconds": preprocess_time,
+                    "nodes_explored": nodes_explored,
+                    "paths_found": sum(
+                        1 for cost in mode_costs if cost != float("inf")
+                    ),
+                    "success": True,
+                }
+            except Exception as e:
+                logger.error(f"Mode {mode} failed: {e}")
+                results["modes"][mode] = {"success": False, "error": str(e)}
+
+        reference = next(iter(costs.values()), [])
+
+        if hierarchy is not None:
+            try:
+                passes = []
+                hpa_costs = []
+                nodes_explored = 0
+                for _ in range(2):
+                    hpa_costs = []
+                    start_time = time.perf_counter()
+                    for start, goal in queries:
+                        result = self.search(graph, start, goal, hierarchy)
+                        hpa_costs.append(result["cost"])
+                        nodes_explored += result["nodes_explored"]
+                    passes.append(time.perf_counter() - start_time)
+
+                ratios = [
+                    a / b
+                    for a, b in zip(hpa_costs, reference)
+                    if b not in (0.0, float("inf"))
+                ]
+                results["modes"]["hpa"] = {
+                    "time_seconds": passes[0],
+                    "time_milliseconds": passes[0] * 1000,
+                    "warm_time_seconds": passes[1],
+                    "warm_time_milliseconds": passes[1] * 1000,
+                    "preprocess_seconds": hierarchy.build_seconds,
+                    "nodes_explored": nodes_explored,
+                    "paths_found": sum(
+                        1 for cost in hpa_costs if cost != float("inf")
+                    ),
+                    "max_suboptimality": max(ratios) if ratios else 1.0,
+                    "cache": hierarchy.cache_info(),
+                    "success": True,
+                }
+            except Exception as e:
+                logger.error(f"HPA* failed: {e}")
+                results["modes"]["hpa"] = {"success": False, "error": str(e)}
+
+        results["costs_match"] = all(
+            all(
+                math.isclose(a, b, rel_tol=1e-9, abs_tol=1e-9) or a == b
+                for a, b in zip(reference, mode_costs)
+            )
+            for mode_costs in costs.values()
+        )
+
+        return results
+
     def _bidirectional_search(
         self,
         graph: GridGraph,
@@ -588,11 +2004,95 @@ def main() -> None:
         action="store_true",
         help="Run test pathfinding problem",
     )
+    parser.add_argument(
+        "--heuristic",
+        choices=[
+            "manhattan",
+            "euclidean",
+            "chebyshev",
+            "diagonal",
+            "octile",
+            "zero",
+        ],
+        help="Override the heuristic from the configuration file",
+    )
+    parser.add_argument(
+        "--benchmark",
+        choices=["open", "maze"],
+        help="Benchmark search modes on a generated open map or maze",
+    )
+    parser.add_argument(
+        "--size",
+        type=int,
+        default=256,
+        help="Width and height of the benchmark grid (default: 256)",
+    )
+    parser.add_argument(
+        "--queries",
+        type=int,
+        default=20,
+        help="Number of random benchmark queries (default: 20)",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="Random seed for benchmark grid and queries (default: 0)",
+    )
+    parser.add_argument(
+        "--hpa",
+        action="store_true",
+        help="Include HPA* (hierarchy from the hpa config section) in benchmark",
+    )
 
     args = parser.parse_args()
 
     astar = AStar(config_path=args.config)
 
+    if args.heuristic:
+        astar.heuristic_name = args.heuristic
+        astar.heuristic = Heuristic.get_heuristic(args.heuristic)
+
+    if args.benchmark:
+        if args.benchmark == "open":
+            grid = generate_open_map(args.size, args.size, seed=args.seed)
+        else:
+            grid = generate_maze(args.size, args.size, seed=args.seed)
+
+        graph = GridGraph(
+            grid, allow_diagonal=True, movement_cost=astar.movement_cost
+        )
+        rng = np.random.default_rng(args.seed)
+        free_cells = np.argwhere(grid == 0)
+        queries = []
+        for _ in range(args.queries):
+            (sy, sx), (gy, gx) = free_cells[
+                rng.integers(len(free_cells), size=2)
+            ]
+            queries.append(((int(sx), int(sy)), (int(gx), int(gy))))
+
+        hierarchy = astar.build_hierarchy(graph) if args.hpa else None
+        comparison = astar.compare_modes(graph, queries, hierarchy=hierarchy)
+
+        print(f"\nSearch Mode Benchmark ({args.benchmark}):")
+        print(f"Grid: {args.size}x{args.size}, queries: {len(queries)}")
+        print("-" * 60)
+        for mode, data in comparison["modes"].items():
+            if data.get("success", False):
+                print(
+                    f"{mode:10s}: {data['time_milliseconds']:10.2f} ms  "
+                    f"explored={data['nodes_explored']:8d}  "
+                    f"preprocess={data['preprocess_seconds'] * 1000:.2f} ms"
+                )
+                if mode == "hpa":
+                    print(
+                        f"{'':10s}  cached: {data['warm_time_milliseconds']:.2f} ms  "
+                        f"max cost ratio: {data['max_suboptimality']:.4f}"
+                    )
+            else:
+                print(f"{mode:10s}: Failed - {data.get('error', 'Unknown')}")
+        print(f"Costs match: {comparison['costs_match']}")
+
     if args.test:
         logger.info("Running test pathfinding on sample grid")
 
@@ -8,7 +8,15 @@ import numpy as np
 import pytest
 import yaml
 
-from src.main import AStar, GridGraph, Heuristic
+from src.main import (
+    DIRECTION_INDEX,
+    AStar,
+    GridGraph,
+    Heuristic,
+    HierarchicalPathfinder,
+    generate_maze,
+    generate_open_map,
+)
 
 
 class TestHeuristic:
@@ -429,5 +437,372 @@ class TestAStar:
         assert result["path_length"] == len(result["path"])
 
 
+class TestJumpPointSearch:
+    """Test JPS and JPS+ search modes."""
+
+    def create_astar(self, mode: str, **overrides) -> AStar:
+        """Create AStar instance with given mode from a temporary config."""
+        a_star = {"heuristic": "octile", "allow_diagonal": True, "mode": mode}
+        a_star.update(overrides)
+        config = {
+            "a_star": a_star,
+            "logging": {"level": "INFO", "file": "logs/test.log"},
+        }
+        temp_file = tempfile.NamedTemporaryFile(
+            mode="w", suffix=".yaml", delete=False
+        )
+        yaml.dump(config, temp_file)
+        temp_file.close()
+        try:
+            return AStar(config_path=temp_file.name)
+        finally:
+            Path(temp_file.name).unlink()
+
+    @pytest.fixture(params=["jps", "jps_plus"])
+    def jump_astar(self, request):
+        """JPS and JPS+ instances."""
+        return self.create_astar(request.param)
+
+    def test_invalid_mode(self):
+        """Test unknown mode raises error."""
+        with pytest.raises(ValueError, match="Unknown mode"):
+            self.create_astar("fast")
+
+    def test_requires_octile_heuristic(self):
+        """Test JPS modes reject heuristics other than octile/diagonal."""
+        with pytest.raises(ValueError, match="requires heuristic"):
+            self.create_astar("jps", heuristic="manhattan")
+
+    def test_rejects_bidirectional(self):
+        """Test JPS modes reject bidirectional search."""
+        with pytest.raises(ValueError, match="bidirectional"):
+            self.create_astar("jps_plus", bidirectional=True)
+
+    def test_requires_diagonal_movement(self, jump_astar):
+        """Test JPS modes reject 4-connected graphs."""
+        graph = GridGraph(np.zeros((5, 5)), allow_diagonal=False)
+        with pytest.raises(ValueError, match="diagonal movement"):
+            jump_astar.search(graph, (0, 0), (4, 4))
+
+    def test_open_grid_path(self, jump_astar):
+        """Test JPS finds the diagonal path on an empty grid."""
+        graph = GridGraph(np.zeros((10, 10)), allow_diagonal=True)
+        result = jump_astar.search(graph, (0, 0), (9, 9))
+
+        assert result["found"] is True
+        assert math.isclose(result["cost"], 9 * math.sqrt(2))
+        assert result["path"] == [(i, i) for i in range(10)]
+        assert result["nodes_explored"] < 10
+
+    def test_same_start_and_goal(self, jump_astar):
+        """Test start equal to goal."""
+        graph = GridGraph(np.zeros((3, 3)), allow_diagonal=True)
+        result = jump_astar.search(graph, (1, 1), (1, 1))
+
+        assert result["found"] is True
+        assert result["path"] == [(1, 1)]
+        assert result["cost"] == 0.0
+
+    def test_no_path_exists(self, jump_astar):
+        """Test JPS reports unreachable goals."""
+        grid = np.zeros((5, 5))
+        grid[:, 2] = 1
+        graph = GridGraph(grid, allow_diagonal=True)
+        result = jump_astar.search(graph, (0, 0), (4, 4))
+
+        assert result["found"] is False
+        assert result["path"] == []
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_matches_astar_costs(self, jump_astar, seed):
+        """Test JPS costs and paths match plain A* on random maps."""
+        rng = np.random.default_rng(seed)
+        grid = (rng.random((15, 20)) < 0.3).astype(int)
+        graph = GridGraph(grid, allow_diagonal=True)
+        plain = self.create_astar("astar")
+        free = [(x, y) for y in range(15) for x in range(20) if grid[y, x] == 0]
+
+        for _ in range(10):
+            start = free[rng.integers(len(free))]
+            goal = free[rng.integers(len(free))]
+            expected = plain.search(graph, start, goal)
+            result = jump_astar.search(graph, start, goal)
+
+            assert result["found"] == expected["found"]
+            if result["found"]:
+                assert math.isclose(result["cost"], expected["cost"])
+                path = result["path"]
+                assert path[0] == start
+                assert path[-1] == goal
+                assert result["path_length"] == len(path)
+                for (x1, y1), (x2, y2) in zip(path, path[1:]):
+                    assert max(abs(x1 - x2), abs(y1 - y2)) == 1
+                    assert graph.is_valid((x2, y2))
+
+    def test_rejects_diagonal_twice_straight(self, jump_astar):
+        """Test JPS modes reject diagonal cost equal to two straight steps."""
+        grid = np.zeros((10, 12))
+        grid[4, 1:11] = 1
+        grid[2:8, 5] = 1
+        graph = GridGraph(
+            grid,
+            allow_diagonal=True,
+            movement_cost={"straight": 1.0, "diagonal": 2.0},
+        )
+        assert graph.supports_jump_points() is False
+        with pytest.raises(ValueError, match="diagonal < 2 \\* straight"):
+            jump_astar.search(graph, (8, 0), (2, 8))
+
+        plain = self.create_astar("astar")
+        assert plain.search(graph, (8, 0), (2, 8))["found"] is True
+
+    @pytest.mark.parametrize("diagonal", [1.0, 1.414, 1.5, 1.999])
+    def test_matches_astar_costs_for_accepted_costs(self, jump_astar, diagonal):
+        """Test JPS costs match plain A* for every accepted cost setting."""
+        rng = np.random.default_rng(int(diagonal * 1000))
+        plain = self.create_astar("astar")
+        movement_cost = {"straight": 1.0, "diagonal": diagonal}
+
+        for _ in range(5):
+            grid = (rng.random((10, 12)) < 0.3).astype(int)
+            graph = GridGraph(grid, allow_diagonal=True, movement_cost=movement_cost)
+            assert graph.supports_jump_points() is True
+            free = [(x, y) for y in range(10) for x in range(12) if grid[y, x] == 0]
+
+            for _ in range(10):
+                start = free[rng.integers(len(free))]
+                goal = free[rng.integers(len(free))]
+                expected = plain.search(graph, start, goal)
+                result = jump_astar.search(graph, start, goal)
+
+                assert result["found"] == expected["found"]
+                if result["found"]:
+                    assert math.isclose(result["cost"], expected["cost"])
+
+    def test_jump_table_layout(self):
+        """Test JPS+ jump distances on a grid with one obstacle."""
+        grid = np.zeros((3, 5))
+        grid[0, 2] = 1
+        graph = GridGraph(grid, allow_diagonal=True)
+        table = graph.jump_table()
+        row_stride = graph.width + 2
+
+        def distance(x, y, direction):
+            index = (y + 1) * row_stride + x + 1
+            return table[index * 8 + DIRECTION_INDEX[direction]]
+
+        # (2, 1) has a forced neighbour at (3, 0) when moving east
+        assert distance(0, 1, (1, 0)) == 2
+        # Row 2 has no jump points; distance is the negated free run
+        assert distance(0, 2, (1, 0)) == -4
+        assert distance(1, 0, (1, 0)) == 0
+
+    def test_set_cells_resets_jump_table(self):
+        """Test JPS+ sees walls added through the hierarchy."""
+        astar = self.create_astar("jps_plus")
+        graph = GridGraph(np.zeros((12, 12)), allow_diagonal=True)
+        assert astar.search(graph, (0, 0), (11, 0))["found"] is True
+
+        hierarchy = HierarchicalPathfinder(graph, cluster_size=4)
+        hierarchy.set_cells([(6, y) for y in range(12)], 1)
+
+        assert astar.search(graph, (0, 0), (11, 0))["found"] is False
+
+    def test_clear_jump_table(self):
+        """Test JPS+ sees grid edits after clearing the cached table."""
+        astar = self.create_astar("jps_plus")
+        graph = GridGraph(np.zeros((8, 8)), allow_diagonal=True)
+        assert astar.search(graph, (0, 0), (7, 0))["found"] is True
+
+        graph.grid[:, 4] = 1
+        graph.clear_jump_table()
+
+        assert astar.search(graph, (0, 0), (7, 0))["found"] is False
+
+    def test_compare_modes(self):
+        """Test benchmarking all modes on open map and maze."""
+        astar = self.create_astar("astar")
+        for grid in (
+            generate_open_map(40, 40, obstacle_ratio=0.15, seed=1),
+            generate_maze(31, 31, seed=1),
+        ):
+            graph = GridGraph(grid, allow_diagonal=True)
+            free = [(int(x), int(y)) for y, x in np.argwhere(grid == 0)]
+            queries = [(free[i], free[-i - 1]) for i in range(3)]
+            comparison = astar.compare_modes(graph, queries)
+
+            assert comparison["num_queries"] == 3
+            assert comparison["costs_match"] is True
+            for mode in AStar.MODES:
+                assert comparison["modes"][mode]["success"] is True
+            assert comparison["modes"]["jps_plus"]["preprocess_seconds"] >= 0
+
+    def test_compare_modes_invalid(self):
+        """Test compare_modes rejects unknown modes."""
+        astar = self.create_astar("astar")
+        graph = GridGraph(np.zeros((3, 3)), allow_diagonal=True)
+        with pytest.raises(ValueError, match="Unknown mode"):
+            astar.compare_modes(graph, [((0, 0), (2, 2))], modes=["bogus"])
+
+    def test_generate_maze(self):
+        """Test maze generation connects corridor cells."""
+        grid = generate_maze(11, 9, seed=0)
+        assert grid.shape == (9, 11)
+        assert grid[1, 1] == 0
+        assert grid[0].all()
+        assert (grid[1::2, 1::2] == 0).all()
+
+
+class TestHierarchicalPathfinder:
+    """Test HPA* hierarchy, route cache and invalidation."""
+
+    @staticmethod
+    def assert_valid_path(graph, result, start, goal):
+        """Check path endpoints, adjacency, walkability and cost."""
+        path = result["path"]
+        assert path[0] == start
+        assert path[-1] == goal
+        assert result["path_length"] == len(path)
+        cost = 0.0
+        for (x1, y1), (x2, y2) in zip(path, path[1:]):
+            assert max(abs(x1 - x2), abs(y1 - y2)) == 1
+            assert graph.is_valid((x2, y2))
+            diagonal = x1 != x2 and y1 != y2
+            cost += graph.diagonal_cost if diagonal else graph.straight_cost
+        assert math.isclose(cost, result["cost"])
+
+    def test_invalid_parameters(self):
+        """Test cluster and cache size validation."""
+        graph = GridGraph(np.zeros((4, 4)))
+        with pytest.raises(ValueError, match="cluster_size"):
+            HierarchicalPathfinder(graph, cluster_size=1)
+        with pytest.raises(ValueError, match="cache_size"):
+            HierarchicalPathfinder(graph, cache_size=-1)
+
+    def test_search_through_hierarchy(self):
+        """Test AStar.search answers queries on the abstract graph."""
+        grid = generate_open_map(48, 40, obstacle_ratio=0.2, seed=2)
+        graph = GridGraph(grid, allow_diagonal=True)
+        astar = AStar()
+        hierarchy = astar.build_hierarchy(graph, cluster_size=8)
+        free = [(int(x), int(y)) for y, x in np.argwhere(grid == 0)]
+        rng = np.random.default_rng(0)
+
+        for _ in range(20):
+            start = free[rng.integers(len(free))]
+            goal = free[rng.integers(len(free))]
+            expected = astar._dispatch(graph, start, goal, "astar")
+            result = astar.search(graph, start, goal, hierarchy=hierarchy)
+
+            assert result["found"] == expected["found"]
+            if result["found"]:
+                self.assert_valid_path(graph, result, start, goal)
+
+    @pytest.mark.parametrize("allow_diagonal", [True, False])
+    def test_complete_and_near_optimal(self, allow_diagonal):
+        """Test hierarchy finds a path whenever one exists."""
+        rng = np.random.default_rng(7)
+        grid = (rng.random((30, 30)) < 0.35).astype(int)
+        graph = GridGraph(grid, allow_diagonal=allow_diagonal)
+        hierarchy = HierarchicalPathfinder(graph, cluster_size=5)
+        config = {
+            "a_star": {"heuristic": "zero", "allow_diagonal": allow_diagonal},
+            "logging": {"level": "INFO", "file": "logs/test.log"},
+        }
+        temp_file = tempfile.NamedTemporaryFile(
+            mode="w", suffix=".yaml", delete=False
+        )
+        yaml.dump(config, temp_file)
+        temp_file.close()
+        try:
+            dijkstra = AStar(config_path=temp_file.name)
+        finally:
+            Path(temp_file.name).unlink()
+        free = [(int(x), int(y)) for y, x in np.argwhere(grid == 0)]
+
+        for _ in range(30):
+            start = free[rng.integers(len(free))]
+            goal = free[rng.integers(len(free))]
+            expected = dijkstra.search(graph, start, goal)
+            result = hierarchy.search(start, goal)
+
+            assert result["found"] == expected["found"]
+            if result["found"]:
+                self.assert_valid_path(graph, result, start, goal)
+                assert result["cost"] >= expected["cost"] - 1e-9
+
+    def test_route_cache(self):
+        """Test LRU cache keyed on cluster pairs."""
+        graph = GridGraph(np.zeros((16, 16)), allow_diagonal=True)
+        hierarchy = HierarchicalPathfinder(graph, cluster_size=4, cache_size=2)
+
+        assert hierarchy.search((0, 0), (15, 15))["cache_hit"] is False
+        assert hierarchy.search((1, 2), (13, 14))["cache_hit"] is True
+        hierarchy.search((0, 0), (0, 15))
+        hierarchy.search((0, 0), (15, 0))
+
+        info = hierarchy.cache_info()
+        assert info["hits"] == 1
+        assert info["misses"] == 3
+        assert info["size"] == 2
+        assert hierarchy.search((0, 0), (15, 15))["cache_hit"] is False
+
+    def test_set_cells_matches_rebuild(self):
+        """Test incremental invalidation equals a fresh build."""
+        rng = np.random.default_rng(3)
+        grid = (rng.random((20, 20)) < 0.25).astype(int)
+        graph = GridGraph(grid, allow_diagonal=True)
+        hierarchy = HierarchicalPathfinder(graph, cluster_size=5)
+
+        for value in (1, 0, 1):
+            cells = [
+                (int(x), int(y)) for x, y in rng.integers(20, size=(5, 2))
+            ]
+            hierarchy.set_cells(cells, value)
+            fresh = HierarchicalPathfinder(graph, cluster_size=5)
+            assert hierarchy._edges == fresh._edges
+            assert hierarchy._cluster_nodes == fresh._cluster_nodes
+
+    def test_set_cells_blocks_cached_route(self):
+        """Test cached routes are evicted when a wall closes them."""
+        graph = GridGraph(np.zeros((12, 12)), allow_diagonal=True)
+        hierarchy = HierarchicalPathfinder(graph, cluster_size=4)
+        assert hierarchy.search((0, 0), (11, 0))["found"] is True
+
+        hierarchy.set_cells([(6, y) for y in range(12)], 1)
+        result = hierarchy.search((0, 0), (11, 0))
+
+        assert result["found"] is False
+        assert result["cache_hit"] is False
+
+    def test_hierarchy_for_other_graph(self):
+        """Test search rejects hierarchy built for another graph."""
+        astar = AStar()
+        graph = GridGraph(np.zeros((8, 8)))
+        other = GridGraph(np.zeros((8, 8)))
+        hierarchy = astar.build_hierarchy(other, cluster_size=4)
+        with pytest.raises(ValueError, match="different graph"):
+            astar.search(graph, (0, 0), (7, 7), hierarchy=hierarchy)
+
+    def test_compare_modes_with_hierarchy(self):
+        """Test benchmark reports HPA* timings and cost ratio."""
+        astar = AStar()
+        grid = generate_maze(21, 21, seed=4)
+        graph = GridGraph(grid, allow_diagonal=True)
+        hierarchy = astar.build_hierarchy(graph, cluster_size=5)
+        free = [(int(x), int(y)) for y, x in np.argwhere(grid == 0)]
+        queries = [(free[i], free[-i - 1]) for i in range(4)]
+
+        comparison = astar.compare_modes(
+            graph, queries, modes=["astar"], hierarchy=hierarchy
+        )
+        hpa = comparison["modes"]["hpa"]
+
+        assert hpa["success"] is True
+        assert hpa["paths_found"] == 4
+        assert hpa["max_suboptimality"] >= 1.0 - 1e-9
+        assert hpa["cache"]["hits"] >= 4
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
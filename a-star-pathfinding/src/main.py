@@ -5,12 +5,15 @@ with support for multiple heuristics (Manhattan, Euclidean, Chebyshev) and
 visualization capabilities.
 """
 
+import heapq
 import logging
 import logging.handlers
 import math
+import random
 import time
+from array import array
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Set, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
 import yaml
 from dotenv import load_dotenv
@@ -206,56 +209,25 @@ class AStarPathfinder:
         dy = abs(y1 - y2)
         return (dx + dy) + (math.sqrt(2) - 2) * min(dx, dy)
 
-    def _get_neighbors(
-        self,
-        node: Node,
-        grid: List[List[int]],
-        allow_diagonal: bool = False,
+    def _reconstruct_index_path(
+        self, parent: array, goal_index: int, cols: int
     ) -> List[Tuple[int, int]]:
-        """Get valid neighbors of a node.
-
-        Args:
-            node: Current node.
-            grid: Grid representation (0=free, 1=obstacle).
-            allow_diagonal: Whether to allow diagonal movement.
-
-        Returns:
-            List of (x, y) tuples for valid neighbors.
-        """
-        neighbors: List[Tuple[int, int]] = []
-        rows = len(grid)
-        cols = len(grid[0]) if grid else 0
-
-        directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]
-        if allow_diagonal:
-            directions.extend([(1, 1), (1, -1), (-1, 1), (-1, -1)])
-
-        for dx, dy in directions:
-            nx, ny = node.x + dx, node.y + dy
-            if (
-                0 <= nx < rows
-                and 0 <= ny < cols
-                and grid[nx][ny] == 0
-            ):
-                neighbors.append((nx, ny))
-
-        return neighbors
-
-    def _reconstruct_path(self, node: Node) -> List[Tuple[int, int]]:
-        """Reconstruct path from goal to start.
+        """Reconstruct path from flat parent buffer.
 
         Args:
-            node: Goal node.
+            parent: Parent index per cell (-1 for none).
+            goal_index: Flat index of the goal cell.
+            cols: Number of grid columns.
 
         Returns:
             List of (x, y) tuples representing the path.
         """
         path: List[Tuple[int, int]] = []
-        current: Optional[Node] = node
+        current = goal_index
 
-        while current is not None:
-            path.append((current.x, current.y))
-            current = current.parent
+        while current >= 0:
+            path.append(divmod(current, cols))
+            current = parent[current]
 
         path.reverse()
         return path
@@ -324,29 +296,48 @@ class AStarPathfinder:
             f"diagonal={allow_diagonal}"
         )
 
-        # Initialize
-        start_node = Node(start[0], start[1], g=0.0, h=h_func(*start, *goal))
-        goal_node = Node(goal[0], goal[1])
+        # Search state lives in flat buffers indexed by x * cols + y;
+        # the open set is a heap of (f, h, index) with lazy deletion
+        inf = float("inf")
+        size = rows * cols
+        g_score = array("d", [inf]) * size
+        parent = array("i", [-1]) * size
+        closed = bytearray(size)
+
+        goal_x, goal_y = goal
+        start_index = start[0] * cols + start[1]
+        goal_index = goal_x * cols + goal_y
+        g_score[start_index] = 0.0
+        start_h = h_func(start[0], start[1], goal_x, goal_y)
+        open_heap: List[Tuple[float, float, int]] = [(start_h, start_h, start_index)]
+        heappush = heapq.heappush
+        heappop = heapq.heappop
+
+        directions = [(0, 1, 1.0), (1, 0, 1.0), (0, -1, 1.0), (-1, 0, 1.0)]
+        if allow_diagonal:
+            diagonal_cost = math.sqrt(2)
+            directions.extend(
+                [
+                    (1, 1, diagonal_cost),
+                    (1, -1, diagonal_cost),
+                    (-1, 1, diagonal_cost),
+                    (-1, -1, diagonal_cost),
+                ]
+            )
 
-        open_set: List[Node] = [start_node]
-        closed_set: Set[Node] = set()
         nodes_explored = 0
 
         # A* algorithm
-        while open_set:
-            # Get node with minimum f-value
-            open_set.sort()
-            current = open_set.pop(0)
+        while open_heap:
+            _, _, current = heappop(open_heap)
+            if closed[current]:
+                continue
+            closed[current] = 1
             nodes_explored += 1
 
-            logger.debug(
-                f"  Exploring {current}, f={current.f:.2f}, "
-                f"g={current.g:.2f}, h={current.h:.2f}"
-            )
-
             # Check if goal reached
-            if current == goal_node:
-                path = self._reconstruct_path(current)
+            if current == goal_index:
+                path = self._reconstruct_index_path(parent, current, cols)
                 logger.info(
                     f"Path found: length={len(path)}, "
                     f"nodes_explored={nodes_explored}"
@@ -354,49 +345,28 @@ class AStarPathfinder:
                 return path, {
                     "nodes_explored": nodes_explored,
                     "path_length": len(path),
-                    "path_cost": current.g,
+                    "path_cost": g_score[current],
                     "success": True,
                 }
 
-            closed_set.add(current)
-
             # Explore neighbors
-            neighbors = self._get_neighbors(current, grid, allow_diagonal)
-            for nx, ny in neighbors:
-                neighbor = Node(nx, ny)
-
-                if neighbor in closed_set:
+            current_x, current_y = divmod(current, cols)
+            current_g = g_score[current]
+            for dx, dy, move_cost in directions:
+                nx = current_x + dx
+                ny = current_y + dy
+                if not (0 <= nx < rows and 0 <= ny < cols) or grid[nx][ny] != 0:
+                    continue
+                neighbor = nx * cols + ny
+                if closed[neighbor]:
                     continue
 
-                # Calculate movement cost
-                if allow_diagonal and abs(nx - current.x) == 1 and abs(ny - current.y) == 1:
-                    move_cost = math.sqrt(2)
-                else:
-                    move_cost = 1.0
-
-                tentative_g = current.g + move_cost
-
-                # Check if this path to neighbor is better
-                neighbor_in_open = False
-                for node in open_set:
-                    if node == neighbor:
-                        neighbor_in_open = True
-                        if tentative_g < node.g:
-                            node.g = tentative_g
-                            node.f = node.g + node.h
-                            node.parent = current
-                        break
-
-                if not neighbor_in_open:
-                    neighbor.g = tentative_g
-                    neighbor.h = h_func(nx, ny, goal[0], goal[1])
-                    neighbor.f = neighbor.g + neighbor.h
-                    neighbor.parent = current
-                    open_set.append(neighbor)
-                    logger.debug(
-                        f"    Added neighbor ({nx}, {ny}), "
-                        f"f={neighbor.f:.2f}"
-                    )
+                tentative_g = current_g + move_cost
+                if tentative_g < g_score[neighbor]:
+                    g_score[neighbor] = tentative_g
+                    parent[neighbor] = current
+                    h = h_func(nx, ny, goal_x, goal_y)
+                    heappush(open_heap, (tentative_g + h, h, neighbor))
 
         logger.warning("No path found")
         return None, {
@@ -499,6 +469,11 @@ class AStarPathfinder:
                     )
                 heuristic_time = time.perf_counter() - start_time
 
+                expansions_per_second = (
+                    stats["nodes_explored"] * iterations / heuristic_time
+                    if heuristic_time > 0
+                    else 0.0
+                )
                 results[heuristic] = {
                     "path_found": path is not None,
                     "path_length": len(path) if path else 0,
@@ -506,6 +481,7 @@ class AStarPathfinder:
                     "path_cost": stats["path_cost"],
                     "time_seconds": heuristic_time / iterations,
                     "time_milliseconds": (heuristic_time / iterations) * 1000,
+                    "expansions_per_second": expansions_per_second,
                     "success": True,
                 }
             except Exception as e:
@@ -514,6 +490,105 @@ class AStarPathfinder:
 
         return results
 
+    def generate_warehouse_grid(
+        self,
+        rows: int,
+        cols: int,
+        rack_depth: int = 2,
+        cross_aisle_spacing: int = 20,
+        clutter: float = 0.0,
+        seed: Optional[int] = None,
+    ) -> List[List[int]]:
+        """Generate a warehouse-style grid of racks and aisles.
+
+        Racks of ``rack_depth`` columns are separated by single-column
+        aisles, and full cross aisles run every ``cross_aisle_spacing``
+        rows as well as along the first and last row. Optional clutter
+        randomly blocks free cells, except the corners (0, 0) and
+        (rows-1, cols-1).
+
+        Args:
+            rows: Number of grid rows.
+            cols: Number of grid columns.
+            rack_depth: Width of each rack in columns (default: 2).
+            cross_aisle_spacing: Rows between cross aisles (default: 20).
+            clutter: Probability of blocking a free cell (default: 0.0).
+            seed: Optional random seed for clutter.
+
+        Returns:
+            Grid representation (0=free, 1=obstacle).
+
+        Raises:
+            ValueError: If parameters are invalid.
+        """
+        if rows < 1 or cols < 1:
+            raise ValueError("Grid dimensions must be positive")
+        if rack_depth < 1:
+            raise ValueError("rack_depth must be at least 1")
+        if cross_aisle_spacing < 1:
+            raise ValueError("cross_aisle_spacing must be at least 1")
+        if not 0.0 <= clutter < 1.0:
+            raise ValueError("clutter must be in [0, 1)")
+
+        period = rack_depth + 1
+        rack_row = [0 if y % period == 0 else 1 for y in range(cols)]
+        aisle_row = [0] * cols
+        grid = [
+            list(aisle_row)
+            if x % cross_aisle_spacing == 0 or x == rows - 1
+            else list(rack_row)
+            for x in range(rows)
+        ]
+
+        if clutter > 0.0:
+            rng = random.Random(seed)
+            for x in range(rows):
+                row = grid[x]
+                for y in range(cols):
+                    if row[y] == 0 and rng.random() < clutter:
+                        row[y] = 1
+            grid[0][0] = 0
+            grid[rows - 1][cols - 1] = 0
+
+        return grid
+
+    def benchmark_heuristics(
+        self,
+        rows: int,
+        cols: int,
+        allow_diagonal: bool = False,
+        iterations: int = 1,
+        clutter: float = 0.0,
+        seed: Optional[int] = None,
+    ) -> Dict[str, any]:
+        """Benchmark heuristics on a generated warehouse grid.
+
+        Routes from corner (0, 0) to corner (rows-1, cols-1) and reports
+        expansions per second for every heuristic.
+
+        Args:
+            rows: Number of grid rows.
+            cols: Number of grid columns.
+            allow_diagonal: Whether to allow diagonal movement.
+            iterations: Number of iterations for timing (default: 1).
+            clutter: Probability of blocking a free cell (default: 0.0).
+            seed: Optional random seed for clutter.
+
+        Returns:
+            Dictionary containing comparison data as returned by
+            compare_heuristics().
+        """
+        logger.info(
+            f"Benchmarking heuristics on {rows}x{cols} warehouse grid, "
+            f"clutter={clutter}"
+        )
+        grid = self.generate_warehouse_grid(
+            rows, cols, clutter=clutter, seed=seed
+        )
+        return self.compare_heuristics(
+            grid, (0, 0), (rows - 1, cols - 1), allow_diagonal, iterations
+        )
+
     def generate_report(
         self,
         comparison_data: Dict[str, any],
@@ -561,6 +636,10 @@ class AStarPathfinder:
                     f"  Time: {h_data['time_milliseconds']:.4f} ms "
                     f"({h_data['time_seconds']:.6f} seconds)"
                 )
+                report_lines.append(
+                    f"  Expansions/second: "
+                    f"{h_data.get('expansions_per_second', 0.0):,.0f}"
+                )
             else:
                 report_lines.append(f"  Status: Failed")
                 report_lines.append(f"  Error: {h_data.get('error', 'Unknown')}")
@@ -572,6 +651,8 @@ class AStarPathfinder:
             "A* Algorithm:",
             "  Time Complexity: O(b^d) where b=branching factor, d=depth",
             "  Space Complexity: O(b^d) for open and closed sets",
+            "  Open set: binary heap with lazy deletion, O(log n) per push/pop",
+            "  Search state: flat g-score/parent buffers indexed by x*cols+y",
             "  Optimal: Yes (with admissible heuristic)",
             "",
             "Heuristics:",
@@ -652,7 +733,7 @@ def main() -> None:
     parser.add_argument(
         "-m",
         "--mode",
-        choices=["find", "compare", "visualize"],
+        choices=["find", "compare", "visualize", "benchmark"],
         default="find",
         help="Operation mode (default: find)",
     )
@@ -668,6 +749,17 @@ def main() -> None:
         "--report",
         help="Output path for performance report",
     )
+    parser.add_argument(
+        "--clutter",
+        type=float,
+        default=0.0,
+        help="Fraction of free cells blocked in benchmark mode (default: 0.0)",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        help="Random seed for benchmark clutter",
+    )
 
     args = parser.parse_args()
 
@@ -721,10 +813,20 @@ def main() -> None:
             else:
                 print("No path found")
 
-        elif args.mode == "compare":
-            comparison = pathfinder.compare_heuristics(
-                grid, start, goal, args.diagonal, args.iterations
-            )
+        elif args.mode in ("compare", "benchmark"):
+            if args.mode == "benchmark":
+                comparison = pathfinder.benchmark_heuristics(
+                    rows,
+                    cols,
+                    args.diagonal,
+                    args.iterations,
+                    clutter=args.clutter,
+                    seed=args.seed,
+                )
+            else:
+                comparison = pathfinder.compare_heuristics(
+                    grid, start, goal, args.diagonal, args.iterations
+                )
 
             print(f"\nA* Heuristic Comparison:")
             print(f"Grid: {comparison['grid_size'][0]}x{comparison['grid_size'][1]}")
@@ -743,7 +845,8 @@ def main() -> None:
                     print(
                         f"{heuristic:12s}: {status:20s} "
                         f"explored={h_data['nodes_explored']:4d}  "
-                        f"({h_data['time_milliseconds']:8.4f} ms)"
+                        f"({h_data['time_milliseconds']:8.4f} ms, "
+                        f"{h_data['expansions_per_second']:,.0f} exp/s)"
                     )
                 else:
                     print(
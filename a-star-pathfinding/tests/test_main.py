@@ -232,6 +232,65 @@ class TestAStarPathfinder:
         assert comparison["iterations"] == 10
         assert comparison["manhattan"]["success"] is True
 
+    def test_compare_heuristics_expansions_per_second(
+        self, pathfinder, simple_grid
+    ):
+        """Test comparison reports expansions per second."""
+        comparison = pathfinder.compare_heuristics(simple_grid, (0, 0), (4, 4))
+        for heuristic in ["manhattan", "euclidean", "chebyshev", "diagonal"]:
+            assert comparison[heuristic]["expansions_per_second"] >= 0
+
+    def test_find_path_optimal_cost_around_walls(self, pathfinder):
+        """Test heap search returns optimal costs with detours."""
+        grid = [
+            [0, 0, 0, 0, 0, 0],
+            [1, 1, 1, 1, 1, 0],
+            [0, 0, 0, 0, 0, 0],
+            [0, 1, 1, 1, 1, 1],
+            [0, 0, 0, 0, 0, 0],
+        ]
+        path, stats = pathfinder.find_path(grid, (0, 0), (4, 5), "euclidean")
+        assert stats["path_cost"] == 19.0
+        assert len(path) == 20
+        assert all(grid[x][y] == 0 for x, y in path)
+
+        path, stats = pathfinder.find_path(
+            grid, (0, 0), (4, 5), "diagonal", allow_diagonal=True
+        )
+        assert stats["path_cost"] == pytest.approx(11 + 4 * 2**0.5)
+        assert path[0] == (0, 0)
+        assert path[-1] == (4, 5)
+
+    def test_generate_warehouse_grid(self, pathfinder):
+        """Test warehouse grid layout."""
+        grid = pathfinder.generate_warehouse_grid(
+            10, 7, rack_depth=2, cross_aisle_spacing=4
+        )
+        assert len(grid) == 10
+        assert len(grid[0]) == 7
+        assert grid[0] == [0] * 7
+        assert grid[4] == [0] * 7
+        assert grid[9] == [0] * 7
+        assert grid[1] == [0, 1, 1, 0, 1, 1, 0]
+
+    def test_generate_warehouse_grid_invalid(self, pathfinder):
+        """Test warehouse grid parameter validation."""
+        with pytest.raises(ValueError):
+            pathfinder.generate_warehouse_grid(0, 5)
+        with pytest.raises(ValueError):
+            pathfinder.generate_warehouse_grid(5, 5, clutter=1.0)
+
+    def test_benchmark_heuristics(self, pathfinder):
+        """Test warehouse benchmark across heuristics."""
+        results = pathfinder.benchmark_heuristics(60, 60, clutter=0.05, seed=3)
+        assert results["grid_size"] == (60, 60)
+        costs = set()
+        for heuristic in ["euclidean", "chebyshev", "diagonal"]:
+            assert results[heuristic]["success"] is True
+            assert results[heuristic]["expansions_per_second"] > 0
+            costs.add(results[heuristic]["path_cost"])
+        assert len(costs) == 1
+
     def test_generate_report_success(self, pathfinder, simple_grid, temp_dir):
         """Test report generation."""
         comparison = pathfinder.compare_heuristics(
@@ -9,12 +9,20 @@ detect negative cycles.
 import logging
 import logging.handlers
 import time
+from collections import deque
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 import yaml
 from dotenv import load_dotenv
 
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 # Load environment variables
 load_dotenv()
 
@@ -24,6 +32,8 @@ logger = logging.getLogger(__name__)
 class BellmanFord:
     """Bellman-Ford algorithm for shortest paths with negative cycle detection."""
 
+    METHODS = ("classic", "queue", "vectorized")
+
     def __init__(self, config_path: str = "config.yaml") -> None:
         """Initialize BellmanFord with configuration.
 
@@ -91,6 +101,7 @@ class BellmanFord:
         num_vertices: int,
         edges: List[Tuple[int, int, float]],
         source: int,
+        method: str = "classic",
     ) -> Tuple[List[float], List[Optional[int]], bool]:
         """Find shortest paths from source using Bellman-Ford algorithm.
 
@@ -98,6 +109,9 @@ class BellmanFord:
             num_vertices: Number of vertices.
             edges: List of edges as (source, destination, weight) tuples.
             source: Source vertex.
+            method: "classic" (full edge sweeps), "queue" (SPFA with
+                SLF/LLL and subtree disassembly) or "vectorized" (NumPy
+                edge arrays relaxed once per round).
 
         Returns:
             Tuple containing:
@@ -111,6 +125,32 @@ class BellmanFord:
         Time Complexity: O(V*E) where V=vertices, E=edges
         Space Complexity: O(V)
         """
+        dist, parent, has_negative_cycle, _ = self._solve(
+            num_vertices, edges, source, method
+        )
+        return dist, parent, has_negative_cycle
+
+    def _solve(
+        self,
+        num_vertices: int,
+        edges: List[Tuple[int, int, float]],
+        source: int,
+        method: str,
+    ) -> Tuple[List[float], List[Optional[int]], bool, Optional[List[int]]]:
+        """Validate inputs and dispatch to the chosen relaxation method.
+
+        Returns:
+            Tuple of (dist, parent, has_negative_cycle, cycle). The queue
+            and vectorized methods fill in cycle when they detect one; the
+            classic method leaves it None.
+        """
+        if method not in self.METHODS:
+            raise ValueError(
+                f"Unknown method: {method}. Choose from {', '.join(self.METHODS)}"
+            )
+        if method == "vectorized" and not NUMPY_AVAILABLE:
+            raise ValueError("Method 'vectorized' requires numpy")
+
         if num_vertices < 0:
             raise ValueError("Number of vertices must be non-negative")
 
@@ -121,13 +161,40 @@ class BellmanFord:
 
         if num_vertices == 0:
             logger.info("Empty graph: returning empty arrays")
-            return [], [], False
+            return [], [], False, None
 
         logger.info(
             f"Bellman-Ford: {num_vertices} vertices, {len(edges)} edges, "
-            f"source={source}"
+            f"source={source}, method={method}"
         )
 
+        cycle = None
+        if method == "classic":
+            dist, parent, has_negative_cycle = self._relax_classic(
+                num_vertices, edges, source
+            )
+        elif method == "queue":
+            dist, parent, cycle = self._relax_queue(num_vertices, edges, source)
+            has_negative_cycle = cycle is not None
+        else:
+            dist, parent, has_negative_cycle, cycle = self._relax_vectorized(
+                num_vertices, edges, source
+            )
+
+        if has_negative_cycle:
+            logger.warning("Graph contains negative cycle reachable from source")
+        else:
+            logger.info("Shortest paths calculated successfully")
+
+        return dist, parent, has_negative_cycle, cycle
+
+    def _relax_classic(
+        self,
+        num_vertices: int,
+        edges: List[Tuple[int, int, float]],
+        source: int,
+    ) -> Tuple[List[float], List[Optional[int]], bool]:
+        """Sweep every edge for up to V-1 rounds, then check once more."""
         # Initialize distances
         dist = [float("inf")] * num_vertices
         dist[source] = 0.0
@@ -163,42 +230,278 @@ class BellmanFord:
                 )
                 break
 
-        if has_negative_cycle:
-            logger.warning("Graph contains negative cycle reachable from source")
+        return dist, parent, has_negative_cycle
+
+    def _relax_queue(
+        self,
+        num_vertices: int,
+        edges: List[Tuple[int, int, float]],
+        source: int,
+    ) -> Tuple[List[float], List[Optional[int]], Optional[List[int]]]:
+        """Queue-based relaxation with SLF/LLL and subtree disassembly.
+
+        Only vertices whose distance dropped are scanned. A vertex that
+        improves goes to the front of the queue if it beats the current
+        front (SLF), and a popped vertex above the queue's mean distance is
+        rotated to the back (LLL). The shortest-path tree is kept as a
+        preorder thread; when a vertex improves, its stale subtree is cut
+        out and dequeued. If that subtree contains the vertex being
+        scanned, the relaxation closes a cycle in the tree, which is a
+        negative cycle, so detection costs no extra passes.
+
+        Returns:
+            Tuple of (dist, parent, cycle), where cycle is the detected
+            negative cycle in edge order (first vertex repeated at the end)
+            or None.
+        """
+        inf = float("inf")
+        adjacency: List[List[Tuple[int, float]]] = [[] for _ in range(num_vertices)]
+        for u, v, w in edges:
+            adjacency[u].append((v, w))
+
+        dist = [inf] * num_vertices
+        dist[source] = 0.0
+        parent: List[Optional[int]] = [None] * num_vertices
+
+        # Preorder thread of the tree; index num_vertices is the sentinel and
+        # depth -1 marks vertices outside the tree.
+        sentinel = num_vertices
+        succ = [sentinel] * (num_vertices + 1)
+        pred = [sentinel] * (num_vertices + 1)
+        depth = [-1] * (num_vertices + 1)
+        succ[sentinel] = pred[sentinel] = source
+        depth[source] = 0
+
+        in_queue = [False] * num_vertices
+        queue = deque([source])
+        in_queue[source] = True
+        queued = 1
+        queue_sum = 0.0
+        rotations = 0
+
+        while queued:
+            u = queue.popleft()
+            if not in_queue[u]:
+                continue
+            du = dist[u]
+            # Large label last: defer vertices above the mean, at most one
+            # full rotation in a row
+            if rotations < queued and du * queued > queue_sum:
+                queue.append(u)
+                rotations += 1
+                continue
+            rotations = 0
+            in_queue[u] = False
+            queued -= 1
+            queue_sum -= du
+
+            for v, w in adjacency[u]:
+                candidate = du + w
+                if candidate >= dist[v]:
+                    continue
+
+                base = depth[v]
+                if base >= 0:
+                    # Cut v's subtree out of the thread and the queue
+                    x = v
+                    while True:
+                        if x == u:
+                            cycle = [u]
+                            while cycle[-1] != v:
+                                cycle.append(parent[cycle[-1]])
+                            cycle.reverse()
+                            cycle.append(v)
+                            logger.warning(f"  Negative cycle found: {cycle}")
+                            return dist, parent, cycle
+                        if in_queue[x]:
+                            in_queue[x] = False
+                            queued -= 1
+                            queue_sum -= dist[x]
+                        depth[x] = -1
+                        following = succ[x]
+                        if depth[following] <= base:
+                            break
+                        x = following
+                    before = pred[v]
+                    succ[before] = following
+                    pred[following] = before
+
+                # Hang v under u
+                after = succ[u]
+                succ[u] = v
+                pred[v] = u
+                succ[v] = after
+                pred[after] = v
+                depth[v] = depth[u] + 1
+
+                dist[v] = candidate
+                parent[v] = u
+                # Small label first
+                if queue and candidate < dist[queue[0]]:
+                    queue.appendleft(v)
+                else:
+                    queue.append(v)
+                in_queue[v] = True
+                queued += 1
+                queue_sum += candidate
+
+        return dist, parent, None
+
+    def _relax_vectorized(
+        self,
+        num_vertices: int,
+        edges: List[Tuple[int, int, float]],
+        source: int,
+    ) -> Tuple[List[float], List[Optional[int]], bool, Optional[List[int]]]:
+        """Relax the edge list as NumPy arrays, one round at a time.
+
+        Each round relaxes only the edges leaving vertices that improved in
+        the previous round, against the previous round's distances. The
+        parent graph is checked for a cycle by pointer doubling once the
+        relaxation work since the last check exceeds the O(V log V) cost of
+        a check, so negative cycles are reported without waiting for V
+        rounds.
+
+        Returns:
+            Tuple of (dist, parent, has_negative_cycle, cycle).
+        """
+        edge_array = np.asarray(edges, dtype=np.float64).reshape(-1, 3)
+        sources = edge_array[:, 0].astype(np.intp)
+        dests = edge_array[:, 1].astype(np.intp)
+        weights = edge_array[:, 2]
+
+        dist = np.full(num_vertices, np.inf)
+        dist[source] = 0.0
+        parent = np.full(num_vertices, -1, dtype=np.intp)
+        active = np.zeros(num_vertices, dtype=bool)
+        active[source] = True
+
+        check_cost = num_vertices * num_vertices.bit_length()
+        work = 0
+        has_negative_cycle = False
+        cycle = None
+
+        for round_number in range(1, num_vertices + 1):
+            selected = np.flatnonzero(active[sources])
+            if not len(selected):
+                break
+            round_sources = sources[selected]
+            round_dests = dests[selected]
+            candidates = dist[round_sources] + weights[selected]
+
+            best = dist.copy()
+            np.minimum.at(best, round_dests, candidates)
+            improved = best < dist
+            if not improved.any():
+                break
+
+            won = improved[round_dests] & (candidates == best[round_dests])
+            parent[round_dests[won]] = round_sources[won]
+            dist = best
+            active = improved
+            logger.debug(
+                f"  Round {round_number}: {len(selected)} edges relaxed, "
+                f"{int(improved.sum())} vertices improved"
+            )
+
+            work += len(selected)
+            if work >= check_cost:
+                work = 0
+                cycle = self._find_parent_cycle(parent)
+                if cycle is not None:
+                    has_negative_cycle = True
+                    break
         else:
-            logger.info("Shortest paths calculated successfully")
+            # Still improving after V rounds
+            has_negative_cycle = True
+            cycle = self._find_parent_cycle(parent)
 
-        return dist, parent, has_negative_cycle
+        if cycle is not None:
+            logger.warning(f"  Negative cycle found: {cycle}")
+
+        parent_list: List[Optional[int]] = [
+            None if p < 0 else p for p in parent.tolist()
+        ]
+        return dist.tolist(), parent_list, has_negative_cycle, cycle
+
+    def _find_parent_cycle(self, parent: "np.ndarray") -> Optional[List[int]]:
+        """Find a cycle in the parent graph by pointer doubling.
+
+        After ceil(log2(V)) + 1 squarings every vertex maps to its ancestor
+        at least V steps up, which is the sentinel for tree vertices and a
+        cycle vertex otherwise.
+
+        Args:
+            parent: Parent array with -1 for no parent.
+
+        Returns:
+            A cycle in edge order (first vertex repeated at the end), or
+            None if the parent graph is a forest.
+        """
+        num_vertices = len(parent)
+        jump = np.append(np.where(parent >= 0, parent, num_vertices), num_vertices)
+        for _ in range(num_vertices.bit_length()):
+            jump = jump[jump]
+
+        on_cycle = np.flatnonzero(jump[:num_vertices] != num_vertices)
+        if not len(on_cycle):
+            return None
+        return self._trace_parent_cycle(parent.tolist(), int(jump[on_cycle[0]]))
+
+    def _trace_parent_cycle(
+        self, parent: List[Optional[int]], vertex: int
+    ) -> List[int]:
+        """Read the parent-graph cycle through vertex in edge order."""
+        backwards = [vertex]
+        current = parent[vertex]
+        while current != vertex:
+            backwards.append(current)
+            current = parent[current]
+        backwards.append(vertex)
+        backwards.reverse()
+        return backwards
 
     def find_negative_cycle(
         self,
         num_vertices: int,
         edges: List[Tuple[int, int, float]],
         source: int,
+        method: str = "queue",
     ) -> Optional[List[int]]:
         """Find negative cycle in graph.
 
+        The queue and vectorized methods report the cycle as soon as it
+        appears in the shortest-path tree. The classic method relaxes for
+        V-1 rounds and then walks parent pointers back from an edge that
+        can still be relaxed.
+
         Args:
             num_vertices: Number of vertices.
             edges: List of edges as (source, destination, weight) tuples.
             source: Source vertex.
+            method: Relaxation method (see find_shortest_paths()).
 
         Returns:
-            List of vertices in negative cycle, or None if no cycle exists.
+            List of vertices in negative cycle in edge order, with the first
+            vertex repeated at the end, or None if no cycle exists.
         """
-        dist, parent, has_negative_cycle = self.find_shortest_paths(
-            num_vertices, edges, source
+        dist, parent, has_negative_cycle, cycle = self._solve(
+            num_vertices, edges, source, method
         )
 
         if not has_negative_cycle:
             return None
+        if cycle is not None:
+            return cycle
 
         logger.info("Finding negative cycle")
 
-        # Find an edge that can still be relaxed
+        # Find an edge that can still be relaxed and apply it
         cycle_start = None
         for u, v, w in edges:
             if dist[u] != float("inf") and dist[u] + w < dist[v]:
+                parent = list(parent)
+                parent[v] = u
                 cycle_start = v
                 logger.debug(f"  Cycle detected starting at vertex {v}")
                 break
@@ -206,46 +509,16 @@ class BellmanFord:
         if cycle_start is None:
             return None
 
-        # Trace back to find cycle
-        # Use slow and fast pointer technique (Floyd's cycle detection)
-        visited = set()
+        # V steps back from a vertex relaxed in round V lands on the cycle
         current = cycle_start
-        path: List[int] = []
-
-        # Trace back through parent pointers
         for _ in range(num_vertices):
-            if current is None:
-                break
-            if current in visited:
-                # Found cycle, extract it
-                cycle_start_idx = path.index(current)
-                cycle = path[cycle_start_idx:] + [current]
-                logger.info(f"  Negative cycle found: {cycle}")
-                return cycle
-            visited.add(current)
-            path.append(current)
             current = parent[current]
-
-        # Alternative: find cycle by following edges
-        # Start from cycle_start and follow parent pointers
-        cycle_vertices: List[int] = []
-        current = cycle_start
-        seen = set()
-
-        for _ in range(num_vertices):
             if current is None:
-                break
-            if current in seen:
-                # Extract cycle
-                start_idx = cycle_vertices.index(current)
-                cycle = cycle_vertices[start_idx:] + [current]
-                logger.info(f"  Negative cycle found: {cycle}")
-                return cycle
-            seen.add(current)
-            cycle_vertices.append(current)
-            current = parent[current]
+                return None
 
-        return None
+        cycle = self._trace_parent_cycle(parent, current)
+        logger.info(f"  Negative cycle found: {cycle}")
+        return cycle
 
     def reconstruct_path(
         self, parent: List[Optional[int]], start: int, end: int
@@ -285,6 +558,7 @@ class BellmanFord:
         edges: List[Tuple[int, int, float]],
         source: int,
         target: int,
+        method: str = "classic",
     ) -> Optional[float]:
         """Get shortest distance from source to target.
 
@@ -293,12 +567,13 @@ class BellmanFord:
             edges: List of edges as (source, destination, weight) tuples.
             source: Source vertex.
             target: Target vertex.
+            method: Relaxation method (see find_shortest_paths()).
 
         Returns:
             Shortest distance, or None if no path exists or negative cycle.
         """
         dist, _, has_negative_cycle = self.find_shortest_paths(
-            num_vertices, edges, source
+            num_vertices, edges, source, method=method
         )
 
         if has_negative_cycle:
@@ -314,6 +589,7 @@ class BellmanFord:
         num_vertices: int,
         edges: List[Tuple[int, int, float]],
         source: int,
+        method: str = "classic",
     ) -> Tuple[List[float], bool]:
         """Get all shortest distances from source.
 
@@ -321,12 +597,13 @@ class BellmanFord:
             num_vertices: Number of vertices.
             edges: List of edges as (source, destination, weight) tuples.
             source: Source vertex.
+            method: Relaxation method (see find_shortest_paths()).
 
         Returns:
             Tuple containing distance array and negative cycle flag.
         """
         dist, _, has_negative_cycle = self.find_shortest_paths(
-            num_vertices, edges, source
+            num_vertices, edges, source, method=method
         )
         return dist, has_negative_cycle
 
@@ -336,21 +613,32 @@ class BellmanFord:
         edges: List[Tuple[int, int, float]],
         source: int,
         iterations: int = 1,
+        methods: Optional[List[str]] = None,
     ) -> Dict[str, any]:
-        """Compare performance of Bellman-Ford algorithm.
+        """Compare performance of Bellman-Ford relaxation methods.
 
         Args:
             num_vertices: Number of vertices.
             edges: List of edges as (source, destination, weight) tuples.
             source: Source vertex.
             iterations: Number of iterations for timing (default: 1).
+            methods: Methods to time (default: every available method).
 
         Returns:
-            Dictionary containing performance data.
+            Dictionary containing performance data. "bellman_ford" holds
+            the classic result; "methods" holds one entry per timed method.
         """
+        if methods is None:
+            methods = [
+                method
+                for method in self.METHODS
+                if method != "vectorized" or NUMPY_AVAILABLE
+            ]
+
         logger.info(
             f"Performance comparison: {num_vertices} vertices, "
-            f"{len(edges)} edges, source={source}, iterations={iterations}"
+            f"{len(edges)} edges, source={source}, iterations={iterations}, "
+            f"methods={', '.join(methods)}"
         )
 
         results = {
@@ -359,25 +647,32 @@ class BellmanFord:
             "source": source,
             "iterations": iterations,
             "bellman_ford": {},
+            "methods": {},
         }
 
-        try:
-            start_time = time.perf_counter()
-            for _ in range(iterations):
-                dist, parent, has_negative_cycle = self.find_shortest_paths(
-                    num_vertices, edges, source
-                )
-            bf_time = time.perf_counter() - start_time
-
-            results["bellman_ford"] = {
-                "time_seconds": bf_time / iterations,
-                "time_milliseconds": (bf_time / iterations) * 1000,
-                "has_negative_cycle": has_negative_cycle,
-                "success": True,
-            }
-        except Exception as e:
-            logger.error(f"Bellman-Ford failed: {e}")
-            results["bellman_ford"] = {"success": False, "error": str(e)}
+        for method in dict.fromkeys(["classic", *methods]):
+            try:
+                start_time = time.perf_counter()
+                for _ in range(iterations):
+                    dist, parent, has_negative_cycle = self.find_shortest_paths(
+                        num_vertices, edges, source, method=method
+                    )
+                bf_time = time.perf_counter() - start_time
+
+                entry = {
+                    "time_seconds": bf_time / iterations,
+                    "time_milliseconds": (bf_time / iterations) * 1000,
+                    "has_negative_cycle": has_negative_cycle,
+                    "success": True,
+                }
+            except Exception as e:
+                logger.error(f"Bellman-Ford ({method}) failed: {e}")
+                entry = {"success": False, "error": str(e)}
+
+            if method == "classic":
+                results["bellman_ford"] = entry
+            if method in methods:
+                results["methods"][method] = entry
 
         return results
 
@@ -424,6 +719,20 @@ class BellmanFord:
             report_lines.append(f"  Status: Failed")
             report_lines.append(f"  Error: {bf_data.get('error', 'Unknown')}")
 
+        method_data = performance_data.get("methods", {})
+        if method_data:
+            report_lines.append("\nRELAXATION METHODS:")
+            for method, data in method_data.items():
+                if data.get("success", False):
+                    report_lines.append(
+                        f"  {method}: {data['time_milliseconds']:.4f} ms "
+                        f"({data['time_seconds']:.6f} seconds)"
+                    )
+                else:
+                    report_lines.append(
+                        f"  {method}: Failed ({data.get('error', 'Unknown')})"
+                    )
+
         report_lines.extend([
             "",
             "ALGORITHM COMPLEXITY",
@@ -440,6 +749,9 @@ class BellmanFord:
             "  - Works with negative edge weights",
             "  - Supports path reconstruction",
             "  - More flexible than Dijkstra's algorithm",
+            "  - Queue method scans only improved vertices (SLF/LLL) and "
+            "finds cycles by subtree disassembly",
+            "  - Vectorized method relaxes the edge list as NumPy arrays",
         ])
 
         report_content = "\n".join(report_lines)
@@ -529,6 +841,13 @@ def main() -> None:
         "--report",
         help="Output path for performance report",
     )
+    parser.add_argument(
+        "-m",
+        "--method",
+        choices=BellmanFord.METHODS,
+        default="classic",
+        help="Relaxation method (default: classic)",
+    )
 
     args = parser.parse_args()
 
@@ -562,7 +881,7 @@ def main() -> None:
 
         # Find shortest paths
         dist, parent, has_negative_cycle = bf.find_shortest_paths(
-            args.num_vertices, edges, args.source
+            args.num_vertices, edges, args.source, method=args.method
         )
 
         if has_negative_cycle:
@@ -571,7 +890,8 @@ def main() -> None:
 
         if args.query is not None:
             distance = bf.get_shortest_distance(
-                args.num_vertices, edges, args.source, args.query
+                args.num_vertices, edges, args.source, args.query,
+                method=args.method,
             )
             if distance is None:
                 if has_negative_cycle:
@@ -601,7 +921,8 @@ def main() -> None:
 
         if args.cycle:
             cycle = bf.find_negative_cycle(
-                args.num_vertices, edges, args.source
+                args.num_vertices, edges, args.source,
+                method=args.method,
             )
             if cycle is None:
                 print("No negative cycle found")
@@ -1,12 +1,13 @@
 """Unit tests for Bellman-Ford algorithm module."""
 
+import random
 import tempfile
 from pathlib import Path
 
 import pytest
 import yaml
 
-from src.main import BellmanFord
+from src.main import NUMPY_AVAILABLE, BellmanFord
 
 
 class TestBellmanFord:
@@ -250,3 +251,115 @@ class TestBellmanFord:
         path = bf.reconstruct_path(parent, 0, 3)
         assert path == [0, 1, 2, 3]
         assert dist[3] == 3.0
+
+
+class TestRelaxationMethods:
+    """Test cases for the queue and vectorized relaxation methods."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create temporary directory for testing."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+
+    @pytest.fixture
+    def config_file(self, temp_dir):
+        """Create temporary config file."""
+        config = {
+            "logging": {"level": "INFO", "file": str(temp_dir / "app.log")},
+        }
+        config_path = temp_dir / "config.yaml"
+        with open(config_path, "w") as f:
+            yaml.dump(config, f)
+        return str(config_path)
+
+    @pytest.fixture
+    def bf(self, config_file):
+        """Create BellmanFord instance."""
+        return BellmanFord(config_path=config_file)
+
+    @pytest.fixture(
+        params=[
+            "queue",
+            pytest.param(
+                "vectorized",
+                marks=pytest.mark.skipif(
+                    not NUMPY_AVAILABLE, reason="numpy not installed"
+                ),
+            ),
+        ]
+    )
+    def method(self, request):
+        """Relaxation method under test."""
+        return request.param
+
+    @staticmethod
+    def _cycle_weight(edges, cycle):
+        weights = {}
+        for u, v, w in edges:
+            weights[(u, v)] = min(weights.get((u, v), float("inf")), w)
+        return sum(weights[edge] for edge in zip(cycle, cycle[1:]))
+
+    def test_matches_classic(self, bf, method):
+        """Test that the method matches classic distances and cycle flags."""
+        rng = random.Random(5)
+        for _ in range(200):
+            n = rng.randint(1, 15)
+            edges = [
+                (rng.randrange(n), rng.randrange(n), rng.randint(-3, 10))
+                for _ in range(rng.randint(0, 3 * n))
+            ]
+            source = rng.randrange(n)
+            expected = bf.find_shortest_paths(n, edges, source)
+            dist, parent, has_negative_cycle = bf.find_shortest_paths(
+                n, edges, source, method=method
+            )
+            assert has_negative_cycle == expected[2]
+            if not has_negative_cycle:
+                assert dist == expected[0]
+                for target in range(n):
+                    path = bf.reconstruct_path(parent, source, target)
+                    assert (path is None) == (dist[target] == float("inf"))
+
+    def test_negative_cycle_found(self, bf, method):
+        """Test that the reported cycle is a real negative cycle."""
+        edges = [(0, 1, 1), (1, 2, 1), (2, 3, -1), (3, 1, -2), (3, 4, 1)]
+        cycle = bf.find_negative_cycle(5, edges, 0, method=method)
+        assert cycle[0] == cycle[-1]
+        assert set(cycle) == {1, 2, 3}
+        assert self._cycle_weight(edges, cycle) < 0
+
+    def test_negative_self_loop(self, bf, method):
+        """Test a negative self-loop on the source."""
+        cycle = bf.find_negative_cycle(2, [(0, 0, -1), (0, 1, 2)], 0, method=method)
+        assert cycle == [0, 0]
+
+    def test_unreachable_cycle_ignored(self, bf, method):
+        """Test that a negative cycle unreachable from source is ignored."""
+        edges = [(0, 1, 1), (2, 3, -1), (3, 2, -1)]
+        dist, _, has_negative_cycle = bf.find_shortest_paths(
+            4, edges, 0, method=method
+        )
+        assert has_negative_cycle is False
+        assert dist == [0.0, 1.0, float("inf"), float("inf")]
+        assert bf.find_negative_cycle(4, edges, 0, method=method) is None
+
+    def test_classic_cycle_is_valid(self, bf):
+        """Test the classic parent walk returns a negative cycle."""
+        edges = [(0, 1, 1), (1, 2, -2), (2, 0, -1)]
+        cycle = bf.find_negative_cycle(3, edges, 0, method="classic")
+        assert cycle[0] == cycle[-1]
+        assert self._cycle_weight(edges, cycle) < 0
+
+    def test_invalid_method(self, bf):
+        """Test that an unknown method raises ValueError."""
+        with pytest.raises(ValueError, match="Unknown method"):
+            bf.find_shortest_paths(2, [(0, 1, 1)], 0, method="dijkstra")
+
+    def test_compare_performance_methods(self, bf):
+        """Test that compare_performance times each method."""
+        edges = [(0, 1, 1), (1, 2, 2)]
+        results = bf.compare_performance(3, edges, 0, methods=["queue"])
+        assert list(results["methods"]) == ["queue"]
+        assert results["bellman_ford"]["success"] is True
+        assert "RELAXATION METHODS" in bf.generate_report(results)
@@ -7,8 +7,12 @@ Dijkstra algorithm with forward and backward searches meeting in the middle.
 import heapq
 import logging
 import logging.handlers
+import random
+import threading
+import time
+from array import array
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, List, Optional, Sequence, Set, Tuple
 
 import numpy as np
 import yaml
@@ -130,6 +134,350 @@ class Graph:
         return self.grid[y, x] == 0
 
 
+class SearchWorkspace:
+    """Per-node search arrays reused across queries.
+
+    Entries are only valid where stamp equals the current version, so
+    starting a new query is O(1) instead of clearing every array.
+    """
+
+    def __init__(self, num_nodes: int) -> None:
+        """Allocate arrays for num_nodes nodes.
+
+        Args:
+            num_nodes: Number of nodes in the indexed graph.
+        """
+        self.dist: List[float] = [0.0] * num_nodes
+        self.parent: List[int] = [-1] * num_nodes
+        self.stamp: List[int] = [0] * num_nodes
+        self.version = 0
+
+    def begin(self) -> int:
+        """Start a new query and return its version."""
+        self.version += 1
+        return self.version
+
+
+class LandmarkIndex:
+    """Landmark distances and a compact adjacency snapshot for ALT search.
+
+    Nodes are numbered 0..n-1. Forward and reverse adjacency are stored as
+    CSR arrays, and landmark distances as flat node-major arrays
+    (``from_landmark[v * k + i]`` is the distance from landmark i to node v,
+    ``to_landmark[v * k + i]`` the distance from v to landmark i).
+    """
+
+    SELECTIONS = ("farthest", "avoid", "random")
+
+    def __init__(
+        self,
+        graph: Graph,
+        num_landmarks: int = 8,
+        selection: str = "avoid",
+        seed: Optional[int] = 0,
+    ) -> None:
+        """Snapshot graph and precompute landmark distances.
+
+        Args:
+            graph: Graph instance with non-negative edge weights.
+            num_landmarks: Number of landmarks (capped at the node count).
+            selection: "farthest" (greedy max-min distance), "avoid"
+                (descend into the shortest-path subtree with the worst
+                current bounds) or "random".
+            seed: Seed for the random choices made during selection.
+
+        Raises:
+            ValueError: If num_landmarks < 1, selection is unknown, or the
+                graph has a negative edge weight.
+        """
+        if num_landmarks < 1:
+            raise ValueError("Number of landmarks must be at least 1")
+        if selection not in self.SELECTIONS:
+            raise ValueError(
+                f"Unknown landmark selection: {selection}. "
+                f"Choose from {', '.join(self.SELECTIONS)}"
+            )
+
+        self.graph = graph
+        try:
+            self.nodes = sorted(graph.nodes)
+        except TypeError:
+            self.nodes = list(graph.nodes)
+        self.node_index: Dict = {node: i for i, node in enumerate(self.nodes)}
+        self._build_csr(graph)
+
+        num_nodes = len(self.nodes)
+        self.num_landmarks = min(num_landmarks, num_nodes)
+        self.selection = selection
+        self.landmarks: List = []
+        self.from_landmark = array("d")
+        self.to_landmark = array("d")
+        self._local = threading.local()
+
+        start_time = time.perf_counter()
+        self._select_landmarks(selection, random.Random(seed))
+        self.preprocessing_seconds = time.perf_counter() - start_time
+        logger.info(
+            f"Landmark index: {num_nodes} nodes, {len(self.targets)} edges, "
+            f"{self.num_landmarks} landmarks ({selection}) in "
+            f"{self.preprocessing_seconds:.3f}s"
+        )
+
+    def _build_csr(self, graph: Graph) -> None:
+        """Build forward and reverse CSR adjacency from graph."""
+        num_nodes = len(self.nodes)
+        node_index = self.node_index
+        edges: List[Tuple[int, int, float]] = []
+        for u, node in enumerate(self.nodes):
+            for neighbor, weight in graph.get_neighbors(node):
+                if weight < 0:
+                    raise ValueError(
+                        f"Negative edge weight {weight} on {node} -> {neighbor}"
+                    )
+                edges.append((u, node_index[neighbor], float(weight)))
+
+        self.offsets, self.targets, self.weights = self._csr(
+            num_nodes, edges
+        )
+        self.reverse_offsets, self.reverse_targets, self.reverse_weights = (
+            self._csr(num_nodes, [(v, u, w) for u, v, w in edges])
+        )
+
+    @staticmethod
+    def _csr(
+        num_nodes: int, edges: List[Tuple[int, int, float]]
+    ) -> Tuple[array, array, array]:
+        """Counting-sort edges into CSR arrays, keeping input order per node."""
+        offsets = array("q", [0]) * (num_nodes + 1)
+        for u, _, _ in edges:
+            offsets[u + 1] += 1
+        for i in range(num_nodes):
+            offsets[i + 1] += offsets[i]
+        cursor = offsets.tolist()
+        targets = array("i", [0]) * len(edges)
+        weights = array("d", [0.0]) * len(edges)
+        for u, v, w in edges:
+            slot = cursor[u]
+            targets[slot] = v
+            weights[slot] = w
+            cursor[u] = slot + 1
+        return offsets, targets, weights
+
+    def _distances(
+        self, source: int, reverse: bool = False
+    ) -> Tuple[List[float], List[int], List[int]]:
+        """Run a full Dijkstra from source over the CSR arrays.
+
+        Returns:
+            Tuple of (dist, parent, settle order); unreachable nodes keep
+            infinite distance and parent -1.
+        """
+        if reverse:
+            offsets = self.reverse_offsets.tolist()
+            targets = self.reverse_targets.tolist()
+            weights = self.reverse_weights.tolist()
+        else:
+            offsets = self.offsets.tolist()
+            targets = self.targets.tolist()
+            weights = self.weights.tolist()
+
+        num_nodes = len(self.nodes)
+        dist = [float("inf")] * num_nodes
+        parent = [-1] * num_nodes
+        settled = [False] * num_nodes
+        order: List[int] = []
+        dist[source] = 0.0
+        heap = [(0.0, source)]
+        while heap:
+            du, u = heapq.heappop(heap)
+            if settled[u]:
+                continue
+            settled[u] = True
+            order.append(u)
+            start, end = offsets[u], offsets[u + 1]
+            for v, w in zip(targets[start:end], weights[start:end]):
+                nd = du + w
+                if nd < dist[v]:
+                    dist[v] = nd
+                    parent[v] = u
+                    heapq.heappush(heap, (nd, v))
+        return dist, parent, order
+
+    def _add_landmark(self, landmark: int) -> None:
+        """Append a landmark's distances to the node-major tables."""
+        from_dist, _, _ = self._distances(landmark)
+        to_dist, _, _ = self._distances(landmark, reverse=True)
+        k = len(self.landmarks)
+        old_from, old_to = self.from_landmark, self.to_landmark
+        from_table = array("d", [0.0]) * (len(self.nodes) * (k + 1))
+        to_table = array("d", [0.0]) * (len(self.nodes) * (k + 1))
+        for v in range(len(self.nodes)):
+            base = v * (k + 1)
+            from_table[base:base + k] = old_from[v * k:v * k + k]
+            to_table[base:base + k] = old_to[v * k:v * k + k]
+            from_table[base + k] = from_dist[v]
+            to_table[base + k] = to_dist[v]
+        self.from_landmark, self.to_landmark = from_table, to_table
+        self.landmarks.append(landmark)
+
+    def _select_landmarks(self, selection: str, rng: random.Random) -> None:
+        """Pick landmarks one at a time with the given strategy."""
+        num_nodes = len(self.nodes)
+        if num_nodes == 0:
+            return
+
+        if selection == "random":
+            for landmark in rng.sample(range(num_nodes), self.num_landmarks):
+                self._add_landmark(landmark)
+            return
+
+        # Farthest: start from the node farthest from a random node, then
+        # repeatedly take the node farthest from every chosen landmark.
+        # Unreachable nodes count as infinitely far, so every component
+        # gets a landmark before any component gets a second one.
+        root = rng.randrange(num_nodes)
+        root_dist, _, _ = self._distances(root)
+        nearest = [float("inf")] * num_nodes
+        self._add_landmark(self._farthest(root_dist, root))
+
+        while len(self.landmarks) < self.num_landmarks:
+            k = len(self.landmarks)
+            latest = k - 1
+            from_table = self.from_landmark
+            for v in range(num_nodes):
+                d = from_table[v * k + latest]
+                if d < nearest[v]:
+                    nearest[v] = d
+
+            if selection == "avoid":
+                landmark = self._avoid_choice(rng.randrange(num_nodes))
+                if landmark is None:
+                    landmark = self._farthest_unused(nearest)
+            else:
+                landmark = self._farthest_unused(nearest)
+            if landmark is None:
+                break
+            self._add_landmark(landmark)
+
+    def _farthest(self, dist: List[float], fallback: int) -> int:
+        """Return the reachable node with the largest finite distance."""
+        best, best_dist = fallback, -1.0
+        for v, d in enumerate(dist):
+            if d != float("inf") and d > best_dist:
+                best, best_dist = v, d
+        return best
+
+    def _farthest_unused(self, nearest: List[float]) -> Optional[int]:
+        """Return the non-landmark node maximizing distance to landmarks."""
+        chosen = set(self.landmarks)
+        best, best_dist = None, -1.0
+        for v, d in enumerate(nearest):
+            if v not in chosen and d > best_dist:
+                best, best_dist = v, d
+        return best
+
+    def _avoid_choice(self, root: int) -> Optional[int]:
+        """Pick a landmark with the avoid heuristic.
+
+        Each node in the shortest-path tree from root is weighted by how
+        far the current landmark bound on d(root, v) falls short of the
+        true distance. Subtree weights are summed bottom-up, dropping any
+        subtree that already contains a landmark, and the walk descends
+        into the heaviest child until it reaches a leaf.
+        """
+        dist, parent, order = self._distances(root)
+        k = len(self.landmarks)
+        from_table, to_table = self.from_landmark, self.to_landmark
+        root_from = from_table[root * k:root * k + k]
+        root_to = to_table[root * k:root * k + k]
+
+        size = [0.0] * len(self.nodes)
+        covered = [False] * len(self.nodes)
+        for landmark in self.landmarks:
+            covered[landmark] = True
+
+        for v in reversed(order):
+            bound = self._lower_bound(
+                root_from, root_to,
+                from_table[v * k:v * k + k], to_table[v * k:v * k + k],
+            )
+            if covered[v]:
+                size[v] = 0.0
+            else:
+                size[v] += dist[v] - bound
+            p = parent[v]
+            if p >= 0:
+                if covered[v]:
+                    covered[p] = True
+                else:
+                    size[p] += size[v]
+
+        children: Dict[int, List[int]] = {}
+        for v in order:
+            if parent[v] >= 0:
+                children.setdefault(parent[v], []).append(v)
+
+        current = root
+        while True:
+            heaviest = max(
+                children.get(current, []), key=size.__getitem__, default=None
+            )
+            if heaviest is None or size[heaviest] <= 0.0:
+                break
+            current = heaviest
+        if current in self.landmarks or size[current] <= 0.0:
+            return None
+        return current
+
+    @staticmethod
+    def _lower_bound(
+        source_from: Sequence[float],
+        source_to: Sequence[float],
+        target_from: Sequence[float],
+        target_to: Sequence[float],
+    ) -> float:
+        """Triangle-inequality lower bound on d(source, target).
+
+        Uses d(L, t) - d(L, s) and d(s, L) - d(t, L) for every landmark L.
+        Terms involving an unreachable landmark distance are skipped, except
+        an infinite bound, which proves the target unreachable.
+        """
+        bound = 0.0
+        for ls, st, lt, tt in zip(source_from, source_to, target_from, target_to):
+            # NaN (inf - inf) compares false and is ignored
+            forward = lt - ls
+            if forward > bound:
+                bound = forward
+            backward = st - tt
+            if backward > bound:
+                bound = backward
+        return bound
+
+    def memory_bytes(self) -> int:
+        """Return bytes used by the CSR and landmark arrays."""
+        return sum(
+            table.itemsize * len(table)
+            for table in (
+                self.offsets, self.targets, self.weights,
+                self.reverse_offsets, self.reverse_targets, self.reverse_weights,
+                self.from_landmark, self.to_landmark,
+            )
+        )
+
+    def workspaces(self) -> Tuple[SearchWorkspace, SearchWorkspace, SearchWorkspace]:
+        """Return this thread's (forward, backward, potential) workspaces."""
+        spaces = getattr(self._local, "spaces", None)
+        if spaces is None:
+            num_nodes = len(self.nodes)
+            spaces = (
+                SearchWorkspace(num_nodes),
+                SearchWorkspace(num_nodes),
+                SearchWorkspace(num_nodes),
+            )
+            self._local.spaces = spaces
+        return spaces
+
+
 class BidirectionalDijkstra:
     """Implements bidirectional Dijkstra algorithm for shortest path finding."""
 
@@ -199,6 +547,35 @@ class BidirectionalDijkstra:
         """Initialize algorithm parameters from configuration."""
         dijkstra_config = self.config.get("bidirectional_dijkstra", {})
         self.max_iterations = dijkstra_config.get("max_iterations", 10000)
+        landmark_config = dijkstra_config.get("landmarks", {})
+        self.num_landmarks = landmark_config.get("count", 8)
+        self.landmark_selection = landmark_config.get("selection", "avoid")
+        self.landmark_seed = landmark_config.get("seed", 0)
+
+    def build_landmarks(
+        self,
+        graph: Graph,
+        num_landmarks: Optional[int] = None,
+        selection: Optional[str] = None,
+        seed: Optional[int] = None,
+    ) -> LandmarkIndex:
+        """Precompute a landmark index for repeated ALT queries on graph.
+
+        Args:
+            graph: Graph instance with non-negative edge weights.
+            num_landmarks: Number of landmarks (default: from config).
+            selection: Landmark selection strategy (default: from config).
+            seed: Random seed for selection (default: from config).
+
+        Returns:
+            LandmarkIndex to pass to search().
+        """
+        return LandmarkIndex(
+            graph,
+            num_landmarks=self.num_landmarks if num_landmarks is None else num_landmarks,
+            selection=self.landmark_selection if selection is None else selection,
+            seed=self.landmark_seed if seed is None else seed,
+        )
 
     def _reconstruct_path(
         self,
@@ -241,6 +618,7 @@ class BidirectionalDijkstra:
         graph: Graph,
         start,
         goal,
+        landmarks: Optional[LandmarkIndex] = None,
     ) -> Dict[str, any]:
         """Run bidirectional Dijkstra search algorithm.
 
@@ -248,6 +626,8 @@ class BidirectionalDijkstra:
             graph: Graph instance.
             start: Start node.
             goal: Goal node.
+            landmarks: Optional index from build_landmarks(); when given,
+                the search runs in ALT mode over the index.
 
         Returns:
             Dictionary containing:
@@ -267,6 +647,8 @@ class BidirectionalDijkstra:
             raise ValueError(f"Start node {start} is not in graph")
         if goal not in graph.nodes:
             raise ValueError(f"Goal node {goal} is not in graph")
+        if landmarks is not None and landmarks.graph is not graph:
+            raise ValueError("Landmark index was built for a different graph")
 
         if start == goal:
             return {
@@ -280,6 +662,9 @@ class BidirectionalDijkstra:
                 "meeting_node": start,
             }
 
+        if landmarks is not None:
+            return self._search_alt(landmarks, start, goal)
+
         open_set_forward = []
         open_set_backward = []
         heapq.heappush(open_set_forward, (0.0, start))
@@ -428,6 +813,232 @@ class BidirectionalDijkstra:
             "meeting_node": None,
         }
 
+    def _search_alt(self, index: LandmarkIndex, start, goal) -> Dict[str, any]:
+        """Bidirectional ALT search over a landmark index.
+
+        Both directions use the average potential
+        p(v) = (pi_t(v) - pi_s(v)) / 2, where pi_t and pi_s are landmark
+        lower bounds on d(v, goal) and d(start, v). Forward keys are
+        d_f(v) + p(v) and backward keys d_b(v) - p(v), which keeps reduced
+        edge costs non-negative in both directions, so the search can stop
+        once the two queue minima sum to at least the best meeting cost.
+        Nodes with an infinite bound cannot lie on a start-goal path and are
+        never queued. Search arrays come from per-thread workspaces reused
+        across queries.
+        """
+        inf = float("inf")
+        k = index.num_landmarks
+        s = index.node_index[start]
+        t = index.node_index[goal]
+        from_table, to_table = index.from_landmark, index.to_landmark
+        s_from = from_table[s * k:s * k + k]
+        s_to = to_table[s * k:s * k + k]
+        t_from = from_table[t * k:t * k + k]
+        t_to = to_table[t * k:t * k + k]
+        lower_bound = index._lower_bound
+
+        forward, backward, potentials = index.workspaces()
+        version = forward.begin()
+        backward.begin()
+        potentials.begin()
+        dist_f, parent_f, stamp_f = forward.dist, forward.parent, forward.stamp
+        dist_b, parent_b, stamp_b = backward.dist, backward.parent, backward.stamp
+        potential_cache, potential_stamp = potentials.dist, potentials.stamp
+
+        def potential(v: int) -> float:
+            if potential_stamp[v] == version:
+                return potential_cache[v]
+            v_from = from_table[v * k:v * k + k]
+            v_to = to_table[v * k:v * k + k]
+            to_goal = lower_bound(v_from, v_to, t_from, t_to)
+            from_start = lower_bound(s_from, s_to, v_from, v_to)
+            if to_goal == inf or from_start == inf:
+                value = inf
+            else:
+                value = (to_goal - from_start) / 2.0
+            potential_cache[v] = value
+            potential_stamp[v] = version
+            return value
+
+        offsets, targets, weights = index.offsets, index.targets, index.weights
+        reverse_offsets = index.reverse_offsets
+        reverse_targets, reverse_weights = index.reverse_targets, index.reverse_weights
+
+        # stamp == version: reached; stamp == -version: settled
+        dist_f[s], parent_f[s], stamp_f[s] = 0.0, -1, version
+        dist_b[t], parent_b[t], stamp_b[t] = 0.0, -1, version
+        heap_f = [(potential(s), s)]
+        heap_b = [(-potential(t), t)]
+
+        best_cost = inf
+        meeting = -1
+        settled_forward = 0
+        settled_backward = 0
+        iteration = 0
+
+        while heap_f and heap_b and iteration < self.max_iterations:
+            if heap_f[0][0] + heap_b[0][0] >= best_cost:
+                break
+            iteration += 1
+
+            _, u = heapq.heappop(heap_f)
+            if stamp_f[u] == version:
+                stamp_f[u] = -version
+                settled_forward += 1
+                du = dist_f[u]
+                start_slot, end_slot = offsets[u], offsets[u + 1]
+                for v, w in zip(
+                    targets[start_slot:end_slot], weights[start_slot:end_slot]
+                ):
+                    nd = du + w
+                    mark = stamp_f[v]
+                    if mark == -version or (mark == version and nd >= dist_f[v]):
+                        continue
+                    pv = potential(v)
+                    if pv == inf:
+                        continue
+                    dist_f[v] = nd
+                    parent_f[v] = u
+                    stamp_f[v] = version
+                    heapq.heappush(heap_f, (nd + pv, v))
+                    if stamp_b[v] == version or stamp_b[v] == -version:
+                        candidate = nd + dist_b[v]
+                        if candidate < best_cost:
+                            best_cost = candidate
+                            meeting = v
+
+            if not heap_b:
+                break
+            _, u = heapq.heappop(heap_b)
+            if stamp_b[u] == version:
+                stamp_b[u] = -version
+                settled_backward += 1
+                du = dist_b[u]
+                start_slot, end_slot = reverse_offsets[u], reverse_offsets[u + 1]
+                for v, w in zip(
+                    reverse_targets[start_slot:end_slot],
+                    reverse_weights[start_slot:end_slot],
+                ):
+                    nd = du + w
+                    mark = stamp_b[v]
+                    if mark == -version or (mark == version and nd >= dist_b[v]):
+                        continue
+                    pv = potential(v)
+                    if pv == inf:
+                        continue
+                    dist_b[v] = nd
+                    parent_b[v] = u
+                    stamp_b[v] = version
+                    heapq.heappush(heap_b, (nd - pv, v))
+                    if stamp_f[v] == version or stamp_f[v] == -version:
+                        candidate = dist_f[v] + nd
+                        if candidate < best_cost:
+                            best_cost = candidate
+                            meeting = v
+
+        nodes_explored = settled_forward + settled_backward
+        if meeting < 0:
+            logger.warning(f"No path found from {start} to {goal}")
+            return {
+                "path": [],
+                "cost": inf,
+                "nodes_explored_forward": settled_forward,
+                "nodes_explored_backward": settled_backward,
+                "nodes_explored": nodes_explored,
+                "path_length": 0,
+                "found": False,
+                "meeting_node": None,
+            }
+
+        path_ids = [meeting]
+        while parent_f[path_ids[-1]] >= 0:
+            path_ids.append(parent_f[path_ids[-1]])
+        path_ids.reverse()
+        current = parent_b[meeting]
+        while current >= 0:
+            path_ids.append(current)
+            current = parent_b[current]
+        nodes = index.nodes
+        path = [nodes[i] for i in path_ids]
+
+        logger.info(
+            f"ALT path found: length={len(path)}, cost={best_cost:.2f}, "
+            f"nodes_explored={nodes_explored}"
+        )
+        return {
+            "path": path,
+            "cost": best_cost,
+            "nodes_explored_forward": settled_forward,
+            "nodes_explored_backward": settled_backward,
+            "nodes_explored": nodes_explored,
+            "path_length": len(path),
+            "found": True,
+            "meeting_node": nodes[meeting],
+        }
+
+    def compare_performance(
+        self,
+        graph: Graph,
+        queries: List[Tuple],
+        landmarks: Optional[LandmarkIndex] = None,
+    ) -> Dict[str, any]:
+        """Compare plain and ALT search on the same point-to-point queries.
+
+        Args:
+            graph: Graph instance.
+            queries: List of (start, goal) pairs.
+            landmarks: Landmark index (default: built with config settings).
+
+        Returns:
+            Dictionary with preprocessing time and, per mode, total time,
+            total and mean settled nodes, and whether costs agreed.
+        """
+        if landmarks is None:
+            landmarks = self.build_landmarks(graph)
+
+        results = {
+            "num_queries": len(queries),
+            "num_landmarks": landmarks.num_landmarks,
+            "landmark_selection": landmarks.selection,
+            "preprocessing_seconds": landmarks.preprocessing_seconds,
+            "index_bytes": landmarks.memory_bytes(),
+        }
+        costs: Dict[str, List[float]] = {}
+        for mode, index in (("plain", None), ("alt", landmarks)):
+            try:
+                settled = 0
+                mode_costs = []
+                start_time = time.perf_counter()
+                for start, goal in queries:
+                    result = self.search(graph, start, goal, landmarks=index)
+                    settled += result["nodes_explored"]
+                    mode_costs.append(result["cost"])
+                elapsed = time.perf_counter() - start_time
+                costs[mode] = mode_costs
+                results[mode] = {
+                    "time_seconds": elapsed,
+                    "time_milliseconds": elapsed * 1000,
+                    "nodes_settled": settled,
+                    "mean_nodes_settled": settled / len(queries) if queries else 0.0,
+                    "success": True,
+                }
+            except Exception as e:
+                logger.error(f"{mode} search failed: {e}")
+                results[mode] = {"success": False, "error": str(e)}
+
+        if "plain" in costs and "alt" in costs:
+            results["costs_match"] = all(
+                abs(a - b) <= 1e-9 * max(1.0, abs(a))
+                if a != float("inf") else b == float("inf")
+                for a, b in zip(costs["plain"], costs["alt"])
+            )
+            plain_settled = results["plain"]["nodes_settled"]
+            if plain_settled:
+                results["settled_ratio"] = (
+                    results["alt"]["nodes_settled"] / plain_settled
+                )
+        return results
+
 
 def main() -> None:
     """Main entry point for command-line usage."""
@@ -447,6 +1058,28 @@ def main() -> None:
         action="store_true",
         help="Run test pathfinding problem",
     )
+    parser.add_argument(
+        "--benchmark",
+        type=int,
+        metavar="QUERIES",
+        help="Compare settled nodes of plain and ALT search on random queries",
+    )
+    parser.add_argument(
+        "--grid-size",
+        type=int,
+        default=60,
+        help="Side length of the random benchmark grid (default: 60)",
+    )
+    parser.add_argument(
+        "--landmarks",
+        type=int,
+        help="Number of landmarks for ALT (default: from config)",
+    )
+    parser.add_argument(
+        "--selection",
+        choices=LandmarkIndex.SELECTIONS,
+        help="Landmark selection strategy (default: from config)",
+    )
 
     args = parser.parse_args()
 
@@ -486,6 +1119,42 @@ def main() -> None:
             print(f"Meeting node: {result['meeting_node']}")
             print(f"Path: {result['path'][:5]}...{result['path'][-5:]}")
 
+    if args.benchmark:
+        rng = np.random.default_rng(0)
+        grid = (rng.random((args.grid_size, args.grid_size)) < 0.2).astype(int)
+        graph = Graph(grid=grid, allow_diagonal=True)
+        nodes = sorted(graph.nodes)
+        picks = rng.integers(0, len(nodes), size=(args.benchmark, 2))
+        queries = [(nodes[a], nodes[b]) for a, b in picks]
+
+        index = dijkstra.build_landmarks(
+            graph, num_landmarks=args.landmarks, selection=args.selection
+        )
+        results = dijkstra.compare_performance(graph, queries, index)
+
+        print(
+            f"\nALT Benchmark ({args.grid_size}x{args.grid_size} grid, "
+            f"{args.benchmark} queries):"
+        )
+        print(
+            f"Landmarks: {results['num_landmarks']} ({results['landmark_selection']}), "
+            f"preprocessing {results['preprocessing_seconds'] * 1000:.1f} ms, "
+            f"{results['index_bytes']} bytes"
+        )
+        for mode in ("plain", "alt"):
+            data = results[mode]
+            if data["success"]:
+                print(
+                    f"{mode:>5}: {data['nodes_settled']} nodes settled "
+                    f"({data['mean_nodes_settled']:.1f}/query), "
+                    f"{data['time_milliseconds']:.1f} ms"
+                )
+            else:
+                print(f"{mode:>5}: failed ({data['error']})")
+        if "settled_ratio" in results:
+            print(f"Settled ratio (alt/plain): {results['settled_ratio']:.3f}")
+        print(f"Costs match: {results.get('costs_match')}")
+
 
 if __name__ == "__main__":
     main()
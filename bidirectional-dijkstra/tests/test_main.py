@@ -7,7 +7,7 @@ import numpy as np
 import pytest
 import yaml
 
-from src.main import BidirectionalDijkstra, Graph
+from src.main import BidirectionalDijkstra, Graph, LandmarkIndex
 
 
 class TestGraph:
@@ -335,5 +335,134 @@ class TestBidirectionalDijkstra:
         assert result["nodes_explored"] < 900
 
 
+class TestLandmarkSearch:
+    """Test ALT search over a landmark index."""
+
+    @staticmethod
+    def _reference_cost(graph, start, goal):
+        import heapq
+
+        dist = {start: 0.0}
+        heap = [(0.0, start)]
+        done = set()
+        while heap:
+            d, node = heapq.heappop(heap)
+            if node in done:
+                continue
+            if node == goal:
+                return d
+            done.add(node)
+            for neighbor, weight in graph.get_neighbors(node):
+                if d + weight < dist.get(neighbor, float("inf")):
+                    dist[neighbor] = d + weight
+                    heapq.heappush(heap, (d + weight, neighbor))
+        return float("inf")
+
+    @pytest.mark.parametrize("selection", ["farthest", "avoid", "random"])
+    def test_alt_matches_reference_on_grid(self, selection):
+        """Test ALT costs against plain Dijkstra on a grid with obstacles."""
+        grid = (np.random.default_rng(4).random((15, 15)) < 0.25).astype(int)
+        graph = Graph(grid=grid, allow_diagonal=True)
+        dijkstra = BidirectionalDijkstra()
+        index = dijkstra.build_landmarks(graph, num_landmarks=4, selection=selection)
+        nodes = sorted(graph.nodes)
+        rng = np.random.default_rng(5)
+        for a, b in rng.integers(0, len(nodes), size=(25, 2)):
+            start, goal = nodes[a], nodes[b]
+            result = dijkstra.search(graph, start, goal, landmarks=index)
+            expected = self._reference_cost(graph, start, goal)
+            if expected == float("inf"):
+                assert result["found"] is False
+            else:
+                assert result["cost"] == pytest.approx(expected)
+                assert result["path"][0] == start
+                assert result["path"][-1] == goal
+
+    def test_alt_directed_graph(self):
+        """Test that ALT follows edge direction in the backward search."""
+        adjacency_list = {
+            0: [(1, 1.0)],
+            1: [(2, 1.0)],
+            2: [(0, 1.0), (3, 5.0)],
+            3: [(0, 1.0)],
+        }
+        graph = Graph(adjacency_list=adjacency_list)
+        dijkstra = BidirectionalDijkstra()
+        index = dijkstra.build_landmarks(graph, num_landmarks=2)
+
+        result = dijkstra.search(graph, 0, 3, landmarks=index)
+        assert result["path"] == [0, 1, 2, 3]
+        assert result["cost"] == 7.0
+
+        result = dijkstra.search(graph, 3, 2, landmarks=index)
+        assert result["path"] == [3, 0, 1, 2]
+        assert result["cost"] == 3.0
+
+    def test_alt_no_path(self):
+        """Test ALT between disconnected components."""
+        graph = Graph(adjacency_list={0: [(1, 1.0)], 1: [], 2: [(3, 1.0)], 3: []})
+        dijkstra = BidirectionalDijkstra()
+        index = dijkstra.build_landmarks(graph, num_landmarks=2)
+        result = dijkstra.search(graph, 0, 3, landmarks=index)
+        assert result["found"] is False
+        assert result["cost"] == float("inf")
+
+    def test_alt_settles_fewer_nodes(self):
+        """Test that ALT settles fewer nodes than plain search."""
+        graph = Graph(grid=np.zeros((30, 30)), allow_diagonal=True)
+        dijkstra = BidirectionalDijkstra()
+        index = dijkstra.build_landmarks(graph, num_landmarks=4)
+        plain = dijkstra.search(graph, (0, 0), (29, 29))
+        alt = dijkstra.search(graph, (0, 0), (29, 29), landmarks=index)
+        assert alt["cost"] == pytest.approx(plain["cost"])
+        assert alt["nodes_explored"] < plain["nodes_explored"]
+
+    def test_index_reused_across_queries(self):
+        """Test that repeated queries on one index give consistent results."""
+        graph = Graph(grid=np.zeros((10, 10)), allow_diagonal=False)
+        dijkstra = BidirectionalDijkstra()
+        index = dijkstra.build_landmarks(graph, num_landmarks=3)
+        first = dijkstra.search(graph, (0, 0), (9, 9), landmarks=index)
+        dijkstra.search(graph, (9, 0), (0, 9), landmarks=index)
+        again = dijkstra.search(graph, (0, 0), (9, 9), landmarks=index)
+        assert first["cost"] == again["cost"] == 18.0
+        assert first["nodes_explored"] == again["nodes_explored"]
+
+    def test_index_layout(self):
+        """Test landmark table sizes and landmark count capping."""
+        graph = Graph(adjacency_list={0: [(1, 2.0)], 1: [(0, 2.0)]})
+        index = LandmarkIndex(graph, num_landmarks=5, selection="farthest")
+        assert index.num_landmarks == 2
+        assert len(index.from_landmark) == len(index.to_landmark) == 4
+        assert index.memory_bytes() > 0
+
+    def test_index_validation(self):
+        """Test invalid landmark settings and mismatched graphs."""
+        graph = Graph(adjacency_list={0: [(1, 1.0)], 1: []})
+        with pytest.raises(ValueError):
+            LandmarkIndex(graph, num_landmarks=0)
+        with pytest.raises(ValueError):
+            LandmarkIndex(graph, selection="closest")
+        with pytest.raises(ValueError):
+            LandmarkIndex(Graph(adjacency_list={0: [(1, -1.0)], 1: []}))
+
+        other = Graph(adjacency_list={0: [(1, 1.0)], 1: []})
+        index = LandmarkIndex(other, num_landmarks=1)
+        with pytest.raises(ValueError, match="different graph"):
+            BidirectionalDijkstra().search(graph, 0, 1, landmarks=index)
+
+    def test_compare_performance(self):
+        """Test the plain versus ALT benchmark."""
+        graph = Graph(grid=np.zeros((12, 12)), allow_diagonal=True)
+        dijkstra = BidirectionalDijkstra()
+        queries = [((0, 0), (11, 11)), ((0, 11), (11, 0)), ((5, 5), (5, 5))]
+        results = dijkstra.compare_performance(graph, queries)
+        assert results["plain"]["success"] is True
+        assert results["alt"]["success"] is True
+        assert "costs_match" in results
+        assert results["alt"]["nodes_settled"] <= results["plain"]["nodes_settled"]
+        assert results["preprocessing_seconds"] >= 0
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -3,14 +3,16 @@
 This module provides functionality to implement the blossom algorithm (Edmonds'
 algorithm) that finds maximum matching in general graphs. The algorithm handles
 odd cycles (blossoms) by contracting them and then expanding after finding
-augmenting paths.
+augmenting paths. Searches start from a greedy maximal matching, run over
+flat adjacency arrays and prune Hungarian trees left by failed searches.
 """
 
 import logging
 import logging.handlers
-from collections import deque
+import random
+import time
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import yaml
 from dotenv import load_dotenv
@@ -24,6 +26,11 @@ logger = logging.getLogger(__name__)
 class BlossomAlgorithm:
     """Blossom algorithm for maximum matching in general graphs."""
 
+    METHODS = ("auto", "blossom", "hopcroft_karp")
+    # Below this many edges the pruned blossom search beats Hopcroft-Karp
+    # on bipartite graphs (see benchmark_crossover)
+    HOPCROFT_KARP_MIN_EDGES = 100000
+
     def __init__(self, num_vertices: int, config_path: str = "config.yaml") -> None:
         """Initialize blossom algorithm.
 
@@ -34,14 +41,69 @@ class BlossomAlgorithm:
         self.num_vertices = num_vertices
         self.graph: List[List[int]] = [[] for _ in range(num_vertices)]
         self.matching: List[Optional[int]] = [None] * num_vertices
-        self.parent: List[Optional[int]] = [None] * num_vertices
-        self.base: List[int] = list(range(num_vertices))
-        self.in_queue: List[bool] = [False] * num_vertices
-        self.in_blossom: List[int] = list(range(num_vertices))
+        self.stats: Dict[str, float] = {}
         self._setup_logging()
         self._load_config(config_path)
         logger.info(f"Initialized blossom algorithm for {num_vertices} vertices")
 
+    @classmethod
+    def random(
+        cls,
+        num_vertices: int,
+        num_edges: int,
+        seed: Optional[int] = None,
+        config_path: str = "config.yaml",
+        bipartite: bool = False,
+    ) -> "BlossomAlgorithm":
+        """Create a random sparse graph for benchmarking.
+
+        Args:
+            num_vertices: Number of vertices.
+            num_edges: Number of distinct undirected edges to generate.
+            seed: Optional random seed for reproducibility.
+            config_path: Path to configuration file.
+            bipartite: If True, every edge joins a vertex below
+                num_vertices // 2 to one at or above it.
+
+        Returns:
+            BlossomAlgorithm instance over the random graph.
+
+        Raises:
+            ValueError: If more edges are requested than the graph can hold.
+        """
+        half = num_vertices // 2
+        if bipartite:
+            max_edges = half * (num_vertices - half)
+        else:
+            max_edges = num_vertices * (num_vertices - 1) // 2
+        if num_edges > max_edges:
+            raise ValueError(
+                f"Too many edges for {num_vertices} vertices: {num_edges}"
+            )
+
+        rng = random.Random(seed)
+        blossom = cls(num_vertices, config_path=config_path)
+        seen = set()
+        while len(seen) < num_edges:
+            if bipartite:
+                u = rng.randrange(half)
+                v = rng.randrange(half, num_vertices)
+            else:
+                u = rng.randrange(num_vertices)
+                v = rng.randrange(num_vertices)
+            if u == v:
+                continue
+            key = (u, v) if u < v else (v, u)
+            if key in seen:
+                continue
+            seen.add(key)
+            blossom.graph[u].append(v)
+            blossom.graph[v].append(u)
+        logger.info(
+            f"Generated random graph: {num_vertices} vertices, {num_edges} edges"
+        )
+        return blossom
+
     def _setup_logging(self) -> None:
         """Configure logging for blossom algorithm operations."""
         log_dir = Path("logs")
@@ -97,7 +159,188 @@ class BlossomAlgorithm:
         if u not in self.graph[v]:
             self.graph[v].append(u)
 
-        logger.info(f"Added edge ({u}, {v})")
+        logger.debug(f"Added edge ({u}, {v})")
+
+    def _build_adjacency(self) -> Tuple[List[int], List[int]]:
+        """Flatten adjacency lists into offset and target arrays.
+
+        Neighbors of u are targets[offsets[u]:offsets[u + 1]].
+
+        Returns:
+            Tuple of (offsets, targets).
+        """
+        offsets = [0] * (self.num_vertices + 1)
+        targets: List[int] = []
+        for u, neighbors in enumerate(self.graph):
+            targets.extend(neighbors)
+            offsets[u + 1] = len(targets)
+        return offsets, targets
+
+    def _greedy_matching(self, offsets: List[int], targets: List[int]) -> int:
+        """Extend the matching greedily to a maximal matching.
+
+        Vertices are visited by increasing degree, and each is matched to
+        its free neighbor of smallest degree, which leaves high-degree
+        vertices available for the rest of the graph.
+
+        Args:
+            offsets: Adjacency offsets from _build_adjacency.
+            targets: Adjacency targets from _build_adjacency.
+
+        Returns:
+            Number of edges added to the matching.
+        """
+        mate = self._mate
+        degree = [offsets[u + 1] - offsets[u] for u in range(self.num_vertices)]
+        added = 0
+        for u in sorted(range(self.num_vertices), key=degree.__getitem__):
+            if mate[u] != -1:
+                continue
+            best = -1
+            for i in range(offsets[u], offsets[u + 1]):
+                v = targets[i]
+                if mate[v] == -1 and (best == -1 or degree[v] < degree[best]):
+                    best = v
+            if best != -1:
+                mate[u] = best
+                mate[best] = u
+                added += 1
+        return added
+
+    def _bipartition(
+        self, offsets: List[int], targets: List[int]
+    ) -> Optional[List[int]]:
+        """Two-color the graph by BFS.
+
+        Args:
+            offsets: Adjacency offsets from _build_adjacency.
+            targets: Adjacency targets from _build_adjacency.
+
+        Returns:
+            Color (0 or 1) per vertex, or None if the graph has an odd cycle.
+        """
+        color = [-1] * self.num_vertices
+        for start in range(self.num_vertices):
+            if color[start] != -1:
+                continue
+            color[start] = 0
+            queue = [start]
+            head = 0
+            while head < len(queue):
+                u = queue[head]
+                head += 1
+                for i in range(offsets[u], offsets[u + 1]):
+                    v = targets[i]
+                    if color[v] == -1:
+                        color[v] = color[u] ^ 1
+                        queue.append(v)
+                    elif color[v] == color[u]:
+                        return None
+        return color
+
+    def _hopcroft_karp(
+        self, offsets: List[int], targets: List[int], color: List[int]
+    ) -> None:
+        """Augment the matching to maximum with Hopcroft-Karp.
+
+        Each phase builds BFS layers from the free color-0 vertices up to
+        the first layer that reaches a free vertex, then finds a maximal set
+        of vertex-disjoint shortest augmenting paths with an iterative DFS
+        that keeps a current-edge pointer per vertex. O(sqrt(V)) phases of
+        O(E) each give O(E * sqrt(V)).
+
+        Args:
+            offsets: Adjacency offsets from _build_adjacency.
+            targets: Adjacency targets from _build_adjacency.
+            color: Bipartition from _bipartition.
+        """
+        mate = self._mate
+        unreached = self.num_vertices + 1
+        dist = [unreached] * self.num_vertices
+        edge_index = [0] * self.num_vertices
+        free = [
+            u for u in range(self.num_vertices) if color[u] == 0 and mate[u] == -1
+        ]
+
+        while free:
+            for u in free:
+                dist[u] = 0
+            queue = list(free)
+            limit = unreached
+            head = 0
+            while head < len(queue):
+                u = queue[head]
+                head += 1
+                depth = dist[u]
+                if depth > limit:
+                    break
+                edge_index[u] = offsets[u]
+                for v in targets[offsets[u]:offsets[u + 1]]:
+                    w = mate[v]
+                    if w == -1:
+                        limit = depth
+                    elif dist[w] == unreached and depth < limit:
+                        dist[w] = depth + 1
+                        queue.append(w)
+            if limit == unreached:
+                break
+            self.stats["phases"] += 1
+
+            for root in free:
+                stack = [root]
+                while stack:
+                    u = stack[-1]
+                    i = edge_index[u]
+                    end = offsets[u + 1]
+                    at_limit = dist[u] == limit
+                    next_depth = dist[u] + 1
+                    w = unreached
+                    while i < end:
+                        w = mate[targets[i]]
+                        if w == -1:
+                            if at_limit:
+                                break
+                        elif dist[w] == next_depth and not at_limit:
+                            break
+                        i += 1
+                    edge_index[u] = i
+
+                    if i == end:
+                        dist[u] = unreached
+                        stack.pop()
+                        if stack:
+                            edge_index[stack[-1]] += 1
+                    elif w != -1:
+                        stack.append(w)
+                    else:
+                        for x in stack:
+                            v = targets[edge_index[x]]
+                            mate[x] = v
+                            mate[v] = x
+                        self.stats["augmentations"] += 1
+                        break
+
+            for u in queue:
+                dist[u] = unreached
+            free = [u for u in free if mate[u] == -1]
+
+    def _find_base(self, v: int) -> int:
+        """Find the base of the outermost blossom containing v.
+
+        Blossoms are stored as a union-find forest with path halving, so a
+        contraction only touches the vertices on the blossom's cycle.
+
+        Args:
+            v: Vertex.
+
+        Returns:
+            Base vertex of v's blossom (v itself if not in a blossom).
+        """
+        forest = self._blossom_parent
+        while forest[v] != v:
+            forest[v] = forest[forest[v]]
+            v = forest[v]
+        return self._blossom_base[v]
 
     def _lca(self, u: int, v: int) -> int:
         """Find lowest common ancestor in alternating tree.
@@ -109,96 +352,130 @@ class BlossomAlgorithm:
         Returns:
             Lowest common ancestor.
         """
-        used: Set[int] = set()
+        find_base = self._find_base
+        mate = self._mate
+        parent = self._parent
+        mark = self._lca_mark
+        self._lca_stamp += 1
+        stamp = self._lca_stamp
         while True:
-            u = self.base[u]
-            used.add(u)
-            if self.matching[u] is None:
+            u = find_base(u)
+            mark[u] = stamp
+            if mate[u] == -1:
                 break
-            u = self.parent[self.matching[u]]
+            u = parent[mate[u]]
 
         while True:
-            v = self.base[v]
-            if v in used:
+            v = find_base(v)
+            if mark[v] == stamp:
                 return v
-            v = self.parent[self.matching[v]]
+            v = parent[mate[v]]
 
-    def _mark_path(self, v: int, b: int, children: List[int]) -> None:
-        """Mark path in blossom.
+    def _mark_path(self, v: int, b: int, child: int, members: List[int]) -> None:
+        """Mark path from v up to blossom base b.
+
+        Parent pointers of the odd vertices on the path are redirected
+        across the blossom so augmenting paths can later walk through it.
 
         Args:
             v: Current vertex.
             b: Base vertex.
-            children: Children list.
+            child: Vertex on the other side of the blossom edge.
+            members: Receives the bases of the blossoms being absorbed.
         """
-        while self.base[v] != b:
-            u = self.matching[v]
-            children.append(u)
-            self.in_blossom[self.base[u]] = True
-            self.in_blossom[self.base[v]] = True
-            v = self.parent[u]
-            if self.base[v] != b:
-                children.append(v)
-
-    def _contract_blossom(self, u: int, v: int) -> None:
+        find_base = self._find_base
+        mate = self._mate
+        parent = self._parent
+        while find_base(v) != b:
+            u = mate[v]
+            members.append(find_base(v))
+            members.append(find_base(u))
+            parent[v] = child
+            child = u
+            v = parent[u]
+
+    def _contract_blossom(self, u: int, v: int, queue: List[int]) -> None:
         """Contract blossom (odd cycle).
 
+        The bases on the cycle are merged into b's union-find set, so the
+        cost is proportional to the cycle length rather than the tree size.
+        Odd vertices on the cycle are singletons, the only blossom members
+        not yet queued.
+
         Args:
             u: First vertex in cycle.
             v: Second vertex in cycle.
+            queue: Search queue; odd vertices of the blossom become even and
+                are appended.
         """
         b = self._lca(u, v)
-        blossom: List[int] = []
-        self._mark_path(u, b, blossom)
-        self._mark_path(v, b, blossom)
-
-        for i in range(self.num_vertices):
-            if self.in_blossom[self.base[i]]:
-                self.base[i] = b
-                if not self.in_queue[i]:
-                    self.in_queue[i] = True
-
-    def _find_augmenting_path(self, root: int) -> bool:
+        members: List[int] = []
+        self._mark_path(u, b, v, members)
+        self._mark_path(v, b, u, members)
+
+        forest = self._blossom_parent
+        root = b
+        while forest[root] != root:
+            root = forest[root]
+        in_queue = self._in_queue
+        for x in members:
+            if not in_queue[x]:
+                in_queue[x] = True
+                queue.append(x)
+            while forest[x] != x:
+                x = forest[x]
+            if x != root:
+                forest[x] = root
+        self._blossom_base[root] = b
+        self.stats["blossoms"] += 1
+
+    def _find_augmenting_path(
+        self, root: int, offsets: List[int], targets: List[int]
+    ) -> int:
         """Find augmenting path from root.
 
         Args:
             root: Root vertex.
+            offsets: Adjacency offsets from _build_adjacency.
+            targets: Adjacency targets from _build_adjacency.
 
         Returns:
-            True if augmenting path found, False otherwise.
+            Free vertex ending the augmenting path, or -1 if none exists.
         """
-        for i in range(self.num_vertices):
-            self.parent[i] = None
-            self.in_queue[i] = False
-            self.base[i] = i
-            self.in_blossom[i] = False
-
-        queue: deque = deque()
-        queue.append(root)
-        self.in_queue[root] = True
-        self.parent[root] = None
-
-        while queue:
-            u = queue.popleft()
-
-            for v in self.graph[u]:
-                if self.base[u] == self.base[v] or self.matching[u] == v:
+        find_base = self._find_base
+        mate = self._mate
+        parent = self._parent
+        in_queue = self._in_queue
+        dead = self._dead
+        touched = self._touched
+
+        queue = [root]
+        in_queue[root] = True
+        touched.append(root)
+        head = 0
+
+        while head < len(queue):
+            u = queue[head]
+            head += 1
+
+            for i in range(offsets[u], offsets[u + 1]):
+                v = targets[i]
+                if dead[v] or mate[u] == v or find_base(u) == find_base(v):
                     continue
 
-                if v == root or (
-                    self.matching[v] is not None and self.parent[self.matching[v]] is not None
-                ):
-                    blossom_base = self._lca(u, v)
-                    self._contract_blossom(u, v)
-                elif self.parent[v] is None:
-                    self.parent[v] = u
-                    if self.matching[v] is None:
-                        return True
-                    matched_v = self.matching[v]
-                    self.in_queue[matched_v] = True
+                if v == root or (mate[v] != -1 and parent[mate[v]] != -1):
+                    self._contract_blossom(u, v, queue)
+                elif parent[v] == -1:
+                    parent[v] = u
+                    touched.append(v)
+                    if mate[v] == -1:
+                        return v
+                    matched_v = mate[v]
+                    in_queue[matched_v] = True
+                    touched.append(matched_v)
                     queue.append(matched_v)
 
-        return False
+        return -1
 
     def _augment_path(self, v: int) -> None:
         """Augment matching along path.
@@ -206,33 +483,136 @@ class BlossomAlgorithm:
         Args:
             v: End vertex of augmenting path.
         """
-        while v is not None:
-            u = self.parent[v]
-            w = self.matching[u]
-            self.matching[v] = u
-            self.matching[u] = v
+        mate = self._mate
+        parent = self._parent
+        while v != -1:
+            u = parent[v]
+            w = mate[u]
+            mate[v] = u
+            mate[u] = v
             v = w
 
-    def find_maximum_matching(self) -> Dict[int, int]:
+    def _reset_search(self) -> None:
+        """Reset search state for the vertices touched by the last search."""
+        parent = self._parent
+        forest = self._blossom_parent
+        blossom_base = self._blossom_base
+        in_queue = self._in_queue
+        for v in self._touched:
+            parent[v] = -1
+            forest[v] = v
+            blossom_base[v] = v
+            in_queue[v] = False
+        self._touched.clear()
+
+    def find_maximum_matching(
+        self, greedy_init: bool = True, method: str = "auto"
+    ) -> Dict[int, int]:
         """Find maximum matching in graph.
 
+        Starts from the current matching, optionally extended greedily to a
+        maximal matching. Large bipartite graphs go to Hopcroft-Karp,
+        O(E sqrt(V)). Otherwise a search runs once from every free vertex.
+        Search state is reset only for the vertices a search touched. When
+        a search fails its tree is Hungarian: no later augmenting path can use those
+        vertices, so they are pruned for the rest of the run. Each vertex
+        therefore enters at most one failed tree, giving O(V * E) overall.
+
+        Args:
+            greedy_init: Whether to start from a greedy maximal matching
+                (default: True).
+            method: "auto" (default) uses Hopcroft-Karp when the graph is
+                bipartite with at least HOPCROFT_KARP_MIN_EDGES edges and
+                blossom search otherwise; "blossom" or "hopcroft_karp" force
+                an engine.
+
         Returns:
             Dictionary mapping vertex to its matched vertex.
+
+        Raises:
+            ValueError: If method is unknown, or hopcroft_karp is requested
+                for a non-bipartite graph.
         """
-        for i in range(self.num_vertices):
-            if self.matching[i] is None:
-                if self._find_augmenting_path(i):
-                    self._augment_path(i)
+        if method not in self.METHODS:
+            raise ValueError(
+                f"Unknown method: {method}. Use one of {', '.join(self.METHODS)}"
+            )
+
+        start_time = time.perf_counter()
+        n = self.num_vertices
+        offsets, targets = self._build_adjacency()
+
+        color = None
+        if method == "hopcroft_karp" or (
+            method == "auto" and len(targets) >= 2 * self.HOPCROFT_KARP_MIN_EDGES
+        ):
+            color = self._bipartition(offsets, targets)
+            if color is None and method == "hopcroft_karp":
+                raise ValueError("Graph is not bipartite")
+
+        self._mate = [-1 if m is None else m for m in self.matching]
+        self._parent = [-1] * n
+        self._blossom_parent = list(range(n))
+        self._blossom_base = list(range(n))
+        self._in_queue = [False] * n
+        self._dead = [False] * n
+        self._touched: List[int] = []
+        self._lca_mark = [0] * n
+        self._lca_stamp = 0
+        self.stats = {
+            "method": "blossom" if color is None else "hopcroft_karp",
+            "greedy_matched": 0,
+            "searches": 0,
+            "phases": 0,
+            "augmentations": 0,
+            "blossoms": 0,
+            "pruned_vertices": 0,
+        }
+
+        if greedy_init:
+            self.stats["greedy_matched"] = self._greedy_matching(offsets, targets)
+
+        mate = self._mate
+        dead = self._dead
+        if color is not None:
+            self._hopcroft_karp(offsets, targets, color)
+        else:
+            for root in range(n):
+                if mate[root] != -1 or dead[root]:
+                    continue
+                self.stats["searches"] += 1
+                end = self._find_augmenting_path(root, offsets, targets)
+                if end != -1:
+                    self._augment_path(end)
+                    self.stats["augmentations"] += 1
+                else:
+                    for v in self._touched:
+                        dead[v] = True
+                    self.stats["pruned_vertices"] += len(self._touched)
+                self._reset_search()
+
+        self.matching = [None if m == -1 else m for m in mate]
+        self.stats["time_seconds"] = time.perf_counter() - start_time
 
         matching_dict: Dict[int, int] = {}
-        for i in range(self.num_vertices):
+        for i in range(n):
             if self.matching[i] is not None and i < self.matching[i]:
                 matching_dict[i] = self.matching[i]
 
         matching_size = len(matching_dict)
-        logger.info(f"Found maximum matching of size {matching_size}")
+        logger.info(
+            f"Found maximum matching of size {matching_size} "
+            f"with {self.stats['method']} "
+            f"(greedy {self.stats['greedy_matched']}, "
+            f"augmentations {self.stats['augmentations']}, "
+            f"blossoms {self.stats['blossoms']})"
+        )
         return matching_dict
 
+    def reset_matching(self) -> None:
+        """Clear the current matching."""
+        self.matching = [None] * self.num_vertices
+
     def get_matching_size(self) -> int:
         """Get size of current matching.
 
@@ -279,9 +659,285 @@ class BlossomAlgorithm:
 
         return self.matching[vertex]
 
+    def compare_performance(self, iterations: int = 1) -> Dict[str, any]:
+        """Compare matching engines and initialization.
+
+        Blossom search runs with and without greedy initialization; bipartite
+        graphs also run Hopcroft-Karp. Each run starts from an empty
+        matching. The matching from the last run is left in place.
+
+        Args:
+            iterations: Number of iterations for timing (default: 1).
+
+        Returns:
+            Dictionary containing performance data per mode and whether the
+            matching sizes agree.
+        """
+        num_edges = sum(len(neighbors) for neighbors in self.graph) // 2
+        logger.info(
+            f"Performance comparison: {self.num_vertices} vertices, "
+            f"{num_edges} edges, iterations={iterations}"
+        )
+
+        results: Dict[str, any] = {
+            "num_vertices": self.num_vertices,
+            "num_edges": num_edges,
+            "iterations": iterations,
+            "modes": ["greedy_init", "empty_init"],
+        }
+        offsets, targets = self._build_adjacency()
+        results["bipartite"] = self._bipartition(offsets, targets) is not None
+        if results["bipartite"]:
+            results["modes"].append("hopcroft_karp")
+
+        for mode in results["modes"]:
+            try:
+                start_time = time.perf_counter()
+                for _ in range(iterations):
+                    self.reset_matching()
+                    matching = self.find_maximum_matching(
+                        greedy_init=mode != "empty_init",
+                        method="hopcroft_karp" if mode == "hopcroft_karp"
+                        else "blossom",
+                    )
+                elapsed = (time.perf_counter() - start_time) / iterations
+                results[mode] = {
+                    "matching_size": len(matching),
+                    "stats": dict(self.stats),
+                    "time_seconds": elapsed,
+                    "time_milliseconds": elapsed * 1000,
+                    "success": True,
+                }
+            except Exception as e:
+                logger.error(f"{mode} failed: {e}")
+                results[mode] = {"success": False, "error": str(e)}
+
+        sizes = {
+            results[mode]["matching_size"]
+            for mode in results["modes"]
+            if results[mode]["success"]
+        }
+        results["all_match"] = len(sizes) <= 1
+        return results
+
+    @classmethod
+    def benchmark_crossover(
+        cls,
+        sizes: List[int],
+        average_degree: float = 3.0,
+        seed: Optional[int] = None,
+        config_path: str = "config.yaml",
+    ) -> Dict[str, any]:
+        """Time blossom search against Hopcroft-Karp on random bipartite graphs.
+
+        Both engines start from the greedy matching.
+
+        Args:
+            sizes: Vertex counts to benchmark.
+            average_degree: Average vertex degree of each graph (default: 3.0).
+            seed: Optional random seed for reproducibility.
+            config_path: Path to configuration file.
+
+        Returns:
+            Dictionary with one row per size (vertices, edges, timings and
+            matching size) and the smallest size where Hopcroft-Karp was
+            faster ("crossover", None if it never was).
+        """
+        rows = []
+        crossover = None
+        for num_vertices in sizes:
+            num_edges = int(num_vertices * average_degree / 2)
+            blossom = cls.random(
+                num_vertices,
+                num_edges,
+                seed=seed,
+                config_path=config_path,
+                bipartite=True,
+            )
+            row: Dict[str, any] = {
+                "num_vertices": num_vertices,
+                "num_edges": num_edges,
+            }
+            for method in ("blossom", "hopcroft_karp"):
+                blossom.reset_matching()
+                matching = blossom.find_maximum_matching(method=method)
+                row[f"{method}_milliseconds"] = (
+                    blossom.stats["time_seconds"] * 1000
+                )
+                row["matching_size"] = len(matching)
+            rows.append(row)
+            if (
+                crossover is None
+                and row["hopcroft_karp_milliseconds"] < row["blossom_milliseconds"]
+            ):
+                crossover = num_vertices
+
+        logger.info(f"Hopcroft-Karp crossover at {crossover} vertices")
+        return {
+            "average_degree": average_degree,
+            "rows": rows,
+            "crossover": crossover,
+        }
+
+    def generate_report(
+        self,
+        performance_data: Dict[str, any],
+        output_path: Optional[str] = None,
+    ) -> str:
+        """Generate performance report for maximum matching.
+
+        Args:
+            performance_data: Performance data from compare_performance().
+            output_path: Optional path to save report file.
+
+        Returns:
+            Report content as string.
+        """
+        report_lines = [
+            "=" * 80,
+            "BLOSSOM ALGORITHM PERFORMANCE REPORT",
+            "=" * 80,
+            "",
+            f"Vertices: {performance_data['num_vertices']}",
+            f"Edges: {performance_data['num_edges']}",
+            f"Bipartite: {performance_data['bipartite']}",
+            f"Iterations: {performance_data['iterations']}",
+            "",
+            "RESULTS",
+            "-" * 80,
+        ]
+
+        for mode in performance_data["modes"]:
+            data = performance_data[mode]
+            report_lines.append(f"\n{mode}:")
+            if data.get("success", False):
+                stats = data["stats"]
+                report_lines.append(f"  Matching size: {data['matching_size']}")
+                report_lines.append(
+                    f"  Time: {data['time_milliseconds']:.4f} ms "
+                    f"({data['time_seconds']:.6f} seconds)"
+                )
+                report_lines.append(
+                    f"  Greedy matched: {stats['greedy_matched']}, "
+                    f"searches: {stats['searches']}, "
+                    f"phases: {stats['phases']}, "
+                    f"augmentations: {stats['augmentations']}"
+                )
+                report_lines.append(
+                    f"  Blossoms: {stats['blossoms']}, "
+                    f"pruned vertices: {stats['pruned_vertices']}"
+                )
+            else:
+                report_lines.append("  Status: Failed")
+                report_lines.append(f"  Error: {data.get('error', 'Unknown')}")
+
+        report_lines.extend([
+            "",
+            f"All results match: {performance_data['all_match']}",
+        ])
+
+        crossover_data = performance_data.get("crossover")
+        if crossover_data:
+            report_lines.extend([
+                "",
+                "BLOSSOM VS HOPCROFT-KARP (bipartite, average degree "
+                f"{crossover_data['average_degree']})",
+                "-" * 80,
+                f"{'Vertices':>10} {'Edges':>10} {'Blossom ms':>12} "
+                f"{'HK ms':>12} {'Matching':>10}",
+            ])
+            for row in crossover_data["rows"]:
+                report_lines.append(
+                    f"{row['num_vertices']:>10} {row['num_edges']:>10} "
+                    f"{row['blossom_milliseconds']:>12.2f} "
+                    f"{row['hopcroft_karp_milliseconds']:>12.2f} "
+                    f"{row['matching_size']:>10}"
+                )
+            report_lines.append(
+                f"Hopcroft-Karp faster from: {crossover_data['crossover']} vertices"
+            )
+
+        report_content = "\n".join(report_lines)
+
+        if output_path:
+            try:
+                output_file = Path(output_path)
+                output_file.parent.mkdir(parents=True, exist_ok=True)
+                with open(output_file, "w", encoding="utf-8") as f:
+                    f.write(report_content)
+                logger.info(f"Report saved to {output_path}")
+            except (IOError, PermissionError) as e:
+                logger.error(f"Failed to save report: {e}")
+                raise
+
+        return report_content
+
 
 def main() -> None:
     """Main function to demonstrate blossom algorithm."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Maximum matching in general graphs using the blossom "
+        "algorithm"
+    )
+    parser.add_argument(
+        "--benchmark",
+        action="store_true",
+        help="Benchmark matching on a random sparse graph",
+    )
+    parser.add_argument(
+        "--vertices",
+        type=int,
+        default=50000,
+        help="Vertices in benchmark graph (default: 50000)",
+    )
+    parser.add_argument(
+        "--edges",
+        type=int,
+        default=100000,
+        help="Edges in benchmark graph (default: 100000)",
+    )
+    parser.add_argument(
+        "--bipartite",
+        action="store_true",
+        help="Generate a bipartite benchmark graph",
+    )
+    parser.add_argument(
+        "--crossover",
+        nargs="+",
+        type=int,
+        metavar="VERTICES",
+        help="Also time blossom against Hopcroft-Karp on random bipartite "
+        "graphs of these sizes",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=42,
+        help="Random seed for benchmark graph (default: 42)",
+    )
+    parser.add_argument(
+        "-r",
+        "--report",
+        help="Output path for performance report",
+    )
+    args = parser.parse_args()
+
+    if args.benchmark:
+        blossom = BlossomAlgorithm.random(
+            args.vertices, args.edges, seed=args.seed, bipartite=args.bipartite
+        )
+        performance = blossom.compare_performance()
+        if args.crossover:
+            performance["crossover"] = BlossomAlgorithm.benchmark_crossover(
+                args.crossover,
+                average_degree=2 * args.edges / args.vertices,
+                seed=args.seed,
+            )
+        print(blossom.generate_report(performance, output_path=args.report))
+        return
+
     print("Blossom Algorithm for Maximum Matching Demo")
     print("=" * 50)
 
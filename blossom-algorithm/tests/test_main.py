@@ -1,5 +1,7 @@
 """Unit tests for blossom algorithm module."""
 
+import functools
+import random
 import tempfile
 from pathlib import Path
 
@@ -9,6 +11,30 @@ import yaml
 from src.main import BlossomAlgorithm
 
 
+def _brute_force_matching_size(num_vertices, edges):
+    """Maximum matching size by exhaustive search over vertex subsets."""
+    adjacency = [0] * num_vertices
+    for u, v in edges:
+        adjacency[u] |= 1 << v
+        adjacency[v] |= 1 << u
+
+    @functools.lru_cache(maxsize=None)
+    def best(mask):
+        if mask == 0:
+            return 0
+        u = (mask & -mask).bit_length() - 1
+        rest = mask & ~(1 << u)
+        result = best(rest)
+        candidates = adjacency[u] & rest
+        while candidates:
+            bit = candidates & -candidates
+            result = max(result, 1 + best(rest & ~bit))
+            candidates ^= bit
+        return result
+
+    return best((1 << num_vertices) - 1)
+
+
 class TestBlossomAlgorithm:
     """Test cases for BlossomAlgorithm class."""
 
@@ -198,3 +224,175 @@ class TestBlossomAlgorithm:
 
         matching = blossom.find_maximum_matching()
         assert blossom.get_matching_size() >= 2
+
+    def test_blossom_requires_contraction(self, config_file):
+        """Test augmenting path that passes through a blossom."""
+        blossom = BlossomAlgorithm(6, config_path=config_file)
+        for u, v in [(0, 1), (1, 2), (2, 3), (3, 4), (4, 0), (1, 5)]:
+            blossom.add_edge(u, v)
+
+        blossom.find_maximum_matching(greedy_init=False)
+        assert blossom.get_matching_size() == 3
+        assert blossom.get_matched_vertex(5) == 1
+        assert blossom.stats["blossoms"] == 1
+
+    def test_random_graphs_match_brute_force(self, config_file):
+        """Test random graphs against exhaustive search."""
+        rng = random.Random(11)
+        for _ in range(60):
+            n = rng.randint(1, 10)
+            edges = [
+                (u, v)
+                for u in range(n)
+                for v in range(u + 1, n)
+                if rng.random() < 0.35
+            ]
+            expected = _brute_force_matching_size(n, edges)
+            for greedy_init in (True, False):
+                blossom = BlossomAlgorithm(n, config_path=config_file)
+                for u, v in edges:
+                    blossom.add_edge(u, v)
+                matching = blossom.find_maximum_matching(greedy_init=greedy_init)
+                assert len(matching) == expected
+                for u, v in matching.items():
+                    assert v in blossom.graph[u]
+
+    def test_greedy_init_stats(self, config_file):
+        """Test greedy initialization does most of the matching on a path."""
+        blossom = BlossomAlgorithm(8, config_path=config_file)
+        for i in range(7):
+            blossom.add_edge(i, i + 1)
+
+        blossom.find_maximum_matching()
+        assert blossom.get_matching_size() == 4
+        assert blossom.stats["greedy_matched"] + blossom.stats[
+            "augmentations"
+        ] == 4
+
+    def test_random_graph(self, config_file):
+        """Test random graph generation."""
+        blossom = BlossomAlgorithm.random(50, 80, seed=1, config_path=config_file)
+        assert sum(len(neighbors) for neighbors in blossom.graph) == 160
+        assert all(v not in blossom.graph[v] for v in range(50))
+
+    def test_random_graph_too_many_edges(self, config_file):
+        """Test random graph with too many edges."""
+        with pytest.raises(ValueError):
+            BlossomAlgorithm.random(3, 4, config_path=config_file)
+
+    def test_compare_performance(self, config_file):
+        """Test performance comparison between initialization modes."""
+        blossom = BlossomAlgorithm.random(200, 300, seed=2, config_path=config_file)
+        performance = blossom.compare_performance()
+
+        assert performance["all_match"] is True
+        assert performance["greedy_init"]["success"] is True
+        assert performance["empty_init"]["stats"]["greedy_matched"] == 0
+        assert "hopcroft_karp" not in performance["modes"]
+
+    def test_compare_performance_bipartite(self, config_file):
+        """Test bipartite graphs also benchmark Hopcroft-Karp."""
+        blossom = BlossomAlgorithm.random(
+            100, 150, seed=2, config_path=config_file, bipartite=True
+        )
+        performance = blossom.compare_performance()
+
+        assert performance["bipartite"] is True
+        assert performance["hopcroft_karp"]["success"] is True
+        assert performance["all_match"] is True
+
+    def test_generate_report(self, config_file, temp_dir):
+        """Test report generation."""
+        blossom = BlossomAlgorithm.random(30, 40, seed=3, config_path=config_file)
+        performance = blossom.compare_performance()
+        output_path = temp_dir / "report.txt"
+
+        report = blossom.generate_report(performance, output_path=str(output_path))
+        assert "BLOSSOM ALGORITHM PERFORMANCE REPORT" in report
+        assert output_path.exists()
+
+    def test_hopcroft_karp_explicit(self, config_file):
+        """Test Hopcroft-Karp on a bipartite graph."""
+        blossom = BlossomAlgorithm(6, config_path=config_file)
+        for u, v in [(0, 3), (0, 4), (1, 3), (2, 4), (2, 5)]:
+            blossom.add_edge(u, v)
+
+        matching = blossom.find_maximum_matching(method="hopcroft_karp")
+        assert len(matching) == 3
+        assert blossom.stats["method"] == "hopcroft_karp"
+        assert blossom.get_matched_vertex(1) == 3
+
+    def test_hopcroft_karp_non_bipartite(self, config_file):
+        """Test Hopcroft-Karp rejects odd cycles."""
+        blossom = BlossomAlgorithm(3, config_path=config_file)
+        blossom.add_edge(0, 1)
+        blossom.add_edge(1, 2)
+        blossom.add_edge(2, 0)
+
+        with pytest.raises(ValueError, match="not bipartite"):
+            blossom.find_maximum_matching(method="hopcroft_karp")
+
+    def test_unknown_method(self, config_file):
+        """Test unknown matching method."""
+        blossom = BlossomAlgorithm(2, config_path=config_file)
+        with pytest.raises(ValueError, match="Unknown method"):
+            blossom.find_maximum_matching(method="greedy")
+
+    def test_auto_selects_hopcroft_karp(self, config_file, monkeypatch):
+        """Test auto mode picks Hopcroft-Karp only for large bipartite graphs."""
+        monkeypatch.setattr(BlossomAlgorithm, "HOPCROFT_KARP_MIN_EDGES", 10)
+        bipartite = BlossomAlgorithm.random(
+            40, 60, seed=4, config_path=config_file, bipartite=True
+        )
+        bipartite.find_maximum_matching()
+        assert bipartite.stats["method"] == "hopcroft_karp"
+
+        general = BlossomAlgorithm.random(40, 60, seed=4, config_path=config_file)
+        general.find_maximum_matching()
+        assert general.stats["method"] == "blossom"
+
+        small = BlossomAlgorithm.random(
+            8, 6, seed=4, config_path=config_file, bipartite=True
+        )
+        small.find_maximum_matching()
+        assert small.stats["method"] == "blossom"
+
+    def test_hopcroft_karp_matches_blossom(self, config_file):
+        """Test both engines agree on random bipartite graphs."""
+        rng = random.Random(21)
+        for _ in range(30):
+            n = rng.randint(2, 40)
+            half = n // 2
+            max_edges = half * (n - half)
+            blossom = BlossomAlgorithm.random(
+                n,
+                rng.randint(0, max_edges),
+                seed=rng.randrange(1000),
+                config_path=config_file,
+                bipartite=True,
+            )
+            sizes = []
+            for method in ("blossom", "hopcroft_karp"):
+                blossom.reset_matching()
+                sizes.append(len(blossom.find_maximum_matching(method=method)))
+            assert sizes[0] == sizes[1]
+
+    def test_benchmark_crossover(self, config_file):
+        """Test crossover benchmark rows."""
+        data = BlossomAlgorithm.benchmark_crossover(
+            [20, 40], average_degree=2.0, seed=1, config_path=config_file
+        )
+        assert [row["num_vertices"] for row in data["rows"]] == [20, 40]
+        assert data["crossover"] in (None, 20, 40)
+        report = BlossomAlgorithm(2, config_path=config_file).generate_report(
+            {
+                "num_vertices": 0,
+                "num_edges": 0,
+                "bipartite": True,
+                "iterations": 1,
+                "modes": [],
+                "all_match": True,
+                "crossover": data,
+            }
+        )
+        assert "BLOSSOM VS HOPCROFT-KARP" in report
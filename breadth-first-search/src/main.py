@@ -7,11 +7,27 @@ for finding shortest paths in unweighted graphs.
 """
 
 import argparse
+import json
 import logging
 import logging.handlers
+import mmap
+import struct
+import sys
+from array import array
 from collections import defaultdict, deque
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
 import yaml
 from dotenv import load_dotenv
@@ -102,6 +118,508 @@ class Graph:
         return "\n".join(lines)
 
 
+class CSRGraph:
+    """Frozen graph in compressed sparse row (CSR) form.
+
+    Vertex labels are remapped to ids 0..n-1. The neighbors of id u are
+    targets[offsets[u]:offsets[u + 1]], with edge weights (if any) at the
+    same positions in weights. Arrays are stdlib ``array`` objects, or
+    read-only memoryviews over a memory-mapped file after load().
+    Undirected edges are stored once in each direction.
+    """
+
+    MAGIC = b"CSRG"
+    VERSION = 1
+    # magic, version, flags, reserved, num_vertices, num_edges
+    _HEADER = struct.Struct("<4sIIIqq")
+    _FLAG_DIRECTED = 1
+    _FLAG_WEIGHTED = 2
+    _FLAG_LABELS = 4
+    _FLAG_BIG_ENDIAN = 8
+
+    def __init__(
+        self,
+        offsets: Sequence[int],
+        targets: Sequence[int],
+        weights: Optional[Sequence[float]] = None,
+        labels: Optional[List[Any]] = None,
+        directed: bool = False,
+        num_edges: Optional[int] = None,
+    ) -> None:
+        """Initialize CSR graph from prebuilt arrays.
+
+        Args:
+            offsets: Row offsets, length num_vertices + 1.
+            targets: Neighbor ids, length offsets[-1].
+            weights: Optional edge weights aligned with targets.
+            labels: Vertex label per id, or None if labels are the ids.
+            directed: Whether edges are directed.
+            num_edges: Number of input edges (default: len(targets)).
+
+        Raises:
+            ValueError: If array lengths are inconsistent.
+        """
+        if len(offsets) == 0 or offsets[-1] != len(targets):
+            raise ValueError("offsets[-1] must equal the number of targets")
+        if weights is not None and len(weights) != len(targets):
+            raise ValueError("weights must align with targets")
+        if labels is not None and len(labels) != len(offsets) - 1:
+            raise ValueError("labels must have one entry per vertex")
+
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.labels = labels
+        self.directed = directed
+        self.num_vertices = len(offsets) - 1
+        self.num_edges = len(targets) if num_edges is None else num_edges
+        self._index: Optional[Dict[Any, int]] = (
+            None if labels is None else {label: i for i, label in enumerate(labels)}
+        )
+        self._mmap: Optional[mmap.mmap] = None
+
+    @staticmethod
+    def _compact_labels(labels: List[Any]) -> Optional[List[Any]]:
+        """Drop the label table when labels are exactly the ids 0..n-1."""
+        if all(type(label) is int and label == i for i, label in enumerate(labels)):
+            return None
+        return labels
+
+    @classmethod
+    def from_edges(
+        cls,
+        edges: Iterable[Tuple[Any, ...]],
+        directed: bool = False,
+        weighted: bool = False,
+        vertices: Optional[Iterable[Any]] = None,
+    ) -> "CSRGraph":
+        """Bulk-load a CSR graph from an edge list.
+
+        Labels get ids in order of first appearance (vertices first, if
+        given). Neighbor order follows edge order, so traversals match the
+        adjacency-list graph built from the same edges. If the labels turn
+        out to be exactly 0..n-1 no label table is kept.
+
+        Args:
+            edges: (u, v) pairs, or (u, v, weight) triples if weighted.
+            directed: Whether edges are directed.
+            weighted: Whether edges carry a weight.
+            vertices: Optional vertices to include even if isolated.
+
+        Returns:
+            CSRGraph instance.
+        """
+        index: Dict[Any, int] = {}
+        labels: List[Any] = []
+        if vertices is not None:
+            for vertex in vertices:
+                if vertex not in index:
+                    index[vertex] = len(labels)
+                    labels.append(vertex)
+
+        sources = array("i")
+        dests = array("i")
+        edge_weights = array("d") if weighted else None
+        num_edges = 0
+        for edge in edges:
+            u, v = edge[0], edge[1]
+            for vertex in (u, v):
+                if vertex not in index:
+                    index[vertex] = len(labels)
+                    labels.append(vertex)
+            ui = index[u]
+            vi = index[v]
+            sources.append(ui)
+            dests.append(vi)
+            if weighted:
+                edge_weights.append(edge[2])
+            if not directed and ui != vi:
+                sources.append(vi)
+                dests.append(ui)
+                if weighted:
+                    edge_weights.append(edge[2])
+            num_edges += 1
+
+        n = len(labels)
+        counts = [0] * (n + 1)
+        for u in sources:
+            counts[u + 1] += 1
+        for u in range(n):
+            counts[u + 1] += counts[u]
+        offsets = array("q", counts)
+
+        position = counts[:-1]
+        targets = array("i", bytes(4 * len(dests)))
+        weights = array("d", bytes(8 * len(dests))) if weighted else None
+        for k, u in enumerate(sources):
+            p = position[u]
+            targets[p] = dests[k]
+            if weighted:
+                weights[p] = edge_weights[k]
+            position[u] = p + 1
+
+        logger.info(f"Built CSR graph: {n} vertices, {num_edges} edges")
+        return cls(
+            offsets,
+            targets,
+            weights=weights,
+            labels=cls._compact_labels(labels),
+            directed=directed,
+            num_edges=num_edges,
+        )
+
+    @classmethod
+    def from_graph(cls, graph: Graph) -> "CSRGraph":
+        """Freeze an adjacency-list Graph into CSR form.
+
+        Vertex and neighbor order are preserved. Vertices that only appear
+        as targets of directed edges get an empty row.
+
+        Args:
+            graph: Graph to convert.
+
+        Returns:
+            CSRGraph instance.
+        """
+        labels = graph.get_vertices()
+        index = {vertex: i for i, vertex in enumerate(labels)}
+        offsets = array("q", [0])
+        targets = array("i")
+        for vertex in labels:
+            for neighbor in graph.get_neighbors(vertex):
+                if neighbor not in index:
+                    index[neighbor] = len(labels)
+                    labels.append(neighbor)
+                targets.append(index[neighbor])
+            offsets.append(len(targets))
+
+        return cls(
+            offsets,
+            targets,
+            labels=cls._compact_labels(labels),
+            directed=graph.directed,
+            num_edges=len(targets) if graph.directed else len(targets) // 2,
+        )
+
+    @classmethod
+    def from_edge_list_file(
+        cls,
+        path: str,
+        directed: bool = False,
+        weighted: bool = False,
+        numeric_ids: bool = True,
+        comment: str = "#",
+    ) -> "CSRGraph":
+        """Bulk-load a CSR graph from a whitespace-separated edge list file.
+
+        Each line is "u v" or "u v weight"; blank lines and lines starting
+        with the comment prefix are skipped.
+
+        Args:
+            path: Path to edge list file.
+            directed: Whether edges are directed.
+            weighted: Whether each line has a third weight column.
+            numeric_ids: Parse vertex labels as int (default: True).
+            comment: Comment line prefix (default: "#").
+
+        Returns:
+            CSRGraph instance.
+
+        Raises:
+            ValueError: If a line has too few columns.
+        """
+        parse_id = int if numeric_ids else str
+
+        def read_edges() -> Iterator[Tuple[Any, ...]]:
+            with open(path, "r", encoding="utf-8") as f:
+                for line_number, line in enumerate(f, 1):
+                    fields = line.split()
+                    if not fields or fields[0].startswith(comment):
+                        continue
+                    if len(fields) < (3 if weighted else 2):
+                        raise ValueError(
+                            f"Line {line_number}: expected "
+                            f"{'u v weight' if weighted else 'u v'}"
+                        )
+                    u = parse_id(fields[0])
+                    v = parse_id(fields[1])
+                    if weighted:
+                        yield u, v, float(fields[2])
+                    else:
+                        yield u, v
+
+        return cls.from_edges(read_edges(), directed=directed, weighted=weighted)
+
+    def save(self, path: str) -> None:
+        """Save graph in the binary CSR format.
+
+        The file holds a 32-byte header, then offsets (int64), targets
+        (int32), weights (float64, if weighted) in native byte order, then
+        the label table as JSON if labels are not the ids.
+
+        Args:
+            path: Output file path.
+        """
+        flags = 0
+        if self.directed:
+            flags |= self._FLAG_DIRECTED
+        if self.weights is not None:
+            flags |= self._FLAG_WEIGHTED
+        if self.labels is not None:
+            flags |= self._FLAG_LABELS
+        if sys.byteorder == "big":
+            flags |= self._FLAG_BIG_ENDIAN
+
+        output_file = Path(path)
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_file, "wb") as f:
+            f.write(
+                self._HEADER.pack(
+                    self.MAGIC,
+                    self.VERSION,
+                    flags,
+                    0,
+                    self.num_vertices,
+                    self.num_edges,
+                )
+            )
+            f.write(array("q", self.offsets).tobytes())
+            f.write(array("i", self.targets).tobytes())
+            if self.weights is not None:
+                f.write(array("d", self.weights).tobytes())
+            if self.labels is not None:
+                f.write(json.dumps(self.labels).encode("utf-8"))
+        logger.info(f"Saved CSR graph to {path}")
+
+    @classmethod
+    def load(cls, path: str, use_mmap: bool = True) -> "CSRGraph":
+        """Load a graph saved with save().
+
+        With use_mmap the arrays are zero-copy memoryviews over a read-only
+        memory map, so only the pages a traversal touches are read. Call
+        close() (or use the graph as a context manager) to release it.
+
+        Args:
+            path: File path.
+            use_mmap: Memory-map the file instead of reading it (default:
+                True).
+
+        Returns:
+            CSRGraph instance.
+
+        Raises:
+            ValueError: If the file is not a CSR graph file or was written
+                with a different byte order.
+        """
+        with open(path, "rb") as f:
+            if use_mmap:
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                buffer = f.read()
+
+        header_size = cls._HEADER.size
+        if len(buffer) < header_size:
+            raise ValueError(f"Not a CSR graph file: {path}")
+        magic, version, flags, _, num_vertices, num_edges = cls._HEADER.unpack_from(
+            buffer, 0
+        )
+        if magic != cls.MAGIC or version != cls.VERSION:
+            raise ValueError(f"Not a CSR graph file: {path}")
+        if bool(flags & cls._FLAG_BIG_ENDIAN) != (sys.byteorder == "big"):
+            raise ValueError(f"CSR graph file has foreign byte order: {path}")
+
+        view = memoryview(buffer)
+        position = header_size
+        end = position + 8 * (num_vertices + 1)
+        offsets = view[position:end].cast("q")
+        num_arcs = offsets[-1]
+        position, end = end, end + 4 * num_arcs
+        targets = view[position:end].cast("i")
+        weights = None
+        if flags & cls._FLAG_WEIGHTED:
+            position, end = end, end + 8 * num_arcs
+            weights = view[position:end].cast("d")
+        labels = None
+        if flags & cls._FLAG_LABELS:
+            labels = [
+                tuple(label) if isinstance(label, list) else label
+                for label in json.loads(bytes(view[end:]).decode("utf-8"))
+            ]
+
+        if not use_mmap:
+            offsets = array("q", offsets)
+            targets = array("i", targets)
+            if weights is not None:
+                weights = array("d", weights)
+
+        graph = cls(
+            offsets,
+            targets,
+            weights=weights,
+            labels=labels,
+            directed=bool(flags & cls._FLAG_DIRECTED),
+            num_edges=num_edges,
+        )
+        if use_mmap:
+            graph._mmap = buffer
+        logger.info(
+            f"Loaded CSR graph from {path}: {num_vertices} vertices, "
+            f"{num_edges} edges{' (mmap)' if use_mmap else ''}"
+        )
+        return graph
+
+    def close(self) -> None:
+        """Release the memory map held by a graph from load()."""
+        if self._mmap is None:
+            return
+        for name in ("offsets", "targets", "weights"):
+            data = getattr(self, name)
+            if isinstance(data, memoryview):
+                data.release()
+        self._mmap.close()
+        self._mmap = None
+
+    def __enter__(self) -> "CSRGraph":
+        """Enter context manager."""
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Exit context manager, releasing any memory map."""
+        self.close()
+
+    def __contains__(self, vertex: Any) -> bool:
+        """Check whether a vertex label is in the graph."""
+        if self._index is not None:
+            return vertex in self._index
+        return type(vertex) is int and 0 <= vertex < self.num_vertices
+
+    def index_of(self, vertex: Any) -> int:
+        """Get the id of a vertex label.
+
+        Args:
+            vertex: Vertex label.
+
+        Returns:
+            Vertex id.
+
+        Raises:
+            ValueError: If vertex not in graph.
+        """
+        if vertex not in self:
+            raise ValueError(f"Vertex {vertex} not in graph")
+        return vertex if self._index is None else self._index[vertex]
+
+    def label_of(self, index: int) -> Any:
+        """Get the label of a vertex id.
+
+        Args:
+            index: Vertex id.
+
+        Returns:
+            Vertex label.
+        """
+        return index if self.labels is None else self.labels[index]
+
+    def labels_of(self, indices: Iterable[int]) -> List[Any]:
+        """Map vertex ids to labels.
+
+        Args:
+            indices: Vertex ids.
+
+        Returns:
+            List of vertex labels.
+        """
+        if self.labels is None:
+            return list(indices)
+        labels = self.labels
+        return [labels[i] for i in indices]
+
+    def neighbors(self, index: int) -> Sequence[int]:
+        """Get neighbor ids of a vertex id.
+
+        Args:
+            index: Vertex id.
+
+        Returns:
+            Slice of targets holding the neighbor ids.
+        """
+        return self.targets[self.offsets[index]:self.offsets[index + 1]]
+
+    def get_vertices(self) -> List[Any]:
+        """Get all vertex labels in id order.
+
+        Returns:
+            List of vertex labels.
+        """
+        if self.labels is None:
+            return list(range(self.num_vertices))
+        return list(self.labels)
+
+    def get_neighbors(self, vertex: Any) -> List[Any]:
+        """Get neighbor labels of a vertex label.
+
+        Args:
+            vertex: Vertex label.
+
+        Returns:
+            List of neighboring vertex labels.
+        """
+        return self.labels_of(self.neighbors(self.index_of(vertex)))
+
+    def transpose(self) -> "CSRGraph":
+        """Build the graph with every arc reversed.
+
+        Each row of the result lists its sources in increasing id order.
+
+        Returns:
+            New CSRGraph sharing this graph's labels.
+        """
+        n = self.num_vertices
+        offsets = self.offsets
+        targets = self.targets
+        weights = self.weights
+        counts = [0] * (n + 1)
+        for v in targets:
+            counts[v + 1] += 1
+        for v in range(n):
+            counts[v + 1] += counts[v]
+
+        position = counts[:-1]
+        reversed_targets = array("i", bytes(4 * len(targets)))
+        reversed_weights = (
+            None if weights is None else array("d", bytes(8 * len(targets)))
+        )
+        for u in range(n):
+            for p in range(offsets[u], offsets[u + 1]):
+                v = targets[p]
+                q = position[v]
+                reversed_targets[q] = u
+                if weights is not None:
+                    reversed_weights[q] = weights[p]
+                position[v] = q + 1
+
+        return type(self)(
+            array("q", counts),
+            reversed_targets,
+            weights=reversed_weights,
+            labels=self.labels,
+            directed=self.directed,
+            num_edges=self.num_edges,
+        )
+
+    def memory_bytes(self) -> int:
+        """Get the size of the CSR arrays in bytes.
+
+        Returns:
+            Bytes used by offsets, targets and weights (label table
+            excluded).
+        """
+        total = 8 * len(self.offsets) + 4 * len(self.targets)
+        if self.weights is not None:
+            total += 8 * len(self.weights)
+        return total
+
+
 class BFS:
     """Breadth-First Search implementation for shortest path finding."""
 
@@ -170,11 +688,13 @@ class BFS:
             ],
         )
 
-    def bfs_traversal(self, graph: Graph, start: Any) -> List[Any]:
+    def bfs_traversal(
+        self, graph: Union[Graph, CSRGraph], start: Any
+    ) -> List[Any]:
         """Perform BFS traversal starting from given vertex.
 
         Args:
-            graph: Graph to traverse.
+            graph: Graph to traverse (adjacency list or CSR).
             start: Starting vertex.
 
         Returns:
@@ -185,6 +705,17 @@ class BFS:
         """
         logger.info(f"Starting BFS traversal from vertex: {start}")
 
+        if isinstance(graph, CSRGraph):
+            if start not in graph:
+                raise ValueError(f"Start vertex {start} not in graph")
+            order, _, _ = self._bfs_csr(graph, graph.index_of(start))
+            traversal_order = graph.labels_of(order)
+            self.visited = set(traversal_order)
+            logger.info(
+                f"BFS traversal complete. Visited {len(traversal_order)} vertices"
+            )
+            return traversal_order
+
         if start not in graph.adjacency_list:
             raise ValueError(f"Start vertex {start} not in graph")
 
@@ -209,7 +740,7 @@ class BFS:
         return traversal_order
 
     def shortest_path(
-        self, graph: Graph, start: Any, target: Any
+        self, graph: Union[Graph, CSRGraph], start: Any, target: Any
     ) -> Tuple[Optional[List[Any]], int]:
         """Find shortest path from start to target using BFS.
 
@@ -217,7 +748,7 @@ class BFS:
         vertices level by level, ensuring the first path found is the shortest.
 
         Args:
-            graph: Graph to search.
+            graph: Graph to search (adjacency list or CSR).
             start: Starting vertex.
             target: Target vertex.
 
@@ -231,6 +762,9 @@ class BFS:
         """
         logger.info(f"Finding shortest path from {start} to {target}")
 
+        if isinstance(graph, CSRGraph):
+            return self._shortest_path_csr(graph, start, target)
+
         if start not in graph.adjacency_list:
             raise ValueError(f"Start vertex {start} not in graph")
         if target not in graph.adjacency_list:
@@ -282,11 +816,13 @@ class BFS:
         logger.warning(f"No path found from {start} to {target}")
         return None, -1
 
-    def shortest_distances(self, graph: Graph, start: Any) -> Dict[Any, int]:
+    def shortest_distances(
+        self, graph: Union[Graph, CSRGraph], start: Any
+    ) -> Dict[Any, int]:
         """Find shortest distances from start to all reachable vertices.
 
         Args:
-            graph: Graph to search.
+            graph: Graph to search (adjacency list or CSR).
             start: Starting vertex.
 
         Returns:
@@ -298,6 +834,17 @@ class BFS:
         """
         logger.info(f"Finding shortest distances from {start} to all vertices")
 
+        if isinstance(graph, CSRGraph):
+            if start not in graph:
+                raise ValueError(f"Start vertex {start} not in graph")
+            order, dist, _ = self._bfs_csr(graph, graph.index_of(start))
+            self.visited = set(graph.labels_of(order))
+            self.distance = {graph.label_of(v): dist[v] for v in order}
+            logger.info(
+                f"Found distances to {len(self.distance)} vertices from {start}"
+            )
+            return self.distance.copy()
+
         if start not in graph.adjacency_list:
             raise ValueError(f"Start vertex {start} not in graph")
 
@@ -320,17 +867,35 @@ class BFS:
         )
         return self.distance.copy()
 
-    def bfs_all_components(self, graph: Graph) -> List[List[Any]]:
+    def bfs_all_components(self, graph: Union[Graph, CSRGraph]) -> List[List[Any]]:
         """Perform BFS on all connected components.
 
         Args:
-            graph: Graph to traverse.
+            graph: Graph to traverse (adjacency list or CSR).
 
         Returns:
             List of traversal orders for each component.
         """
         logger.info("Finding all connected components using BFS")
 
+        if isinstance(graph, CSRGraph):
+            all_components = []
+            seen = array("i", [-1]) * graph.num_vertices
+            for vertex in range(graph.num_vertices):
+                if seen[vertex] < 0:
+                    # Undirected components are disjoint, so one distance
+                    # array can be shared; directed traversals may revisit
+                    # earlier vertices, as in the adjacency-list path.
+                    order, dist, _ = self._bfs_csr(
+                        graph, vertex, dist=None if graph.directed else seen
+                    )
+                    if graph.directed:
+                        for reached in order:
+                            seen[reached] = dist[reached]
+                    all_components.append(graph.labels_of(order))
+            logger.info(f"Found {len(all_components)} connected components")
+            return all_components
+
         all_components = []
         visited_all = set()
 
@@ -343,11 +908,13 @@ class BFS:
         logger.info(f"Found {len(all_components)} connected components")
         return all_components
 
-    def level_order_traversal(self, graph: Graph, start: Any) -> List[List[Any]]:
+    def level_order_traversal(
+        self, graph: Union[Graph, CSRGraph], start: Any
+    ) -> List[List[Any]]:
         """Get vertices grouped by level (distance from start).
 
         Args:
-            graph: Graph to traverse.
+            graph: Graph to traverse (adjacency list or CSR).
             start: Starting vertex.
 
         Returns:
@@ -358,6 +925,20 @@ class BFS:
         """
         logger.info(f"Performing level-order traversal from {start}")
 
+        if isinstance(graph, CSRGraph):
+            if start not in graph:
+                raise ValueError(f"Start vertex {start} not in graph")
+            order, dist, _ = self._bfs_csr(graph, graph.index_of(start))
+            self.visited = set(graph.labels_of(order))
+            level_ids: List[List[int]] = []
+            for vertex in order:
+                if dist[vertex] == len(level_ids):
+                    level_ids.append([])
+                level_ids[-1].append(vertex)
+            levels = [graph.labels_of(level) for level in level_ids]
+            logger.info(f"Found {len(levels)} levels from {start}")
+            return levels
+
         if start not in graph.adjacency_list:
             raise ValueError(f"Start vertex {start} not in graph")
 
@@ -393,6 +974,90 @@ class BFS:
         logger.info(f"Found {len(levels)} levels from {start}")
         return levels
 
+    def _bfs_csr(
+        self,
+        graph: CSRGraph,
+        source: int,
+        target: int = -1,
+        dist: Optional[array] = None,
+    ) -> Tuple[List[int], array, array]:
+        """Run BFS over CSR arrays using vertex ids.
+
+        The discovery list doubles as the queue, and distances and parents
+        live in flat int arrays, so no per-vertex hashing is done.
+
+        Args:
+            graph: CSR graph to traverse.
+            source: Source vertex id.
+            target: Vertex id to stop at once dequeued (default: -1, none).
+            dist: Distance array to reuse; vertices with a non-negative
+                entry are treated as already visited (default: new array).
+
+        Returns:
+            Tuple of (order, dist, parent): vertex ids in discovery order,
+            and per-id distance and parent arrays (-1 if unset).
+        """
+        offsets = graph.offsets
+        targets = graph.targets
+        if dist is None:
+            dist = array("i", [-1]) * graph.num_vertices
+        parent = array("i", [-1]) * graph.num_vertices
+        dist[source] = 0
+        order = [source]
+        head = 0
+
+        while head < len(order):
+            vertex = order[head]
+            head += 1
+            if vertex == target:
+                break
+            next_distance = dist[vertex] + 1
+            for neighbor in targets[offsets[vertex]:offsets[vertex + 1]]:
+                if dist[neighbor] < 0:
+                    dist[neighbor] = next_distance
+                    parent[neighbor] = vertex
+                    order.append(neighbor)
+
+        return order, dist, parent
+
+    def _shortest_path_csr(
+        self, graph: CSRGraph, start: Any, target: Any
+    ) -> Tuple[Optional[List[Any]], int]:
+        """Find shortest path on a CSR graph; see shortest_path()."""
+        if start not in graph:
+            raise ValueError(f"Start vertex {start} not in graph")
+        if target not in graph:
+            raise ValueError(f"Target vertex {target} not in graph")
+
+        if start == target:
+            return [start], 0
+
+        source = graph.index_of(start)
+        goal = graph.index_of(target)
+        order, dist, parent = self._bfs_csr(graph, source, goal)
+        self.visited = set(graph.labels_of(order))
+        self.distance = {graph.label_of(v): dist[v] for v in order}
+        self.parent = {
+            graph.label_of(v): None if parent[v] < 0 else graph.label_of(parent[v])
+            for v in order
+        }
+
+        if dist[goal] < 0:
+            logger.warning(f"No path found from {start} to {target}")
+            return None, -1
+
+        path_ids = []
+        current = goal
+        while current >= 0:
+            path_ids.append(current)
+            current = parent[current]
+        path_ids.reverse()
+        path = graph.labels_of(path_ids)
+        distance = dist[goal]
+
+        logger.info(f"Shortest path found: {path} (distance: {distance})")
+        return path, distance
+
     def generate_report(
         self,
         graph: Graph,
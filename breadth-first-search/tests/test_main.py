@@ -6,7 +6,7 @@ from pathlib import Path
 import pytest
 import yaml
 
-from src.main import Graph, BFS
+from src.main import BFS, CSRGraph, Graph
 
 
 class TestGraph:
@@ -371,3 +371,112 @@ class TestBFS:
         assert levels[0] == [0]
         assert set(levels[1]) == {1, 2}
         assert set(levels[2]) == {3, 4, 5}
+
+
+class TestCSRGraph:
+    """Test cases for CSRGraph class and BFS over CSR graphs."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create temporary directory for testing."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+
+    @pytest.fixture
+    def bfs(self, temp_dir):
+        """Create BFS instance."""
+        config_path = temp_dir / "config.yaml"
+        with open(config_path, "w") as f:
+            yaml.dump(
+                {"logging": {"level": "INFO", "file": str(temp_dir / "app.log")}}, f
+            )
+        return BFS(config_path=str(config_path))
+
+    @pytest.fixture
+    def edges(self):
+        """Edge list with a second component and a self-loop."""
+        return [("a", "b"), ("a", "c"), ("b", "d"), ("c", "d"), ("d", "e"),
+                ("x", "y"), ("y", "y")]
+
+    def test_from_edges_layout(self):
+        """Test offsets and targets for an undirected edge list."""
+        csr = CSRGraph.from_edges([(0, 1), (1, 2), (2, 2)])
+        assert list(csr.offsets) == [0, 1, 3, 5]
+        assert list(csr.targets) == [1, 0, 2, 1, 2]
+        assert csr.labels is None
+        assert csr.num_vertices == 3
+        assert csr.num_edges == 3
+
+    def test_label_remapping(self, edges):
+        """Test labels are mapped to ids in order of first appearance."""
+        csr = CSRGraph.from_edges(edges, vertices=["z"])
+        assert csr.get_vertices() == ["z", "a", "b", "c", "d", "e", "x", "y"]
+        assert csr.index_of("z") == 0
+        assert csr.label_of(1) == "a"
+        assert csr.get_neighbors("d") == ["b", "c", "e"]
+        assert "q" not in csr
+        with pytest.raises(ValueError, match="not in graph"):
+            csr.index_of("q")
+
+    def test_matches_adjacency_list_graph(self, bfs, edges):
+        """Test BFS results on CSR match the adjacency-list graph."""
+        graph = Graph()
+        for u, v in edges:
+            graph.add_edge(u, v)
+        for csr in (CSRGraph.from_edges(edges), CSRGraph.from_graph(graph)):
+            assert bfs.bfs_traversal(csr, "a") == bfs.bfs_traversal(graph, "a")
+            assert bfs.shortest_path(csr, "a", "e") == bfs.shortest_path(graph, "a", "e")
+            assert bfs.shortest_path(csr, "a", "x") == (None, -1)
+            assert bfs.shortest_distances(csr, "a") == bfs.shortest_distances(graph, "a")
+            assert bfs.level_order_traversal(csr, "a") == [["a"], ["b", "c"], ["d"], ["e"]]
+            assert bfs.bfs_all_components(csr) == bfs.bfs_all_components(graph)
+
+    def test_directed(self, bfs):
+        """Test directed CSR graph only follows edge direction."""
+        csr = CSRGraph.from_edges([(0, 1), (1, 2)], directed=True)
+        assert bfs.bfs_traversal(csr, 1) == [1, 2]
+        assert bfs.shortest_path(csr, 2, 0) == (None, -1)
+
+    def test_invalid_start(self, bfs, edges):
+        """Test missing start vertex raises ValueError."""
+        csr = CSRGraph.from_edges(edges)
+        with pytest.raises(ValueError, match="not in graph"):
+            bfs.bfs_traversal(csr, "q")
+
+    @pytest.mark.parametrize("use_mmap", [True, False])
+    def test_save_load_roundtrip(self, bfs, edges, temp_dir, use_mmap):
+        """Test binary save/load preserves the graph."""
+        csr = CSRGraph.from_edges(edges)
+        path = temp_dir / "graph.csr"
+        csr.save(str(path))
+
+        with CSRGraph.load(str(path), use_mmap=use_mmap) as loaded:
+            assert list(loaded.offsets) == list(csr.offsets)
+            assert list(loaded.targets) == list(csr.targets)
+            assert loaded.get_vertices() == csr.get_vertices()
+            assert loaded.num_edges == csr.num_edges
+            assert loaded.directed is False
+            assert bfs.bfs_traversal(loaded, "a") == bfs.bfs_traversal(csr, "a")
+
+    def test_load_rejects_other_files(self, temp_dir):
+        """Test loading a non-CSR file raises ValueError."""
+        path = temp_dir / "other.bin"
+        path.write_bytes(b"not a graph" * 4)
+        with pytest.raises(ValueError, match="Not a CSR graph file"):
+            CSRGraph.load(str(path))
+
+    def test_from_edge_list_file(self, temp_dir):
+        """Test bulk loading from an edge list file."""
+        path = temp_dir / "edges.txt"
+        path.write_text("# comment\n0 1\n\n1 2\n2 0\n")
+        csr = CSRGraph.from_edge_list_file(str(path), directed=True)
+        assert csr.num_vertices == 3
+        assert csr.num_edges == 3
+        assert csr.get_neighbors(2) == [0]
+
+    def test_from_edge_list_file_bad_line(self, temp_dir):
+        """Test edge list line with one column raises ValueError."""
+        path = temp_dir / "edges.txt"
+        path.write_text("0 1\n2\n")
+        with pytest.raises(ValueError, match="Line 2"):
+            CSRGraph.from_edge_list_file(str(path))
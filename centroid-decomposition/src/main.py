@@ -3,14 +3,20 @@
 This module provides functionality to implement centroid decomposition that
 decomposes a tree into a centroid tree for efficient divide and conquer
 solutions to tree problems. Centroid decomposition achieves O(n log n) time
-complexity for many tree problems.
+complexity for many tree problems, such as counting pairs within a distance
+bound and nearest-marked-node queries.
 """
 
+import heapq
 import logging
 import logging.handlers
+import random
+import time
+from array import array
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Set, Tuple
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
 
+import numpy as np
 import yaml
 from dotenv import load_dotenv
 
@@ -19,6 +25,33 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Histogram lengths above which self-convolution switches from a Python loop
+# to np.convolve, and from np.convolve to an FFT
+DIRECT_CONVOLVE_LIMIT = 8
+FFT_CONVOLVE_LIMIT = 256
+
+
+def _self_convolve(values: np.ndarray) -> np.ndarray:
+    """Convolve a non-negative integer histogram with itself.
+
+    Short histograms use np.convolve, which is exact; longer ones use a
+    real FFT in O(h log h) and round the result. Entries stay far below
+    2**53 for trees of up to 10**6 nodes, so rounding is exact.
+
+    Args:
+        values: Histogram as an int64 array.
+
+    Returns:
+        int64 array of length 2 * len(values) - 1.
+    """
+    if len(values) <= FFT_CONVOLVE_LIMIT:
+        return np.convolve(values, values)
+    size = 2 * len(values) - 1
+    fft_size = 1 << (size - 1).bit_length()
+    spectrum = np.fft.rfft(values.astype(np.float64), fft_size)
+    product = np.fft.irfft(spectrum * spectrum, fft_size)[:size]
+    return np.rint(product).astype(np.int64)
+
 
 class TreeNode:
     """Node in a tree."""
@@ -52,7 +85,14 @@ class TreeNode:
 
 
 class CentroidDecomposition:
-    """Centroid decomposition for divide and conquer tree problems."""
+    """Centroid decomposition for divide and conquer tree problems.
+
+    The tree is stored as CSR adjacency arrays and decomposed iteratively.
+    While decomposing, every centroid records the distance of each node in
+    its component (one array per centroid-tree level) and a distance
+    histogram per child subtree, which back the pair-counting and
+    nearest-marked-node queries.
+    """
 
     def __init__(self, root: TreeNode, config_path: str = "config.yaml") -> None:
         """Initialize centroid decomposition.
@@ -62,13 +102,76 @@ class CentroidDecomposition:
             config_path: Path to configuration file.
         """
         self.root = root
-        self.n = self._count_nodes(root)
-        self.subtree_size: Dict[TreeNode, int] = {}
-        self.centroid_tree_parent: Dict[TreeNode, Optional[TreeNode]] = {}
-        self.centroid_tree_root: Optional[TreeNode] = None
-        self.decomposed: bool = False
+        self.nodes: List[TreeNode] = [root]
+        self.node_to_index: Dict[TreeNode, int] = {root: 0}
+        edges: List[Tuple[int, int]] = []
+        for node in self.nodes:
+            node_idx = self.node_to_index[node]
+            for neighbor in node.neighbors:
+                if neighbor not in self.node_to_index:
+                    self.node_to_index[neighbor] = len(self.nodes)
+                    self.nodes.append(neighbor)
+                    edges.append((node_idx, self.node_to_index[neighbor]))
+
         self._setup_logging()
         self._load_config(config_path)
+        self._build_adjacency(len(self.nodes), edges)
+
+    @classmethod
+    def from_edges(
+        cls,
+        n: int,
+        edges: Sequence[Tuple[int, int]],
+        config_path: str = "config.yaml",
+    ) -> "CentroidDecomposition":
+        """Build directly from an undirected edge list, without TreeNode objects.
+
+        Nodes are then addressed by index in every method.
+
+        Args:
+            n: Number of nodes.
+            edges: n - 1 undirected (u, v) edges over nodes 0..n-1.
+            config_path: Path to configuration file.
+
+        Returns:
+            CentroidDecomposition instance.
+
+        Raises:
+            ValueError: If the edges do not form a tree on n nodes.
+        """
+        if n < 1:
+            raise ValueError("Tree must have at least one node")
+        if len(edges) != n - 1:
+            raise ValueError(f"A tree on {n} nodes needs {n - 1} edges, got {len(edges)}")
+        for u, v in edges:
+            if not (0 <= u < n and 0 <= v < n) or u == v:
+                raise ValueError(f"Invalid edge: ({u}, {v})")
+
+        instance = cls.__new__(cls)
+        instance.root = None
+        instance.nodes = []
+        instance.node_to_index = {}
+        instance._setup_logging()
+        instance._load_config(config_path)
+        instance._build_adjacency(n, edges)
+
+        seen = bytearray(n)
+        seen[0] = 1
+        stack = [0]
+        visited = 1
+        adj_start = instance.adj_start
+        adjacency = instance.adjacency
+        while stack:
+            x = stack.pop()
+            for e in range(adj_start[x], adj_start[x + 1]):
+                y = adjacency[e]
+                if not seen[y]:
+                    seen[y] = 1
+                    visited += 1
+                    stack.append(y)
+        if visited != n:
+            raise ValueError("Edges do not form a tree: graph is disconnected")
+        return instance
 
     def _setup_logging(self) -> None:
         """Configure logging for centroid decomposition operations."""
@@ -104,284 +207,485 @@ class CentroidDecomposition:
         except Exception as e:
             logger.warning(f"Could not load config: {e}")
 
-    def _count_nodes(self, node: Optional[TreeNode]) -> int:
-        """Count nodes in tree using DFS.
+    def _build_adjacency(self, n: int, edges: Sequence[Tuple[int, int]]) -> None:
+        """Store the tree as CSR adjacency arrays and reset decomposition state.
 
         Args:
-            node: Current node.
-
-        Returns:
-            Number of nodes.
+            n: Number of nodes.
+            edges: Undirected (u, v) edges.
         """
-        if node is None:
-            return 0
-
-        visited: Set[TreeNode] = set()
-
-        def dfs(n: TreeNode) -> int:
-            visited.add(n)
-            count = 1
-            for neighbor in n.neighbors:
-                if neighbor not in visited:
-                    count += dfs(neighbor)
-            return count
-
-        return dfs(node)
-
-    def _compute_sizes(
-        self, node: TreeNode, parent: Optional[TreeNode], visited: Set[TreeNode]
-    ) -> int:
-        """Compute subtree sizes.
+        self.n = n
+        adj_start = array("i", [0]) * (n + 1)
+        for u, v in edges:
+            adj_start[u + 1] += 1
+            adj_start[v + 1] += 1
+        for i in range(n):
+            adj_start[i + 1] += adj_start[i]
+
+        adjacency = array("i", [0]) * (2 * len(edges))
+        fill = adj_start[:n]
+        for u, v in edges:
+            adjacency[fill[u]] = v
+            fill[u] += 1
+            adjacency[fill[v]] = u
+            fill[v] += 1
+
+        self.adj_start = adj_start
+        self.adjacency = adjacency
+        self.centroid_parent = array("i", [-1]) * n
+        self.centroid_level = array("i", [0]) * n
+        self.centroid_order = array("i")
+        self.centroid_tree_root: Optional[Union[TreeNode, int]] = None
+        self.decomposed: bool = False
+        self._level_distance: List[array] = []
+        self._hist_values = array("i")
+        self._hist_bounds = array("i", [0])
+        self._hist_merged = bytearray()
+        self._marked = bytearray(n)
+        self._marked_heaps: Dict[int, List[int]] = {}
+        self._unmarked: Dict[int, Dict[int, int]] = {}
 
-        Args:
-            node: Current node.
-            parent: Parent node.
-            visited: Set of visited nodes.
+    def decompose(self) -> None:
+        """Perform centroid decomposition.
 
-        Returns:
-            Subtree size.
+        Each component is carried as a BFS order with BFS parents, so subtree
+        sizes are a single reverse pass. The BFS from a centroid splits the
+        component into its child subtrees, whose orders are already valid
+        BFS orders for the next level, so every level costs one traversal.
         """
-        visited.add(node)
-        size = 1
-
-        for neighbor in node.neighbors:
-            if neighbor != parent and neighbor not in visited:
-                size += self._compute_sizes(neighbor, node, visited)
+        if self.decomposed:
+            logger.warning("Tree already decomposed")
+            return
 
-        self.subtree_size[node] = size
-        return size
+        n = self.n
+        adj_start = self.adj_start
+        adjacency = self.adjacency
+        centroid_parent = self.centroid_parent
+        centroid_level = self.centroid_level
+        centroid_order = self.centroid_order
+        hist_values = self._hist_values
+        hist_bounds = self._hist_bounds
+        hist_merged = self._hist_merged
+        removed = bytearray(n)
+        parent = array("i", [-1]) * n
+        size = array("i", [0]) * n
+
+        order = [0]
+        for x in order:
+            for e in range(adj_start[x], adj_start[x + 1]):
+                y = adjacency[e]
+                if y != parent[x]:
+                    parent[y] = x
+                    order.append(y)
+
+        stack = [(order, -1, 0)]
+        while stack:
+            order, parent_centroid, level = stack.pop()
+            total = len(order)
+
+            for x in order:
+                size[x] = 1
+            for i in range(total - 1, 0, -1):
+                x = order[i]
+                size[parent[x]] += size[x]
+
+            centroid = order[0]
+            half = total // 2
+            moved = True
+            while moved:
+                moved = False
+                for e in range(adj_start[centroid], adj_start[centroid + 1]):
+                    y = adjacency[e]
+                    if not removed[y] and parent[y] == centroid and size[y] > half:
+                        centroid = y
+                        moved = True
+                        break
+
+            removed[centroid] = 1
+            centroid_parent[centroid] = parent_centroid
+            centroid_level[centroid] = level
+            centroid_order.append(centroid)
+            if level == len(self._level_distance):
+                self._level_distance.append(array("i", [-1]) * n)
+            distance = self._level_distance[level]
+            distance[centroid] = 0
+            if total == 1:
+                continue
+
+            merged = [1]
+            subtrees = []
+            for e in range(adj_start[centroid], adj_start[centroid + 1]):
+                y = adjacency[e]
+                if removed[y]:
+                    continue
+                parent[y] = centroid
+                distance[y] = 1
+                subtree = [y]
+                for x in subtree:
+                    px = parent[x]
+                    dx = distance[x] + 1
+                    for f in range(adj_start[x], adj_start[x + 1]):
+                        z = adjacency[f]
+                        if z != px and not removed[z]:
+                            parent[z] = x
+                            distance[z] = dx
+                            subtree.append(z)
+
+                histogram = [0] * (distance[subtree[-1]] + 1)
+                for x in subtree:
+                    histogram[distance[x]] += 1
+                if len(histogram) > len(merged):
+                    merged.extend([0] * (len(histogram) - len(merged)))
+                for d in range(1, len(histogram)):
+                    merged[d] += histogram[d]
+                subtrees.append((subtree, histogram))
+
+            hist_values.extend(merged)
+            hist_bounds.append(len(hist_values))
+            hist_merged.append(1)
+            for subtree, histogram in subtrees:
+                hist_values.extend(histogram)
+                hist_bounds.append(len(hist_values))
+                hist_merged.append(0)
+                stack.append((subtree, centroid, level + 1))
+
+        self.centroid_tree_root = self._node(centroid_order[0])
+        self.decomposed = True
+        logger.info(
+            f"Centroid decomposition completed, root: "
+            f"{self._label(self.centroid_tree_root)}, "
+            f"depth: {len(self._level_distance)}"
+        )
 
-    def _find_centroid(
-        self, node: TreeNode, parent: Optional[TreeNode], total_size: int, visited: Set[TreeNode]
-    ) -> Optional[TreeNode]:
-        """Find centroid of tree.
+    def _index(self, node: Union[TreeNode, int]) -> int:
+        """Resolve a TreeNode or node index to an index.
 
         Args:
-            node: Current node.
-            parent: Parent node.
-            total_size: Total size of current component.
-            visited: Set of visited nodes.
+            node: TreeNode or node index.
 
         Returns:
-            Centroid node or None.
-        """
-        visited.add(node)
-
-        for neighbor in node.neighbors:
-            if neighbor != parent and neighbor not in visited:
-                if self.subtree_size[neighbor] > total_size // 2:
-                    return self._find_centroid(neighbor, node, total_size, visited)
+            Node index.
 
+        Raises:
+            ValueError: If the node is not in the tree.
+        """
+        if isinstance(node, TreeNode):
+            if node not in self.node_to_index:
+                raise ValueError(f"Node {node.value} not in tree")
+            return self.node_to_index[node]
+        if not 0 <= node < self.n:
+            raise ValueError(f"Node {node} out of range [0, {self.n})")
         return node
 
-    def _get_component_nodes(
-        self, node: TreeNode, parent: Optional[TreeNode], visited: Set[TreeNode]
-    ) -> List[TreeNode]:
-        """Get all nodes in component.
+    def _node(self, index: int) -> Union[TreeNode, int]:
+        """Map a node index back to its TreeNode when there is one.
 
         Args:
-            node: Current node.
-            parent: Parent node.
-            visited: Set of visited nodes.
+            index: Node index.
 
         Returns:
-            List of nodes in component.
+            TreeNode, or the index for trees built from an edge list.
         """
-        visited.add(node)
-        nodes = [node]
+        return self.nodes[index] if self.nodes else index
 
-        for neighbor in node.neighbors:
-            if neighbor != parent and neighbor not in visited:
-                nodes.extend(self._get_component_nodes(neighbor, node, visited))
+    def _require_decomposed(self) -> None:
+        """Raise if decompose() has not been called.
 
-        return nodes
+        Raises:
+            ValueError: If tree not decomposed.
+        """
+        if not self.decomposed:
+            raise ValueError("Tree must be decomposed first")
 
-    def _remove_centroid(self, centroid: TreeNode) -> List[List[TreeNode]]:
-        """Remove centroid and get connected components.
+    def solve_with_divide_conquer(
+        self,
+        problem_solver: Callable[[TreeNode, List[Tuple[TreeNode, int]]], float],
+    ) -> float:
+        """Solve tree problem using divide and conquer.
+
+        problem_solver is called once per centroid, top-down, with the
+        centroid and the (node, distance) pairs of its component.
 
         Args:
-            centroid: Centroid node to remove.
+            problem_solver: Function that solves problem for centroid and distances.
 
         Returns:
-            List of connected components.
-        """
-        visited: Set[TreeNode] = {centroid}
-        components: List[List[TreeNode]] = []
-
-        for neighbor in centroid.neighbors:
-            if neighbor not in visited:
-                component = self._get_component_nodes(neighbor, centroid, visited.copy())
-                if component:
-                    components.append(component)
+            Sum of problem_solver results over all centroids.
 
-        return components
+        Raises:
+            ValueError: If tree not decomposed.
+        """
+        self._require_decomposed()
+
+        adj_start = self.adj_start
+        adjacency = self.adjacency
+        centroid_level = self.centroid_level
+        result = 0.0
+        for centroid in self.centroid_order:
+            level = centroid_level[centroid]
+            distance = self._level_distance[level]
+            component = [centroid]
+            for x in component:
+                for e in range(adj_start[x], adj_start[x + 1]):
+                    y = adjacency[e]
+                    if centroid_level[y] > level and distance[y] == distance[x] + 1:
+                        component.append(y)
+            distances = [(self._node(x), distance[x]) for x in component]
+            result += problem_solver(self._node(centroid), distances)
+
+        return result
+
+    @staticmethod
+    def _count_pairs_within(
+        histogram: array, start: int, end: int, k: int
+    ) -> int:
+        """Count unordered node pairs whose distance sum is at most k.
 
-    def _decompose(
-        self, nodes: List[TreeNode], parent_centroid: Optional[TreeNode]
-    ) -> Optional[TreeNode]:
-        """Recursively decompose tree using centroids.
+        The histogram is already a counting sort of the distances, so a two
+        pointer sweep pairs each distance d with every distance <= k - d.
 
         Args:
-            nodes: Nodes in current component.
-            parent_centroid: Parent centroid in centroid tree.
+            histogram: Flat histogram storage.
+            start: First slot of the histogram (distance 0).
+            end: One past the last slot.
+            k: Distance bound.
 
         Returns:
-            Centroid node.
+            Number of pairs {x, y}, x != y, with d(x) + d(y) <= k.
         """
-        if not nodes:
-            return None
-
-        if len(nodes) == 1:
-            centroid = nodes[0]
-            self.centroid_tree_parent[centroid] = parent_centroid
-            return centroid
-
-        root = nodes[0]
-        visited: Set[TreeNode] = set()
-        self._compute_sizes(root, None, visited)
-
-        visited.clear()
-        total_size = self.subtree_size[root]
-        centroid = self._find_centroid(root, None, total_size, visited)
-
-        if centroid is None:
-            centroid = nodes[0]
-
-        self.centroid_tree_parent[centroid] = parent_centroid
+        top = min(end - start - 1, k)
+        j = top
+        below = sum(histogram[start:start + j + 1])
+        ordered = 0
+        for d in range(top + 1):
+            while d + j > k:
+                below -= histogram[start + j]
+                j -= 1
+            count = histogram[start + d]
+            ordered += count * below
+            if 2 * d <= k:
+                ordered -= count
+        return ordered // 2
+
+    def count_pairs_within(self, k: int) -> int:
+        """Count unordered pairs of distinct nodes at distance <= k.
+
+        Pairs are counted at the centroid their path passes through: pairs
+        over the whole component minus pairs that stay inside one child
+        subtree. Runs in time linear in the total size of the stored
+        histograms, independent of the number of pairs.
 
-        components = self._remove_centroid(centroid)
-        for component in components:
-            child_centroid = self._decompose(component, centroid)
-            if child_centroid:
-                pass
-
-        return centroid
+        Args:
+            k: Distance bound.
 
-    def decompose(self) -> None:
-        """Perform centroid decomposition."""
-        if self.decomposed:
-            logger.warning("Tree already decomposed")
-            return
+        Returns:
+            Number of pairs.
 
-        visited: Set[TreeNode] = set()
-        all_nodes = self._get_component_nodes(self.root, None, visited)
-        self.centroid_tree_root = self._decompose(all_nodes, None)
-        self.decomposed = True
-        if self.centroid_tree_root:
-            logger.info(f"Centroid decomposition completed, root: {self.centroid_tree_root.value}")
-        else:
-            logger.info("Centroid decomposition completed")
+        Raises:
+            ValueError: If tree not decomposed or k is negative.
+        """
+        self._require_decomposed()
+        if k < 0:
+            raise ValueError(f"k must be non-negative, got {k}")
+
+        histogram = self._hist_values
+        bounds = self._hist_bounds
+        merged = self._hist_merged
+        total = 0
+        for s in range(len(merged)):
+            pairs = self._count_pairs_within(histogram, bounds[s], bounds[s + 1], k)
+            total += pairs if merged[s] else -pairs
+        return total
+
+    def distance_distribution(self) -> List[int]:
+        """Count node pairs at every distance.
+
+        Convolves each stored histogram with itself using an FFT for long
+        histograms, so the cost is O(h log h) per histogram of height h and
+        O(n log^2 n) overall.
 
-    def _dfs_from_centroid(
-        self,
-        centroid: TreeNode,
-        node: TreeNode,
-        parent: Optional[TreeNode],
-        visited: Set[TreeNode],
-        distance: int,
-        callback: Callable[[TreeNode, int], None],
-    ) -> None:
-        """DFS from centroid to process nodes.
+        Returns:
+            List where entry d is the number of unordered pairs at distance d.
 
-        Args:
-            centroid: Centroid node.
-            node: Current node.
-            parent: Parent node.
-            visited: Set of visited nodes.
-            distance: Distance from centroid.
-            callback: Callback function(node, distance).
+        Raises:
+            ValueError: If tree not decomposed.
         """
-        visited.add(node)
-        callback(node, distance)
+        self._require_decomposed()
+
+        histogram = self._hist_values
+        values = np.frombuffer(histogram, dtype=np.intc).astype(np.int64)
+        bounds = self._hist_bounds
+        merged = self._hist_merged
+        longest = max(
+            (bounds[s + 1] - bounds[s] for s in range(len(merged))), default=0
+        )
+        # Ordered pairs (u, v), including u == v, at each distance
+        ordered = np.zeros(max(2 * longest - 1, 1), dtype=np.int64)
+        small = [0] * len(ordered)
+        for s in range(len(merged)):
+            start, end = bounds[s], bounds[s + 1]
+            sign = 1 if merged[s] else -1
+            if end - start <= DIRECT_CONVOLVE_LIMIT:
+                for i in range(start, end):
+                    ci = histogram[i]
+                    if ci:
+                        for j in range(start, end):
+                            small[i + j - 2 * start] += sign * ci * histogram[j]
+                continue
+            product = _self_convolve(values[start:end])
+            if sign > 0:
+                ordered[: len(product)] += product
+            else:
+                ordered[: len(product)] -= product
+
+        # Remove u == v and halve to get unordered pairs of distinct nodes
+        counts = ordered.tolist()
+        for d, extra in enumerate(small):
+            counts[d] += extra
+        for s in range(len(merged)):
+            start, end = bounds[s], bounds[s + 1]
+            sign = 1 if merged[s] else -1
+            for i in range(start, end):
+                counts[2 * (i - start)] -= sign * histogram[i]
+        counts = [c // 2 for c in counts]
+
+        while len(counts) > 1 and counts[-1] == 0:
+            counts.pop()
+        return counts
 
-        for neighbor in node.neighbors:
-            if neighbor != parent and neighbor not in visited:
-                self._dfs_from_centroid(
-                    centroid, neighbor, node, visited, distance + 1, callback
-                )
+    def count_paths_with_condition(
+        self, condition: Callable[[int], bool]
+    ) -> int:
+        """Count paths (unordered pairs of distinct nodes) satisfying condition.
 
-    def solve_with_divide_conquer(
-        self,
-        problem_solver: Callable[[TreeNode, List[Tuple[TreeNode, int]]], float],
-    ) -> float:
-        """Solve tree problem using divide and conquer.
+        condition is evaluated once per distance value on the output of
+        distance_distribution(). For a plain distance bound use
+        count_pairs_within(), which is much faster.
 
         Args:
-            problem_solver: Function that solves problem for centroid and distances.
+            condition: Function that checks if distance satisfies condition.
 
         Returns:
-            Problem solution.
+            Number of paths satisfying condition.
 
         Raises:
             ValueError: If tree not decomposed.
         """
-        if not self.decomposed:
-            raise ValueError("Tree must be decomposed first")
+        counts = self.distance_distribution()
+        return sum(
+            count for d, count in enumerate(counts) if count and condition(d)
+        )
 
-        def solve_recursive(centroid: TreeNode) -> float:
-            if centroid is None:
-                return 0.0
+    def get_distance(
+        self, u: Union[TreeNode, int], v: Union[TreeNode, int]
+    ) -> int:
+        """Get tree distance through the lowest common centroid ancestor.
 
-            visited: Set[TreeNode] = {centroid}
-            distances: List[Tuple[TreeNode, int]] = [(centroid, 0)]
+        Args:
+            u: First node.
+            v: Second node.
 
-            for neighbor in centroid.neighbors:
-                if neighbor not in visited:
-                    self._dfs_from_centroid(
-                        centroid,
-                        neighbor,
-                        centroid,
-                        visited,
-                        1,
-                        lambda n, d: distances.append((n, d)),
-                    )
+        Returns:
+            Number of edges on the path from u to v.
 
-            result = problem_solver(centroid, distances)
+        Raises:
+            ValueError: If tree not decomposed or a node is not in the tree.
+        """
+        self._require_decomposed()
+        u_idx = self._index(u)
+        v_idx = self._index(v)
+        a, b = u_idx, v_idx
+        level = self.centroid_level
+        parent = self.centroid_parent
+        while a != b:
+            if level[a] >= level[b]:
+                a = parent[a]
+            else:
+                b = parent[b]
+        distance = self._level_distance[level[a]]
+        return distance[u_idx] + distance[v_idx]
+
+    def mark_node(self, node: Union[TreeNode, int]) -> None:
+        """Mark a node for nearest-marked-node queries.
+
+        Pushes the node's distance to each of its O(log n) centroid
+        ancestors. Marking an already marked node does nothing.
 
-            parent = self.centroid_tree_parent.get(centroid)
-            if parent:
-                result += solve_recursive(parent)
+        Args:
+            node: Node to mark.
 
-            return result
+        Raises:
+            ValueError: If tree not decomposed or node is not in the tree.
+        """
+        self._require_decomposed()
+        idx = self._index(node)
+        if self._marked[idx]:
+            return
+        self._marked[idx] = 1
+        level = self.centroid_level
+        a = idx
+        while a != -1:
+            distance = self._level_distance[level[a]][idx]
+            heapq.heappush(self._marked_heaps.setdefault(a, []), distance)
+            a = self.centroid_parent[a]
 
-        return solve_recursive(self.centroid_tree_root)
+    def unmark_node(self, node: Union[TreeNode, int]) -> None:
+        """Unmark a node.
 
-    def count_paths_with_condition(
-        self, condition: Callable[[int], bool]
-    ) -> int:
-        """Count paths satisfying condition using divide and conquer.
+        Removal from the per-centroid heaps is lazy: the distances are
+        recorded as pending and dropped when they reach a heap top.
 
         Args:
-            condition: Function that checks if distance satisfies condition.
-
-        Returns:
-            Number of paths satisfying condition.
+            node: Node to unmark.
 
         Raises:
-            ValueError: If tree not decomposed.
+            ValueError: If tree not decomposed or node is not in the tree.
         """
-        if not self.decomposed:
-            raise ValueError("Tree must be decomposed first")
-
-        total_paths = 0
-
-        def solve_for_centroid(
-            centroid: TreeNode, distances: List[Tuple[TreeNode, int]]
-        ) -> float:
-            nonlocal total_paths
-
-            count = 0
-            for node, dist in distances:
-                if condition(dist):
-                    count += 1
+        self._require_decomposed()
+        idx = self._index(node)
+        if not self._marked[idx]:
+            return
+        self._marked[idx] = 0
+        level = self.centroid_level
+        a = idx
+        while a != -1:
+            distance = self._level_distance[level[a]][idx]
+            pending = self._unmarked.setdefault(a, {})
+            pending[distance] = pending.get(distance, 0) + 1
+            a = self.centroid_parent[a]
+
+    def nearest_marked_distance(self, node: Union[TreeNode, int]) -> Optional[int]:
+        """Get distance from node to the closest marked node.
 
-            total_paths += count
-            return count
+        Args:
+            node: Query node.
 
-        self.solve_with_divide_conquer(solve_for_centroid)
-        return total_paths
+        Returns:
+            Distance to the nearest marked node, or None if none is marked.
 
-    def get_centroid_tree_root(self) -> Optional[TreeNode]:
+        Raises:
+            ValueError: If tree not decomposed or node is not in the tree.
+        """
+        self._require_decomposed()
+        idx = self._index(node)
+        level = self.centroid_level
+        best: Optional[int] = None
+        a = idx
+        while a != -1:
+            heap = self._marked_heaps.get(a)
+            if heap:
+                pending = self._unmarked.get(a)
+                while heap and pending and pending.get(heap[0]):
+                    pending[heap[0]] -= 1
+                    heapq.heappop(heap)
+                if heap:
+                    candidate = heap[0] + self._level_distance[level[a]][idx]
+                    if best is None or candidate < best:
+                        best = candidate
+            a = self.centroid_parent[a]
+        return best
+
+    def get_centroid_tree_root(self) -> Optional[Union[TreeNode, int]]:
         """Get root of centroid tree.
 
         Returns:
@@ -389,16 +693,34 @@ class CentroidDecomposition:
         """
         return self.centroid_tree_root
 
-    def get_centroid_parent(self, node: TreeNode) -> Optional[TreeNode]:
+    def get_centroid_parent(
+        self, node: Union[TreeNode, int]
+    ) -> Optional[Union[TreeNode, int]]:
         """Get parent of node in centroid tree.
 
         Args:
             node: Node in centroid tree.
 
         Returns:
-            Parent node or None.
+            Parent node, or None for the centroid tree root or before
+            decomposition.
         """
-        return self.centroid_tree_parent.get(node)
+        if not self.decomposed:
+            return None
+        parent = self.centroid_parent[self._index(node)]
+        return None if parent == -1 else self._node(parent)
+
+    @staticmethod
+    def _label(node: Union[TreeNode, int]) -> int:
+        """Get printable identifier for a node.
+
+        Args:
+            node: TreeNode or node index.
+
+        Returns:
+            TreeNode value or the index itself.
+        """
+        return node.value if isinstance(node, TreeNode) else node
 
 
 def build_tree_from_edges(
@@ -434,6 +756,99 @@ def build_tree_from_edges(
     return root
 
 
+def generate_random_edges(
+    n: int, shape: str = "random", seed: Optional[int] = None
+) -> List[Tuple[int, int]]:
+    """Generate a random tree as an undirected edge list over nodes 0..n-1.
+
+    Args:
+        n: Number of nodes.
+        shape: "random" (each node attached to a uniformly chosen earlier
+            node) or "path" (a chain of length n - 1).
+        seed: Random seed.
+
+    Returns:
+        List of n - 1 (parent, child) edges.
+
+    Raises:
+        ValueError: If shape is unknown or n < 1.
+    """
+    if n < 1:
+        raise ValueError("Tree must have at least one node")
+    if shape not in ("random", "path"):
+        raise ValueError(f"Unknown shape: {shape}. Choose from random, path")
+
+    rng = random.Random(seed)
+    if shape == "path":
+        return [(i - 1, i) for i in range(1, n)]
+    return [(rng.randrange(i), i) for i in range(1, n)]
+
+
+def benchmark_pair_counting(
+    n: int = 100000,
+    k: int = 10,
+    num_queries: int = 100000,
+    shape: str = "random",
+    seed: Optional[int] = None,
+) -> Dict[str, any]:
+    """Benchmark decomposition, pair counting and nearest-marked queries.
+
+    Queries alternate between marking a random node and asking for the
+    nearest marked node from another random node.
+
+    Args:
+        n: Number of nodes.
+        k: Distance bound for count_pairs_within.
+        num_queries: Number of mark plus nearest-marked operations.
+        shape: Tree shape passed to generate_random_edges.
+        seed: Random seed.
+
+    Returns:
+        Dictionary with tree size, pair count, timings and success flag.
+    """
+    try:
+        rng = random.Random(seed)
+        edges = generate_random_edges(n, shape=shape, seed=seed)
+        targets = [rng.randrange(n) for _ in range(num_queries)]
+
+        start_time = time.perf_counter()
+        cd = CentroidDecomposition.from_edges(n, edges)
+        cd.decompose()
+        decompose_time = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        pairs = cd.count_pairs_within(k)
+        count_time = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        for i, node in enumerate(targets):
+            if i % 2 == 0:
+                cd.mark_node(node)
+            else:
+                cd.nearest_marked_distance(node)
+        query_time = time.perf_counter() - start_time
+
+        return {
+            "n": n,
+            "k": k,
+            "shape": shape,
+            "pairs": pairs,
+            "centroid_depth": len(cd._level_distance),
+            "decompose_seconds": decompose_time,
+            "count_seconds": count_time,
+            "query_seconds": query_time,
+            "queries_per_second": (
+                num_queries / query_time if query_time > 0 else 0.0
+            ),
+            "time_seconds": decompose_time + count_time,
+            "time_milliseconds": (decompose_time + count_time) * 1000,
+            "success": True,
+        }
+    except Exception as e:
+        logger.error(f"Error benchmarking pair counting: {e}")
+        return {"success": False, "error": str(e)}
+
+
 def main() -> None:
     """Main function to demonstrate centroid decomposition."""
     print("Centroid Decomposition Demo")
@@ -460,6 +875,18 @@ def main() -> None:
     print("\nCounting paths with distance <= 2:")
     count = cd.count_paths_with_condition(lambda d: d <= 2)
     print(f"Number of paths: {count}")
+    print(f"Two-pointer count: {cd.count_pairs_within(2)}")
+
+    cd.mark_node(cd.nodes[3])
+    nearest = cd.nearest_marked_distance(cd.nodes[6])
+    print(f"\nNearest marked node to 6 (3 marked): {nearest}")
+
+    print("\nBenchmark (20000 nodes, k = 10):")
+    stats = benchmark_pair_counting(n=20000, k=10, num_queries=20000, seed=42)
+    if stats["success"]:
+        print(f"Decompose: {stats['decompose_seconds']:.3f}s")
+        print(f"Pairs within 10: {stats['pairs']} ({stats['count_seconds']:.3f}s)")
+        print(f"Mark/nearest queries: {stats['queries_per_second']:.0f} ops/s")
 
 
 if __name__ == "__main__":
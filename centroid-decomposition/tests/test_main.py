@@ -1,12 +1,41 @@
 """Unit tests for centroid decomposition module."""
 
+import random
 import tempfile
+from collections import deque
 from pathlib import Path
 
 import pytest
 import yaml
 
-from src.main import CentroidDecomposition, TreeNode, build_tree_from_edges
+from src.main import (
+    CentroidDecomposition,
+    TreeNode,
+    benchmark_pair_counting,
+    build_tree_from_edges,
+    generate_random_edges,
+)
+
+
+def brute_force_distances(n, edges):
+    """All-pairs distances by BFS from every node."""
+    adjacency = [[] for _ in range(n)]
+    for u, v in edges:
+        adjacency[u].append(v)
+        adjacency[v].append(u)
+    distances = []
+    for source in range(n):
+        dist = [-1] * n
+        dist[source] = 0
+        queue = deque([source])
+        while queue:
+            x = queue.popleft()
+            for y in adjacency[x]:
+                if dist[y] < 0:
+                    dist[y] = dist[x] + 1
+                    queue.append(y)
+        distances.append(dist)
+    return distances
 
 
 class TestTreeNode:
@@ -208,6 +237,199 @@ class TestCentroidDecomposition:
         assert cd.decomposed is True
         assert cd.centroid_tree_root is not None
 
+    def test_count_paths_matches_pairs(self, complex_tree, config_file):
+        """Test condition counting counts node pairs across subtrees."""
+        root, _, _, _, _, _, _ = complex_tree
+        cd = CentroidDecomposition(root, config_path=config_file)
+        cd.decompose()
+
+        # 6 edges, 3 sibling pairs and 4 grandparent pairs.
+        assert cd.count_paths_with_condition(lambda d: d <= 2) == 13
+        assert cd.count_pairs_within(2) == 13
+        assert cd.count_paths_with_condition(lambda d: d >= 0) == 21
+
+    def test_solve_visits_every_centroid(self, complex_tree, config_file):
+        """Test problem solver is called once per node."""
+        root, _, _, _, _, _, _ = complex_tree
+        cd = CentroidDecomposition(root, config_path=config_file)
+        cd.decompose()
+
+        centroids = []
+
+        def problem_solver(centroid, distances):
+            centroids.append(centroid)
+            return len(distances)
+
+        result = cd.solve_with_divide_conquer(problem_solver)
+        assert len(centroids) == 7
+        assert set(centroids) == set(cd.nodes)
+        assert result == 7 + 3 + 3 + 4
+
+    def test_deep_path_tree(self, config_file):
+        """Test decomposition of a long path does not recurse."""
+        n = 20000
+        root = build_tree_from_edges(n, [(i, i + 1) for i in range(n - 1)], 0)
+        cd = CentroidDecomposition(root, config_path=config_file)
+        cd.decompose()
+
+        assert cd.n == n
+        assert len(cd._level_distance) <= 15
+        assert cd.count_pairs_within(1) == n - 1
+
+
+class TestPairCounting:
+    """Test cases for array-encoded pair counting and marked-node queries."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create temporary directory for testing."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+
+    @pytest.fixture
+    def config_file(self, temp_dir):
+        """Create temporary config file."""
+        config = {
+            "logging": {"level": "INFO", "file": str(temp_dir / "app.log")},
+        }
+        config_path = temp_dir / "config.yaml"
+        with open(config_path, "w") as f:
+            yaml.dump(config, f)
+        return str(config_path)
+
+    @pytest.mark.parametrize("shape", ["random", "path"])
+    def test_count_pairs_matches_brute_force(self, shape, config_file):
+        """Test two-pointer pair counts against all-pairs BFS."""
+        for seed in range(10):
+            n = 30 + seed
+            edges = generate_random_edges(n, shape=shape, seed=seed)
+            distances = brute_force_distances(n, edges)
+            cd = CentroidDecomposition.from_edges(n, edges, config_path=config_file)
+            cd.decompose()
+
+            for k in range(n + 1):
+                expected = sum(
+                    1
+                    for u in range(n)
+                    for v in range(u + 1, n)
+                    if distances[u][v] <= k
+                )
+                assert cd.count_pairs_within(k) == expected
+
+    def test_distance_distribution(self, config_file):
+        """Test exact-distance pair counts against all-pairs BFS."""
+        n = 40
+        edges = generate_random_edges(n, seed=7)
+        distances = brute_force_distances(n, edges)
+        cd = CentroidDecomposition.from_edges(n, edges, config_path=config_file)
+        cd.decompose()
+
+        counts = cd.distance_distribution()
+        assert sum(counts) == n * (n - 1) // 2
+        for d, count in enumerate(counts):
+            assert count == sum(
+                1 for u in range(n) for v in range(u + 1, n) if distances[u][v] == d
+            )
+
+    def test_distance_distribution_long_path(self, config_file):
+        """Test FFT convolution on long histograms is exact."""
+        n = 3000
+        edges = generate_random_edges(n, shape="path", seed=1)
+        cd = CentroidDecomposition.from_edges(n, edges, config_path=config_file)
+        cd.decompose()
+
+        assert cd.distance_distribution() == [0] + [n - d for d in range(1, n)]
+        assert cd.count_paths_with_condition(lambda d: d >= n - 2) == 3
+
+    def test_get_distance(self, config_file):
+        """Test distances through centroid ancestors."""
+        n = 50
+        edges = generate_random_edges(n, seed=3)
+        distances = brute_force_distances(n, edges)
+        cd = CentroidDecomposition.from_edges(n, edges, config_path=config_file)
+        cd.decompose()
+
+        for u in range(n):
+            for v in range(n):
+                assert cd.get_distance(u, v) == distances[u][v]
+
+    def test_nearest_marked_node(self, config_file):
+        """Test mark/unmark and nearest-marked queries against brute force."""
+        n = 60
+        edges = generate_random_edges(n, seed=11)
+        distances = brute_force_distances(n, edges)
+        cd = CentroidDecomposition.from_edges(n, edges, config_path=config_file)
+        cd.decompose()
+
+        assert cd.nearest_marked_distance(0) is None
+        rng = random.Random(5)
+        marked = set()
+        for _ in range(500):
+            node = rng.randrange(n)
+            action = rng.random()
+            if action < 0.3:
+                cd.mark_node(node)
+                marked.add(node)
+            elif action < 0.5:
+                cd.unmark_node(node)
+                marked.discard(node)
+            else:
+                expected = min((distances[node][m] for m in marked), default=None)
+                assert cd.nearest_marked_distance(node) == expected
+
+    def test_centroid_depth_is_logarithmic(self, config_file):
+        """Test centroid tree depth on a path is about log2(n)."""
+        n = 1024
+        edges = generate_random_edges(n, shape="path")
+        cd = CentroidDecomposition.from_edges(n, edges, config_path=config_file)
+        cd.decompose()
+
+        assert len(cd._level_distance) <= 11
+        assert cd.get_centroid_parent(cd.get_centroid_tree_root()) is None
+
+    def test_from_edges_invalid(self, config_file):
+        """Test edge lists that are not trees are rejected."""
+        with pytest.raises(ValueError):
+            CentroidDecomposition.from_edges(0, [], config_path=config_file)
+        with pytest.raises(ValueError):
+            CentroidDecomposition.from_edges(3, [(0, 1)], config_path=config_file)
+        with pytest.raises(ValueError):
+            CentroidDecomposition.from_edges(3, [(0, 1), (1, 5)], config_path=config_file)
+        with pytest.raises(ValueError):
+            CentroidDecomposition.from_edges(
+                4, [(0, 1), (1, 0), (2, 3)], config_path=config_file
+            )
+
+    def test_queries_require_decomposition(self, config_file):
+        """Test queries before decompose() raise."""
+        cd = CentroidDecomposition.from_edges(
+            3, [(0, 1), (1, 2)], config_path=config_file
+        )
+        with pytest.raises(ValueError):
+            cd.count_pairs_within(1)
+        with pytest.raises(ValueError):
+            cd.mark_node(0)
+        cd.decompose()
+        with pytest.raises(ValueError):
+            cd.count_pairs_within(-1)
+        with pytest.raises(ValueError):
+            cd.nearest_marked_distance(3)
+
+    def test_benchmark(self):
+        """Test benchmark result."""
+        result = benchmark_pair_counting(n=2000, k=5, num_queries=1000, seed=1)
+        assert result["success"] is True
+        assert result["n"] == 2000
+        assert result["pairs"] > 0
+        assert result["centroid_depth"] <= 11
+
+    def test_generate_random_edges_invalid(self):
+        """Test invalid generator arguments."""
+        with pytest.raises(ValueError):
+            generate_random_edges(0)
+        with pytest.raises(ValueError):
+            generate_random_edges(10, shape="star")
+
 
 class TestBuildTreeFromEdges:
     """Test cases for build_tree_from_edges function."""
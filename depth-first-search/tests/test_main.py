@@ -6,7 +6,7 @@ from pathlib import Path
 import pytest
 import yaml
 
-from src.main import Graph, DFS
+from src.main import CSRGraph, DFS, Graph
 
 
 class TestGraph:
@@ -310,3 +310,84 @@ class TestDFS:
         path = dfs.dfs_recursive(graph, 0)
         assert len(path) == 3
         assert set(path) == {0, 1, 2}
+
+
+class TestCSRGraph:
+    """Test cases for CSRGraph class and DFS over CSR graphs."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create temporary directory for testing."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+
+    @pytest.fixture
+    def dfs(self, temp_dir):
+        """Create DFS instance."""
+        config_path = temp_dir / "config.yaml"
+        with open(config_path, "w") as f:
+            yaml.dump(
+                {"logging": {"level": "INFO", "file": str(temp_dir / "app.log")}}, f
+            )
+        return DFS(config_path=str(config_path))
+
+    @pytest.fixture
+    def edges(self):
+        """Edge list with two components."""
+        return [(0, 1), (0, 2), (1, 3), (2, 3), (3, 4), (5, 6)]
+
+    def test_from_graph_preserves_order(self, edges):
+        """Test conversion keeps vertex and neighbor order."""
+        graph = Graph()
+        for u, v in edges:
+            graph.add_edge(u, v)
+        csr = CSRGraph.from_graph(graph)
+        assert csr.get_vertices() == graph.get_vertices()
+        for vertex in graph.get_vertices():
+            assert csr.get_neighbors(vertex) == graph.get_neighbors(vertex)
+
+    def test_matches_recursive_order(self, dfs, edges):
+        """Test CSR traversal reproduces recursive DFS order."""
+        graph = Graph()
+        for u, v in edges:
+            graph.add_edge(u, v)
+        csr = CSRGraph.from_edges(edges)
+        expected = dfs.dfs_recursive(graph, 0)
+        assert dfs.dfs_recursive(csr, 0) == expected
+        assert dfs.dfs_iterative(csr, 0) == expected
+        assert dfs.dfs_all_components(csr) == dfs.dfs_all_components(graph)
+        assert dfs.find_path(csr, 0, 4) == dfs.find_path(graph, 0, 4)
+        assert dfs.find_path(csr, 0, 6) is None
+
+    def test_deep_path_graph(self, dfs):
+        """Test CSR traversal handles paths deeper than the recursion limit."""
+        n = 20000
+        csr = CSRGraph.from_edges([(i, i + 1) for i in range(n - 1)], directed=True)
+        assert dfs.dfs_iterative(csr, 0) == list(range(n))
+        assert dfs.find_path(csr, 0, n - 1) == list(range(n))
+
+    def test_invalid_start(self, dfs, edges):
+        """Test missing start vertex raises ValueError."""
+        csr = CSRGraph.from_edges(edges)
+        with pytest.raises(ValueError, match="not in graph"):
+            dfs.dfs_recursive(csr, 99)
+
+    @pytest.mark.parametrize("use_mmap", [True, False])
+    def test_save_load_roundtrip(self, dfs, temp_dir, use_mmap):
+        """Test binary save/load preserves labels and adjacency."""
+        csr = CSRGraph.from_edges([("a", "b"), ("b", "c")], directed=True)
+        path = temp_dir / "graph.csr"
+        csr.save(str(path))
+
+        with CSRGraph.load(str(path), use_mmap=use_mmap) as loaded:
+            assert loaded.directed is True
+            assert loaded.get_vertices() == ["a", "b", "c"]
+            assert dfs.dfs_iterative(loaded, "a") == ["a", "b", "c"]
+
+    def test_from_edge_list_file(self, temp_dir):
+        """Test bulk loading from an edge list file with string ids."""
+        path = temp_dir / "edges.txt"
+        path.write_text("a b\nb c\n")
+        csr = CSRGraph.from_edge_list_file(str(path), numeric_ids=False)
+        assert csr.get_neighbors("b") == ["a", "c"]
+        assert csr.num_edges == 2
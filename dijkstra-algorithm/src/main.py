@@ -7,12 +7,32 @@ for finding shortest paths from a source vertex to all other vertices.
 """
 
 import argparse
+import functools
 import heapq
+import itertools
+import json
 import logging
 import logging.handlers
+import mmap
+import struct
+import sys
+import threading
+import weakref
+from array import array
 from collections import defaultdict
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
 import yaml
 from dotenv import load_dotenv
@@ -107,9 +127,677 @@ class WeightedGraph:
         return "\n".join(lines)
 
 
+class CSRGraph:
+    """Frozen graph in compressed sparse row (CSR) form.
+
+    Vertex labels are remapped to ids 0..n-1. The neighbors of id u are
+    targets[offsets[u]:offsets[u + 1]], with edge weights (if any) at the
+    same positions in weights. Arrays are stdlib ``array`` objects, or
+    read-only memoryviews over a memory-mapped file after load().
+    Undirected edges are stored once in each direction.
+    """
+
+    MAGIC = b"CSRG"
+    VERSION = 1
+    # magic, version, flags, reserved, num_vertices, num_edges
+    _HEADER = struct.Struct("<4sIIIqq")
+    _FLAG_DIRECTED = 1
+    _FLAG_WEIGHTED = 2
+    _FLAG_LABELS = 4
+    _FLAG_BIG_ENDIAN = 8
+
+    def __init__(
+        self,
+        offsets: Sequence[int],
+        targets: Sequence[int],
+        weights: Optional[Sequence[float]] = None,
+        labels: Optional[List[Any]] = None,
+        directed: bool = False,
+        num_edges: Optional[int] = None,
+    ) -> None:
+        """Initialize CSR graph from prebuilt arrays.
+
+        Args:
+            offsets: Row offsets, length num_vertices + 1.
+            targets: Neighbor ids, length offsets[-1].
+            weights: Optional edge weights aligned with targets.
+            labels: Vertex label per id, or None if labels are the ids.
+            directed: Whether edges are directed.
+            num_edges: Number of input edges (default: len(targets)).
+
+        Raises:
+            ValueError: If array lengths are inconsistent.
+        """
+        if len(offsets) == 0 or offsets[-1] != len(targets):
+            raise ValueError("offsets[-1] must equal the number of targets")
+        if weights is not None and len(weights) != len(targets):
+            raise ValueError("weights must align with targets")
+        if labels is not None and len(labels) != len(offsets) - 1:
+            raise ValueError("labels must have one entry per vertex")
+
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.labels = labels
+        self.directed = directed
+        self.num_vertices = len(offsets) - 1
+        self.num_edges = len(targets) if num_edges is None else num_edges
+        self._index: Optional[Dict[Any, int]] = (
+            None if labels is None else {label: i for i, label in enumerate(labels)}
+        )
+        self._mmap: Optional[mmap.mmap] = None
+
+    @staticmethod
+    def _compact_labels(labels: List[Any]) -> Optional[List[Any]]:
+        """Drop the label table when labels are exactly the ids 0..n-1."""
+        if all(type(label) is int and label == i for i, label in enumerate(labels)):
+            return None
+        return labels
+
+    @classmethod
+    def from_edges(
+        cls,
+        edges: Iterable[Tuple[Any, ...]],
+        directed: bool = False,
+        weighted: bool = False,
+        vertices: Optional[Iterable[Any]] = None,
+    ) -> "CSRGraph":
+        """Bulk-load a CSR graph from an edge list.
+
+        Labels get ids in order of first appearance (vertices first, if
+        given). Neighbor order follows edge order, so traversals match the
+        adjacency-list graph built from the same edges. If the labels turn
+        out to be exactly 0..n-1 no label table is kept.
+
+        Args:
+            edges: (u, v) pairs, or (u, v, weight) triples if weighted.
+            directed: Whether edges are directed.
+            weighted: Whether edges carry a weight.
+            vertices: Optional vertices to include even if isolated.
+
+        Returns:
+            CSRGraph instance.
+        """
+        index: Dict[Any, int] = {}
+        labels: List[Any] = []
+        if vertices is not None:
+            for vertex in vertices:
+                if vertex not in index:
+                    index[vertex] = len(labels)
+                    labels.append(vertex)
+
+        sources = array("i")
+        dests = array("i")
+        edge_weights = array("d") if weighted else None
+        num_edges = 0
+        for edge in edges:
+            u, v = edge[0], edge[1]
+            for vertex in (u, v):
+                if vertex not in index:
+                    index[vertex] = len(labels)
+                    labels.append(vertex)
+            ui = index[u]
+            vi = index[v]
+            sources.append(ui)
+            dests.append(vi)
+            if weighted:
+                edge_weights.append(edge[2])
+            if not directed and ui != vi:
+                sources.append(vi)
+                dests.append(ui)
+                if weighted:
+                    edge_weights.append(edge[2])
+            num_edges += 1
+
+        n = len(labels)
+        counts = [0] * (n + 1)
+        for u in sources:
+            counts[u + 1] += 1
+        for u in range(n):
+            counts[u + 1] += counts[u]
+        offsets = array("q", counts)
+
+        position = counts[:-1]
+        targets = array("i", bytes(4 * len(dests)))
+        weights = array("d", bytes(8 * len(dests))) if weighted else None
+        for k, u in enumerate(sources):
+            p = position[u]
+            targets[p] = dests[k]
+            if weighted:
+                weights[p] = edge_weights[k]
+            position[u] = p + 1
+
+        logger.info(f"Built CSR graph: {n} vertices, {num_edges} edges")
+        return cls(
+            offsets,
+            targets,
+            weights=weights,
+            labels=cls._compact_labels(labels),
+            directed=directed,
+            num_edges=num_edges,
+        )
+
+    @classmethod
+    def from_graph(cls, graph: WeightedGraph) -> "CSRGraph":
+        """Freeze an adjacency-list WeightedGraph into CSR form.
+
+        Vertex and neighbor order are preserved. Vertices that only appear
+        as targets of directed edges get an empty row.
+
+        Args:
+            graph: Weighted graph to convert.
+
+        Returns:
+            CSRGraph instance.
+        """
+        labels = graph.get_vertices()
+        index = {vertex: i for i, vertex in enumerate(labels)}
+        offsets = array("q", [0])
+        targets = array("i")
+        weights = array("d")
+        for vertex in labels:
+            for neighbor, weight in graph.get_neighbors(vertex):
+                if neighbor not in index:
+                    index[neighbor] = len(labels)
+                    labels.append(neighbor)
+                targets.append(index[neighbor])
+                weights.append(weight)
+            offsets.append(len(targets))
+
+        return cls(
+            offsets,
+            targets,
+            weights=weights,
+            labels=cls._compact_labels(labels),
+            directed=graph.directed,
+            num_edges=len(targets) if graph.directed else len(targets) // 2,
+        )
+
+    @classmethod
+    def from_edge_list_file(
+        cls,
+        path: str,
+        directed: bool = False,
+        weighted: bool = False,
+        numeric_ids: bool = True,
+        comment: str = "#",
+    ) -> "CSRGraph":
+        """Bulk-load a CSR graph from a whitespace-separated edge list file.
+
+        Each line is "u v" or "u v weight"; blank lines and lines starting
+        with the comment prefix are skipped.
+
+        Args:
+            path: Path to edge list file.
+            directed: Whether edges are directed.
+            weighted: Whether each line has a third weight column.
+            numeric_ids: Parse vertex labels as int (default: True).
+            comment: Comment line prefix (default: "#").
+
+        Returns:
+            CSRGraph instance.
+
+        Raises:
+            ValueError: If a line has too few columns.
+        """
+        parse_id = int if numeric_ids else str
+
+        def read_edges() -> Iterator[Tuple[Any, ...]]:
+            with open(path, "r", encoding="utf-8") as f:
+                for line_number, line in enumerate(f, 1):
+                    fields = line.split()
+                    if not fields or fields[0].startswith(comment):
+                        continue
+                    if len(fields) < (3 if weighted else 2):
+                        raise ValueError(
+                            f"Line {line_number}: expected "
+                            f"{'u v weight' if weighted else 'u v'}"
+                        )
+                    u = parse_id(fields[0])
+                    v = parse_id(fields[1])
+                    if weighted:
+                        yield u, v, float(fields[2])
+                    else:
+                        yield u, v
+
+        return cls.from_edges(read_edges(), directed=directed, weighted=weighted)
+
+    def save(self, path: str) -> None:
+        """Save graph in the binary CSR format.
+
+        The file holds a 32-byte header, then offsets (int64), targets
+        (int32), weights (float64, if weighted) in native byte order, then
+        the label table as JSON if labels are not the ids.
+
+        Args:
+            path: Output file path.
+        """
+        flags = 0
+        if self.directed:
+            flags |= self._FLAG_DIRECTED
+        if self.weights is not None:
+            flags |= self._FLAG_WEIGHTED
+        if self.labels is not None:
+            flags |= self._FLAG_LABELS
+        if sys.byteorder == "big":
+            flags |= self._FLAG_BIG_ENDIAN
+
+        output_file = Path(path)
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_file, "wb") as f:
+            f.write(
+                self._HEADER.pack(
+                    self.MAGIC,
+                    self.VERSION,
+                    flags,
+                    0,
+                    self.num_vertices,
+                    self.num_edges,
+                )
+            )
+            f.write(array("q", self.offsets).tobytes())
+            f.write(array("i", self.targets).tobytes())
+            if self.weights is not None:
+                f.write(array("d", self.weights).tobytes())
+            if self.labels is not None:
+                f.write(json.dumps(self.labels).encode("utf-8"))
+        logger.info(f"Saved CSR graph to {path}")
+
+    @classmethod
+    def load(cls, path: str, use_mmap: bool = True) -> "CSRGraph":
+        """Load a graph saved with save().
+
+        With use_mmap the arrays are zero-copy memoryviews over a read-only
+        memory map, so only the pages a traversal touches are read. Call
+        close() (or use the graph as a context manager) to release it.
+
+        Args:
+            path: File path.
+            use_mmap: Memory-map the file instead of reading it (default:
+                True).
+
+        Returns:
+            CSRGraph instance.
+
+        Raises:
+            ValueError: If the file is not a CSR graph file or was written
+                with a different byte order.
+        """
+        with open(path, "rb") as f:
+            if use_mmap:
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                buffer = f.read()
+
+        header_size = cls._HEADER.size
+        if len(buffer) < header_size:
+            raise ValueError(f"Not a CSR graph file: {path}")
+        magic, version, flags, _, num_vertices, num_edges = cls._HEADER.unpack_from(
+            buffer, 0
+        )
+        if magic != cls.MAGIC or version != cls.VERSION:
+            raise ValueError(f"Not a CSR graph file: {path}")
+        if bool(flags & cls._FLAG_BIG_ENDIAN) != (sys.byteorder == "big"):
+            raise ValueError(f"CSR graph file has foreign byte order: {path}")
+
+        view = memoryview(buffer)
+        position = header_size
+        end = position + 8 * (num_vertices + 1)
+        offsets = view[position:end].cast("q")
+        num_arcs = offsets[-1]
+        position, end = end, end + 4 * num_arcs
+        targets = view[position:end].cast("i")
+        weights = None
+        if flags & cls._FLAG_WEIGHTED:
+            position, end = end, end + 8 * num_arcs
+            weights = view[position:end].cast("d")
+        labels = None
+        if flags & cls._FLAG_LABELS:
+            labels = [
+                tuple(label) if isinstance(label, list) else label
+                for label in json.loads(bytes(view[end:]).decode("utf-8"))
+            ]
+
+        if not use_mmap:
+            offsets = array("q", offsets)
+            targets = array("i", targets)
+            if weights is not None:
+                weights = array("d", weights)
+
+        graph = cls(
+            offsets,
+            targets,
+            weights=weights,
+            labels=labels,
+            directed=bool(flags & cls._FLAG_DIRECTED),
+            num_edges=num_edges,
+        )
+        if use_mmap:
+            graph._mmap = buffer
+        logger.info(
+            f"Loaded CSR graph from {path}: {num_vertices} vertices, "
+            f"{num_edges} edges{' (mmap)' if use_mmap else ''}"
+        )
+        return graph
+
+    def close(self) -> None:
+        """Release the memory map held by a graph from load()."""
+        if self._mmap is None:
+            return
+        for name in ("offsets", "targets", "weights"):
+            data = getattr(self, name)
+            if isinstance(data, memoryview):
+                data.release()
+        self._mmap.close()
+        self._mmap = None
+
+    def __enter__(self) -> "CSRGraph":
+        """Enter context manager."""
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Exit context manager, releasing any memory map."""
+        self.close()
+
+    def __contains__(self, vertex: Any) -> bool:
+        """Check whether a vertex label is in the graph."""
+        if self._index is not None:
+            return vertex in self._index
+        return type(vertex) is int and 0 <= vertex < self.num_vertices
+
+    def index_of(self, vertex: Any) -> int:
+        """Get the id of a vertex label.
+
+        Args:
+            vertex: Vertex label.
+
+        Returns:
+            Vertex id.
+
+        Raises:
+            ValueError: If vertex not in graph.
+        """
+        if vertex not in self:
+            raise ValueError(f"Vertex {vertex} not in graph")
+        return vertex if self._index is None else self._index[vertex]
+
+    def label_of(self, index: int) -> Any:
+        """Get the label of a vertex id.
+
+        Args:
+            index: Vertex id.
+
+        Returns:
+            Vertex label.
+        """
+        return index if self.labels is None else self.labels[index]
+
+    def labels_of(self, indices: Iterable[int]) -> List[Any]:
+        """Map vertex ids to labels.
+
+        Args:
+            indices: Vertex ids.
+
+        Returns:
+            List of vertex labels.
+        """
+        if self.labels is None:
+            return list(indices)
+        labels = self.labels
+        return [labels[i] for i in indices]
+
+    def neighbors(self, index: int) -> Sequence[int]:
+        """Get neighbor ids of a vertex id.
+
+        Args:
+            index: Vertex id.
+
+        Returns:
+            Slice of targets holding the neighbor ids.
+        """
+        return self.targets[self.offsets[index]:self.offsets[index + 1]]
+
+    def get_vertices(self) -> List[Any]:
+        """Get all vertex labels in id order.
+
+        Returns:
+            List of vertex labels.
+        """
+        if self.labels is None:
+            return list(range(self.num_vertices))
+        return list(self.labels)
+
+    def get_neighbors(self, vertex: Any) -> List[Any]:
+        """Get neighbor labels of a vertex label.
+
+        Args:
+            vertex: Vertex label.
+
+        Returns:
+            List of neighboring vertex labels.
+        """
+        return self.labels_of(self.neighbors(self.index_of(vertex)))
+
+    def transpose(self) -> "CSRGraph":
+        """Build the graph with every arc reversed.
+
+        Each row of the result lists its sources in increasing id order.
+
+        Returns:
+            New CSRGraph sharing this graph's labels.
+        """
+        n = self.num_vertices
+        offsets = self.offsets
+        targets = self.targets
+        weights = self.weights
+        counts = [0] * (n + 1)
+        for v in targets:
+            counts[v + 1] += 1
+        for v in range(n):
+            counts[v + 1] += counts[v]
+
+        position = counts[:-1]
+        reversed_targets = array("i", bytes(4 * len(targets)))
+        reversed_weights = (
+            None if weights is None else array("d", bytes(8 * len(targets)))
+        )
+        for u in range(n):
+            for p in range(offsets[u], offsets[u + 1]):
+                v = targets[p]
+                q = position[v]
+                reversed_targets[q] = u
+                if weights is not None:
+                    reversed_weights[q] = weights[p]
+                position[v] = q + 1
+
+        return type(self)(
+            array("q", counts),
+            reversed_targets,
+            weights=reversed_weights,
+            labels=self.labels,
+            directed=self.directed,
+            num_edges=self.num_edges,
+        )
+
+    def memory_bytes(self) -> int:
+        """Get the size of the CSR arrays in bytes.
+
+        Returns:
+            Bytes used by offsets, targets and weights (label table
+            excluded).
+        """
+        total = 8 * len(self.offsets) + 4 * len(self.targets)
+        if self.weights is not None:
+            total += 8 * len(self.weights)
+        return total
+
+
+class SearchWorkspace:
+    """Reusable per-search state for Dijkstra over CSR graphs.
+
+    dist and parent entries are only valid where the stamp matches the
+    current search: stamp[v] is version once v is reached and -version once
+    it is settled. Starting a new search bumps the version in O(1) instead
+    of reallocating or clearing O(V) state. Plain lists are used rather than
+    typed arrays because the search loop indexes them on every edge, and
+    list reads avoid re-boxing numbers.
+    """
+
+    def __init__(self, num_vertices: int) -> None:
+        """Initialize workspace.
+
+        Args:
+            num_vertices: Number of vertex ids the workspace can hold.
+        """
+        self.num_vertices = num_vertices
+        self.dist: List[float] = [0.0] * num_vertices
+        self.parent: List[int] = [-1] * num_vertices
+        self.stamp: List[int] = [0] * num_vertices
+        self.version = 0
+
+    def begin(self) -> int:
+        """Start a new search, invalidating all entries.
+
+        Returns:
+            Version stamp of the new search.
+        """
+        self.version += 1
+        return self.version
+
+    def is_reached(self, index: int) -> bool:
+        """Check whether a vertex id has a distance in the current search."""
+        return abs(self.stamp[index]) == self.version
+
+    def is_settled(self, index: int) -> bool:
+        """Check whether a vertex id's distance is final in the current search."""
+        return self.stamp[index] == -self.version
+
+
+class BucketQueue:
+    """Dial's bucket queue for non-negative integer keys.
+
+    Keys pushed must lie within max_span of the last popped key, which holds
+    for Dijkstra when max_span is the largest edge weight. Buckets are used
+    circularly, so push is O(1) and pop is amortized O(1) per unit of key
+    range scanned.
+    """
+
+    def __init__(self, max_span: int) -> None:
+        """Initialize bucket queue.
+
+        Args:
+            max_span: Largest difference between a pushed key and the last
+                popped key.
+        """
+        self._buckets: List[List[Any]] = [[] for _ in range(max_span + 1)]
+        self._current = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        """Get number of queued items."""
+        return self._size
+
+    def push(self, item: Tuple[int, Any]) -> None:
+        """Add a (key, value) item with an integer key.
+
+        Raises:
+            ValueError: If key is outside the current window.
+        """
+        key = item[0]
+        if not self._current <= key <= self._current + len(self._buckets) - 1:
+            raise ValueError(
+                f"Key {key} outside bucket window starting at {self._current}"
+            )
+        self._buckets[key % len(self._buckets)].append(item[1])
+        self._size += 1
+
+    def pop(self) -> Tuple[int, Any]:
+        """Remove an item with the smallest key.
+
+        Returns:
+            Tuple of (key, value).
+
+        Raises:
+            IndexError: If queue is empty.
+        """
+        if not self._size:
+            raise IndexError("pop from empty BucketQueue")
+        buckets = self._buckets
+        num_buckets = len(buckets)
+        current = self._current
+        while not buckets[current % num_buckets]:
+            current += 1
+        self._current = current
+        self._size -= 1
+        return current, buckets[current % num_buckets].pop()
+
+
+class RadixHeap:
+    """Radix heap for monotone non-negative integer keys below 2**64.
+
+    Keys pushed must not be smaller than the last popped key, which holds
+    for Dijkstra with non-negative integer weights. Items sit in buckets by
+    the highest bit where their key differs from the last popped key and
+    only ever move to lower buckets, so each is redistributed at most 64
+    times regardless of the weight range.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty radix heap."""
+        self._buckets: List[List[Tuple[int, Any]]] = [[] for _ in range(65)]
+        self._last = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        """Get number of queued items."""
+        return self._size
+
+    def push(self, item: Tuple[int, Any]) -> None:
+        """Add a (key, value) item with an integer key.
+
+        Raises:
+            ValueError: If key is smaller than the last popped key.
+        """
+        key = item[0]
+        if key < self._last:
+            raise ValueError(
+                f"Key {key} is smaller than last popped key {self._last}"
+            )
+        self._buckets[(key ^ self._last).bit_length()].append(item)
+        self._size += 1
+
+    def pop(self) -> Tuple[int, Any]:
+        """Remove an item with the smallest key.
+
+        Returns:
+            Tuple of (key, value).
+
+        Raises:
+            IndexError: If heap is empty.
+        """
+        if not self._size:
+            raise IndexError("pop from empty RadixHeap")
+        buckets = self._buckets
+        if not buckets[0]:
+            index = 1
+            while not buckets[index]:
+                index += 1
+            items = buckets[index]
+            buckets[index] = []
+            last = min(key for key, _ in items)
+            self._last = last
+            for item in items:
+                buckets[(item[0] ^ last).bit_length()].append(item)
+        self._size -= 1
+        return buckets[0].pop()
+
+
 class Dijkstra:
     """Dijkstra's algorithm implementation with priority queue optimization."""
 
+    # Priority queues available for CSR graph searches
+    QUEUE_TYPES = ("heap", "dial", "radix")
+
     def __init__(self, config_path: str = "config.yaml") -> None:
         """Initialize Dijkstra with configuration.
 
@@ -125,6 +813,12 @@ class Dijkstra:
         self.distance: Dict[Any, float] = {}
         self.parent: Dict[Any, Optional[Any]] = {}
         self.visited: Set[Any] = set()
+        # One reusable SearchWorkspace per thread
+        self._local = threading.local()
+        # CSR graph -> (integer weights, largest weight) for dial/radix
+        self._integer_weight_cache: weakref.WeakKeyDictionary = (
+            weakref.WeakKeyDictionary()
+        )
 
     def _load_config(self, config_path: str) -> dict:
         """Load configuration from YAML file.
@@ -176,14 +870,23 @@ class Dijkstra:
         )
 
     def shortest_path(
-        self, graph: WeightedGraph, start: Any, target: Any
+        self,
+        graph: Union[WeightedGraph, CSRGraph],
+        start: Any,
+        target: Any,
+        queue: str = "heap",
     ) -> Tuple[Optional[List[Any]], float]:
         """Find shortest path from start to target using Dijkstra's algorithm.
 
         Args:
-            graph: Weighted graph to search.
+            graph: Weighted graph to search (adjacency list or CSR; a CSR
+                graph without weights uses unit weights).
             start: Starting vertex.
             target: Target vertex.
+            queue: Priority queue for CSR searches: "heap" (binary heap),
+                "dial" (bucket queue) or "radix" (radix heap). The last two
+                need non-negative integer weights. A WeightedGraph searched
+                with a queue other than "heap" is frozen to CSR first.
 
         Returns:
             Tuple of (path, distance):
@@ -191,10 +894,15 @@ class Dijkstra:
                 - distance: Shortest distance, or float('inf') if no path
 
         Raises:
-            ValueError: If start or target vertex not in graph.
+            ValueError: If start or target vertex not in graph, or the queue
+                is unknown or does not support the graph's weights.
         """
         logger.info(f"Finding shortest path from {start} to {target} using Dijkstra's algorithm")
 
+        graph = self._resolve_graph(graph, queue)
+        if isinstance(graph, CSRGraph):
+            return self._shortest_path_csr(graph, start, target, queue)
+
         if start not in graph.adjacency_list:
             raise ValueError(f"Start vertex {start} not in graph")
         if target not in graph.adjacency_list:
@@ -260,22 +968,46 @@ class Dijkstra:
         logger.warning(f"No path found from {start} to {target}")
         return None, float('inf')
 
-    def shortest_distances(self, graph: WeightedGraph, start: Any) -> Dict[Any, float]:
+    def shortest_distances(
+        self,
+        graph: Union[WeightedGraph, CSRGraph],
+        start: Any,
+        queue: str = "heap",
+    ) -> Dict[Any, float]:
         """Find shortest distances from start to all reachable vertices.
 
         Args:
-            graph: Weighted graph to search.
+            graph: Weighted graph to search (adjacency list or CSR; a CSR
+                graph without weights uses unit weights).
             start: Starting vertex.
+            queue: Priority queue for CSR searches: "heap" (binary heap),
+                "dial" (bucket queue) or "radix" (radix heap). The last two
+                need non-negative integer weights. A WeightedGraph searched
+                with a queue other than "heap" is frozen to CSR first.
 
         Returns:
             Dictionary mapping each vertex to its shortest distance from start.
             Unreachable vertices are not included.
 
         Raises:
-            ValueError: If start vertex not in graph.
+            ValueError: If start vertex not in graph, or the queue is unknown
+                or does not support the graph's weights.
         """
         logger.info(f"Finding shortest distances from {start} to all vertices")
 
+        graph = self._resolve_graph(graph, queue)
+        if isinstance(graph, CSRGraph):
+            if start not in graph:
+                raise ValueError(f"Start vertex {start} not in graph")
+            reached, workspace = self._dijkstra_csr(
+                graph, graph.index_of(start), queue=queue
+            )
+            self._store_csr_state(graph, reached, workspace)
+            logger.info(
+                f"Found distances to {len(self.distance)} vertices from {start}"
+            )
+            return self.distance.copy()
+
         if start not in graph.adjacency_list:
             raise ValueError(f"Start vertex {start} not in graph")
 
@@ -317,25 +1049,34 @@ class Dijkstra:
         return self.distance.copy()
 
     def shortest_paths_from_source(
-        self, graph: WeightedGraph, start: Any
+        self,
+        graph: Union[WeightedGraph, CSRGraph],
+        start: Any,
+        queue: str = "heap",
     ) -> Dict[Any, Tuple[Optional[List[Any]], float]]:
         """Find shortest paths from start to all reachable vertices.
 
         Args:
-            graph: Weighted graph to search.
+            graph: Weighted graph to search (adjacency list or CSR; a CSR
+                graph without weights uses unit weights).
             start: Starting vertex.
+            queue: Priority queue for CSR searches: "heap" (binary heap),
+                "dial" (bucket queue) or "radix" (radix heap). The last two
+                need non-negative integer weights. A WeightedGraph searched
+                with a queue other than "heap" is frozen to CSR first.
 
         Returns:
             Dictionary mapping each vertex to (path, distance) tuple.
             Unreachable vertices are not included.
 
         Raises:
-            ValueError: If start vertex not in graph.
+            ValueError: If start vertex not in graph, or the queue is unknown
+                or does not support the graph's weights.
         """
         logger.info(f"Finding shortest paths from {start} to all vertices")
 
         # First, compute all shortest distances
-        self.shortest_distances(graph, start)
+        self.shortest_distances(graph, start, queue)
 
         # Reconstruct paths for all vertices
         paths = {}
@@ -355,6 +1096,277 @@ class Dijkstra:
         logger.info(f"Computed paths to {len(paths)} vertices from {start}")
         return paths
 
+    def one_to_many(
+        self,
+        graph: Union[WeightedGraph, CSRGraph],
+        source: Any,
+        targets: Iterable[Any],
+        queue: str = "heap",
+    ) -> Dict[Any, Tuple[Optional[List[Any]], float]]:
+        """Find shortest paths from source to several targets in one search.
+
+        The search stops as soon as every target is settled instead of
+        exploring the whole graph. Unlike the other queries it does not
+        update distance, parent and visited. A WeightedGraph is frozen to
+        CSR first; freeze it once with CSRGraph.from_graph() when running
+        many queries.
+
+        Args:
+            graph: Weighted graph to search (adjacency list or CSR; a CSR
+                graph without weights uses unit weights).
+            source: Starting vertex.
+            targets: Target vertices.
+            queue: Priority queue: "heap" (binary heap), "dial" (bucket
+                queue) or "radix" (radix heap). The last two need
+                non-negative integer weights.
+
+        Returns:
+            Dictionary mapping each target to (path, distance), or
+            (None, float('inf')) if unreachable.
+
+        Raises:
+            ValueError: If source or a target is not in graph, or the queue
+                is unknown or does not support the graph's weights.
+        """
+        if not isinstance(graph, CSRGraph):
+            graph = CSRGraph.from_graph(graph)
+        if source not in graph:
+            raise ValueError(f"Start vertex {source} not in graph")
+        targets = list(targets)
+        for target in targets:
+            if target not in graph:
+                raise ValueError(f"Target vertex {target} not in graph")
+
+        logger.info(
+            f"Finding shortest paths from {source} to {len(targets)} targets "
+            f"({queue} queue)"
+        )
+
+        target_ids = [graph.index_of(target) for target in targets]
+        _, workspace = self._dijkstra_csr(
+            graph, graph.index_of(source), target_ids, queue
+        )
+        results: Dict[Any, Tuple[Optional[List[Any]], float]] = {}
+        for target, target_id in zip(targets, target_ids):
+            if workspace.is_settled(target_id):
+                results[target] = (
+                    graph.labels_of(self._path_ids(workspace, target_id)),
+                    workspace.dist[target_id],
+                )
+            else:
+                results[target] = (None, float("inf"))
+
+        logger.info(
+            f"Reached {sum(path is not None for path, _ in results.values())}"
+            f"/{len(targets)} targets from {source}"
+        )
+        return results
+
+    def get_workspace(self, num_vertices: int) -> SearchWorkspace:
+        """Get this thread's search workspace, growing it if needed.
+
+        Each thread keeps one workspace that is reused by every CSR search
+        it runs, for graphs with up to workspace.num_vertices vertices.
+
+        Args:
+            num_vertices: Number of vertex ids the search needs.
+
+        Returns:
+            SearchWorkspace for the calling thread.
+        """
+        workspace = getattr(self._local, "workspace", None)
+        if workspace is None or workspace.num_vertices < num_vertices:
+            workspace = SearchWorkspace(num_vertices)
+            self._local.workspace = workspace
+            logger.debug(f"Allocated search workspace for {num_vertices} vertices")
+        return workspace
+
+    def _resolve_graph(
+        self, graph: Union[WeightedGraph, CSRGraph], queue: str
+    ) -> Union[WeightedGraph, CSRGraph]:
+        """Validate queue and freeze a WeightedGraph if the queue needs CSR."""
+        if queue not in self.QUEUE_TYPES:
+            raise ValueError(
+                f"Unknown queue: {queue}. Use one of {', '.join(self.QUEUE_TYPES)}"
+            )
+        if queue != "heap" and not isinstance(graph, CSRGraph):
+            return CSRGraph.from_graph(graph)
+        return graph
+
+    def _integer_weights(self, graph: CSRGraph) -> Tuple[Optional[array], int]:
+        """Get integer edge weights and the largest weight for dial/radix.
+
+        The check and conversion run once per graph and are cached.
+
+        Returns:
+            Tuple of (integer weights, or None for unit weights; largest
+            weight).
+
+        Raises:
+            ValueError: If a weight is negative or not an integer.
+        """
+        cached = self._integer_weight_cache.get(graph)
+        if cached is not None:
+            return cached
+
+        if graph.weights is None:
+            cached = (None, 1)
+        else:
+            weights = array("q")
+            for weight in graph.weights:
+                if weight < 0 or not float(weight).is_integer():
+                    raise ValueError(
+                        "Bucket and radix queues require non-negative integer "
+                        f"weights, got {weight}"
+                    )
+                weights.append(int(weight))
+            cached = (weights, max(weights, default=0))
+        self._integer_weight_cache[graph] = cached
+        return cached
+
+    def _dijkstra_csr(
+        self,
+        graph: CSRGraph,
+        source: int,
+        targets: Iterable[int] = (),
+        queue: str = "heap",
+    ) -> Tuple[List[int], SearchWorkspace]:
+        """Run Dijkstra over CSR arrays using vertex ids.
+
+        Distances and parents live in this thread's workspace and the queue
+        holds duplicate (distance, id) items instead of supporting
+        decrease-key; stale items are skipped when popped.
+
+        Args:
+            graph: CSR graph to search.
+            source: Source vertex id.
+            targets: Vertex ids to stop at once all are settled (default:
+                none, search everything reachable).
+            queue: Priority queue type (see QUEUE_TYPES).
+
+        Returns:
+            Tuple of (reached, workspace): ids with a distance in discovery
+            order, and the workspace holding dist, parent and stamps for
+            the current version. Distances of reached vertices that are not
+            settled are tentative.
+        """
+        offsets = graph.offsets
+        graph_targets = graph.targets
+        if queue == "heap":
+            weights = graph.weights
+            heap: List[Tuple[float, int]] = []
+            push = functools.partial(heapq.heappush, heap)
+            pop = functools.partial(heapq.heappop, heap)
+        else:
+            weights, max_weight = self._integer_weights(graph)
+            pending = BucketQueue(max_weight) if queue == "dial" else RadixHeap()
+            push = pending.push
+            pop = pending.pop
+
+        workspace = self.get_workspace(graph.num_vertices)
+        version = workspace.begin()
+        done = -version
+        dist = workspace.dist
+        parent = workspace.parent
+        stamp = workspace.stamp
+
+        remaining = set(targets)
+        dist[source] = 0
+        parent[source] = -1
+        stamp[source] = version
+        reached = [source]
+        unit_weights = itertools.repeat(1)
+        push((0, source))
+
+        while True:
+            try:
+                current_dist, vertex = pop()
+            except IndexError:
+                break
+            if stamp[vertex] == done:
+                continue
+            stamp[vertex] = done
+            if remaining:
+                remaining.discard(vertex)
+                if not remaining:
+                    break
+
+            start = offsets[vertex]
+            end = offsets[vertex + 1]
+            for neighbor, weight in zip(
+                graph_targets[start:end],
+                unit_weights if weights is None else weights[start:end],
+            ):
+                mark = stamp[neighbor]
+                if mark == done:
+                    continue
+                new_distance = current_dist + weight
+                if mark != version:
+                    stamp[neighbor] = version
+                    reached.append(neighbor)
+                elif new_distance >= dist[neighbor]:
+                    continue
+                dist[neighbor] = new_distance
+                parent[neighbor] = vertex
+                push((new_distance, neighbor))
+
+        return reached, workspace
+
+    def _path_ids(self, workspace: SearchWorkspace, target: int) -> List[int]:
+        """Follow parent links from target back to the source."""
+        path_ids = []
+        parent = workspace.parent
+        current = target
+        while current >= 0:
+            path_ids.append(current)
+            current = parent[current]
+        path_ids.reverse()
+        return path_ids
+
+    def _store_csr_state(
+        self, graph: CSRGraph, reached: List[int], workspace: SearchWorkspace
+    ) -> None:
+        """Expose CSR search results through distance, parent and visited."""
+        dist = workspace.dist
+        parent = workspace.parent
+        labels = graph.labels_of(reached)
+        parent_ids = [parent[v] for v in reached]
+        if graph.labels is None:
+            parent_labels = [None if p < 0 else p for p in parent_ids]
+        else:
+            parent_labels = [None if p < 0 else graph.labels[p] for p in parent_ids]
+        self.distance = dict(zip(labels, [dist[v] for v in reached]))
+        self.parent = dict(zip(labels, parent_labels))
+        self.visited = set(labels)
+
+    def _shortest_path_csr(
+        self, graph: CSRGraph, start: Any, target: Any, queue: str = "heap"
+    ) -> Tuple[Optional[List[Any]], float]:
+        """Find shortest path on a CSR graph; see shortest_path()."""
+        if start not in graph:
+            raise ValueError(f"Start vertex {start} not in graph")
+        if target not in graph:
+            raise ValueError(f"Target vertex {target} not in graph")
+
+        if start == target:
+            return [start], 0.0
+
+        goal = graph.index_of(target)
+        reached, workspace = self._dijkstra_csr(
+            graph, graph.index_of(start), (goal,), queue
+        )
+        self._store_csr_state(graph, reached, workspace)
+
+        if not workspace.is_settled(goal):
+            logger.warning(f"No path found from {start} to {target}")
+            return None, float("inf")
+
+        path = graph.labels_of(self._path_ids(workspace, goal))
+        distance = workspace.dist[goal]
+
+        logger.info(f"Shortest path found: {path} (distance: {distance})")
+        return path, distance
+
     def generate_report(
         self,
         graph: WeightedGraph,
@@ -636,6 +1648,7 @@ def main() -> None:
             print("  - shortest_path(graph, start, target)")
             print("  - shortest_distances(graph, start)")
             print("  - shortest_paths_from_source(graph, start)")
+            print("  - one_to_many(graph, source, targets, queue)")
 
     except Exception as e:
         logger.error(f"Error during execution: {e}", exc_info=True)
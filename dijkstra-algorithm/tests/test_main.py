@@ -6,7 +6,14 @@ from pathlib import Path
 import pytest
 import yaml
 
-from src.main import WeightedGraph, Dijkstra
+from src.main import (
+    BucketQueue,
+    CSRGraph,
+    Dijkstra,
+    RadixHeap,
+    SearchWorkspace,
+    WeightedGraph,
+)
 
 
 class TestWeightedGraph:
@@ -321,3 +328,208 @@ class TestDijkstra:
         # Optimal: 0 -> 2 -> 1 = 1 + 1 = 2 (not 0 -> 1 = 10)
         assert distance == 2.0
         assert path == [0, 2, 1]
+
+
+class TestCSRGraph:
+    """Test cases for CSRGraph class and Dijkstra over CSR graphs."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create temporary directory for testing."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+
+    @pytest.fixture
+    def dijkstra(self, temp_dir):
+        """Create Dijkstra instance."""
+        config_path = temp_dir / "config.yaml"
+        with open(config_path, "w") as f:
+            yaml.dump(
+                {"logging": {"level": "INFO", "file": str(temp_dir / "app.log")}}, f
+            )
+        return Dijkstra(config_path=str(config_path))
+
+    @pytest.fixture
+    def edges(self):
+        """Weighted edge list where the direct edge is not shortest."""
+        return [("A", "B", 4), ("A", "C", 1), ("C", "B", 2), ("B", "D", 5), ("E", "F", 1)]
+
+    def test_from_graph_keeps_weights(self, edges):
+        """Test conversion keeps neighbors and weights aligned."""
+        graph = WeightedGraph()
+        for u, v, w in edges:
+            graph.add_edge(u, v, w)
+        csr = CSRGraph.from_graph(graph)
+        row = csr.index_of("B")
+        start, end = csr.offsets[row], csr.offsets[row + 1]
+        assert csr.labels_of(csr.targets[start:end]) == ["A", "C", "D"]
+        assert list(csr.weights[start:end]) == [4.0, 2.0, 5.0]
+
+    def test_matches_adjacency_list_graph(self, dijkstra, edges):
+        """Test Dijkstra results on CSR match the adjacency-list graph."""
+        graph = WeightedGraph()
+        for u, v, w in edges:
+            graph.add_edge(u, v, w)
+        csr = CSRGraph.from_edges(edges, weighted=True)
+        assert dijkstra.shortest_path(csr, "A", "D") == (["A", "C", "B", "D"], 8.0)
+        assert dijkstra.shortest_path(csr, "A", "F") == (None, float("inf"))
+        assert dijkstra.shortest_distances(csr, "A") == dijkstra.shortest_distances(
+            graph, "A"
+        )
+        paths = dijkstra.shortest_paths_from_source(csr, "A")
+        assert paths["B"] == (["A", "C", "B"], 3.0)
+
+    def test_unweighted_uses_unit_weights(self, dijkstra):
+        """Test CSR graph without weights is searched with unit weights."""
+        csr = CSRGraph.from_edges([(0, 1), (1, 2), (0, 2)], directed=True)
+        assert dijkstra.shortest_distances(csr, 0) == {0: 0.0, 1: 1.0, 2: 1.0}
+
+    def test_invalid_target(self, dijkstra, edges):
+        """Test missing target vertex raises ValueError."""
+        csr = CSRGraph.from_edges(edges, weighted=True)
+        with pytest.raises(ValueError, match="not in graph"):
+            dijkstra.shortest_path(csr, "A", "Z")
+
+    @pytest.mark.parametrize("use_mmap", [True, False])
+    def test_save_load_roundtrip(self, dijkstra, edges, temp_dir, use_mmap):
+        """Test binary save/load preserves weights."""
+        csr = CSRGraph.from_edges(edges, weighted=True)
+        path = temp_dir / "graph.csr"
+        csr.save(str(path))
+
+        with CSRGraph.load(str(path), use_mmap=use_mmap) as loaded:
+            assert list(loaded.weights) == list(csr.weights)
+            assert loaded.memory_bytes() == csr.memory_bytes()
+            assert dijkstra.shortest_path(loaded, "A", "D") == (
+                ["A", "C", "B", "D"],
+                8.0,
+            )
+
+    def test_from_weighted_edge_list_file(self, dijkstra, temp_dir):
+        """Test bulk loading a weighted edge list file."""
+        path = temp_dir / "edges.txt"
+        path.write_text("0 1 2.5\n1 2 0.5\n0 2 4\n")
+        csr = CSRGraph.from_edge_list_file(str(path), directed=True, weighted=True)
+        assert dijkstra.shortest_distances(csr, 0) == {0: 0.0, 1: 2.5, 2: 3.0}
+
+    @pytest.mark.parametrize("queue", ["heap", "dial", "radix"])
+    def test_queue_types_match(self, dijkstra, queue):
+        """Test every queue type gives the same distances."""
+        edges = [(0, 1, 7), (0, 2, 9), (0, 5, 14), (1, 2, 10), (1, 3, 15),
+                 (2, 3, 11), (2, 5, 2), (3, 4, 6), (4, 5, 9)]
+        csr = CSRGraph.from_edges(edges, weighted=True)
+        assert dijkstra.shortest_distances(csr, 0, queue=queue) == {
+            0: 0.0, 1: 7.0, 2: 9.0, 5: 11.0, 3: 20.0, 4: 20.0
+        }
+        assert dijkstra.shortest_path(csr, 0, 4, queue=queue) == ([0, 2, 5, 4], 20.0)
+
+    def test_queue_on_weighted_graph(self, dijkstra):
+        """Test a WeightedGraph is frozen for non-heap queues."""
+        graph = WeightedGraph(directed=True)
+        graph.add_edge("a", "b", 3)
+        graph.add_edge("b", "c", 4)
+        assert dijkstra.shortest_path(graph, "a", "c", queue="radix") == (
+            ["a", "b", "c"],
+            7.0,
+        )
+
+    def test_unknown_queue(self, dijkstra, edges):
+        """Test unknown queue name raises ValueError."""
+        csr = CSRGraph.from_edges(edges, weighted=True)
+        with pytest.raises(ValueError, match="Unknown queue"):
+            dijkstra.shortest_distances(csr, "A", queue="fibonacci")
+
+    def test_integer_queue_rejects_fractional_weights(self, dijkstra):
+        """Test dial/radix queues require integer weights."""
+        csr = CSRGraph.from_edges([(0, 1, 1.5)], weighted=True)
+        with pytest.raises(ValueError, match="integer weights"):
+            dijkstra.shortest_distances(csr, 0, queue="dial")
+
+    @pytest.mark.parametrize("queue", ["heap", "dial", "radix"])
+    def test_one_to_many(self, dijkstra, edges, queue):
+        """Test one_to_many returns a path per target."""
+        csr = CSRGraph.from_edges(edges, weighted=True)
+        results = dijkstra.one_to_many(csr, "A", ["B", "D", "F"], queue=queue)
+        assert results == {
+            "B": (["A", "C", "B"], 3.0),
+            "D": (["A", "C", "B", "D"], 8.0),
+            "F": (None, float("inf")),
+        }
+
+    def test_one_to_many_stops_early(self, dijkstra):
+        """Test search stops once all targets are settled."""
+        n = 1000
+        csr = CSRGraph.from_edges(
+            [(i, i + 1, 1) for i in range(n - 1)], directed=True, weighted=True
+        )
+        results = dijkstra.one_to_many(csr, 0, [3, 5])
+        assert results[5] == ([0, 1, 2, 3, 4, 5], 5.0)
+        workspace = dijkstra.get_workspace(n)
+        assert workspace.is_settled(5)
+        assert not workspace.is_reached(7)
+
+    def test_one_to_many_invalid_target(self, dijkstra, edges):
+        """Test missing target raises ValueError."""
+        csr = CSRGraph.from_edges(edges, weighted=True)
+        with pytest.raises(ValueError, match="not in graph"):
+            dijkstra.one_to_many(csr, "A", ["Z"])
+
+    def test_workspace_reused(self, dijkstra, edges):
+        """Test repeated queries reuse the thread's workspace."""
+        csr = CSRGraph.from_edges(edges, weighted=True)
+        dijkstra.shortest_path(csr, "A", "D")
+        workspace = dijkstra.get_workspace(csr.num_vertices)
+        version = workspace.version
+        assert dijkstra.shortest_path(csr, "E", "F") == (["E", "F"], 1.0)
+        assert dijkstra.get_workspace(csr.num_vertices) is workspace
+        assert workspace.version == version + 1
+        assert not workspace.is_reached(csr.index_of("A"))
+
+
+class TestPriorityQueues:
+    """Test cases for BucketQueue, RadixHeap and SearchWorkspace."""
+
+    def test_bucket_queue_order(self):
+        """Test bucket queue pops keys in non-decreasing order."""
+        queue = BucketQueue(max_span=5)
+        for key in (3, 0, 5, 1):
+            queue.push((key, f"v{key}"))
+        assert [queue.pop() for _ in range(2)] == [(0, "v0"), (1, "v1")]
+        queue.push((6, "v6"))
+        assert [queue.pop()[0] for _ in range(3)] == [3, 5, 6]
+        assert len(queue) == 0
+
+    def test_bucket_queue_window(self):
+        """Test keys outside the window raise ValueError."""
+        queue = BucketQueue(max_span=2)
+        with pytest.raises(ValueError, match="outside bucket window"):
+            queue.push((3, "x"))
+        with pytest.raises(IndexError):
+            queue.pop()
+
+    def test_radix_heap_order(self):
+        """Test radix heap pops keys in non-decreasing order."""
+        heap = RadixHeap()
+        keys = [50, 7, 2**40, 7, 0, 1000]
+        for key in keys:
+            heap.push((key, None))
+        assert [heap.pop()[0] for _ in keys] == sorted(keys)
+        with pytest.raises(IndexError):
+            heap.pop()
+
+    def test_radix_heap_rejects_smaller_key(self):
+        """Test pushing below the last popped key raises ValueError."""
+        heap = RadixHeap()
+        heap.push((10, "a"))
+        heap.pop()
+        with pytest.raises(ValueError, match="smaller than last popped"):
+            heap.push((9, "b"))
+
+    def test_workspace_versions(self):
+        """Test beginning a search invalidates earlier entries."""
+        workspace = SearchWorkspace(3)
+        version = workspace.begin()
+        workspace.stamp[1] = -version
+        assert workspace.is_settled(1)
+        workspace.begin()
+        assert not workspace.is_reached(1)
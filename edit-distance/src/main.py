@@ -207,6 +207,269 @@ class EditDistance:
         logger.info(f"Edit distance: {distance}")
         return distance, prev
 
+    def calculate_banded(
+        self, str1: str, str2: str, max_distance: int
+    ) -> int:
+        """Calculate edit distance within a diagonal band (Ukkonen cutoff).
+
+        Only cells with |i - j| <= max_distance can lie on a path of cost
+        at most max_distance, so each row fills just that band. The scan
+        stops as soon as every cell of a row exceeds max_distance.
+
+        Args:
+            str1: First string.
+            str2: Second string.
+            max_distance: Largest distance of interest (k).
+
+        Returns:
+            Edit distance, or max_distance + 1 if it exceeds max_distance.
+
+        Raises:
+            ValueError: If max_distance is negative.
+
+        Time Complexity: O(k*min(m,n)) where k=max_distance
+        Space Complexity: O(min(m,n))
+        """
+        if max_distance < 0:
+            raise ValueError("max_distance must be non-negative")
+
+        m, n = len(str1), len(str2)
+        if m < n:
+            str1, str2 = str2, str1
+            m, n = n, m
+
+        k = max_distance
+        cutoff = k + 1
+
+        logger.info(
+            f"Calculating edit distance (Banded, k={k}): "
+            f"lengths {m} and {n}"
+        )
+
+        if m - n > k:
+            logger.info(f"Length difference exceeds {k}, cutoff")
+            return cutoff
+
+        # Cells outside the band hold the cutoff value
+        prev = [j if j <= k else cutoff for j in range(n + 1)]
+        curr = [cutoff] * (n + 1)
+
+        for i in range(1, m + 1):
+            low = max(1, i - k)
+            high = min(n, i + k)
+            curr[low - 1] = i if low == 1 and i <= k else cutoff
+            row_min = curr[low - 1]
+            char1 = str1[i - 1]
+
+            for j in range(low, high + 1):
+                if char1 == str2[j - 1]:
+                    value = prev[j - 1]
+                else:
+                    value = 1 + min(prev[j], curr[j - 1], prev[j - 1])
+                if value > cutoff:
+                    value = cutoff
+                curr[j] = value
+                if value < row_min:
+                    row_min = value
+
+            if high < n:
+                curr[high + 1] = cutoff
+
+            if row_min > k:
+                logger.info(f"Row {i} exceeds {k}, early exit")
+                return cutoff
+
+            prev, curr = curr, prev
+
+        distance = min(prev[n], cutoff)
+        logger.info(f"Edit distance (Banded): {distance}")
+        return distance
+
+    def _build_pattern_masks(self, pattern: str) -> Dict[str, int]:
+        """Build per-character match bit-masks for bit-parallel distance.
+
+        Bit i of masks[c] is set when pattern[i] == c. Python integers are
+        arbitrary precision, so one mask spans every machine word of a long
+        pattern.
+
+        Args:
+            pattern: Pattern string (the query).
+
+        Returns:
+            Dictionary mapping character to match mask.
+        """
+        masks: Dict[str, int] = {}
+        bit = 1
+        for char in pattern:
+            masks[char] = masks.get(char, 0) | bit
+            bit <<= 1
+        return masks
+
+    def _bit_parallel_distance(
+        self,
+        masks: Dict[str, int],
+        pattern_length: int,
+        text: str,
+        max_distance: Optional[int] = None,
+    ) -> int:
+        """Run Myers/Hyyro bit-parallel Levenshtein over precomputed masks.
+
+        Each DP column is encoded as vertical +1/-1 delta bit-vectors, so a
+        text character updates the whole column with a constant number of
+        integer operations regardless of pattern length.
+
+        Args:
+            masks: Pattern masks from _build_pattern_masks().
+            pattern_length: Length of the pattern (m).
+            text: Text string compared against the pattern.
+            max_distance: Optional cutoff for early exit.
+
+        Returns:
+            Edit distance, or max_distance + 1 if it exceeds max_distance.
+        """
+        n = len(text)
+        if pattern_length == 0:
+            distance = n
+        else:
+            full = (1 << pattern_length) - 1
+            last_bit = 1 << (pattern_length - 1)
+            vp = full
+            vn = 0
+            score = pattern_length
+
+            for j, char in enumerate(text, 1):
+                eq = masks.get(char, 0)
+                xv = eq | vn
+                xh = (((eq & vp) + vp) ^ vp) | eq
+                hp = (vn | ~(xh | vp)) & full
+                hn = vp & xh
+
+                if hp & last_bit:
+                    score += 1
+                elif hn & last_bit:
+                    score -= 1
+
+                # Score can drop by at most one per remaining text character
+                if max_distance is not None and score - (n - j) > max_distance:
+                    return max_distance + 1
+
+                hp = ((hp << 1) | 1) & full
+                hn = (hn << 1) & full
+                vp = (hn | ~(xv | hp)) & full
+                vn = hp & xv
+
+            distance = score
+
+        if max_distance is not None and distance > max_distance:
+            return max_distance + 1
+        return distance
+
+    def calculate_bit_parallel(
+        self, str1: str, str2: str, max_distance: Optional[int] = None
+    ) -> int:
+        """Calculate edit distance with Myers/Hyyro bit-parallel algorithm.
+
+        Args:
+            str1: First string (used as the bit-vector pattern).
+            str2: Second string.
+            max_distance: Optional cutoff; stop once the distance is known
+                to exceed it.
+
+        Returns:
+            Edit distance, or max_distance + 1 if it exceeds max_distance.
+
+        Raises:
+            ValueError: If max_distance is negative.
+
+        Time Complexity: O(ceil(m/w)*n) where w is the machine word size
+        Space Complexity: O(sigma + m/w) for the character masks
+        """
+        if max_distance is not None and max_distance < 0:
+            raise ValueError("max_distance must be non-negative")
+
+        logger.info(
+            f"Calculating edit distance (Bit-parallel): "
+            f"lengths {len(str1)} and {len(str2)}"
+        )
+
+        masks = self._build_pattern_masks(str1)
+        distance = self._bit_parallel_distance(
+            masks, len(str1), str2, max_distance
+        )
+        logger.info(f"Edit distance (Bit-parallel): {distance}")
+        return distance
+
+    def distance_many(
+        self,
+        query: str,
+        candidates: List[str],
+        max_distance: Optional[int] = None,
+    ) -> List[int]:
+        """Calculate edit distance from one query to many candidates.
+
+        The query's bit-masks are built once and reused for every candidate.
+        With max_distance set, candidates whose length differs from the
+        query by more than max_distance are rejected without scanning.
+
+        Args:
+            query: Query string.
+            candidates: Strings to compare against the query.
+            max_distance: Optional cutoff for early exit.
+
+        Returns:
+            List of distances in candidate order; with max_distance set,
+            distances above it are reported as max_distance + 1.
+
+        Raises:
+            ValueError: If max_distance is negative.
+        """
+        if max_distance is not None and max_distance < 0:
+            raise ValueError("max_distance must be non-negative")
+
+        logger.info(
+            f"Calculating edit distance for {len(candidates)} candidates "
+            f"(query length {len(query)}, max_distance={max_distance})"
+        )
+
+        masks = self._build_pattern_masks(query)
+        m = len(query)
+        distances: List[int] = []
+
+        for candidate in candidates:
+            if max_distance is not None and abs(len(candidate) - m) > max_distance:
+                distances.append(max_distance + 1)
+                continue
+            distances.append(
+                self._bit_parallel_distance(masks, m, candidate, max_distance)
+            )
+
+        return distances
+
+    def is_within_distance(
+        self, str1: str, str2: str, max_distance: int
+    ) -> bool:
+        """Check whether edit distance is at most max_distance.
+
+        Args:
+            str1: First string.
+            str2: Second string.
+            max_distance: Distance threshold (k).
+
+        Returns:
+            True if edit distance <= max_distance, False otherwise.
+
+        Raises:
+            ValueError: If max_distance is negative.
+        """
+        if max_distance < 0:
+            raise ValueError("max_distance must be non-negative")
+        if abs(len(str1) - len(str2)) > max_distance:
+            return False
+        return (
+            self.calculate_bit_parallel(str1, str2, max_distance)
+            <= max_distance
+        )
+
     def get_distance_dp(self, str1: str, str2: str) -> int:
         """Get edit distance using standard DP.
 
@@ -380,6 +643,97 @@ class EditDistance:
 
         return results
 
+    def benchmark_methods(
+        self,
+        query: str,
+        candidates: List[str],
+        max_distance: Optional[int] = None,
+        iterations: int = 1,
+    ) -> Dict[str, any]:
+        """Benchmark DP, banded and bit-parallel modes on a candidate batch.
+
+        Args:
+            query: Query string.
+            candidates: Strings compared against the query.
+            max_distance: Optional cutoff; required for the banded mode.
+            iterations: Number of iterations for timing (default: 1).
+
+        Returns:
+            Dictionary containing benchmark data per method.
+        """
+        logger.info(
+            f"Benchmarking methods: {len(candidates)} candidates, "
+            f"max_distance={max_distance}, iterations={iterations}"
+        )
+
+        def cap(distance: int) -> int:
+            if max_distance is not None and distance > max_distance:
+                return max_distance + 1
+            return distance
+
+        methods = {
+            "dp": lambda: [
+                cap(self.calculate_dp(query, c)[0]) for c in candidates
+            ],
+            "optimized": lambda: [
+                cap(self.calculate_optimized(query, c)[0]) for c in candidates
+            ],
+            "bit_parallel": lambda: [
+                self.calculate_bit_parallel(query, c, max_distance)
+                for c in candidates
+            ],
+            "distance_many": lambda: self.distance_many(
+                query, candidates, max_distance
+            ),
+        }
+        if max_distance is not None:
+            methods["banded"] = lambda: [
+                self.calculate_banded(query, c, max_distance)
+                for c in candidates
+            ]
+
+        results = {
+            "query_length": len(query),
+            "num_candidates": len(candidates),
+            "max_distance": max_distance,
+            "iterations": iterations,
+        }
+
+        for name, run in methods.items():
+            try:
+                start_time = time.perf_counter()
+                for _ in range(iterations):
+                    distances = run()
+                elapsed = time.perf_counter() - start_time
+
+                results[name] = {
+                    "distances": distances,
+                    "time_seconds": elapsed / iterations,
+                    "time_milliseconds": (elapsed / iterations) * 1000,
+                    "success": True,
+                }
+            except Exception as e:
+                logger.error(f"{name} method failed: {e}")
+                results[name] = {"success": False, "error": str(e)}
+
+        successful = [
+            name for name in methods if results[name].get("success", False)
+        ]
+        if successful:
+            reference = results[successful[0]]["distances"]
+            results["all_match"] = all(
+                results[name]["distances"] == reference for name in successful
+            )
+            if not results["all_match"]:
+                logger.warning("Distances differ between methods!")
+            fastest = min(
+                successful, key=lambda name: results[name]["time_seconds"]
+            )
+            results["fastest"] = fastest
+            results["fastest_time"] = results[fastest]["time_seconds"]
+
+        return results
+
     def generate_report(
         self,
         comparison_data: Dict[str, any],
@@ -514,7 +868,7 @@ def main() -> None:
     parser.add_argument(
         "-m",
         "--method",
-        choices=["dp", "optimized", "compare"],
+        choices=["dp", "optimized", "banded", "bitparallel", "compare"],
         default="compare",
         help="Solution method (default: compare)",
     )
@@ -536,6 +890,12 @@ def main() -> None:
         "--report",
         help="Output path for performance report",
     )
+    parser.add_argument(
+        "-k",
+        "--max-distance",
+        type=int,
+        help="Distance cutoff for banded and bit-parallel methods",
+    )
 
     args = parser.parse_args()
 
@@ -619,6 +979,26 @@ def main() -> None:
             distance, _ = ed.calculate_optimized(args.str1, args.str2)
             print(f"Edit distance (Optimized): {distance}")
 
+        elif args.method == "banded":
+            if args.max_distance is None:
+                parser.error("--max-distance is required for banded method")
+            distance = ed.calculate_banded(
+                args.str1, args.str2, args.max_distance
+            )
+            if distance > args.max_distance:
+                print(f"Edit distance (Banded): > {args.max_distance}")
+            else:
+                print(f"Edit distance (Banded): {distance}")
+
+        elif args.method == "bitparallel":
+            distance = ed.calculate_bit_parallel(
+                args.str1, args.str2, args.max_distance
+            )
+            if args.max_distance is not None and distance > args.max_distance:
+                print(f"Edit distance (Bit-parallel): > {args.max_distance}")
+            else:
+                print(f"Edit distance (Bit-parallel): {distance}")
+
     except Exception as e:
         logger.error(f"Error during execution: {e}", exc_info=True)
         raise
@@ -245,3 +245,84 @@ class TestEditDistance:
             distance, dp_table = ed.calculate_dp(str1, str2)
             operations = ed.get_operations(str1, str2, dp_table)
             assert len(operations) == distance
+
+    def test_calculate_banded_within_band(self, ed):
+        """Test banded calculation when distance is within the cutoff."""
+        assert ed.calculate_banded("kitten", "sitting", 3) == 3
+        assert ed.calculate_banded("kitten", "sitting", 10) == 3
+        assert ed.calculate_banded("", "", 0) == 0
+        assert ed.calculate_banded("abc", "", 3) == 3
+
+    def test_calculate_banded_cutoff(self, ed):
+        """Test banded calculation reports cutoff + 1 above max_distance."""
+        assert ed.calculate_banded("kitten", "sitting", 2) == 3
+        assert ed.calculate_banded("abc", "xyz", 1) == 2
+        assert ed.calculate_banded("a", "abcdef", 2) == 3
+
+    def test_calculate_banded_negative_cutoff(self, ed):
+        """Test banded calculation rejects negative max_distance."""
+        with pytest.raises(ValueError):
+            ed.calculate_banded("abc", "abd", -1)
+
+    def test_calculate_bit_parallel(self, ed):
+        """Test bit-parallel calculation matches DP."""
+        pairs = [
+            ("kitten", "sitting"),
+            ("", "abc"),
+            ("abc", ""),
+            ("flaw", "lawn"),
+            ("intention", "execution"),
+        ]
+        for str1, str2 in pairs:
+            expected = ed.get_distance_dp(str1, str2)
+            assert ed.calculate_bit_parallel(str1, str2) == expected
+
+    def test_calculate_bit_parallel_long_strings(self, ed):
+        """Test bit-parallel calculation beyond a single machine word."""
+        str1 = "ACGT" * 50
+        str2 = ("ACGA" * 50)[:190] + "TTTT"
+        expected = ed.get_distance_optimized(str1, str2)
+        assert ed.calculate_bit_parallel(str1, str2) == expected
+        assert ed.calculate_banded(str1, str2, expected) == expected
+
+    def test_calculate_bit_parallel_cutoff(self, ed):
+        """Test bit-parallel early exit."""
+        assert ed.calculate_bit_parallel("kitten", "sitting", 3) == 3
+        assert ed.calculate_bit_parallel("kitten", "sitting", 1) == 2
+
+    def test_distance_many(self, ed):
+        """Test batch distances reuse one query."""
+        candidates = ["sitting", "kitten", "mitten", "", "knitting"]
+        distances = ed.distance_many("kitten", candidates)
+        expected = [ed.get_distance_dp("kitten", c) for c in candidates]
+        assert distances == expected
+
+    def test_distance_many_with_cutoff(self, ed):
+        """Test batch distances with max_distance."""
+        distances = ed.distance_many(
+            "kitten", ["sitting", "kitten", "", "mitten"], max_distance=1
+        )
+        assert distances == [2, 0, 2, 1]
+
+    def test_is_within_distance(self, ed):
+        """Test threshold check."""
+        assert ed.is_within_distance("kitten", "sitting", 3) is True
+        assert ed.is_within_distance("kitten", "sitting", 2) is False
+        assert ed.is_within_distance("abc", "abcdef", 2) is False
+
+    def test_benchmark_methods(self, ed):
+        """Test benchmark of all methods against DP."""
+        results = ed.benchmark_methods(
+            "kitten", ["sitting", "mitten", "kitchen"], max_distance=2
+        )
+        for method in ("dp", "optimized", "banded", "bit_parallel", "distance_many"):
+            assert results[method]["success"] is True
+        assert results["dp"]["distances"] == [3, 1, 2]
+        assert results["all_match"] is True
+        assert "fastest" in results
+
+    def test_benchmark_methods_without_cutoff(self, ed):
+        """Test benchmark skips banded mode without max_distance."""
+        results = ed.benchmark_methods("kitten", ["sitting"])
+        assert "banded" not in results
+        assert results["bit_parallel"]["distances"] == [3]
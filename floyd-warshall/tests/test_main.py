@@ -1,12 +1,13 @@
 """Unit tests for Floyd-Warshall algorithm module."""
 
+import random
 import tempfile
 from pathlib import Path
 
 import pytest
 import yaml
 
-from src.main import FloydWarshall
+from src.main import NO_HOP, NUMPY_AVAILABLE, FloydWarshall
 
 
 class TestFloydWarshall:
@@ -237,3 +238,150 @@ class TestFloydWarshall:
         dist, next_matrix, has_negative_cycle = fw.find_shortest_paths(4, edges)
         assert abs(dist[0][3] - 7.5) < 0.001
         assert has_negative_cycle is False
+
+
+@pytest.mark.skipif(not NUMPY_AVAILABLE, reason="numpy not installed")
+class TestBackends:
+    """Test cases for the NumPy and blocked backends."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create temporary directory for testing."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+
+    @pytest.fixture
+    def config_file(self, temp_dir):
+        """Create temporary config file."""
+        config = {
+            "logging": {"level": "INFO", "file": str(temp_dir / "app.log")},
+        }
+        config_path = temp_dir / "config.yaml"
+        with open(config_path, "w") as f:
+            yaml.dump(config, f)
+        return str(config_path)
+
+    @pytest.fixture
+    def fw(self, config_file):
+        """Create FloydWarshall instance."""
+        return FloydWarshall(config_path=config_file)
+
+    @staticmethod
+    def _random_edges(rng, num_vertices, num_edges, min_weight=0):
+        return [
+            (
+                rng.randrange(num_vertices),
+                rng.randrange(num_vertices),
+                rng.randint(min_weight, 10),
+            )
+            for _ in range(num_edges)
+        ]
+
+    @staticmethod
+    def _path_cost(edges, path):
+        weights = {(source, dest): weight for source, dest, weight in edges}
+        return sum(weights[edge] for edge in zip(path, path[1:]))
+
+    @pytest.mark.parametrize(
+        "backend,options",
+        [
+            ("numpy", {}),
+            ("blocked", {"block_size": 4}),
+            ("blocked", {"block_size": 7}),
+            ("blocked", {"block_size": 64}),
+        ],
+    )
+    def test_backends_match_python(self, fw, backend, options):
+        """Test that every backend matches the Python distances and paths."""
+        rng = random.Random(7)
+        for _ in range(10):
+            num_vertices = rng.randint(1, 25)
+            edges = self._random_edges(
+                rng, num_vertices, rng.randint(0, 3 * num_vertices)
+            )
+            expected, _, _ = fw.find_shortest_paths(
+                num_vertices, edges, backend="python"
+            )
+            dist, next_matrix, has_negative_cycle = fw.find_shortest_paths(
+                num_vertices, edges, backend=backend, **options
+            )
+            assert has_negative_cycle is False
+            assert dist.tolist() == expected
+            for start in range(num_vertices):
+                for end in range(num_vertices):
+                    path = fw.reconstruct_path(next_matrix, start, end)
+                    if start == end or dist[start][end] == float("inf"):
+                        assert path is None
+                    else:
+                        assert path[0] == start and path[-1] == end
+                        assert self._path_cost(edges, path) == dist[start][end]
+
+    def test_next_matrix_is_int32(self, fw):
+        """Test the next-hop matrix dtype and missing-hop marker."""
+        edges = [(0, 1, 1), (1, 2, 2)]
+        for backend in ("numpy", "blocked"):
+            _, next_matrix, _ = fw.find_shortest_paths(3, edges, backend=backend)
+            assert next_matrix.dtype.name == "int32"
+            assert next_matrix[0][2] == 1
+            assert next_matrix[2][0] == NO_HOP
+            assert fw.reconstruct_path(next_matrix, 0, 2) == [0, 1, 2]
+            assert fw.reconstruct_path(next_matrix, 2, 0) is None
+
+    def test_blocked_with_workers(self, fw):
+        """Test the blocked backend with a process pool."""
+        rng = random.Random(11)
+        edges = self._random_edges(rng, 20, 60)
+        expected, _, _ = fw.find_shortest_paths(20, edges, backend="python")
+        dist, _, _ = fw.find_shortest_paths(
+            20, edges, backend="blocked", block_size=5, workers=2
+        )
+        assert dist.tolist() == expected
+
+    def test_blocked_zero_weight_cycle_paths(self, fw):
+        """Test next hops stay loop-free around zero-weight cycles."""
+        rng = random.Random(3)
+        for _ in range(20):
+            edges = self._random_edges(rng, 12, 40)
+            edges += [(0, 5, 0), (5, 9, 0), (9, 0, 0)]
+            dist, next_matrix, _ = fw.find_shortest_paths(
+                12, edges, backend="blocked", block_size=3
+            )
+            for start in range(12):
+                for end in range(12):
+                    if start != end and dist[start][end] != float("inf"):
+                        path = fw.reconstruct_path(next_matrix, start, end)
+                        assert self._path_cost(edges, path) == dist[start][end]
+
+    @pytest.mark.parametrize("backend", ["python", "numpy", "blocked"])
+    def test_negative_cycle_per_backend(self, fw, backend):
+        """Test negative cycle detection on every backend."""
+        edges = [(0, 1, 1), (1, 2, -3), (2, 0, 1), (2, 3, 1)]
+        _, _, has_negative_cycle = fw.find_shortest_paths(
+            4, edges, backend=backend, block_size=2
+        )
+        assert has_negative_cycle is True
+
+    def test_duplicate_edges_last_wins(self, fw):
+        """Test that a later duplicate edge overrides an earlier one."""
+        edges = [(0, 1, 1), (0, 1, 5), (5, 0, 1)]
+        for backend in ("python", "numpy", "blocked"):
+            dist, _, _ = fw.find_shortest_paths(2, edges, backend=backend)
+            assert dist[0][1] == 5.0
+
+    def test_invalid_backend_options(self, fw):
+        """Test invalid backend, block size and worker count."""
+        with pytest.raises(ValueError):
+            fw.find_shortest_paths(2, [], backend="gpu")
+        with pytest.raises(ValueError):
+            fw.find_shortest_paths(2, [], backend="blocked", block_size=0)
+        with pytest.raises(ValueError):
+            fw.find_shortest_paths(2, [], backend="blocked", workers=0)
+
+    def test_compare_performance_backends(self, fw):
+        """Test that compare_performance times every backend."""
+        edges = [(0, 1, 1), (1, 2, 2), (2, 3, 3)]
+        results = fw.compare_performance(4, edges)
+        assert set(results["backends"]) == {"python", "numpy", "blocked"}
+        assert results["floyd_warshall"]["success"] is True
+        report = fw.generate_report(results)
+        assert "BACKENDS" in report
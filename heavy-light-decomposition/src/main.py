@@ -3,12 +3,19 @@
 This module provides functionality to implement heavy-light decomposition
 (HLD) that decomposes a tree into chains for efficient path queries and
 updates. HLD achieves O(log^2 n) time complexity for path operations.
+Chains share one flat position array backed by a lazy segment tree with
+pluggable monoids (sum, min, max) and range add/assign updates.
 """
 
 import logging
 import logging.handlers
+import math
+import operator
+import random
+import time
+from array import array
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
 
 import yaml
 from dotenv import load_dotenv
@@ -48,103 +55,309 @@ class TreeNode:
         return f"TreeNode({self.value}, data={self.data})"
 
 
+class Monoid:
+    """Aggregate used by SegmentTree.
+
+    ``combine`` must be associative and commutative with ``identity`` as
+    its neutral element. ``repeat(value, length)`` gives the aggregate of
+    ``length`` copies of ``value`` and is what lets range updates skip
+    whole segments: an assign sets a segment to ``repeat(x, length)``, an
+    add shifts it by ``repeat(delta, length)``. Adds are only meaningful
+    when shifting every element shifts the aggregate that way, which
+    holds for sum, min and max.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        combine: Callable[[float, float], float],
+        identity: float,
+        repeat: Callable[[float, int], float],
+    ) -> None:
+        """Initialize monoid.
+
+        Args:
+            name: Monoid name.
+            combine: Associative, commutative binary operation.
+            identity: Identity element for combine.
+            repeat: Aggregate of a value repeated a number of times.
+        """
+        self.name = name
+        self.combine = combine
+        self.identity = identity
+        self.repeat = repeat
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"Monoid({self.name})"
+
+
+MONOIDS: Dict[str, Monoid] = {
+    "sum": Monoid("sum", operator.add, 0.0, lambda value, length: value * length),
+    "min": Monoid("min", min, math.inf, lambda value, length: value),
+    "max": Monoid("max", max, -math.inf, lambda value, length: value),
+}
+
+
+def get_monoid(monoid: Union[str, Monoid]) -> Monoid:
+    """Resolve a monoid name or instance.
+
+    Args:
+        monoid: Monoid instance or one of the names in MONOIDS.
+
+    Returns:
+        Monoid instance.
+
+    Raises:
+        ValueError: If the name is unknown.
+    """
+    if isinstance(monoid, Monoid):
+        return monoid
+    if monoid not in MONOIDS:
+        raise ValueError(
+            f"Unknown monoid: {monoid}. Choose from {', '.join(MONOIDS)}"
+        )
+    return MONOIDS[monoid]
+
+
 class SegmentTree:
-    """Segment tree for range queries and updates."""
+    """Lazy segment tree with range add/assign and monoid range queries.
+
+    The tree is iterative and stored in flat arrays: aggregates in an
+    ``array('d')``, and pending updates as an assign flag, assign value
+    and add value per internal node. A pending update means "assign the
+    value if flagged, then add", which composes in O(1).
+    """
 
     def __init__(
         self,
         size: int,
-        operation: Callable[[float, float], float] = lambda x, y: x + y,
-        identity: float = 0.0,
+        monoid: Union[str, Monoid] = "sum",
+        values: Optional[Sequence[float]] = None,
     ) -> None:
         """Initialize segment tree.
 
         Args:
             size: Size of array.
-            operation: Binary operation (default: addition).
-            identity: Identity element for operation.
+            monoid: Monoid instance or name ('sum', 'min', 'max').
+            values: Initial values (default: all zeros).
+
+        Raises:
+            ValueError: If size is negative, values has the wrong length
+                or the monoid is unknown.
         """
+        if size < 0:
+            raise ValueError("Size must be non-negative")
+        if values is not None and len(values) != size:
+            raise ValueError(f"Expected {size} values, got {len(values)}")
+
         self.n = size
-        self.operation = operation
-        self.identity = identity
-        self.size = 1
-        while self.size < self.n:
-            self.size *= 2
-        self.tree = [identity] * (2 * self.size)
-        self.lazy = [identity] * (2 * self.size)
+        self.monoid = get_monoid(monoid)
+        self.log = max(0, (size - 1).bit_length())
+        self.size = 1 << self.log
+
+        identity = self.monoid.identity
+        self.tree = array("d", [identity]) * (2 * self.size)
+        self.length = array("i", bytes(4 * 2 * self.size))
+        self.tag_assign = bytearray(self.size)
+        self.tag_value = array("d", bytes(8 * self.size))
+        self.tag_add = array("d", bytes(8 * self.size))
+
+        for i in range(size):
+            self.tree[self.size + i] = values[i] if values is not None else 0.0
+            self.length[self.size + i] = 1
+        for i in range(self.size - 1, 0, -1):
+            self.length[i] = self.length[2 * i] + self.length[2 * i + 1]
+            self._pull(i)
+
+    def _pull(self, idx: int) -> None:
+        """Recompute node aggregate from its children.
 
-    def _apply(self, idx: int, value: float) -> None:
-        """Apply lazy update.
+        Args:
+            idx: Index in segment tree.
+        """
+        self.tree[idx] = self.monoid.combine(self.tree[2 * idx], self.tree[2 * idx + 1])
+
+    def _apply(self, idx: int, assign: int, value: float, add: float) -> None:
+        """Apply a pending update to a node.
 
         Args:
             idx: Index in segment tree.
-            value: Value to apply.
+            assign: Whether to assign value first.
+            value: Value to assign.
+            add: Value to add after the assign.
         """
-        self.tree[idx] = self.operation(self.tree[idx], value)
+        length = self.length[idx]
+        if length == 0:
+            return
+        repeat = self.monoid.repeat
+        if assign:
+            self.tree[idx] = repeat(value, length)
+        if add:
+            self.tree[idx] += repeat(add, length)
         if idx < self.size:
-            self.lazy[idx] = self.operation(self.lazy[idx], value)
+            if assign:
+                self.tag_assign[idx] = 1
+                self.tag_value[idx] = value
+                self.tag_add[idx] = add
+            else:
+                self.tag_add[idx] += add
 
     def _push(self, idx: int) -> None:
-        """Push lazy update to children.
+        """Push pending update to children.
 
         Args:
             idx: Index in segment tree.
         """
-        if self.lazy[idx] != self.identity:
-            self._apply(2 * idx, self.lazy[idx])
-            self._apply(2 * idx + 1, self.lazy[idx])
-            self.lazy[idx] = self.identity
-
-    def _build(self, arr: List[float]) -> None:
-        """Build segment tree from array.
+        assign = self.tag_assign[idx]
+        add = self.tag_add[idx]
+        if assign or add:
+            value = self.tag_value[idx]
+            self._apply(2 * idx, assign, value, add)
+            self._apply(2 * idx + 1, assign, value, add)
+            self.tag_assign[idx] = 0
+            self.tag_add[idx] = 0.0
+
+    def _check_range(self, left: int, right: int) -> None:
+        """Validate an inclusive range.
 
         Args:
-            arr: Input array.
+            left: Left index (inclusive).
+            right: Right index (inclusive).
+
+        Raises:
+            ValueError: If the range is empty or out of bounds.
         """
-        for i in range(self.n):
-            self.tree[self.size + i] = arr[i]
-        for i in range(self.size - 1, 0, -1):
-            self.tree[i] = self.operation(
-                self.tree[2 * i], self.tree[2 * i + 1]
-            )
+        if not 0 <= left <= right < self.n:
+            raise ValueError(f"Invalid range [{left}, {right}] for size {self.n}")
+
+    def _push_path(self, left: int, right: int) -> None:
+        """Push pending updates on all strict ancestors of two leaves.
 
-    def update_range(
-        self, left: int, right: int, value: float
+        Args:
+            left: First leaf index in the tree array.
+            right: Second leaf index in the tree array.
+        """
+        tag_assign = self.tag_assign
+        tag_add = self.tag_add
+        for i in range(self.log, 0, -1):
+            node = left >> i
+            if tag_assign[node] or tag_add[node]:
+                self._push(node)
+            other = right >> i
+            if other != node and (tag_assign[other] or tag_add[other]):
+                self._push(other)
+
+    def _update(
+        self, ranges: Sequence[Tuple[int, int]], assign: int, value: float
     ) -> None:
-        """Update range [left, right] with value.
+        """Assign or add value over disjoint ranges without validation.
+
+        Ancestors shared by several ranges, such as the top levels for the
+        ranges of one tree path, are recomputed once at the end.
+
+        Args:
+            ranges: Disjoint inclusive (left, right) ranges.
+            assign: 1 to assign value, 0 to add it.
+            value: Value to assign or add.
+        """
+        size = self.size
+        if assign:
+            update = (1, value, 0.0)
+        else:
+            update = (0, 0.0, value)
+        apply = self._apply
+        stale = set()
+
+        for left, right in ranges:
+            left += size
+            right += size + 1
+            self._push_path(left, right - 1)
+
+            # Ancestors that only partly overlap the range need recomputing.
+            # Above the lowest set bit of a boundary every ancestor does, so
+            # each chain is walked up until it meets one already collected.
+            node = left >> (left & -left).bit_length()
+            while node and node not in stale:
+                stale.add(node)
+                node >>= 1
+            node = (right - 1) >> (right & -right).bit_length()
+            while node and node not in stale:
+                stale.add(node)
+                node >>= 1
+
+            while left < right:
+                if left & 1:
+                    apply(left, *update)
+                    left += 1
+                if right & 1:
+                    right -= 1
+                    apply(right, *update)
+                left >>= 1
+                right >>= 1
+
+        # Children have larger indices than parents, so this is bottom-up
+        tree = self.tree
+        combine = self.monoid.combine
+        for node in sorted(stale, reverse=True):
+            tree[node] = combine(tree[2 * node], tree[2 * node + 1])
+
+    def _query(self, left: int, right: int) -> float:
+        """Aggregate [left, right] without validation.
 
         Args:
             left: Left index (inclusive).
             right: Right index (inclusive).
-            value: Value to apply.
+
+        Returns:
+            Aggregate over the range.
         """
         left += self.size
         right += self.size
-        l0, r0 = left, right
-
-        while left <= right:
-            if left % 2 == 1:
-                self._apply(left, value)
+        self._push_path(left, right)
+        right += 1
+
+        combine = self.monoid.combine
+        tree = self.tree
+        result = self.monoid.identity
+        while left < right:
+            if left & 1:
+                result = combine(result, tree[left])
                 left += 1
-            if right % 2 == 0:
-                self._apply(right, value)
+            if right & 1:
                 right -= 1
-            left //= 2
-            right //= 2
-
-        left, right = l0, r0
-        while left > 1:
-            left //= 2
-            right //= 2
-            self._push(left)
-            self._push(right)
-            if left < right:
-                self.tree[left] = self.operation(
-                    self.tree[2 * left], self.tree[2 * left + 1]
-                )
-                self.tree[right] = self.operation(
-                    self.tree[2 * right], self.tree[2 * right + 1]
-                )
+                result = combine(result, tree[right])
+            left >>= 1
+            right >>= 1
+        return result
+
+    def update_range(self, left: int, right: int, value: float) -> None:
+        """Add value to every element in [left, right].
+
+        Args:
+            left: Left index (inclusive).
+            right: Right index (inclusive).
+            value: Value to add.
+
+        Raises:
+            ValueError: If the range is invalid.
+        """
+        self._check_range(left, right)
+        self._update(((left, right),), 0, value)
+
+    def assign_range(self, left: int, right: int, value: float) -> None:
+        """Set every element in [left, right] to value.
+
+        Args:
+            left: Left index (inclusive).
+            right: Right index (inclusive).
+            value: Value to assign.
+
+        Raises:
+            ValueError: If the range is invalid.
+        """
+        self._check_range(left, right)
+        self._update(((left, right),), 1, value)
 
     def query_range(self, left: int, right: int) -> float:
         """Query range [left, right].
@@ -154,52 +367,88 @@ class SegmentTree:
             right: Right index (inclusive).
 
         Returns:
-            Result of operation over range.
-        """
-        left += self.size
-        right += self.size
-        result = self.identity
+            Monoid aggregate over the range.
 
-        self._push(left)
-        self._push(right)
+        Raises:
+            ValueError: If the range is invalid.
+        """
+        self._check_range(left, right)
+        return self._query(left, right)
 
-        while left <= right:
-            if left % 2 == 1:
-                result = self.operation(result, self.tree[left])
-                left += 1
-            if right % 2 == 0:
-                result = self.operation(result, self.tree[right])
-                right -= 1
-            left //= 2
-            right //= 2
 
-        return result
+class HeavyLightDecomposition:
+    """Heavy-light decomposition for path queries and updates.
 
+    Decomposition is iterative over a parent array. Positions are assigned
+    so that every heavy chain and every subtree is a contiguous range of a
+    single flat position array, which backs one lazy SegmentTree.
+    """
 
-class HeavyLightDecomposition:
-    """Heavy-light decomposition for path queries and updates."""
+    OPERATIONS = ("query", "add", "assign")
 
-    def __init__(self, root: TreeNode, config_path: str = "config.yaml") -> None:
+    def __init__(
+        self,
+        root: TreeNode,
+        config_path: str = "config.yaml",
+        monoid: Union[str, Monoid] = "sum",
+    ) -> None:
         """Initialize heavy-light decomposition.
 
         Args:
             root: Root of the tree.
             config_path: Path to configuration file.
+            monoid: Monoid for path and subtree queries.
         """
         self.root = root
-        self.n = self._count_nodes(root)
-        self.subtree_size: Dict[TreeNode, int] = {}
-        self.parent: Dict[TreeNode, Optional[TreeNode]] = {}
-        self.depth: Dict[TreeNode, int] = {}
-        self.heavy_child: Dict[TreeNode, Optional[TreeNode]] = {}
-        self.chain_head: Dict[TreeNode, TreeNode] = {}
-        self.chain_pos: Dict[TreeNode, int] = {}
-        self.chains: List[List[TreeNode]] = []
-        self.chain_segment_trees: List[SegmentTree] = []
-        self.node_to_chain: Dict[TreeNode, int] = {}
+        self.nodes: List[TreeNode] = []
+        parents: List[int] = []
+        stack = [(root, -1)]
+        while stack:
+            node, parent_idx = stack.pop()
+            node_idx = len(self.nodes)
+            self.nodes.append(node)
+            parents.append(parent_idx)
+            for child in reversed(node.children):
+                stack.append((child, node_idx))
+        self.node_to_index: Dict[TreeNode, int] = {
+            node: i for i, node in enumerate(self.nodes)
+        }
+
         self._setup_logging()
         self._load_config(config_path)
-        self._decompose()
+        self._decompose(parents, [node.data for node in self.nodes], monoid)
+
+    @classmethod
+    def from_parents(
+        cls,
+        parents: Sequence[int],
+        values: Optional[Sequence[float]] = None,
+        config_path: str = "config.yaml",
+        monoid: Union[str, Monoid] = "sum",
+    ) -> "HeavyLightDecomposition":
+        """Build directly from a parent array, without TreeNode objects.
+
+        Nodes are then addressed by index in every method.
+
+        Args:
+            parents: parents[i] is the parent of node i, or -1 for the root.
+            values: Initial node values (default: all zeros).
+            config_path: Path to configuration file.
+            monoid: Monoid for path and subtree queries.
+
+        Returns:
+            HeavyLightDecomposition instance.
+        """
+        instance = cls.__new__(cls)
+        instance.root = None
+        instance.nodes = []
+        instance.node_to_index = {}
+        instance._setup_logging()
+        instance._load_config(config_path)
+        if values is None:
+            values = [0.0] * len(parents)
+        instance._decompose(parents, values, monoid)
+        return instance
 
     def _setup_logging(self) -> None:
         """Configure logging for HLD operations."""
@@ -235,282 +484,388 @@ class HeavyLightDecomposition:
         except Exception as e:
             logger.warning(f"Could not load config: {e}")
 
-    def _count_nodes(self, node: Optional[TreeNode]) -> int:
-        """Count nodes in tree.
+    def _decompose(
+        self,
+        parents: Sequence[int],
+        values: Sequence[float],
+        monoid: Union[str, Monoid],
+    ) -> None:
+        """Perform heavy-light decomposition.
 
         Args:
-            node: Current node.
+            parents: Parent array with -1 for the root.
+            values: Initial node values.
+            monoid: Monoid for the segment tree.
+
+        Raises:
+            ValueError: If parents does not describe a single rooted tree.
+        """
+        n = self.n = len(parents)
+        if n == 0:
+            raise ValueError("Tree must have at least one node")
+        if len(values) != n:
+            raise ValueError(f"Expected {n} values, got {len(values)}")
+
+        self.parent = array("i", parents)
+        child_start = array("i", bytes(4 * (n + 1)))
+        root = -1
+        for node, parent in enumerate(self.parent):
+            if parent == -1:
+                if root != -1:
+                    raise ValueError("Tree has more than one root")
+                root = node
+            elif 0 <= parent < n:
+                child_start[parent + 1] += 1
+            else:
+                raise ValueError(f"Invalid parent {parent} for node {node}")
+        if root == -1:
+            raise ValueError("Tree has no root")
+        self.root_index = root
+
+        for i in range(n):
+            child_start[i + 1] += child_start[i]
+        fill = array("i", child_start[:n])
+        children = array("i", bytes(4 * (n - 1)))
+        for node, parent in enumerate(self.parent):
+            if parent != -1:
+                children[fill[parent]] = node
+                fill[parent] += 1
+
+        # Breadth-first order: parents before children
+        order = array("i", [root])
+        self.depth = array("i", bytes(4 * n))
+        i = 0
+        while i < len(order):
+            node = order[i]
+            i += 1
+            for j in range(child_start[node], child_start[node + 1]):
+                child = children[j]
+                self.depth[child] = self.depth[node] + 1
+                order.append(child)
+        if len(order) != n:
+            raise ValueError("Parent array does not describe a single tree")
+
+        self.subtree_size = array("i", [1]) * n
+        self.heavy = array("i", [-1]) * n
+        for node in reversed(order):
+            best = 0
+            for j in range(child_start[node], child_start[node + 1]):
+                child = children[j]
+                size = self.subtree_size[child]
+                self.subtree_size[node] += size
+                if size > best:
+                    best = size
+                    self.heavy[node] = child
+
+        # Walk each chain top-down, then its light subtrees deepest first,
+        # so chains and subtrees both occupy contiguous positions
+        self.head = array("i", bytes(4 * n))
+        self.pos = array("i", bytes(4 * n))
+        self.order = array("i", bytes(4 * n))
+        self.chain_heads = array("i")
+        current = 0
+        stack = [root]
+        while stack:
+            chain_head = stack.pop()
+            self.chain_heads.append(chain_head)
+            node = chain_head
+            while node != -1:
+                self.head[node] = chain_head
+                self.pos[node] = current
+                self.order[current] = node
+                current += 1
+                heavy = self.heavy[node]
+                for j in range(child_start[node], child_start[node + 1]):
+                    if children[j] != heavy:
+                        stack.append(children[j])
+                node = heavy
+
+        self.segment_tree = SegmentTree(
+            n, monoid, [values[self.order[p]] for p in range(n)]
+        )
+        self.monoid = self.segment_tree.monoid
+
+        logger.info(
+            f"Decomposed tree into {len(self.chain_heads)} chains with {n} nodes"
+        )
+
+    @property
+    def chains(self) -> List[List[Union[TreeNode, int]]]:
+        """List chains top-down as nodes (or indices without TreeNodes).
 
         Returns:
-            Number of nodes.
+            One list per heavy chain.
         """
-        if node is None:
-            return 0
-        count = 1
-        for child in node.children:
-            count += self._count_nodes(child)
-        return count
+        result = []
+        for chain_head in self.chain_heads:
+            chain = []
+            node = chain_head
+            while node != -1:
+                chain.append(self._node(node))
+                node = self.heavy[node]
+            result.append(chain)
+        return result
 
-    def _dfs_size(self, node: TreeNode, parent: Optional[TreeNode], d: int) -> None:
-        """DFS to compute subtree sizes and depths.
+    def _index(self, node: Union[TreeNode, int]) -> int:
+        """Resolve a TreeNode or node index to an index.
 
         Args:
-            node: Current node.
-            parent: Parent node.
-            d: Current depth.
-        """
-        self.parent[node] = parent
-        self.depth[node] = d
-        self.subtree_size[node] = 1
-        self.heavy_child[node] = None
+            node: TreeNode or node index.
 
-        max_size = 0
-        for child in node.children:
-            self._dfs_size(child, node, d + 1)
-            self.subtree_size[node] += self.subtree_size[child]
-            if self.subtree_size[child] > max_size:
-                max_size = self.subtree_size[child]
-                self.heavy_child[node] = child
+        Returns:
+            Node index.
 
-    def _dfs_chains(self, node: TreeNode, chain_id: int) -> None:
-        """DFS to build chains.
+        Raises:
+            ValueError: If the node is not in the tree.
+        """
+        if isinstance(node, TreeNode):
+            if node not in self.node_to_index:
+                raise ValueError(f"Node {node.value} not in tree")
+            return self.node_to_index[node]
+        if not 0 <= node < self.n:
+            raise ValueError(f"Node {node} out of range [0, {self.n})")
+        return node
+
+    def _node(self, index: int) -> Union[TreeNode, int]:
+        """Map a node index back to its TreeNode when there is one.
 
         Args:
-            node: Current node.
-            chain_id: Current chain ID.
-        """
-        if chain_id >= len(self.chains):
-            self.chains.append([])
+            index: Node index.
 
-        self.chains[chain_id].append(node)
-        self.node_to_chain[node] = chain_id
-        self.chain_pos[node] = len(self.chains[chain_id]) - 1
-        self.chain_head[node] = self.chains[chain_id][0]
+        Returns:
+            TreeNode, or the index for trees built from a parent array.
+        """
+        return self.nodes[index] if self.nodes else index
 
-        if self.heavy_child[node]:
-            self._dfs_chains(self.heavy_child[node], chain_id)
+    def _lca(self, u: int, v: int) -> int:
+        """Find lowest common ancestor by climbing chains.
 
-        for child in node.children:
-            if child != self.heavy_child[node]:
-                self._dfs_chains(child, len(self.chains))
+        Args:
+            u: First node index.
+            v: Second node index.
 
-    def _decompose(self) -> None:
-        """Perform heavy-light decomposition."""
-        self._dfs_size(self.root, None, 0)
-        self._dfs_chains(self.root, 0)
+        Returns:
+            LCA node index.
+        """
+        head = self.head
+        depth = self.depth
+        while head[u] != head[v]:
+            if depth[head[u]] < depth[head[v]]:
+                u, v = v, u
+            u = self.parent[head[u]]
+        return u if depth[u] < depth[v] else v
 
-        for chain in self.chains:
-            chain_data = [node.data for node in chain]
-            seg_tree = SegmentTree(len(chain))
-            seg_tree._build(chain_data)
-            self.chain_segment_trees.append(seg_tree)
+    def _path_ranges(self, u: int, v: int) -> List[Tuple[int, int]]:
+        """Split the u-v path into position ranges.
 
-        logger.info(
-            f"Decomposed tree into {len(self.chains)} chains with {self.n} nodes"
-        )
+        Args:
+            u: First node index.
+            v: Second node index.
 
-    def _lca(self, u: TreeNode, v: TreeNode) -> TreeNode:
-        """Find lowest common ancestor.
+        Returns:
+            List of inclusive (left, right) position ranges, at most
+            O(log n) of them, that together cover the path exactly once.
+        """
+        head = self.head
+        depth = self.depth
+        pos = self.pos
+        parent = self.parent
+        ranges = []
+        while head[u] != head[v]:
+            if depth[head[u]] < depth[head[v]]:
+                u, v = v, u
+            ranges.append((pos[head[u]], pos[u]))
+            u = parent[head[u]]
+        if pos[u] > pos[v]:
+            u, v = v, u
+        ranges.append((pos[u], pos[v]))
+        return ranges
+
+    def process_batch(
+        self, operations: Sequence[Tuple]
+    ) -> List[float]:
+        """Run a sequence of path operations in order.
+
+        Operations are ("query", u, v), ("add", u, v, value) or
+        ("assign", u, v, value), with u and v TreeNodes or indices. Nothing
+        is logged per operation, which matters for large batches.
 
         Args:
-            u: First node.
-            v: Second node.
+            operations: Operations to apply.
 
         Returns:
-            LCA node.
-        """
-        while self.node_to_chain[u] != self.node_to_chain[v]:
-            if (
-                self.depth[self.chain_head[u]]
-                < self.depth[self.chain_head[v]]
-            ):
-                v = self.parent[self.chain_head[v]]
+            Results of the query operations, in order.
+
+        Raises:
+            ValueError: If an operation or node is invalid.
+        """
+        tree = self.segment_tree
+        combine = self.monoid.combine
+        identity = self.monoid.identity
+        results = []
+
+        for operation in operations:
+            kind = operation[0]
+            u = self._index(operation[1])
+            v = self._index(operation[2])
+            if kind == "query":
+                result = identity
+                for left, right in self._path_ranges(u, v):
+                    result = combine(result, tree._query(left, right))
+                results.append(result)
+            elif kind == "add" or kind == "assign":
+                assign = 1 if kind == "assign" else 0
+                value = operation[3]
+                tree._update(self._path_ranges(u, v), assign, value)
             else:
-                u = self.parent[self.chain_head[u]]
+                raise ValueError(
+                    f"Unknown operation: {kind}. "
+                    f"Choose from {', '.join(self.OPERATIONS)}"
+                )
 
-        if self.depth[u] < self.depth[v]:
-            return u
-        return v
+        logger.info(
+            f"Processed batch of {len(operations)} path operations "
+            f"({len(results)} queries)"
+        )
+        return results
 
-    def _query_chain(
-        self, chain_id: int, left: int, right: int
-    ) -> float:
-        """Query range in a chain.
+    def query_paths(
+        self, pairs: Sequence[Tuple[Union[TreeNode, int], Union[TreeNode, int]]]
+    ) -> List[float]:
+        """Query many paths.
 
         Args:
-            chain_id: Chain ID.
-            left: Left position in chain.
-            right: Right position in chain.
+            pairs: Sequence of (u, v) pairs.
 
         Returns:
-            Query result.
+            Monoid aggregate along each path.
         """
-        if left > right:
-            left, right = right, left
-        return self.chain_segment_trees[chain_id].query_range(left, right)
+        return self.process_batch([("query", u, v) for u, v in pairs])
 
-    def _update_chain(
-        self, chain_id: int, left: int, right: int, value: float
+    def update_paths(
+        self,
+        updates: Sequence[Tuple[Union[TreeNode, int], Union[TreeNode, int], float]],
+        assign: bool = False,
     ) -> None:
-        """Update range in a chain.
+        """Update many paths.
 
         Args:
-            chain_id: Chain ID.
-            left: Left position in chain.
-            right: Right position in chain.
-            value: Value to add.
+            updates: Sequence of (u, v, value) triples.
+            assign: Assign value instead of adding it.
         """
-        if left > right:
-            left, right = right, left
-        self.chain_segment_trees[chain_id].update_range(left, right, value)
+        kind = "assign" if assign else "add"
+        self.process_batch([(kind, u, v, value) for u, v, value in updates])
 
-    def query_path(self, u: TreeNode, v: TreeNode) -> float:
+    def query_path(self, u: Union[TreeNode, int], v: Union[TreeNode, int]) -> float:
         """Query path from u to v.
 
         Args:
-            u: First node.
-            v: Second node.
+            u: First node (TreeNode or index).
+            v: Second node (TreeNode or index).
 
         Returns:
-            Sum of data along path.
-        """
-        u_orig, v_orig = u, v
-        lca = self._lca(u, v)
-        result = 0.0
-
-        while u != lca:
-            chain_id = self.node_to_chain[u]
-            head = self.chain_head[u]
-            if self.node_to_chain[head] == self.node_to_chain[lca]:
-                pos_u = self.chain_pos[u]
-                pos_lca = self.chain_pos[lca]
-                result += self._query_chain(chain_id, pos_lca, pos_u)
-                u = lca
-            else:
-                pos_u = self.chain_pos[u]
-                pos_head = self.chain_pos[head]
-                result += self._query_chain(chain_id, pos_head, pos_u)
-                u = self.parent[head]
-
-        while v != lca:
-            chain_id = self.node_to_chain[v]
-            head = self.chain_head[v]
-            if self.node_to_chain[head] == self.node_to_chain[lca]:
-                pos_v = self.chain_pos[v]
-                pos_lca = self.chain_pos[lca]
-                result += self._query_chain(chain_id, pos_lca, pos_v)
-                v = lca
-            else:
-                pos_v = self.chain_pos[v]
-                pos_head = self.chain_pos[head]
-                result += self._query_chain(chain_id, pos_head, pos_v)
-                v = self.parent[head]
-
-        lca_chain_id = self.node_to_chain[lca]
-        lca_pos = self.chain_pos[lca]
-        result += self._query_chain(lca_chain_id, lca_pos, lca_pos)
-
-        logger.info(f"Path query from {u_orig.value} to {v_orig.value}: {result}")
+            Monoid aggregate (sum by default) of data along path.
+        """
+        result = self.process_batch([("query", u, v)])[0]
+        logger.info(f"Path query from {self._label(u)} to {self._label(v)}: {result}")
         return result
 
-    def update_path(self, u: TreeNode, v: TreeNode, value: float) -> None:
+    def update_path(
+        self, u: Union[TreeNode, int], v: Union[TreeNode, int], value: float
+    ) -> None:
         """Update path from u to v by adding value.
 
         Args:
-            u: First node.
-            v: Second node.
+            u: First node (TreeNode or index).
+            v: Second node (TreeNode or index).
             value: Value to add to each node.
         """
-        u_orig, v_orig = u, v
-        lca = self._lca(u, v)
-
-        while u != lca:
-            chain_id = self.node_to_chain[u]
-            head = self.chain_head[u]
-            if self.node_to_chain[head] == self.node_to_chain[lca]:
-                pos_u = self.chain_pos[u]
-                pos_lca = self.chain_pos[lca]
-                self._update_chain(chain_id, pos_lca, pos_u, value)
-                u = lca
-            else:
-                pos_u = self.chain_pos[u]
-                pos_head = self.chain_pos[head]
-                self._update_chain(chain_id, pos_head, pos_u, value)
-                u = self.parent[head]
-
-        while v != lca:
-            chain_id = self.node_to_chain[v]
-            head = self.chain_head[v]
-            if self.node_to_chain[head] == self.node_to_chain[lca]:
-                pos_v = self.chain_pos[v]
-                pos_lca = self.chain_pos[lca]
-                self._update_chain(chain_id, pos_lca, pos_v, value)
-                v = lca
-            else:
-                pos_v = self.chain_pos[v]
-                pos_head = self.chain_pos[head]
-                self._update_chain(chain_id, pos_head, pos_v, value)
-                v = self.parent[head]
+        self.process_batch([("add", u, v, value)])
+        logger.info(
+            f"Path update from {self._label(u)} to {self._label(v)} with value {value}"
+        )
 
-        lca_chain_id = self.node_to_chain[lca]
-        lca_pos = self.chain_pos[lca]
-        self._update_chain(lca_chain_id, lca_pos, lca_pos, value)
+    def assign_path(
+        self, u: Union[TreeNode, int], v: Union[TreeNode, int], value: float
+    ) -> None:
+        """Set every node on the path from u to v to value.
 
-        logger.info(f"Path update from {u_orig.value} to {v_orig.value} with value {value}")
+        Args:
+            u: First node (TreeNode or index).
+            v: Second node (TreeNode or index).
+            value: Value to assign.
+        """
+        self.process_batch([("assign", u, v, value)])
+        logger.info(
+            f"Path assign from {self._label(u)} to {self._label(v)} with value {value}"
+        )
 
-    def query_subtree(self, node: TreeNode) -> float:
+    def query_subtree(self, node: Union[TreeNode, int]) -> float:
         """Query subtree rooted at node.
 
         Args:
-            node: Root of subtree.
+            node: Root of subtree (TreeNode or index).
 
         Returns:
-            Sum of data in subtree.
+            Monoid aggregate (sum by default) of data in subtree.
         """
-        chain_id = self.node_to_chain[node]
-        pos = self.chain_pos[node]
-        chain = self.chains[chain_id]
-
-        result = self._query_chain(chain_id, pos, len(chain) - 1)
-
-        for child in node.children:
-            if child != self.heavy_child[node]:
-                result += self.query_subtree(child)
-
-        logger.info(f"Subtree query for node {node.value}: {result}")
+        index = self._index(node)
+        left = self.pos[index]
+        result = self.segment_tree._query(
+            left, left + self.subtree_size[index] - 1
+        )
+        logger.info(f"Subtree query for node {self._label(node)}: {result}")
         return result
 
-    def get_lca(self, u: TreeNode, v: TreeNode) -> TreeNode:
+    def get_lca(
+        self, u: Union[TreeNode, int], v: Union[TreeNode, int]
+    ) -> Union[TreeNode, int]:
         """Get lowest common ancestor of two nodes.
 
         Args:
-            u: First node.
-            v: Second node.
+            u: First node (TreeNode or index).
+            v: Second node (TreeNode or index).
 
         Returns:
-            LCA node.
+            LCA node (an index for trees built from a parent array).
         """
-        lca = self._lca(u, v)
-        logger.info(f"LCA of {u.value} and {v.value}: {lca.value}")
+        lca = self._node(self._lca(self._index(u), self._index(v)))
+        logger.info(
+            f"LCA of {self._label(u)} and {self._label(v)}: {self._label(lca)}"
+        )
         return lca
 
-    def get_distance(self, u: TreeNode, v: TreeNode) -> int:
+    def get_distance(self, u: Union[TreeNode, int], v: Union[TreeNode, int]) -> int:
         """Get distance between two nodes.
 
         Args:
-            u: First node.
-            v: Second node.
+            u: First node (TreeNode or index).
+            v: Second node (TreeNode or index).
 
         Returns:
             Distance (number of edges).
         """
-        lca = self._lca(u, v)
-        distance = (
-            self.depth[u] + self.depth[v] - 2 * self.depth[lca]
+        u_idx = self._index(u)
+        v_idx = self._index(v)
+        lca = self._lca(u_idx, v_idx)
+        distance = self.depth[u_idx] + self.depth[v_idx] - 2 * self.depth[lca]
+        logger.info(
+            f"Distance between {self._label(u)} and {self._label(v)}: {distance}"
         )
-        logger.info(f"Distance between {u.value} and {v.value}: {distance}")
         return distance
 
+    @staticmethod
+    def _label(node: Union[TreeNode, int]) -> int:
+        """Get printable identifier for a node.
+
+        Args:
+            node: TreeNode or node index.
+
+        Returns:
+            TreeNode value or the index itself.
+        """
+        return node.value if isinstance(node, TreeNode) else node
+
 
 def build_tree_from_edges(
     n: int, edges: List[Tuple[int, int]], root_value: int = 0
@@ -545,6 +900,101 @@ def build_tree_from_edges(
     return root
 
 
+def generate_random_parents(
+    n: int, shape: str = "random", seed: Optional[int] = None
+) -> List[int]:
+    """Generate a random tree as a parent array rooted at node 0.
+
+    Args:
+        n: Number of nodes.
+        shape: "random" (parent drawn uniformly from earlier nodes) or
+            "path" (a chain of depth n - 1).
+        seed: Random seed.
+
+    Returns:
+        Parent array with parents[0] == -1.
+
+    Raises:
+        ValueError: If shape is unknown or n < 1.
+    """
+    if n < 1:
+        raise ValueError("Tree must have at least one node")
+    if shape not in ("random", "path"):
+        raise ValueError(f"Unknown shape: {shape}. Choose from random, path")
+
+    rng = random.Random(seed)
+    if shape == "path":
+        return [-1] + list(range(n - 1))
+    return [-1] + [rng.randrange(i) for i in range(1, n)]
+
+
+def benchmark_path_operations(
+    n: int = 100000,
+    num_operations: int = 1000000,
+    shape: str = "random",
+    monoid: str = "sum",
+    update_ratio: float = 0.5,
+    seed: Optional[int] = None,
+) -> Dict[str, any]:
+    """Benchmark a batch of mixed path queries and updates.
+
+    Updates are split evenly between adds and assigns.
+
+    Args:
+        n: Number of nodes.
+        num_operations: Number of path operations.
+        shape: Tree shape passed to generate_random_parents.
+        monoid: Monoid name.
+        update_ratio: Fraction of operations that are updates.
+        seed: Random seed.
+
+    Returns:
+        Dictionary with tree and batch sizes, build and batch timings and
+        success flag.
+    """
+    try:
+        rng = random.Random(seed)
+        parents = generate_random_parents(n, shape=shape, seed=seed)
+        values = [float(rng.randint(0, 100)) for _ in range(n)]
+
+        operations = []
+        for _ in range(num_operations):
+            u = rng.randrange(n)
+            v = rng.randrange(n)
+            if rng.random() < update_ratio:
+                kind = "add" if rng.random() < 0.5 else "assign"
+                operations.append((kind, u, v, float(rng.randint(-10, 10))))
+            else:
+                operations.append(("query", u, v))
+
+        start_time = time.perf_counter()
+        hld = HeavyLightDecomposition.from_parents(parents, values, monoid=monoid)
+        build_time = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        results = hld.process_batch(operations)
+        elapsed = time.perf_counter() - start_time
+
+        return {
+            "n": n,
+            "shape": shape,
+            "monoid": monoid,
+            "num_operations": num_operations,
+            "num_queries": len(results),
+            "num_chains": len(hld.chain_heads),
+            "build_seconds": build_time,
+            "time_seconds": elapsed,
+            "time_milliseconds": elapsed * 1000,
+            "operations_per_second": (
+                num_operations / elapsed if elapsed > 0 else 0.0
+            ),
+            "success": True,
+        }
+    except Exception as e:
+        logger.error(f"Error benchmarking path operations: {e}")
+        return {"success": False, "error": str(e)}
+
+
 def main() -> None:
     """Main function to demonstrate heavy-light decomposition."""
     print("Heavy-Light Decomposition Demo")
@@ -589,6 +1039,24 @@ def main() -> None:
     distance = hld.get_distance(node3, node6)
     print(f"Distance: {distance}")
 
+    print("\nMax over paths of a parent-array tree:")
+    hld_max = HeavyLightDecomposition.from_parents(
+        [-1, 0, 0, 1, 1, 2, 2], values=[1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0],
+        monoid="max",
+    )
+    hld_max.update_paths([(3, 4, 10.0)], assign=True)
+    print(f"Max on paths (3, 5), (5, 6): {hld_max.query_paths([(3, 5), (5, 6)])}")
+
+    print("\nBenchmark: 20,000 mixed path operations on 10,000 nodes")
+    result = benchmark_path_operations(n=10000, num_operations=20000, seed=42)
+    if result["success"]:
+        print(
+            f"Batch time: {result['time_milliseconds']:.2f} ms "
+            f"({result['operations_per_second']:,.0f} ops/s)"
+        )
+    else:
+        print(f"Benchmark failed: {result['error']}")
+
 
 if __name__ == "__main__":
     main()
@@ -8,8 +8,12 @@ import yaml
 
 from src.main import (
     HeavyLightDecomposition,
+    Monoid,
+    SegmentTree,
     TreeNode,
+    benchmark_path_operations,
     build_tree_from_edges,
+    generate_random_parents,
 )
 
 
@@ -184,3 +188,174 @@ class TestHeavyLightDecomposition:
 
         assert result1 >= 0.0
         assert result2 >= 0.0
+
+    def test_query_path_exact_sum(self, complex_tree, config_file):
+        """Test that path sums count every node exactly once."""
+        root, node1, node2, node3, node4, node5, node6 = complex_tree
+        hld = HeavyLightDecomposition(root, config_path=config_file)
+
+        assert hld.query_path(node3, node5) == 4.0 + 2.0 + 1.0 + 3.0 + 6.0
+        hld.update_path(node3, node5, 10.0)
+        assert hld.query_path(node3, node5) == 16.0 + 50.0
+        assert hld.query_subtree(node1) == 2.0 + 4.0 + 5.0 + 20.0
+
+
+class TestSegmentTree:
+    """Test cases for SegmentTree class."""
+
+    @pytest.mark.parametrize("monoid", ["sum", "min", "max"])
+    def test_matches_naive(self, monoid):
+        """Test mixed add/assign updates against a plain list."""
+        values = [float((i * 7) % 11) for i in range(23)]
+        tree = SegmentTree(len(values), monoid, values)
+        aggregate = {"sum": sum, "min": min, "max": max}[monoid]
+
+        for step in range(60):
+            left = (step * 5) % 23
+            right = min(22, left + step % 9)
+            if step % 3 == 0:
+                tree.assign_range(left, right, float(step % 4))
+                values[left:right + 1] = [float(step % 4)] * (right - left + 1)
+            elif step % 3 == 1:
+                tree.update_range(left, right, 2.0)
+                values[left:right + 1] = [v + 2.0 for v in values[left:right + 1]]
+            assert tree.query_range(left, right) == aggregate(values[left:right + 1])
+            assert tree.query_range(0, 22) == aggregate(values)
+
+    def test_custom_monoid(self):
+        """Test a user-supplied monoid with assign updates."""
+        product = Monoid("product", lambda a, b: a * b, 1.0, lambda v, n: v ** n)
+        tree = SegmentTree(4, product, [1.0, 2.0, 3.0, 4.0])
+
+        assert tree.query_range(0, 3) == 24.0
+        tree.assign_range(1, 2, 2.0)
+        assert tree.query_range(0, 3) == 16.0
+
+    def test_invalid_arguments(self):
+        """Test that invalid monoids and ranges raise ValueError."""
+        with pytest.raises(ValueError):
+            SegmentTree(4, "xor")
+        tree = SegmentTree(4)
+        with pytest.raises(ValueError):
+            tree.query_range(2, 4)
+        with pytest.raises(ValueError):
+            tree.update_range(3, 1, 1.0)
+
+
+class TestArrayDecomposition:
+    """Test cases for decomposition built from parent arrays."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create temporary directory for testing."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+
+    @pytest.fixture
+    def config_file(self, temp_dir):
+        """Create temporary config file."""
+        config = {
+            "logging": {"level": "INFO", "file": str(temp_dir / "app.log")},
+        }
+        config_path = temp_dir / "config.yaml"
+        with open(config_path, "w") as f:
+            yaml.dump(config, f)
+        return str(config_path)
+
+    @staticmethod
+    def path_nodes(parents, u, v):
+        """List nodes on the u-v path by walking up."""
+        ancestors = []
+        while u != -1:
+            ancestors.append(u)
+            u = parents[u]
+        other = []
+        while v not in ancestors:
+            other.append(v)
+            v = parents[v]
+        return ancestors[: ancestors.index(v) + 1] + other
+
+    def test_positions_are_contiguous(self, config_file):
+        """Test that chains and subtrees occupy contiguous positions."""
+        parents = generate_random_parents(200, seed=4)
+        hld = HeavyLightDecomposition.from_parents(parents, config_path=config_file)
+
+        assert sorted(hld.pos) == list(range(200))
+        for chain in hld.chains:
+            positions = [hld.pos[node] for node in chain]
+            assert positions == list(range(positions[0], positions[0] + len(chain)))
+        for node in range(200):
+            descendants = [
+                x for x in range(200) if node in self.path_nodes(parents, x, 0)
+            ]
+            start = hld.pos[node]
+            assert sorted(hld.pos[x] for x in descendants) == list(
+                range(start, start + hld.subtree_size[node])
+            )
+
+    @pytest.mark.parametrize("monoid", ["sum", "min", "max"])
+    def test_batch_matches_naive(self, config_file, monoid):
+        """Test batched path operations against direct path walks."""
+        parents = generate_random_parents(120, seed=9)
+        values = [float(i % 13) for i in range(120)]
+        hld = HeavyLightDecomposition.from_parents(
+            parents, values, config_path=config_file, monoid=monoid
+        )
+        aggregate = {"sum": sum, "min": min, "max": max}[monoid]
+
+        operations = []
+        expected = []
+        for step in range(150):
+            u, v = (step * 31) % 120, (step * 17 + 5) % 120
+            nodes = self.path_nodes(parents, u, v)
+            if step % 3 == 0:
+                operations.append(("query", u, v))
+                expected.append(aggregate(values[x] for x in nodes))
+            elif step % 3 == 1:
+                operations.append(("add", u, v, 3.0))
+                for x in nodes:
+                    values[x] += 3.0
+            else:
+                operations.append(("assign", u, v, float(step % 7)))
+                for x in nodes:
+                    values[x] = float(step % 7)
+
+        assert hld.process_batch(operations) == expected
+        pairs = [(0, 119), (50, 60)]
+        assert hld.query_paths(pairs) == [
+            aggregate(values[x] for x in self.path_nodes(parents, u, v))
+            for u, v in pairs
+        ]
+
+    def test_deep_path_tree(self, config_file):
+        """Test that a long chain is decomposed without recursion."""
+        n = 50000
+        hld = HeavyLightDecomposition.from_parents(
+            generate_random_parents(n, shape="path"), config_path=config_file
+        )
+
+        hld.update_paths([(0, n - 1, 1.0)])
+
+        assert len(hld.chains) == 1
+        assert hld.query_path(10, n - 1) == n - 10
+        assert hld.get_lca(n - 1, 123) == 123
+
+    def test_invalid_input(self, config_file):
+        """Test that malformed trees and operations raise ValueError."""
+        with pytest.raises(ValueError):
+            HeavyLightDecomposition.from_parents([-1, -1], config_path=config_file)
+        with pytest.raises(ValueError):
+            HeavyLightDecomposition.from_parents([-1, 2, 1], config_path=config_file)
+        hld = HeavyLightDecomposition.from_parents([-1, 0], config_path=config_file)
+        with pytest.raises(ValueError):
+            hld.process_batch([("multiply", 0, 1, 2.0)])
+        with pytest.raises(ValueError):
+            hld.query_path(0, 5)
+
+    def test_benchmark(self):
+        """Test benchmark structure."""
+        result = benchmark_path_operations(n=300, num_operations=500, seed=1)
+
+        assert result["success"] is True
+        assert result["num_operations"] == 500
+        assert 0 < result["num_queries"] < 500
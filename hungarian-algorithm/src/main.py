@@ -5,8 +5,10 @@ graphs using the Hungarian algorithm (Kuhn-Munkres algorithm). The assignment
 problem finds the minimum cost assignment of workers to jobs given a cost matrix.
 """
 
+import heapq
 import logging
 import logging.handlers
+import math
 import sys
 from copy import deepcopy
 from pathlib import Path
@@ -15,6 +17,13 @@ from typing import Dict, List, Optional, Tuple
 import yaml
 from dotenv import load_dotenv
 
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 # Load environment variables
 load_dotenv()
 
@@ -28,20 +37,29 @@ class HungarianAlgorithm:
         """Initialize Hungarian algorithm with cost matrix.
 
         Args:
-            cost_matrix: Square cost matrix (n x n) where cost_matrix[i][j]
-                        is cost of assigning worker i to job j.
+            cost_matrix: Cost matrix (n x m) where cost_matrix[i][j] is cost
+                        of assigning worker i to job j. Rectangular matrices
+                        assign min(n, m) pairs. None or math.inf marks a
+                        forbidden pair.
             config_path: Path to configuration YAML file.
         """
-        if not cost_matrix:
+        if not cost_matrix or not cost_matrix[0]:
             raise ValueError("Cost matrix cannot be empty")
-        if not all(len(row) == len(cost_matrix) for row in cost_matrix):
-            raise ValueError("Cost matrix must be square")
+        if not all(len(row) == len(cost_matrix[0]) for row in cost_matrix):
+            raise ValueError("Cost matrix rows must all have the same length")
 
-        self.original_matrix = [row[:] for row in cost_matrix]
+        self.original_matrix = [
+            [math.inf if cost is None else cost for cost in row]
+            for row in cost_matrix
+        ]
         self.n = len(cost_matrix)
+        self.m = len(cost_matrix[0])
+        # Dual state kept from the last shortest-path solve for warm starts
+        self._warm_state: Optional[Dict] = None
+        self._dirty_rows: set = set()
         self._setup_logging()
         self.config = self._load_config(config_path)
-        logger.info(f"Hungarian algorithm initialized with {self.n}x{self.n} matrix")
+        logger.info(f"Hungarian algorithm initialized with {self.n}x{self.m} matrix")
 
     def _setup_logging(self) -> None:
         """Configure logging for the application."""
@@ -78,13 +96,38 @@ class HungarianAlgorithm:
             logger.warning(f"Configuration file not found: {config_path}")
             return {}
 
-    def solve(self) -> Tuple[int, List[Tuple[int, int]]]:
+    def solve(
+        self, method: str = "shortest_path"
+    ) -> Tuple[int, List[Tuple[int, int]]]:
         """Solve assignment problem using Hungarian algorithm.
 
+        Args:
+            method: "shortest_path" (default) for the O(n^3) potentials-based
+                shortest augmenting path solver, or "cover_zeros" for the
+                textbook row/column reduction and zero-covering loop (square
+                matrices without forbidden pairs only).
+
         Returns:
             Tuple of (minimum_cost, assignments) where assignments is list of
             (worker, job) pairs.
+
+        Raises:
+            ValueError: If method is unknown, no complete assignment exists,
+                or cover_zeros is used on an unsupported matrix.
         """
+        if method == "shortest_path":
+            return self._solve_shortest_path()
+        if method != "cover_zeros":
+            raise ValueError(
+                f"Unknown method: {method}. Use 'shortest_path' or 'cover_zeros'"
+            )
+        if self.n != self.m or any(
+            math.isinf(cost) for row in self.original_matrix for cost in row
+        ):
+            raise ValueError(
+                "cover_zeros requires a square matrix without forbidden pairs"
+            )
+
         logger.info("Solving assignment problem using Hungarian algorithm")
 
         matrix = [row[:] for row in self.original_matrix]
@@ -104,6 +147,350 @@ class HungarianAlgorithm:
         logger.info(f"Optimal assignment found with cost: {total_cost}")
         return total_cost, assignments
 
+    def update_costs(self, changes: Dict[Tuple[int, int], Optional[int]]) -> None:
+        """Change individual costs, keeping the last solution for a warm start.
+
+        The next solve() frees only the workers whose rows changed and
+        re-augments them from the previous potentials. This costs
+        O(k * n^2) for k changed rows instead of a full O(n^3) solve.
+
+        Args:
+            changes: Mapping of (worker, job) to new cost (None or math.inf
+                forbids the pair).
+
+        Raises:
+            ValueError: If an index is invalid.
+        """
+        for (worker, job), cost in changes.items():
+            if worker < 0 or worker >= self.n:
+                raise ValueError(f"Invalid worker index: {worker}")
+            if job < 0 or job >= self.m:
+                raise ValueError(f"Invalid job index: {job}")
+            self.original_matrix[worker][job] = math.inf if cost is None else cost
+            row = job if self.n > self.m else worker
+            self._dirty_rows.add(row)
+        logger.info(
+            f"Updated {len(changes)} costs, {len(self._dirty_rows)} rows to re-solve"
+        )
+
+    def _solve_shortest_path(self) -> Tuple[int, List[Tuple[int, int]]]:
+        """Solve using shortest augmenting paths with dual potentials.
+
+        The problem is oriented so rows are the smaller side. Square
+        problems start with column reduction and reduction transfer, as in
+        Jonker-Volgenant. Each remaining free row is then augmented along a
+        Dijkstra shortest path in reduced costs. The column scans use NumPy
+        when it is available, and a heap-based sparse search otherwise.
+
+        Returns:
+            Tuple of (minimum_cost, assignments).
+
+        Raises:
+            ValueError: If forbidden pairs leave no complete assignment.
+        """
+        transpose = self.n > self.m
+        if transpose:
+            rows = [list(col) for col in zip(*self.original_matrix)]
+        else:
+            rows = self.original_matrix
+        num_rows, num_cols = len(rows), len(rows[0])
+
+        state = self._warm_state
+        if state is not None and self._dirty_rows:
+            v = state["v"][:]
+            row_to_col = state["row_to_col"][:]
+            col_to_row = state["col_to_row"][:]
+            for i in self._dirty_rows:
+                j = row_to_col[i]
+                if j != -1:
+                    col_to_row[j] = -1
+                    row_to_col[i] = -1
+            logger.info(f"Warm start: re-solving {len(self._dirty_rows)} rows")
+        elif state is not None:
+            v = state["v"][:]
+            row_to_col = state["row_to_col"][:]
+            col_to_row = state["col_to_row"][:]
+        else:
+            v = [0.0] * num_cols
+            row_to_col = [-1] * num_rows
+            col_to_row = [-1] * num_cols
+
+        if NUMPY_AVAILABLE:
+            v, row_to_col, col_to_row = self._augment_dense(
+                rows, v, row_to_col, col_to_row, warm=state is not None
+            )
+        else:
+            adjacency = [
+                [(j, cost) for j, cost in enumerate(row) if not math.isinf(cost)]
+                for row in rows
+            ]
+            free_rows = [i for i in range(num_rows) if row_to_col[i] == -1]
+            self._augment_sparse(adjacency, v, row_to_col, col_to_row, free_rows)
+
+        # Rectangular optimality needs v <= 0 with v = 0 on unused columns;
+        # a warm start can break that, in which case re-solve from scratch
+        if (
+            state is not None
+            and num_rows < num_cols
+            and any(col_to_row[j] == -1 and v[j] != 0 for j in range(num_cols))
+        ):
+            logger.info("Warm start certificate failed, solving from scratch")
+            self._warm_state = None
+            self._dirty_rows.clear()
+            return self._solve_shortest_path()
+
+        self._warm_state = {
+            "v": list(v),
+            "row_to_col": list(row_to_col),
+            "col_to_row": list(col_to_row),
+        }
+        self._dirty_rows.clear()
+
+        if transpose:
+            assignments = sorted((j, i) for i, j in enumerate(row_to_col))
+        else:
+            assignments = sorted(enumerate(row_to_col))
+        total_cost = self._calculate_total_cost(assignments)
+        logger.info(f"Optimal assignment found with cost: {total_cost}")
+        return total_cost, assignments
+
+    def _augment_dense(
+        self,
+        rows: List[List[float]],
+        v: List[float],
+        row_to_col: List[int],
+        col_to_row: List[int],
+        warm: bool,
+    ) -> Tuple[List[float], List[int], List[int]]:
+        """Augment all free rows using NumPy-vectorized column scans.
+
+        Args:
+            rows: Cost matrix with rows as the smaller side.
+            v: Column potentials.
+            row_to_col: Column assigned to each row (-1 if free).
+            col_to_row: Row assigned to each column (-1 if free).
+            warm: Whether the state comes from a previous solve.
+
+        Returns:
+            Tuple of (v, row_to_col, col_to_row) after augmentation.
+
+        Raises:
+            ValueError: If a row cannot be assigned.
+        """
+        cost = np.array(rows, dtype=float)
+        num_rows, num_cols = cost.shape
+        v = np.array(v, dtype=float)
+        row_to_col = np.array(row_to_col, dtype=np.int64)
+        col_to_row = np.array(col_to_row, dtype=np.int64)
+
+        if np.isinf(cost).all(axis=1).any():
+            raise ValueError("No feasible assignment: a worker has no allowed job")
+
+        if not warm and num_rows == num_cols:
+            # Column reduction: each column's cheapest row takes it if free
+            v = cost.min(axis=0)
+            if np.isinf(v).any():
+                raise ValueError("No feasible assignment: a job has no allowed worker")
+            cheapest = cost.argmin(axis=0)
+            for j in range(num_cols - 1, -1, -1):
+                i = cheapest[j]
+                if row_to_col[i] == -1:
+                    row_to_col[i] = j
+                    col_to_row[j] = i
+
+            # Reduction transfer: move slack from assigned columns to rows
+            for i in np.flatnonzero(row_to_col != -1):
+                j = row_to_col[i]
+                reduced = cost[i] - v
+                reduced[j] = np.inf
+                second = reduced.min()
+                if not np.isinf(second):
+                    v[j] = cost[i, j] - second
+
+        for r in np.flatnonzero(row_to_col == -1):
+            dist = cost[r] - v
+            pred = np.full(num_cols, r, dtype=np.int64)
+            scanned = np.zeros(num_cols, dtype=bool)
+
+            while True:
+                masked = np.where(scanned, np.inf, dist)
+                j = int(masked.argmin())
+                delta = masked[j]
+                if np.isinf(delta):
+                    raise ValueError(
+                        f"No feasible assignment: worker {r} cannot be assigned"
+                    )
+                scanned[j] = True
+                i = col_to_row[j]
+                if i == -1:
+                    break
+                # Reduced cost from row i, whose own reduced cost on j is 0
+                candidate = delta + (cost[i] - v) - (cost[i, j] - v[j])
+                better = ~scanned & (candidate < dist)
+                dist[better] = candidate[better]
+                pred[better] = i
+
+            v[scanned] += dist[scanned] - delta
+
+            while True:
+                i = pred[j]
+                col_to_row[j] = i
+                previous = row_to_col[i]
+                row_to_col[i] = j
+                if i == r:
+                    break
+                j = previous
+
+        return v.tolist(), row_to_col.tolist(), col_to_row.tolist()
+
+    @staticmethod
+    def _augment_sparse(
+        adjacency: List[List[Tuple[int, float]]],
+        v: List[float],
+        row_to_col: List[int],
+        col_to_row: List[int],
+        free_rows: List[int],
+    ) -> None:
+        """Augment free rows using heap-based Dijkstra over allowed pairs.
+
+        Runs in O(E log V) per row, so sparse inputs never materialize a
+        dense matrix. All lists are updated in place.
+
+        Args:
+            adjacency: For each row, list of (column, cost) allowed pairs.
+            v: Column potentials.
+            row_to_col: Column assigned to each row (-1 if free).
+            col_to_row: Row assigned to each column (-1 if free).
+            free_rows: Rows to augment.
+
+        Raises:
+            ValueError: If a row cannot be assigned.
+        """
+        num_cols = len(v)
+        matched_cost = [0.0] * len(row_to_col)
+        for i, row in enumerate(adjacency):
+            if row_to_col[i] != -1:
+                matched_cost[i] = min(
+                    cost for j, cost in row if j == row_to_col[i]
+                )
+
+        dist = [math.inf] * num_cols
+        pred = [-1] * num_cols
+        done = [False] * num_cols
+
+        for r in free_rows:
+            touched: List[int] = []
+            scanned: List[int] = []
+            heap: List[Tuple[float, int]] = []
+            for j, cost in adjacency[r]:
+                d = cost - v[j]
+                if d < dist[j]:
+                    if math.isinf(dist[j]):
+                        touched.append(j)
+                    dist[j] = d
+                    pred[j] = r
+                    heap.append((d, j))
+            heapq.heapify(heap)
+
+            end = -1
+            delta = math.inf
+            while heap:
+                d, j = heapq.heappop(heap)
+                if done[j] or d > dist[j]:
+                    continue
+                done[j] = True
+                scanned.append(j)
+                i = col_to_row[j]
+                if i == -1:
+                    end = j
+                    delta = d
+                    break
+                base = d - (matched_cost[i] - v[j])
+                for k, cost in adjacency[i]:
+                    if done[k]:
+                        continue
+                    nd = base + cost - v[k]
+                    if nd < dist[k]:
+                        if math.isinf(dist[k]):
+                            touched.append(k)
+                        dist[k] = nd
+                        pred[k] = i
+                        heapq.heappush(heap, (nd, k))
+
+            if end == -1:
+                raise ValueError(
+                    f"No feasible assignment: worker {r} cannot be assigned"
+                )
+
+            for k in scanned:
+                v[k] += dist[k] - delta
+
+            j = end
+            while True:
+                i = pred[j]
+                col_to_row[j] = i
+                previous = row_to_col[i]
+                row_to_col[i] = j
+                matched_cost[i] = min(cost for k, cost in adjacency[i] if k == j)
+                if i == r:
+                    break
+                j = previous
+
+            for k in touched:
+                dist[k] = math.inf
+                pred[k] = -1
+                done[k] = False
+
+    @classmethod
+    def solve_sparse(
+        cls,
+        left_size: int,
+        right_size: int,
+        edges: Dict[Tuple[int, int], int],
+    ) -> Tuple[int, List[Tuple[int, int]]]:
+        """Solve an assignment problem given only its allowed pairs.
+
+        Pairs missing from edges are forbidden. min(left_size, right_size)
+        pairs are assigned.
+
+        Args:
+            left_size: Number of workers.
+            right_size: Number of jobs.
+            edges: Mapping of (worker, job) to cost.
+
+        Returns:
+            Tuple of (minimum_cost, assignments).
+
+        Raises:
+            ValueError: If no complete assignment exists.
+        """
+        transpose = left_size > right_size
+        num_rows = right_size if transpose else left_size
+        num_cols = left_size if transpose else right_size
+        adjacency: List[List[Tuple[int, float]]] = [[] for _ in range(num_rows)]
+        for (left, right), cost in edges.items():
+            if transpose:
+                adjacency[right].append((left, cost))
+            else:
+                adjacency[left].append((right, cost))
+
+        v = [0.0] * num_cols
+        row_to_col = [-1] * num_rows
+        col_to_row = [-1] * num_cols
+        cls._augment_sparse(
+            adjacency, v, row_to_col, col_to_row, list(range(num_rows))
+        )
+
+        if transpose:
+            assignments = sorted((j, i) for i, j in enumerate(row_to_col))
+        else:
+            assignments = sorted(enumerate(row_to_col))
+        total_cost = sum(edges[pair] for pair in assignments)
+        logger.info(
+            f"Sparse assignment: {len(edges)} edges, cost {total_cost}"
+        )
+        return total_cost, assignments
+
     def _reduce_rows(self, matrix: List[List[int]]) -> List[List[int]]:
         """Reduce rows by subtracting minimum from each row.
 
@@ -344,7 +731,7 @@ class HungarianAlgorithm:
         """
         if worker < 0 or worker >= self.n:
             raise ValueError(f"Invalid worker index: {worker}")
-        if job < 0 or job >= self.n:
+        if job < 0 or job >= self.m:
             raise ValueError(f"Invalid job index: {job}")
         return self.original_matrix[worker][job]
 
@@ -358,9 +745,13 @@ class HungarianAlgorithm:
         """
         logger.info("Solving maximization assignment problem")
 
-        max_val = max(max(row) for row in self.original_matrix)
+        max_val = max(
+            cost for row in self.original_matrix for cost in row
+            if not math.isinf(cost)
+        )
         transformed = [
-            [max_val - cost for cost in row] for row in self.original_matrix
+            [math.inf if math.isinf(cost) else max_val - cost for cost in row]
+            for row in self.original_matrix
         ]
 
         temp_algorithm = HungarianAlgorithm(transformed)
@@ -379,13 +770,14 @@ class HungarianAlgorithm:
         Returns:
             True if valid, False otherwise.
         """
-        if len(assignments) != self.n:
+        size = min(self.n, self.m)
+        if len(assignments) != size:
             return False
 
         workers = {i for i, _ in assignments}
         jobs = {j for _, j in assignments}
 
-        return len(workers) == self.n and len(jobs) == self.n
+        return len(workers) == size and len(jobs) == size
 
 
 class BipartiteGraph:
@@ -403,6 +795,8 @@ class BipartiteGraph:
         self.left_size = left_size
         self.right_size = right_size
         self.edges: Dict[Tuple[int, int], int] = {}
+        self.match_left: List[Optional[int]] = [None] * left_size
+        self.match_right: List[Optional[int]] = [None] * right_size
         logger.info(
             f"Bipartite graph initialized: "
             f"{left_size} left, {right_size} right vertices"
@@ -444,14 +838,168 @@ class BipartiteGraph:
         return matrix
 
     def solve_assignment(self) -> Tuple[int, List[Tuple[int, int]]]:
-        """Solve assignment problem using Hungarian algorithm.
+        """Solve assignment problem over the graph's edges.
+
+        Missing edges are forbidden pairs, and min(left_size, right_size)
+        pairs are assigned. When every edge has the same weight any maximum
+        matching is optimal, so Hopcroft-Karp is used; otherwise the sparse
+        shortest augmenting path solver runs. Neither builds a dense matrix.
 
         Returns:
             Tuple of (minimum_cost, assignments).
+
+        Raises:
+            ValueError: If no complete assignment exists.
         """
-        matrix = self.to_cost_matrix()
-        algorithm = HungarianAlgorithm(matrix)
-        return algorithm.solve()
+        weights = set(self.edges.values())
+        if len(weights) == 1:
+            matching = self.find_maximum_matching()
+            if len(matching) < min(self.left_size, self.right_size):
+                raise ValueError(
+                    "No feasible assignment: maximum matching has "
+                    f"{len(matching)} pairs"
+                )
+            weight = weights.pop()
+            logger.info("Uniform edge weights, solved with Hopcroft-Karp")
+            return weight * len(matching), sorted(matching.items())
+
+        return HungarianAlgorithm.solve_sparse(
+            self.left_size, self.right_size, self.edges
+        )
+
+    def _build_adjacency(self) -> Tuple[List[int], List[int]]:
+        """Flatten edges into left-vertex offset and right-vertex target arrays.
+
+        Neighbors of left vertex u are targets[offsets[u]:offsets[u + 1]].
+
+        Returns:
+            Tuple of (offsets, targets).
+        """
+        offsets = [0] * (self.left_size + 1)
+        for left, _ in self.edges:
+            offsets[left + 1] += 1
+        for u in range(self.left_size):
+            offsets[u + 1] += offsets[u]
+        targets = [0] * len(self.edges)
+        position = offsets[:-1]
+        for left, right in self.edges:
+            targets[position[left]] = right
+            position[left] += 1
+        return offsets, targets
+
+    def find_maximum_matching(self) -> Dict[int, int]:
+        """Find a maximum cardinality matching with Hopcroft-Karp.
+
+        Edge weights are ignored. Each phase builds BFS layers from the free
+        left vertices up to the first layer that reaches a free right
+        vertex, then finds a maximal set of vertex-disjoint shortest
+        augmenting paths with an iterative DFS over flat adjacency arrays.
+        O(sqrt(V)) phases of O(E) each give O(E * sqrt(V)).
+
+        Returns:
+            Dictionary mapping left vertex to its matched right vertex.
+        """
+        offsets, targets = self._build_adjacency()
+        match_left = [-1] * self.left_size
+        match_right = [-1] * self.right_size
+        unreached = self.left_size + 1
+        dist = [unreached] * self.left_size
+        edge_index = [0] * self.left_size
+        free = list(range(self.left_size))
+        phases = 0
+
+        while free:
+            for u in free:
+                dist[u] = 0
+            queue = list(free)
+            limit = unreached
+            head = 0
+            while head < len(queue):
+                u = queue[head]
+                head += 1
+                depth = dist[u]
+                if depth > limit:
+                    break
+                edge_index[u] = offsets[u]
+                for v in targets[offsets[u]:offsets[u + 1]]:
+                    w = match_right[v]
+                    if w == -1:
+                        limit = depth
+                    elif dist[w] == unreached and depth < limit:
+                        dist[w] = depth + 1
+                        queue.append(w)
+            if limit == unreached:
+                break
+            phases += 1
+
+            for root in free:
+                stack = [root]
+                while stack:
+                    u = stack[-1]
+                    i = edge_index[u]
+                    end = offsets[u + 1]
+                    at_limit = dist[u] == limit
+                    next_depth = dist[u] + 1
+                    w = unreached
+                    while i < end:
+                        w = match_right[targets[i]]
+                        if w == -1:
+                            if at_limit:
+                                break
+                        elif dist[w] == next_depth and not at_limit:
+                            break
+                        i += 1
+                    edge_index[u] = i
+
+                    if i == end:
+                        dist[u] = unreached
+                        stack.pop()
+                        if stack:
+                            edge_index[stack[-1]] += 1
+                    elif w != -1:
+                        stack.append(w)
+                    else:
+                        for x in stack:
+                            v = targets[edge_index[x]]
+                            match_left[x] = v
+                            match_right[v] = x
+                        break
+
+            for u in queue:
+                dist[u] = unreached
+            free = [u for u in free if match_left[u] == -1]
+
+        self.match_left = [None if v == -1 else v for v in match_left]
+        self.match_right = [None if u == -1 else u for u in match_right]
+        matching = {u: v for u, v in enumerate(match_left) if v != -1}
+        logger.info(
+            f"Hopcroft-Karp matching of size {len(matching)} in {phases} phases"
+        )
+        return matching
+
+    def get_matching_size(self) -> int:
+        """Get size of the matching from find_maximum_matching().
+
+        Returns:
+            Number of matched pairs.
+        """
+        return sum(1 for v in self.match_left if v is not None)
+
+    def get_matched_vertex(self, left: int) -> Optional[int]:
+        """Get right vertex matched to a left vertex.
+
+        Args:
+            left: Vertex in left partition.
+
+        Returns:
+            Matched right vertex or None.
+
+        Raises:
+            ValueError: If vertex is invalid.
+        """
+        if left < 0 or left >= self.left_size:
+            raise ValueError(f"Invalid left vertex: {left}")
+        return self.match_left[left]
 
 
 def main() -> None:
@@ -489,6 +1037,23 @@ def main() -> None:
     graph_cost, graph_assignments = graph.solve_assignment()
     logger.info(f"Graph-based solution cost: {graph_cost}")
 
+    logger.info("\nUnweighted bipartite matching (Hopcroft-Karp):")
+    unweighted = BipartiteGraph(4, 4)
+    for left, right in [(0, 0), (0, 1), (1, 0), (2, 1), (2, 2), (3, 2)]:
+        unweighted.add_edge(left, right, 1)
+    matching = unweighted.find_maximum_matching()
+    logger.info(f"Matching size: {unweighted.get_matching_size()}: {matching}")
+
+    logger.info("\nRectangular problem with a forbidden pair:")
+    rectangular = HungarianAlgorithm([[4, None, 6], [2, 3, 1]])
+    rect_cost, rect_assignments = rectangular.solve()
+    logger.info(f"Cost: {rect_cost}, assignments: {rect_assignments}")
+
+    logger.info("\nWarm start after a cost change:")
+    algorithm.update_costs({(2, 2): 20})
+    warm_cost, warm_assignments = algorithm.solve()
+    logger.info(f"Cost: {warm_cost}, assignments: {warm_assignments}")
+
 
 if __name__ == "__main__":
     main()
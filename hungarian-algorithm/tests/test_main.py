@@ -1,5 +1,8 @@
 """Unit tests for Hungarian algorithm module."""
 
+import itertools
+import math
+import random
 import tempfile
 from pathlib import Path
 
@@ -9,6 +12,20 @@ import yaml
 from src.main import BipartiteGraph, HungarianAlgorithm
 
 
+def _brute_force_cost(matrix):
+    """Minimum assignment cost by enumerating all assignments."""
+    rows, cols = len(matrix), len(matrix[0])
+    if rows <= cols:
+        return min(
+            sum(matrix[i][perm[i]] for i in range(rows))
+            for perm in itertools.permutations(range(cols), rows)
+        )
+    return min(
+        sum(matrix[perm[j]][j] for j in range(cols))
+        for perm in itertools.permutations(range(rows), cols)
+    )
+
+
 class TestHungarianAlgorithm:
     """Test cases for HungarianAlgorithm class."""
 
@@ -154,6 +171,114 @@ class TestHungarianAlgorithm:
         assert min_cost == 850
         assert algorithm.is_valid_assignment(assignments)
 
+    def test_cover_zeros_method(self, complex_matrix):
+        """Test textbook method agrees with shortest path solver."""
+        cost, _ = complex_matrix.solve()
+        cover_cost, assignments = complex_matrix.solve(method="cover_zeros")
+        assert cover_cost == cost
+        assert complex_matrix.is_valid_assignment(assignments)
+
+    def test_unknown_method(self, simple_matrix):
+        """Test unknown solve method raises error."""
+        with pytest.raises(ValueError, match="Unknown method"):
+            simple_matrix.solve(method="simplex")
+
+    def test_rectangular_wide(self, config_file):
+        """Test more jobs than workers."""
+        matrix = [[4, 1, 3, 9], [2, 0, 5, 8]]
+        algorithm = HungarianAlgorithm(matrix, config_path=config_file)
+        min_cost, assignments = algorithm.solve()
+        assert min_cost == 3
+        assert assignments == [(0, 1), (1, 0)]
+        assert algorithm.is_valid_assignment(assignments)
+
+    def test_rectangular_tall(self, config_file):
+        """Test more workers than jobs."""
+        matrix = [[4, 1], [2, 0], [1, 7]]
+        algorithm = HungarianAlgorithm(matrix, config_path=config_file)
+        min_cost, assignments = algorithm.solve()
+        assert min_cost == 1
+        assert assignments == [(1, 1), (2, 0)]
+
+    def test_forbidden_pairs(self, config_file):
+        """Test None and inf entries are never assigned."""
+        matrix = [[1, None, 5], [math.inf, 1, 1], [1, 2, None]]
+        algorithm = HungarianAlgorithm(matrix, config_path=config_file)
+        min_cost, assignments = algorithm.solve()
+        assert min_cost == 4
+        assert assignments == [(0, 0), (1, 2), (2, 1)]
+
+    def test_forbidden_pairs_infeasible(self, config_file):
+        """Test infeasible assignment raises error."""
+        matrix = [[1, None], [2, None]]
+        algorithm = HungarianAlgorithm(matrix, config_path=config_file)
+        with pytest.raises(ValueError, match="No feasible assignment"):
+            algorithm.solve()
+
+    def test_cover_zeros_rejects_rectangular(self, config_file):
+        """Test textbook method requires a square matrix."""
+        algorithm = HungarianAlgorithm([[1, 2, 3]], config_path=config_file)
+        with pytest.raises(ValueError):
+            algorithm.solve(method="cover_zeros")
+
+    def test_random_matches_brute_force(self, config_file):
+        """Test random rectangular and forbidden inputs against brute force."""
+        rng = random.Random(7)
+        for _ in range(40):
+            rows, cols = rng.randint(1, 5), rng.randint(1, 5)
+            matrix = [
+                [rng.randint(-10, 30) for _ in range(cols)] for _ in range(rows)
+            ]
+            for i in range(rows):
+                for j in range(cols):
+                    if (i + j) % 2 and rng.random() < 0.3:
+                        matrix[i][j] = None
+            dense = [[math.inf if c is None else c for c in row] for row in matrix]
+            expected = _brute_force_cost(dense)
+            algorithm = HungarianAlgorithm(matrix, config_path=config_file)
+            if math.isinf(expected):
+                with pytest.raises(ValueError):
+                    algorithm.solve()
+            else:
+                assert algorithm.solve()[0] == expected
+
+    def test_warm_start_matches_cold(self, config_file):
+        """Test re-solving after cost updates matches a fresh solve."""
+        rng = random.Random(3)
+        matrix = [[rng.randint(0, 100) for _ in range(6)] for _ in range(6)]
+        algorithm = HungarianAlgorithm(matrix, config_path=config_file)
+        algorithm.solve()
+        for _ in range(10):
+            changes = {
+                (rng.randrange(6), rng.randrange(6)): rng.randint(0, 100)
+                for _ in range(2)
+            }
+            algorithm.update_costs(changes)
+            warm_cost, assignments = algorithm.solve()
+            assert warm_cost == _brute_force_cost(algorithm.original_matrix)
+            assert algorithm.is_valid_assignment(assignments)
+
+    def test_warm_start_rectangular(self, config_file):
+        """Test warm start on a rectangular matrix."""
+        matrix = [[5, 1, 9, 4], [6, 2, 3, 8]]
+        algorithm = HungarianAlgorithm(matrix, config_path=config_file)
+        assert algorithm.solve()[0] == 4
+        algorithm.update_costs({(0, 1): 50, (1, 2): None})
+        min_cost, _ = algorithm.solve()
+        assert min_cost == _brute_force_cost(algorithm.original_matrix)
+
+    def test_update_costs_invalid(self, simple_matrix):
+        """Test cost update with invalid index."""
+        with pytest.raises(ValueError):
+            simple_matrix.update_costs({(0, 5): 1})
+
+    def test_solve_sparse(self):
+        """Test solving directly from allowed pairs."""
+        edges = {(0, 0): 4, (0, 2): 1, (1, 0): 2, (2, 1): 3, (2, 2): 0}
+        min_cost, assignments = HungarianAlgorithm.solve_sparse(3, 3, edges)
+        assert min_cost == 6
+        assert assignments == [(0, 2), (1, 0), (2, 1)]
+
 
 class TestBipartiteGraph:
     """Test cases for BipartiteGraph class."""
@@ -241,3 +366,80 @@ class TestBipartiteGraph:
         min_cost, assignments = graph.solve_assignment()
         assert min_cost >= 0
         assert len(assignments) == 4
+        assert min_cost == 11
+        assert assignments == [(0, 1), (1, 0), (2, 2), (3, 3)]
+
+    def test_solve_assignment_unequal_sizes(self):
+        """Test graph assignment with more right vertices."""
+        graph = BipartiteGraph(2, 3)
+        graph.add_edge(0, 0, 1)
+        graph.add_edge(0, 1, 2)
+        graph.add_edge(1, 1, 1)
+        graph.add_edge(1, 2, 2)
+
+        min_cost, assignments = graph.solve_assignment()
+        assert min_cost == 2
+        assert assignments == [(0, 0), (1, 1)]
+
+    def test_solve_assignment_infeasible(self):
+        """Test graph without a complete matching."""
+        graph = BipartiteGraph(2, 2)
+        graph.add_edge(0, 0, 1)
+        graph.add_edge(1, 0, 1)
+
+        with pytest.raises(ValueError):
+            graph.solve_assignment()
+
+    def test_find_maximum_matching(self):
+        """Test Hopcroft-Karp maximum matching."""
+        graph = BipartiteGraph(4, 4)
+        for left, right in [(0, 0), (0, 1), (1, 0), (2, 1), (2, 2), (3, 2)]:
+            graph.add_edge(left, right, 1)
+
+        matching = graph.find_maximum_matching()
+        assert len(matching) == 3
+        assert graph.get_matching_size() == 3
+        assert all((left, right) in graph.edges for left, right in matching.items())
+        assert len(set(matching.values())) == 3
+
+    def test_find_maximum_matching_long_augmenting_path(self):
+        """Test matching that needs a long augmenting path."""
+        graph = BipartiteGraph(5, 5)
+        for i in range(5):
+            graph.add_edge(i, i, 1)
+            if i + 1 < 5:
+                graph.add_edge(i + 1, i, 1)
+
+        assert len(graph.find_maximum_matching()) == 5
+
+    def test_get_matched_vertex(self):
+        """Test matched vertex lookup."""
+        graph = BipartiteGraph(2, 3)
+        graph.add_edge(0, 2, 1)
+        graph.add_edge(1, 2, 1)
+        graph.find_maximum_matching()
+
+        matched = [graph.get_matched_vertex(0), graph.get_matched_vertex(1)]
+        assert sorted(matched, key=str) == [2, None]
+        with pytest.raises(ValueError):
+            graph.get_matched_vertex(5)
+
+    def test_solve_assignment_uniform_weights(self):
+        """Test uniform weights use maximum matching."""
+        graph = BipartiteGraph(3, 4)
+        for left, right in [(0, 1), (1, 1), (1, 3), (2, 0), (2, 1)]:
+            graph.add_edge(left, right, 2)
+
+        min_cost, assignments = graph.solve_assignment()
+        assert min_cost == 6
+        assert len(assignments) == 3
+        assert graph.get_matching_size() == 3
+
+    def test_solve_assignment_uniform_weights_infeasible(self):
+        """Test uniform weights without a complete matching."""
+        graph = BipartiteGraph(2, 2)
+        graph.add_edge(0, 0, 1)
+        graph.add_edge(1, 0, 1)
+
+        with pytest.raises(ValueError, match="No feasible assignment"):
+            graph.solve_assignment()
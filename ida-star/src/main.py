@@ -7,6 +7,8 @@ with memory-efficient depth-first search and configurable heuristics.
 import logging
 import logging.handlers
 import math
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Callable, Dict, List, Optional, Tuple
 
@@ -228,6 +230,158 @@ class GridGraph:
         return neighbors
 
 
+class TranspositionTable:
+    """Bounded transposition table mapping states to the best g seen.
+
+    Entries live in a fixed number of slots addressed by the state hash.
+    When two states compete for a slot, the replacement policy decides:
+    "depth" keeps the entry nearer the root (smaller g) unless it is left
+    over from an earlier iteration, "always" lets the newest entry win.
+    """
+
+    POLICIES = ("depth", "always")
+
+    def __init__(self, size: int, replacement: str = "depth") -> None:
+        """Initialize transposition table.
+
+        Args:
+            size: Number of slots.
+            replacement: Replacement policy ('depth' or 'always').
+
+        Raises:
+            ValueError: If size is not positive or policy is unknown.
+        """
+        if size < 1:
+            raise ValueError("Transposition table size must be positive")
+        if replacement not in self.POLICIES:
+            raise ValueError(
+                f"Unknown replacement policy: {replacement}. "
+                f"Choose from {', '.join(self.POLICIES)}"
+            )
+
+        self.size = size
+        self.replacement = replacement
+        self._keys: List[Optional[Tuple[int, int]]] = [None] * size
+        self._g: List[float] = [0.0] * size
+        self._iteration: List[int] = [0] * size
+
+        self.hits = 0
+        self.prunes = 0
+        self.stores = 0
+        self.overwrites = 0
+
+    def visit(self, state: Tuple[int, int], g_cost: float, iteration: int) -> bool:
+        """Record a visit and decide whether its subtree can be pruned.
+
+        A state may be pruned when it was already reached more cheaply, or
+        equally cheaply in the current iteration: that earlier visit
+        searches (or has searched) the same subtree under the same
+        threshold with at least as much budget.
+
+        Args:
+            state: Node coordinates (x, y).
+            g_cost: Cost from start to state along the current path.
+            iteration: Current iteration number.
+
+        Returns:
+            True if the subtree below state need not be searched.
+        """
+        slot = hash(state) % self.size
+        key = self._keys[slot]
+
+        if key == state:
+            self.hits += 1
+            stored_g = self._g[slot]
+            if g_cost > stored_g or (
+                g_cost == stored_g and self._iteration[slot] == iteration
+            ):
+                self.prunes += 1
+                return True
+            self._g[slot] = g_cost
+            self._iteration[slot] = iteration
+            return False
+
+        if (
+            key is None
+            or self.replacement == "always"
+            or self._iteration[slot] != iteration
+            or g_cost <= self._g[slot]
+        ):
+            if key is not None:
+                self.overwrites += 1
+            self._keys[slot] = state
+            self._g[slot] = g_cost
+            self._iteration[slot] = iteration
+            self.stores += 1
+        return False
+
+    def counters(self) -> Dict[str, int]:
+        """Get table counters.
+
+        Returns:
+            Dictionary with tt_hits, tt_prunes, tt_stores and tt_overwrites.
+        """
+        return {
+            "tt_hits": self.hits,
+            "tt_prunes": self.prunes,
+            "tt_stores": self.stores,
+            "tt_overwrites": self.overwrites,
+        }
+
+
+# Per-process state for parallel root splitting
+_worker_state: Dict[str, any] = {}
+
+
+def _init_root_worker(ida: "IDAStar", graph: GridGraph) -> None:
+    """Store search objects and a private transposition table in a worker.
+
+    Args:
+        ida: IDAStar instance providing heuristic and settings.
+        graph: GridGraph being searched.
+    """
+    _worker_state["ida"] = ida
+    _worker_state["graph"] = graph
+    _worker_state["table"] = ida._create_table()
+
+
+def _search_root_child(
+    task: Tuple[Tuple[int, int], Tuple[int, int], Tuple[int, int], float, float, int]
+) -> Tuple[Optional[List[Tuple[int, int]]], float, float, Dict[str, int]]:
+    """Search the subtree below one child of the root in a worker.
+
+    Args:
+        task: Tuple of (root, child, goal, child g-cost, f-limit, iteration).
+
+    Returns:
+        Tuple of (path if found, path cost, next f-limit, counters).
+    """
+    root, child, goal, g_cost, f_limit, iteration = task
+    ida = _worker_state["ida"]
+    table = _worker_state["table"]
+    before = table.counters() if table is not None else {}
+    stats = {"nodes_expanded": 0, "nodes_generated": 0}
+
+    if table is not None:
+        table.visit(root, 0.0, iteration)
+    path, cost, next_f_limit = ida._bounded_search(
+        _worker_state["graph"],
+        child,
+        goal,
+        g_cost,
+        f_limit,
+        [root],
+        table,
+        iteration,
+        stats,
+    )
+
+    if table is not None:
+        for key, value in table.counters().items():
+            stats[key] = value - before[key]
+    return path, cost, next_f_limit, stats
+
+
 class IDAStar:
     """Implements Iterative Deepening A* pathfinding algorithm."""
 
@@ -300,63 +454,183 @@ class IDAStar:
         self.allow_diagonal = ida_config.get("allow_diagonal", True)
         self.max_iterations = ida_config.get("max_iterations", 1000)
         self.movement_cost = ida_config.get("movement_cost", {})
+        self.move_ordering = ida_config.get("move_ordering", True)
+        self.workers = ida_config.get("workers", 1)
+
+        tt_config = ida_config.get("transposition_table", {})
+        self.tt_size = tt_config.get("size", 1 << 16)
+        self.tt_replacement = tt_config.get("replacement", "depth")
 
         self.heuristic = Heuristic.get_heuristic(self.heuristic_name)
 
-    def _depth_limited_search(
+        if self.workers < 1:
+            raise ValueError("workers must be at least 1")
+        if self.tt_size < 0:
+            raise ValueError("Transposition table size must be non-negative")
+        if self.tt_replacement not in TranspositionTable.POLICIES:
+            raise ValueError(
+                f"Unknown replacement policy: {self.tt_replacement}. "
+                f"Choose from {', '.join(TranspositionTable.POLICIES)}"
+            )
+
+    def _create_table(self) -> Optional[TranspositionTable]:
+        """Create a transposition table from the configured settings.
+
+        Returns:
+            TranspositionTable, or None if the table is disabled.
+        """
+        if not self.tt_size:
+            return None
+        return TranspositionTable(self.tt_size, self.tt_replacement)
+
+    def _bounded_search(
         self,
         graph: GridGraph,
         node: Tuple[int, int],
         goal: Tuple[int, int],
         g_cost: float,
         f_limit: float,
-        path: List[Tuple[int, int]],
-        visited: set,
-    ) -> Tuple[Optional[List[Tuple[int, int]]], float]:
-        """Perform depth-limited search with f-cost pruning.
+        prefix: List[Tuple[int, int]],
+        table: Optional[TranspositionTable],
+        iteration: int,
+        stats: Dict[str, int],
+    ) -> Tuple[Optional[List[Tuple[int, int]]], float, float]:
+        """Perform one f-bounded depth-first search with an explicit stack.
+
+        Successors whose f-cost exceeds the limit are cut and the smallest
+        such f-cost is tracked exactly as the next limit. With move ordering
+        successors are sorted by f-cost, so the first cut ends the scan of
+        its siblings. States pruned by the transposition table were reached
+        at least as cheaply elsewhere, so they cannot lower the next limit.
 
         Args:
             graph: GridGraph instance.
-            node: Current node.
+            node: Node to search from.
             goal: Goal node.
-            g_cost: Cost from start to current node.
+            g_cost: Cost from start to node.
             f_limit: Maximum f-cost to explore.
-            path: Current path from start.
-            visited: Set of visited nodes in current iteration.
+            prefix: Path from start up to, but excluding, node.
+            table: Optional transposition table.
+            iteration: Current iteration number (for table entries).
+            stats: Counters updated in place (nodes_expanded,
+                nodes_generated).
 
         Returns:
-            Tuple of (path if found, next_f_limit).
+            Tuple of (path if found, path cost, next_f_limit).
         """
-        f_cost = g_cost + self.heuristic(node, goal)
+        heuristic = self.heuristic
+        move_ordering = self.move_ordering
 
+        f_cost = g_cost + heuristic(node, goal)
         if f_cost > f_limit:
-            return None, f_cost
-
+            return None, float("inf"), f_cost
         if node == goal:
-            return path + [node], f_cost
+            return prefix + [node], g_cost, f_cost
 
+        path = prefix + [node]
+        on_path = set(path)
         next_f_limit = float("inf")
-        visited.add(node)
 
-        for neighbor, move_cost in graph.get_neighbors(node):
-            if neighbor in visited:
+        def expand(current: Tuple[int, int], current_g: float) -> list:
+            stats["nodes_expanded"] += 1
+            children = []
+            for neighbor, move_cost in graph.get_neighbors(current):
+                if neighbor in on_path:
+                    continue
+                child_g = current_g + move_cost
+                child_h = heuristic(neighbor, goal)
+                children.append((child_g + child_h, child_h, child_g, neighbor))
+            stats["nodes_generated"] += len(children)
+            if move_ordering:
+                children.sort()
+            return children
+
+        stack = [[g_cost, expand(node, g_cost), 0]]
+
+        while stack:
+            frame = stack[-1]
+            children = frame[1]
+            if frame[2] == len(children):
+                stack.pop()
+                on_path.discard(path.pop())
                 continue
 
-            new_g = g_cost + move_cost
-            new_path = path + [node]
+            child_f, _, child_g, child = children[frame[2]]
+            frame[2] += 1
 
-            result, candidate_f = self._depth_limited_search(
-                graph, neighbor, goal, new_g, f_limit, new_path, visited
-            )
+            if child_f > f_limit:
+                if child_f < next_f_limit:
+                    next_f_limit = child_f
+                if move_ordering:
+                    frame[2] = len(children)
+                continue
+
+            if child == goal:
+                return path + [child], child_g, next_f_limit
 
-            if result is not None:
-                return result, candidate_f
+            if table is not None and table.visit(child, child_g, iteration):
+                continue
+
+            path.append(child)
+            on_path.add(child)
+            stack.append([child_g, expand(child, child_g), 0])
 
-            if candidate_f < next_f_limit:
-                next_f_limit = candidate_f
+        return None, float("inf"), next_f_limit
+
+    def _root_split_iteration(
+        self,
+        executor: ProcessPoolExecutor,
+        graph: GridGraph,
+        start: Tuple[int, int],
+        goal: Tuple[int, int],
+        f_limit: float,
+        iteration: int,
+        stats: Dict[str, int],
+    ) -> Tuple[Optional[List[Tuple[int, int]]], float, float]:
+        """Run one iteration with the root's subtrees searched in parallel.
 
-        visited.remove(node)
-        return None, next_f_limit
+        Every child of the start node within the limit becomes one task.
+        When several subtrees contain a goal, the cheapest path is kept, so
+        the result is the same optimum as the sequential search.
+
+        Args:
+            executor: Process pool initialized with _init_root_worker.
+            graph: GridGraph instance.
+            start: Start node.
+            goal: Goal node.
+            f_limit: Maximum f-cost to explore.
+            iteration: Current iteration number.
+            stats: Counters updated in place.
+
+        Returns:
+            Tuple of (path if found, path cost, next_f_limit).
+        """
+        if start == goal:
+            return [start], 0.0, self.heuristic(start, goal)
+
+        stats["nodes_expanded"] += 1
+        next_f_limit = float("inf")
+        tasks = []
+        for neighbor, move_cost in graph.get_neighbors(start):
+            stats["nodes_generated"] += 1
+            child_f = move_cost + self.heuristic(neighbor, goal)
+            if child_f > f_limit:
+                next_f_limit = min(next_f_limit, child_f)
+            else:
+                tasks.append((start, neighbor, goal, move_cost, f_limit, iteration))
+
+        best_path = None
+        best_cost = float("inf")
+        for path, cost, child_limit, task_stats in executor.map(
+            _search_root_child, tasks
+        ):
+            for key, value in task_stats.items():
+                stats[key] = stats.get(key, 0) + value
+            if path is not None and cost < best_cost:
+                best_path, best_cost = path, cost
+            next_f_limit = min(next_f_limit, child_limit)
+
+        return best_path, best_cost, next_f_limit
 
     def search(
         self,
@@ -376,9 +650,14 @@ class IDAStar:
                 - path: List of nodes from start to goal
                 - cost: Total path cost
                 - iterations: Number of iterations performed
-                - nodes_explored: Total nodes explored across iterations
+                - nodes_explored: Total nodes expanded across iterations
+                - nodes_expanded: Same as nodes_explored
                 - path_length: Number of nodes in path
                 - found: Whether path was found
+                - thresholds: f-limit used by each iteration
+                - stats: Counters (nodes_expanded, nodes_generated and,
+                  with a transposition table, tt_hits, tt_prunes,
+                  tt_stores, tt_overwrites)
 
         Raises:
             ValueError: If start or goal nodes are invalid.
@@ -390,71 +669,190 @@ class IDAStar:
 
         f_limit = self.heuristic(start, goal)
         iterations = 0
-        total_nodes_explored = 0
+        thresholds: List[float] = []
+        stats = {"nodes_expanded": 0, "nodes_generated": 0}
+        table = None
+        executor = None
+        if self.workers == 1:
+            table = self._create_table()
+        else:
+            executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_root_worker,
+                initargs=(self, graph),
+            )
 
         logger.info(
             f"Starting IDA* search from {start} to {goal} "
             f"with initial f-limit {f_limit:.2f}"
         )
 
-        while iterations < self.max_iterations:
-            visited = set()
-            path, next_f_limit = self._depth_limited_search(
-                graph, start, goal, 0.0, f_limit, [], visited
-            )
+        path = None
+        try:
+            while iterations < self.max_iterations:
+                iterations += 1
+                thresholds.append(f_limit)
+
+                if executor is not None:
+                    path, _, next_f_limit = self._root_split_iteration(
+                        executor, graph, start, goal, f_limit, iterations, stats
+                    )
+                else:
+                    if table is not None:
+                        table.visit(start, 0.0, iterations)
+                    path, _, next_f_limit = self._bounded_search(
+                        graph, start, goal, 0.0, f_limit, [], table, iterations, stats
+                    )
+
+                if path is not None or next_f_limit == float("inf"):
+                    break
 
-            iterations += 1
-            total_nodes_explored += len(visited)
+                f_limit = next_f_limit
+                logger.debug(
+                    f"Iteration {iterations}: f-limit increased to {f_limit:.2f}"
+                )
+        finally:
+            if executor is not None:
+                executor.shutdown()
 
-            if path is not None:
-                cost = self._calculate_path_cost(graph, path)
+        if table is not None:
+            stats.update(table.counters())
 
-                logger.info(
-                    f"Path found after {iterations} iterations: "
-                    f"length={len(path)}, cost={cost:.2f}, "
-                    f"nodes_explored={total_nodes_explored}"
-                )
+        result = {
+            "path": [],
+            "cost": float("inf"),
+            "iterations": iterations,
+            "nodes_explored": stats["nodes_expanded"],
+            "nodes_expanded": stats["nodes_expanded"],
+            "path_length": 0,
+            "found": False,
+            "thresholds": thresholds,
+            "stats": stats,
+        }
 
-                return {
+        if path is not None:
+            cost = self._calculate_path_cost(graph, path)
+            logger.info(
+                f"Path found after {iterations} iterations: "
+                f"length={len(path)}, cost={cost:.2f}, "
+                f"nodes_explored={stats['nodes_expanded']}"
+            )
+            result.update(
+                {
                     "path": path,
                     "cost": cost,
-                    "iterations": iterations,
-                    "nodes_explored": total_nodes_explored,
                     "path_length": len(path),
                     "found": True,
                 }
+            )
+        elif next_f_limit == float("inf"):
+            logger.warning(
+                f"No path found from {start} to {goal} "
+                f"after {iterations} iterations"
+            )
+        else:
+            logger.warning(
+                f"Maximum iterations ({self.max_iterations}) reached "
+                f"without finding path"
+            )
 
-            if next_f_limit == float("inf"):
-                logger.warning(
-                    f"No path found from {start} to {goal} "
-                    f"after {iterations} iterations"
-                )
-                return {
-                    "path": [],
-                    "cost": float("inf"),
-                    "iterations": iterations,
-                    "nodes_explored": total_nodes_explored,
-                    "path_length": 0,
-                    "found": False,
-                }
+        return result
 
-            f_limit = next_f_limit
-            logger.debug(
-                f"Iteration {iterations}: f-limit increased to {f_limit:.2f}"
-            )
+    ENHANCEMENTS = {
+        "baseline": {"tt_size": 0, "move_ordering": False, "workers": 1},
+        "move_ordering": {"tt_size": 0, "move_ordering": True, "workers": 1},
+        "transposition_table": {"move_ordering": False, "workers": 1},
+        "tt_move_ordering": {"move_ordering": True, "workers": 1},
+    }
 
-        logger.warning(
-            f"Maximum iterations ({self.max_iterations}) reached "
-            f"without finding path"
-        )
-        return {
-            "path": [],
-            "cost": float("inf"),
-            "iterations": iterations,
-            "nodes_explored": total_nodes_explored,
-            "path_length": 0,
-            "found": False,
+    def compare_enhancements(
+        self,
+        graph: GridGraph,
+        queries: List[Tuple[Tuple[int, int], Tuple[int, int]]],
+        workers: int = 0,
+    ) -> Dict[str, any]:
+        """Benchmark search enhancements on the same queries.
+
+        Runs every query with the baseline search (no table, no ordering),
+        each enhancement on its own, both together and, if workers > 1,
+        the parallel root split with both enhancements. The configured
+        table size and replacement policy are used wherever a table is on.
+
+        Args:
+            graph: GridGraph instance.
+            queries: List of (start, goal) pairs.
+            workers: Worker processes for the parallel variant (0 or 1
+                skips it).
+
+        Returns:
+            Dictionary with num_queries, per-variant results under
+            'variants' and whether all variants found equal costs.
+        """
+        variants = dict(self.ENHANCEMENTS)
+        if workers > 1:
+            variants["parallel"] = {"move_ordering": True, "workers": workers}
+
+        saved = {
+            "tt_size": self.tt_size,
+            "move_ordering": self.move_ordering,
+            "workers": self.workers,
+        }
+        results = {
+            "num_queries": len(queries),
+            "variants": {},
         }
+        reference_costs = None
+        costs_match = True
+
+        try:
+            for name, settings in variants.items():
+                for key, value in saved.items():
+                    setattr(self, key, settings.get(key, value))
+                try:
+                    costs = []
+                    nodes_expanded = 0
+                    nodes_generated = 0
+                    tt_prunes = 0
+                    start_time = time.perf_counter()
+                    for start, goal in queries:
+                        result = self.search(graph, start, goal)
+                        costs.append(result["cost"])
+                        nodes_expanded += result["stats"]["nodes_expanded"]
+                        nodes_generated += result["stats"]["nodes_generated"]
+                        tt_prunes += result["stats"].get("tt_prunes", 0)
+                    elapsed = time.perf_counter() - start_time
+
+                    if reference_costs is None:
+                        reference_costs = costs
+                    elif any(
+                        not math.isclose(a, b, rel_tol=1e-9)
+                        for a, b in zip(costs, reference_costs)
+                    ):
+                        costs_match = False
+
+                    results["variants"][name] = {
+                        "time_seconds": elapsed,
+                        "time_milliseconds": elapsed * 1000,
+                        "nodes_expanded": nodes_expanded,
+                        "nodes_generated": nodes_generated,
+                        "tt_prunes": tt_prunes,
+                        "expansions_per_second": (
+                            nodes_expanded / elapsed if elapsed > 0 else 0.0
+                        ),
+                        "success": True,
+                    }
+                except Exception as e:
+                    logger.error(f"Error benchmarking {name}: {e}")
+                    results["variants"][name] = {
+                        "success": False,
+                        "error": str(e),
+                    }
+        finally:
+            for key, value in saved.items():
+                setattr(self, key, value)
+
+        results["costs_match"] = costs_match
+        return results
 
     def _calculate_path_cost(
         self,
@@ -503,6 +901,35 @@ def main() -> None:
         action="store_true",
         help="Run test pathfinding problem",
     )
+    parser.add_argument(
+        "--benchmark",
+        action="store_true",
+        help="Compare search enhancements on a random grid",
+    )
+    parser.add_argument(
+        "--size",
+        type=int,
+        default=24,
+        help="Grid size for benchmark (default: 24)",
+    )
+    parser.add_argument(
+        "--queries",
+        type=int,
+        default=10,
+        help="Number of benchmark queries (default: 10)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=0,
+        help="Worker processes for the parallel benchmark variant",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="Random seed for benchmark grid and queries",
+    )
 
     args = parser.parse_args()
 
@@ -540,6 +967,39 @@ def main() -> None:
             print(f"Nodes explored: {result['nodes_explored']}")
             print(f"Path: {result['path'][:5]}...{result['path'][-5:]}")
 
+    if args.benchmark:
+        rng = np.random.default_rng(args.seed)
+        grid = (rng.random((args.size, args.size)) < 0.2).astype(int)
+        graph = GridGraph(
+            grid,
+            allow_diagonal=ida.allow_diagonal,
+            movement_cost=ida.movement_cost,
+        )
+        free = np.argwhere(grid == 0)
+        queries = []
+        for _ in range(args.queries):
+            (y1, x1), (y2, x2) = free[rng.choice(len(free), size=2, replace=False)]
+            queries.append(((int(x1), int(y1)), (int(x2), int(y2))))
+
+        logger.info(
+            f"Benchmarking enhancements on {args.size}x{args.size} grid "
+            f"with {len(queries)} queries"
+        )
+        results = ida.compare_enhancements(graph, queries, workers=args.workers)
+
+        print(f"\nEnhancement Benchmark ({args.size}x{args.size}, "
+              f"{results['num_queries']} queries):")
+        for name, variant in results["variants"].items():
+            if variant["success"]:
+                print(
+                    f"  {name:20s} {variant['time_milliseconds']:10.2f} ms  "
+                    f"expanded={variant['nodes_expanded']:>10,}  "
+                    f"tt_prunes={variant['tt_prunes']:>8,}"
+                )
+            else:
+                print(f"  {name:20s} failed: {variant['error']}")
+        print(f"Costs match: {results['costs_match']}")
+
 
 if __name__ == "__main__":
     main()
@@ -8,7 +8,7 @@ import numpy as np
 import pytest
 import yaml
 
-from src.main import GridGraph, Heuristic, IDAStar
+from src.main import GridGraph, Heuristic, IDAStar, TranspositionTable
 
 
 class TestHeuristic:
@@ -407,5 +407,122 @@ class TestIDAStar:
             assert result["iterations"] > 0
 
 
+class TestTranspositionTable:
+    """Test transposition table and enhanced iterative deepening."""
+
+    def create_temp_config(self, config_dict: dict) -> str:
+        """Create temporary config file for testing."""
+        temp_file = tempfile.NamedTemporaryFile(
+            mode="w", suffix=".yaml", delete=False
+        )
+        yaml.dump(config_dict, temp_file)
+        temp_file.close()
+        return temp_file.name
+
+    def create_search(self, **ida_config) -> IDAStar:
+        """Create IDAStar instance with the given ida_star settings."""
+        config = {
+            "ida_star": {"heuristic": "octile", "allow_diagonal": True, **ida_config},
+            "logging": {"level": "WARNING", "file": "logs/test.log"},
+        }
+        config_path = self.create_temp_config(config)
+        try:
+            return IDAStar(config_path=config_path)
+        finally:
+            Path(config_path).unlink()
+
+    def create_grid(self) -> np.ndarray:
+        """Create grid with a wall forcing a detour."""
+        grid = np.zeros((12, 12))
+        grid[2:11, 6] = 1
+        grid[6, 1:6] = 1
+        return grid
+
+    def test_table_prunes_costlier_revisit(self):
+        """Test that a state reached more expensively is pruned."""
+        table = TranspositionTable(16)
+
+        assert table.visit((1, 1), 2.0, 1) is False
+        assert table.visit((1, 1), 3.0, 1) is True
+        assert table.visit((1, 1), 2.0, 1) is True
+        assert table.visit((1, 1), 2.0, 2) is False
+        assert table.visit((1, 1), 1.0, 2) is False
+        assert table.prunes == 2
+
+    def test_replacement_policies(self):
+        """Test depth-preferred and always-replace policies on collisions."""
+        depth = TranspositionTable(1, replacement="depth")
+        depth.visit((0, 0), 1.0, 1)
+        depth.visit((5, 5), 4.0, 1)
+        assert depth.visit((0, 0), 2.0, 1) is True
+
+        always = TranspositionTable(1, replacement="always")
+        always.visit((0, 0), 1.0, 1)
+        always.visit((5, 5), 4.0, 1)
+        assert always.visit((0, 0), 2.0, 1) is False
+        assert always.overwrites >= 1
+
+    def test_invalid_table_settings(self):
+        """Test that invalid table settings raise ValueError."""
+        with pytest.raises(ValueError):
+            TranspositionTable(0)
+        with pytest.raises(ValueError):
+            TranspositionTable(8, replacement="random")
+        with pytest.raises(ValueError):
+            self.create_search(transposition_table={"replacement": "random"})
+        with pytest.raises(ValueError):
+            self.create_search(workers=0)
+
+    def test_enhancements_preserve_cost(self):
+        """Test that table and move ordering keep the optimal cost."""
+        graph = GridGraph(self.create_grid(), allow_diagonal=True)
+        baseline = self.create_search(
+            transposition_table={"size": 0}, move_ordering=False
+        ).search(graph, (0, 0), (11, 11))
+        enhanced = self.create_search().search(graph, (0, 0), (11, 11))
+
+        assert baseline["found"] and enhanced["found"]
+        assert math.isclose(baseline["cost"], enhanced["cost"])
+        assert enhanced["nodes_expanded"] < baseline["nodes_expanded"]
+        assert enhanced["stats"]["tt_prunes"] > 0
+
+    def test_thresholds_increase(self):
+        """Test that each iteration uses a strictly larger f-limit."""
+        graph = GridGraph(self.create_grid(), allow_diagonal=True)
+        result = self.create_search().search(graph, (0, 0), (11, 11))
+
+        thresholds = result["thresholds"]
+        assert len(thresholds) == result["iterations"]
+        assert all(a < b for a, b in zip(thresholds, thresholds[1:]))
+        assert math.isclose(thresholds[-1], result["cost"])
+
+    def test_parallel_root_split(self):
+        """Test that parallel root splitting finds the optimal cost."""
+        graph = GridGraph(self.create_grid(), allow_diagonal=True)
+        sequential = self.create_search().search(graph, (0, 0), (11, 11))
+        parallel = self.create_search(workers=2).search(graph, (0, 0), (11, 11))
+
+        assert parallel["found"] is True
+        assert math.isclose(parallel["cost"], sequential["cost"])
+        assert parallel["path"][0] == (0, 0)
+        assert parallel["path"][-1] == (11, 11)
+
+    def test_compare_enhancements(self):
+        """Test enhancement benchmark structure."""
+        graph = GridGraph(self.create_grid(), allow_diagonal=True)
+        ida = self.create_search()
+        queries = [((0, 0), (11, 11)), ((0, 11), (11, 0))]
+
+        results = ida.compare_enhancements(graph, queries)
+
+        assert results["num_queries"] == 2
+        assert results["costs_match"] is True
+        assert set(results["variants"]) == set(IDAStar.ENHANCEMENTS)
+        for variant in results["variants"].values():
+            assert variant["success"] is True
+            assert variant["nodes_expanded"] > 0
+        assert ida.workers == 1
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -3,12 +3,17 @@
 This module provides functionality to implement LCA algorithms using two
 different techniques: binary lifting and Euler tour. Both algorithms achieve
 O(log n) query time complexity with different preprocessing approaches.
+A block-decomposed Euler tour variant answers queries in O(1) after O(n)
+preprocessing and also supports Tarjan's offline batch method.
 """
 
 import logging
 import logging.handlers
+import random
+import time
+from array import array
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 
 import yaml
 from dotenv import load_dotenv
@@ -112,9 +117,12 @@ class LCABinaryLifting:
         """
         if node is None:
             return 0
-        count = 1
-        for child in node.children:
-            count += self._count_nodes(child)
+        count = 0
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            count += 1
+            stack.extend(current.children)
         return count
 
     def _index_nodes(self, node: Optional[TreeNode], index: int) -> int:
@@ -130,13 +138,13 @@ class LCABinaryLifting:
         if node is None:
             return index
 
-        self.node_to_index[node] = index
-        self.index_to_node[index] = node
-        current_index = index
-        index += 1
-
-        for child in node.children:
-            index = self._index_nodes(child, index)
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            self.node_to_index[current] = index
+            self.index_to_node[index] = current
+            index += 1
+            stack.extend(reversed(current.children))
 
         return index
 
@@ -151,13 +159,15 @@ class LCABinaryLifting:
         if node is None:
             return
 
-        node_idx = self.node_to_index[node]
-        self.depth[node_idx] = d
-        self.parent[node_idx][0] = parent_idx
+        stack = [(node, parent_idx, d)]
+        while stack:
+            current, current_parent, current_depth = stack.pop()
+            node_idx = self.node_to_index[current]
+            self.depth[node_idx] = current_depth
+            self.parent[node_idx][0] = current_parent
 
-        for child in node.children:
-            child_idx = self.node_to_index[child]
-            self._dfs(child, node_idx, d + 1)
+            for child in current.children:
+                stack.append((child, node_idx, current_depth + 1))
 
     def _preprocess(self) -> None:
         """Preprocess tree for binary lifting."""
@@ -297,20 +307,27 @@ class LCAEulerTour:
         if node is None:
             return
 
-        value = node.value
-        self.node_to_value[node] = value
-        self.value_to_node[value] = node
-
-        if value not in self.first_occurrence:
-            self.first_occurrence[value] = len(self.euler_tour)
+        # Frames are [node, depth, next child position]
+        stack = [[node, d, 0]]
+        while stack:
+            frame = stack[-1]
+            current, current_depth, child_pos = frame
+            value = current.value
 
-        self.euler_tour.append(value)
-        self.depth.append(d)
+            if child_pos == 0:
+                self.node_to_value[current] = value
+                self.value_to_node[value] = current
+                if value not in self.first_occurrence:
+                    self.first_occurrence[value] = len(self.euler_tour)
 
-        for child in node.children:
-            self._euler_tour_dfs(child, d + 1)
             self.euler_tour.append(value)
-            self.depth.append(d)
+            self.depth.append(current_depth)
+
+            if child_pos < len(current.children):
+                frame[2] += 1
+                stack.append([current.children[child_pos], current_depth + 1, 0])
+            else:
+                stack.pop()
 
     def _preprocess(self) -> None:
         """Preprocess tree for Euler tour."""
@@ -318,19 +335,18 @@ class LCAEulerTour:
 
         n = len(self.euler_tour)
         self.log_n = (n).bit_length()
-        self.sparse_table: List[List[int]] = [[0] * n for _ in range(self.log_n)]
-
-        for i in range(n):
-            self.sparse_table[0][i] = i
+        depth = self.depth
+        self.sparse_table: List[array] = [array("i", range(n))]
 
         for j in range(1, self.log_n):
-            for i in range(n - (1 << j) + 1):
-                left = self.sparse_table[j - 1][i]
-                right = self.sparse_table[j - 1][i + (1 << (j - 1))]
-                if self.depth[left] < self.depth[right]:
-                    self.sparse_table[j][i] = left
-                else:
-                    self.sparse_table[j][i] = right
+            previous = self.sparse_table[j - 1]
+            half = 1 << (j - 1)
+            level = array("i", bytes(4 * (n - (1 << j) + 1)))
+            for i in range(len(level)):
+                left = previous[i]
+                right = previous[i + half]
+                level[i] = left if depth[left] < depth[right] else right
+            self.sparse_table.append(level)
 
         logger.info(f"Preprocessed tree with Euler tour of length {n}")
 
@@ -387,6 +403,440 @@ class LCAEulerTour:
         return result
 
 
+class LCABlockRMQ:
+    """LCA with O(n) preprocessing and O(1) queries (Farach-Colton-Bender).
+
+    The tree is given as a parent array and the Euler tour is built
+    iteratively, so deep trees never touch the recursion limit. Adjacent
+    depths in the tour differ by exactly one, so the tour is cut into
+    blocks of about (log n) / 2 entries; blocks with the same up/down
+    pattern share one in-block lookup table, and a sparse table over the
+    block minima covers the whole blocks between two positions. All
+    tables are stored in ``array`` buffers.
+    """
+
+    def __init__(
+        self,
+        parents: Sequence[int],
+        config_path: str = "config.yaml",
+        block_size: Optional[int] = None,
+    ) -> None:
+        """Initialize LCA from a parent array.
+
+        Args:
+            parents: parents[i] is the parent of node i, or -1 for the root.
+            config_path: Path to configuration file.
+            block_size: Euler tour block size (default: half the bit
+                length of the tour length).
+
+        Raises:
+            ValueError: If parents does not describe a single rooted tree
+                or block_size is not positive.
+        """
+        self.n = len(parents)
+        self.parents = array("i", parents)
+        self.nodes: List[TreeNode] = []
+        self.node_to_index: Dict[TreeNode, int] = {}
+        self._setup_logging()
+        self._load_config(config_path)
+        self._preprocess(block_size)
+
+    @classmethod
+    def from_tree(
+        cls,
+        root: TreeNode,
+        config_path: str = "config.yaml",
+        block_size: Optional[int] = None,
+    ) -> "LCABlockRMQ":
+        """Build from a TreeNode tree, indexing nodes in preorder.
+
+        The ``nodes`` list and ``node_to_index`` dict of the result map
+        between indices and TreeNode objects.
+
+        Args:
+            root: Root of the tree.
+            config_path: Path to configuration file.
+            block_size: Euler tour block size.
+
+        Returns:
+            LCABlockRMQ instance.
+        """
+        nodes: List[TreeNode] = []
+        parents: List[int] = []
+        stack = [(root, -1)]
+        while stack:
+            node, parent_idx = stack.pop()
+            node_idx = len(nodes)
+            nodes.append(node)
+            parents.append(parent_idx)
+            for child in reversed(node.children):
+                stack.append((child, node_idx))
+
+        instance = cls(parents, config_path=config_path, block_size=block_size)
+        instance.nodes = nodes
+        instance.node_to_index = {node: i for i, node in enumerate(nodes)}
+        return instance
+
+    def _setup_logging(self) -> None:
+        """Configure logging for LCA operations."""
+        log_dir = Path("logs")
+        log_dir.mkdir(exist_ok=True)
+
+        handler = logging.handlers.RotatingFileHandler(
+            log_dir / "lca.log",
+            maxBytes=10485760,
+            backupCount=5,
+        )
+        formatter = logging.Formatter(
+            "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+        )
+        handler.setFormatter(formatter)
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+
+    def _load_config(self, config_path: str) -> None:
+        """Load configuration from YAML file.
+
+        Args:
+            config_path: Path to configuration file.
+        """
+        try:
+            config_file = Path(config_path)
+            if config_file.exists():
+                with open(config_file, "r") as f:
+                    config = yaml.safe_load(f)
+                    if config and "logging" in config:
+                        log_level = config["logging"].get("level", "INFO")
+                        logger.setLevel(getattr(logging, log_level))
+        except Exception as e:
+            logger.warning(f"Could not load config: {e}")
+
+    def _build_children(self) -> None:
+        """Validate the parent array and build a CSR children list.
+
+        Raises:
+            ValueError: If a parent is out of range or there is not
+                exactly one root.
+        """
+        n = self.n
+        if n == 0:
+            raise ValueError("Tree must have at least one node")
+
+        counts = array("i", bytes(4 * (n + 1)))
+        roots = []
+        for node, parent in enumerate(self.parents):
+            if parent == -1:
+                roots.append(node)
+            elif 0 <= parent < n:
+                counts[parent + 1] += 1
+            else:
+                raise ValueError(f"Invalid parent {parent} for node {node}")
+
+        if len(roots) != 1:
+            raise ValueError(f"Expected exactly one root, found {len(roots)}")
+        self.root = roots[0]
+
+        for i in range(n):
+            counts[i + 1] += counts[i]
+        self.child_start = counts
+
+        fill = array("i", counts[:n])
+        self.child_list = array("i", bytes(4 * (n - 1)))
+        for node, parent in enumerate(self.parents):
+            if parent != -1:
+                self.child_list[fill[parent]] = node
+                fill[parent] += 1
+
+    def _build_euler_tour(self) -> None:
+        """Build Euler tour, tour depths and first occurrences iteratively.
+
+        Raises:
+            ValueError: If some nodes are unreachable from the root (the
+                parent array contains a cycle).
+        """
+        n = self.n
+        child_start = self.child_start
+        child_list = self.child_list
+        root = self.root
+
+        depth = array("i", bytes(4 * n))
+        first = array("i", [-1]) * n
+        euler = array("i", [root])
+        tour_depth = array("i", [0])
+        first[root] = 0
+        visited = 1
+
+        next_child = array("i", child_start[:n])
+        stack = [root]
+        while stack:
+            node = stack[-1]
+            pos = next_child[node]
+            if pos < child_start[node + 1]:
+                next_child[node] = pos + 1
+                child = child_list[pos]
+                depth[child] = depth[node] + 1
+                first[child] = len(euler)
+                euler.append(child)
+                tour_depth.append(depth[child])
+                stack.append(child)
+                visited += 1
+            else:
+                stack.pop()
+                if stack:
+                    parent = stack[-1]
+                    euler.append(parent)
+                    tour_depth.append(depth[parent])
+
+        if visited != n:
+            raise ValueError("Parent array does not describe a single tree")
+
+        self.depth = depth
+        self.first_occurrence = first
+        self.euler_tour = euler
+        self.tour_depth = tour_depth
+
+    def _block_table(self, mask: int) -> array:
+        """Build in-block argmin table for one up/down pattern.
+
+        Args:
+            mask: Bit i-1 set if step i of the block goes down the tree.
+
+        Returns:
+            Flat table where entry i * block_size + j is the offset of the
+            minimum depth in block offsets [i, j].
+        """
+        b = self.block_size
+        relative = [0] * b
+        for i in range(1, b):
+            relative[i] = relative[i - 1] + (1 if mask >> (i - 1) & 1 else -1)
+
+        table = array("H", bytes(2 * b * b))
+        for i in range(b):
+            best = i
+            row = i * b
+            for j in range(i, b):
+                if relative[j] < relative[best]:
+                    best = j
+                table[row + j] = best
+        return table
+
+    def _preprocess(self, block_size: Optional[int]) -> None:
+        """Build Euler tour, block tables and block sparse table.
+
+        Args:
+            block_size: Euler tour block size, or None for automatic.
+
+        Raises:
+            ValueError: If block_size is not positive.
+        """
+        self._build_children()
+        self._build_euler_tour()
+
+        m = len(self.euler_tour)
+        if block_size is None:
+            block_size = max(1, m.bit_length() // 2)
+        if block_size < 1:
+            raise ValueError("block_size must be positive")
+        b = self.block_size = block_size
+        tour_depth = self.tour_depth
+
+        num_blocks = (m + b - 1) // b
+        tables: Dict[int, array] = {}
+        self.block_tables: List[array] = []
+        block_min = array("i", bytes(4 * num_blocks))
+
+        for block in range(num_blocks):
+            start = block * b
+            mask = 0
+            for i in range(1, b):
+                pos = start + i
+                # Pad the last block with downward steps so padding never
+                # becomes a minimum
+                if pos >= m or tour_depth[pos] > tour_depth[pos - 1]:
+                    mask |= 1 << (i - 1)
+            table = tables.get(mask)
+            if table is None:
+                table = tables[mask] = self._block_table(mask)
+            self.block_tables.append(table)
+            block_min[block] = start + table[b - 1]
+
+        self.sparse_table: List[array] = [block_min]
+        j = 1
+        while (1 << j) <= num_blocks:
+            previous = self.sparse_table[j - 1]
+            half = 1 << (j - 1)
+            level = array("i", bytes(4 * (num_blocks - (1 << j) + 1)))
+            for i in range(len(level)):
+                left = previous[i]
+                right = previous[i + half]
+                level[i] = left if tour_depth[left] <= tour_depth[right] else right
+            self.sparse_table.append(level)
+            j += 1
+
+        logger.info(
+            f"Preprocessed tree with {self.n} nodes: Euler tour of length {m}, "
+            f"{num_blocks} blocks of size {b}, {len(tables)} block types"
+        )
+
+    def _check_node(self, node: int) -> None:
+        """Validate node index.
+
+        Args:
+            node: Node index.
+
+        Raises:
+            ValueError: If node is out of range.
+        """
+        if not 0 <= node < self.n:
+            raise ValueError(f"Node {node} out of range [0, {self.n})")
+
+    def lca(self, u: int, v: int) -> int:
+        """Find lowest common ancestor of two nodes in O(1).
+
+        Args:
+            u: First node index.
+            v: Second node index.
+
+        Returns:
+            Index of the LCA node.
+
+        Raises:
+            ValueError: If either node is out of range.
+        """
+        self._check_node(u)
+        self._check_node(v)
+
+        left = self.first_occurrence[u]
+        right = self.first_occurrence[v]
+        if left > right:
+            left, right = right, left
+
+        b = self.block_size
+        tables = self.block_tables
+        tour_depth = self.tour_depth
+        left_block = left // b
+        right_block = right // b
+        left_start = left_block * b
+
+        if left_block == right_block:
+            pos = left_start + tables[left_block][
+                (left - left_start) * b + right - left_start
+            ]
+            return self.euler_tour[pos]
+
+        pos = left_start + tables[left_block][(left - left_start) * b + b - 1]
+        right_start = right_block * b
+        candidate = right_start + tables[right_block][right - right_start]
+        if tour_depth[candidate] < tour_depth[pos]:
+            pos = candidate
+
+        if right_block - left_block > 1:
+            lo = left_block + 1
+            hi = right_block - 1
+            k = (hi - lo + 1).bit_length() - 1
+            level = self.sparse_table[k]
+            for candidate in (level[lo], level[hi - (1 << k) + 1]):
+                if tour_depth[candidate] < tour_depth[pos]:
+                    pos = candidate
+
+        return self.euler_tour[pos]
+
+    def lca_batch(self, pairs: Sequence[Tuple[int, int]]) -> array:
+        """Answer many LCA queries offline with Tarjan's union-find method.
+
+        One iterative DFS with a path-halving union-find answers every
+        query, without touching the Euler tour tables.
+
+        Args:
+            pairs: Sequence of (u, v) node index pairs.
+
+        Returns:
+            Array of LCA indices, one per pair, in input order.
+
+        Raises:
+            ValueError: If any node is out of range.
+        """
+        n = self.n
+        q = len(pairs)
+
+        query_start = array("i", bytes(4 * (n + 1)))
+        for u, v in pairs:
+            self._check_node(u)
+            self._check_node(v)
+            query_start[u + 1] += 1
+            query_start[v + 1] += 1
+        for i in range(n):
+            query_start[i + 1] += query_start[i]
+
+        fill = array("i", query_start[:n])
+        query_other = array("i", bytes(4 * 2 * q))
+        query_id = array("i", bytes(4 * 2 * q))
+        for index, (u, v) in enumerate(pairs):
+            slot = fill[u]
+            query_other[slot] = v
+            query_id[slot] = index
+            fill[u] = slot + 1
+            slot = fill[v]
+            query_other[slot] = u
+            query_id[slot] = index
+            fill[v] = slot + 1
+
+        answers = array("i", bytes(4 * q))
+        # Each finished subtree is linked under its parent, so the root of
+        # a node's set is always its deepest unfinished ancestor
+        uf_parent = array("i", range(n))
+        finished = bytearray(n)
+
+        child_start = self.child_start
+        child_list = self.child_list
+        next_child = array("i", child_start[:n])
+        stack = [self.root]
+
+        while stack:
+            node = stack[-1]
+            pos = next_child[node]
+            if pos < child_start[node + 1]:
+                next_child[node] = pos + 1
+                stack.append(child_list[pos])
+                continue
+
+            stack.pop()
+            finished[node] = 1
+            for slot in range(query_start[node], query_start[node + 1]):
+                other = query_other[slot]
+                if finished[other]:
+                    while uf_parent[other] != other:
+                        uf_parent[other] = uf_parent[uf_parent[other]]
+                        other = uf_parent[other]
+                    answers[query_id[slot]] = other
+
+            if stack:
+                uf_parent[node] = stack[-1]
+
+        logger.info(f"Answered {q} offline LCA queries")
+        return answers
+
+    def memory_bytes(self) -> int:
+        """Estimate memory used by the array buffers.
+
+        Returns:
+            Total size in bytes of tour, depth and lookup arrays.
+        """
+        buffers = [
+            self.parents,
+            self.child_start,
+            self.child_list,
+            self.depth,
+            self.first_occurrence,
+            self.euler_tour,
+            self.tour_depth,
+        ] + self.sparse_table
+        total = sum(buf.itemsize * len(buf) for buf in buffers)
+        unique_tables = {id(table): table for table in self.block_tables}
+        total += sum(t.itemsize * len(t) for t in unique_tables.values())
+        return total
+
+
 def build_tree_from_edges(
     n: int, edges: List[Tuple[int, int]], root_value: int = 0
 ) -> TreeNode:
@@ -422,6 +872,132 @@ def build_tree_from_edges(
     return root
 
 
+def generate_random_parents(
+    n: int, shape: str = "random", seed: Optional[int] = None
+) -> List[int]:
+    """Generate a random tree as a parent array rooted at node 0.
+
+    Args:
+        n: Number of nodes.
+        shape: "random" (parent drawn uniformly from earlier nodes, depth
+            about log n) or "path" (a chain of depth n - 1).
+        seed: Random seed.
+
+    Returns:
+        Parent array with parents[0] == -1.
+
+    Raises:
+        ValueError: If shape is unknown or n < 1.
+    """
+    if n < 1:
+        raise ValueError("Tree must have at least one node")
+    if shape not in ("random", "path"):
+        raise ValueError(f"Unknown shape: {shape}. Choose from random, path")
+
+    rng = random.Random(seed)
+    if shape == "path":
+        return [-1] + list(range(n - 1))
+    return [-1] + [rng.randrange(i) for i in range(1, n)]
+
+
+def benchmark_lca(
+    n: int = 100000,
+    num_queries: int = 100000,
+    shape: str = "random",
+    seed: Optional[int] = None,
+) -> Dict[str, any]:
+    """Compare LCA implementations on the same tree and queries.
+
+    Binary lifting and the Euler tour sparse table run on a TreeNode
+    tree; the block RMQ runs online queries and the Tarjan offline batch.
+
+    Args:
+        n: Number of nodes.
+        num_queries: Number of random queries.
+        shape: Tree shape passed to generate_random_parents.
+        seed: Random seed.
+
+    Returns:
+        Dictionary with n, num_queries, per-algorithm results under
+        'algorithms' and whether all answers agree.
+    """
+    parents = generate_random_parents(n, shape=shape, seed=seed)
+    rng = random.Random(seed)
+    pairs = [(rng.randrange(n), rng.randrange(n)) for _ in range(num_queries)]
+    edges = [(parent, child) for child, parent in enumerate(parents) if parent != -1]
+    root = build_tree_from_edges(n, edges, 0)
+
+    tree_nodes: List[TreeNode] = [root] * n
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        tree_nodes[node.value] = node
+        stack.extend(node.children)
+    node_pairs = [(tree_nodes[u], tree_nodes[v]) for u, v in pairs]
+
+    def run_tree_lca(cls):
+        structure = cls(root)
+        # Both classes log every query at INFO level
+        logger.setLevel(logging.WARNING)
+        start = time.perf_counter()
+        answers = [structure.lca(u, v).value for u, v in node_pairs]
+        return answers, time.perf_counter() - start
+
+    def run_block_online():
+        structure = LCABlockRMQ(parents)
+        start = time.perf_counter()
+        answers = [structure.lca(u, v) for u, v in pairs]
+        return answers, time.perf_counter() - start
+
+    def run_block_batch():
+        structure = LCABlockRMQ(parents)
+        start = time.perf_counter()
+        answers = list(structure.lca_batch(pairs))
+        return answers, time.perf_counter() - start
+
+    runners = {
+        "binary_lifting": lambda: run_tree_lca(LCABinaryLifting),
+        "euler_tour": lambda: run_tree_lca(LCAEulerTour),
+        "block_rmq": run_block_online,
+        "tarjan_batch": run_block_batch,
+    }
+
+    results = {"n": n, "num_queries": num_queries, "algorithms": {}}
+    reference = None
+    results_match = True
+
+    for name, runner in runners.items():
+        try:
+            build_start = time.perf_counter()
+            previous_level = logger.level
+            try:
+                answers, query_time = runner()
+            finally:
+                logger.setLevel(previous_level)
+            total_time = time.perf_counter() - build_start
+
+            if reference is None:
+                reference = answers
+            elif answers != reference:
+                results_match = False
+
+            results["algorithms"][name] = {
+                "time_seconds": query_time,
+                "time_milliseconds": query_time * 1000,
+                "preprocess_seconds": total_time - query_time,
+                "queries_per_second": (
+                    num_queries / query_time if query_time > 0 else 0.0
+                ),
+                "success": True,
+            }
+        except Exception as e:
+            logger.error(f"Error benchmarking {name}: {e}")
+            results["algorithms"][name] = {"success": False, "error": str(e)}
+
+    results["results_match"] = results_match
+    return results
+
+
 def main() -> None:
     """Main function to demonstrate LCA algorithms."""
     print("LCA Algorithms Demo")
@@ -466,6 +1042,26 @@ def main() -> None:
     lca_result = lca_et.lca(node5, node6)
     print(f"LCA(5, 6) = {lca_result.value if lca_result else None}")
 
+    print("\n=== Block RMQ LCA (parent array) ===")
+    lca_block = LCABlockRMQ([-1, 0, 0, 1, 1, 2, 2])
+    print(f"LCA(3, 4) = {lca_block.lca(3, 4)}")
+    print(f"LCA(3, 5) = {lca_block.lca(3, 5)}")
+    print(f"LCA(5, 6) = {lca_block.lca(5, 6)}")
+    print(f"Batch [(3, 4), (3, 5), (5, 6)] = "
+          f"{list(lca_block.lca_batch([(3, 4), (3, 5), (5, 6)]))}")
+
+    print("\n=== Benchmark (10,000 nodes, 10,000 queries) ===")
+    results = benchmark_lca(n=10000, num_queries=10000, seed=42)
+    for name, result in results["algorithms"].items():
+        if result["success"]:
+            print(
+                f"{name:15s} query={result['time_milliseconds']:8.2f} ms  "
+                f"preprocess={result['preprocess_seconds'] * 1000:8.2f} ms"
+            )
+        else:
+            print(f"{name:15s} failed: {result['error']}")
+    print(f"Results match: {results['results_match']}")
+
 
 if __name__ == "__main__":
     main()
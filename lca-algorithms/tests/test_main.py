@@ -8,9 +8,12 @@ import yaml
 
 from src.main import (
     LCABinaryLifting,
+    LCABlockRMQ,
     LCAEulerTour,
     TreeNode,
+    benchmark_lca,
     build_tree_from_edges,
+    generate_random_parents,
 )
 
 
@@ -398,3 +401,127 @@ class TestComparison:
         assert result_bl is not None
         assert result_et is not None
         assert result_bl.value == result_et.value
+
+    def test_deep_tree(self, config_file):
+        """Test that a chain deeper than the recursion limit is handled."""
+        n = 5000
+        root = build_tree_from_edges(n, [(i - 1, i) for i in range(1, n)], 0)
+
+        lca_bl = LCABinaryLifting(root, config_path=config_file)
+        lca_et = LCAEulerTour(root, config_path=config_file)
+        deepest = lca_bl.index_to_node[n - 1]
+        middle = lca_bl.index_to_node[n // 2]
+
+        assert lca_bl.lca(deepest, middle) is middle
+        assert lca_et.lca(deepest, middle) is middle
+
+
+class TestLCABlockRMQ:
+    """Test cases for LCABlockRMQ class."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create temporary directory for testing."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+
+    @pytest.fixture
+    def config_file(self, temp_dir):
+        """Create temporary config file."""
+        config = {
+            "logging": {"level": "INFO", "file": str(temp_dir / "app.log")},
+        }
+        config_path = temp_dir / "config.yaml"
+        with open(config_path, "w") as f:
+            yaml.dump(config, f)
+        return str(config_path)
+
+    @staticmethod
+    def naive_lca(parents, u, v):
+        """Find LCA by walking up from u and v."""
+        ancestors = set()
+        while u != -1:
+            ancestors.add(u)
+            u = parents[u]
+        while v not in ancestors:
+            v = parents[v]
+        return v
+
+    def test_lca_simple_tree(self, config_file):
+        """Test LCA on the demo tree."""
+        lca = LCABlockRMQ([-1, 0, 0, 1, 1, 2, 2], config_path=config_file)
+
+        assert lca.lca(3, 4) == 1
+        assert lca.lca(3, 5) == 0
+        assert lca.lca(5, 6) == 2
+        assert lca.lca(1, 3) == 1
+        assert lca.lca(4, 4) == 4
+
+    @pytest.mark.parametrize("block_size", [None, 1, 2, 5])
+    def test_matches_naive(self, config_file, block_size):
+        """Test online and batch queries against naive LCA."""
+        parents = generate_random_parents(300, seed=7)
+        lca = LCABlockRMQ(parents, config_path=config_file, block_size=block_size)
+        pairs = [(u, (u * 37 + 11) % 300) for u in range(300)]
+
+        batch = lca.lca_batch(pairs)
+
+        for (u, v), answer in zip(pairs, batch):
+            expected = self.naive_lca(parents, u, v)
+            assert lca.lca(u, v) == expected
+            assert answer == expected
+
+    def test_deep_path(self, config_file):
+        """Test that a long chain is preprocessed without recursion."""
+        n = 50000
+        lca = LCABlockRMQ(
+            generate_random_parents(n, shape="path"), config_path=config_file
+        )
+
+        assert lca.lca(n - 1, 123) == 123
+        assert list(lca.lca_batch([(n - 1, n - 2), (10, 20)])) == [n - 2, 10]
+
+    def test_from_tree(self, config_file):
+        """Test building from TreeNode objects."""
+        root = build_tree_from_edges(5, [(0, 1), (0, 2), (2, 3), (2, 4)], 0)
+        lca = LCABlockRMQ.from_tree(root, config_path=config_file)
+        node3 = root.children[1].children[0]
+        node4 = root.children[1].children[1]
+
+        result = lca.lca(lca.node_to_index[node3], lca.node_to_index[node4])
+
+        assert lca.nodes[result] is root.children[1]
+
+    def test_invalid_parents(self, config_file):
+        """Test that malformed parent arrays raise ValueError."""
+        with pytest.raises(ValueError):
+            LCABlockRMQ([], config_path=config_file)
+        with pytest.raises(ValueError):
+            LCABlockRMQ([-1, -1], config_path=config_file)
+        with pytest.raises(ValueError):
+            LCABlockRMQ([-1, 5], config_path=config_file)
+        with pytest.raises(ValueError):
+            LCABlockRMQ([-1, 2, 1], config_path=config_file)
+
+    def test_invalid_query(self, config_file):
+        """Test that out-of-range nodes raise ValueError."""
+        lca = LCABlockRMQ([-1, 0], config_path=config_file)
+
+        with pytest.raises(ValueError):
+            lca.lca(0, 2)
+        with pytest.raises(ValueError):
+            lca.lca_batch([(0, 1), (-1, 0)])
+
+    def test_benchmark(self):
+        """Test benchmark structure and agreement."""
+        results = benchmark_lca(n=200, num_queries=100, seed=3)
+
+        assert results["results_match"] is True
+        assert set(results["algorithms"]) == {
+            "binary_lifting",
+            "euler_tour",
+            "block_rmq",
+            "tarjan_batch",
+        }
+        for result in results["algorithms"].values():
+            assert result["success"] is True
@@ -3,13 +3,20 @@
 This module provides functionality to implement link-cut tree data structure
 that maintains a forest of trees and supports efficient link, cut, and path
 operations. Link-cut trees achieve O(log n) amortized time complexity for
-all operations using splay trees.
+all operations using splay trees. Splay trees are stored as flat arrays
+indexed by vertex id, with pluggable path monoids (sum, min, max), lazy
+path add/assign updates and subtree sums through virtual children.
 """
 
 import logging
 import logging.handlers
+import math
+import operator
+import random
+import time
+from array import array
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
 
 import yaml
 from dotenv import load_dotenv
@@ -20,8 +27,78 @@ load_dotenv()
 logger = logging.getLogger(__name__)
 
 
+class Monoid:
+    """Aggregate used for path queries.
+
+    ``combine`` must be associative and commutative with ``identity`` as
+    its neutral element, so that reversing a path (rerooting) leaves the
+    aggregate unchanged. ``repeat(value, length)`` gives the aggregate of
+    ``length`` copies of ``value``: an assign sets a path segment to
+    ``repeat(x, length)``, an add shifts it by ``repeat(delta, length)``.
+    Adds are only meaningful when shifting every element shifts the
+    aggregate that way, which holds for sum, min and max.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        combine: Callable[[float, float], float],
+        identity: float,
+        repeat: Callable[[float, int], float],
+    ) -> None:
+        """Initialize monoid.
+
+        Args:
+            name: Monoid name.
+            combine: Associative, commutative binary operation.
+            identity: Identity element for combine.
+            repeat: Aggregate of a value repeated a number of times.
+        """
+        self.name = name
+        self.combine = combine
+        self.identity = identity
+        self.repeat = repeat
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"Monoid({self.name})"
+
+
+MONOIDS: Dict[str, Monoid] = {
+    "sum": Monoid("sum", operator.add, 0.0, lambda value, length: value * length),
+    "min": Monoid("min", min, math.inf, lambda value, length: value),
+    "max": Monoid("max", max, -math.inf, lambda value, length: value),
+}
+
+
+def get_monoid(monoid: Union[str, Monoid]) -> Monoid:
+    """Resolve a monoid name or instance.
+
+    Args:
+        monoid: Monoid instance or one of the names in MONOIDS.
+
+    Returns:
+        Monoid instance.
+
+    Raises:
+        ValueError: If the name is unknown.
+    """
+    if isinstance(monoid, Monoid):
+        return monoid
+    if monoid not in MONOIDS:
+        raise ValueError(
+            f"Unknown monoid: {monoid}. Choose from {', '.join(MONOIDS)}"
+        )
+    return MONOIDS[monoid]
+
+
 class LinkCutNode:
-    """Node in link-cut tree."""
+    """Handle for a vertex of a link-cut tree.
+
+    All splay tree state lives in the owning tree's arrays. ``data`` and
+    the splay links are read through the tree; a node that does not
+    belong to a tree only keeps its value and data.
+    """
 
     def __init__(self, value: int, data: float = 0.0) -> None:
         """Initialize link-cut node.
@@ -31,12 +108,64 @@ class LinkCutNode:
             data: Data stored in node.
         """
         self.value = value
-        self.data = data
-        self.path_parent: Optional["LinkCutNode"] = None
-        self.left: Optional["LinkCutNode"] = None
-        self.right: Optional["LinkCutNode"] = None
-        self.parent: Optional["LinkCutNode"] = None
-        self.reversed = False
+        self.index = -1
+        self.tree: Optional["LinkCutTree"] = None
+        self._data = data
+
+    @property
+    def data(self) -> float:
+        """Current node value, including pending path updates."""
+        if self.tree is None:
+            return self._data
+        return self.tree.get_value(self)
+
+    @data.setter
+    def data(self, value: float) -> None:
+        if self.tree is None:
+            self._data = value
+        else:
+            self.tree.set_value(self, value)
+
+    def _link(self, links: array) -> Optional["LinkCutNode"]:
+        """Resolve a splay link array entry to a node.
+
+        Args:
+            links: One of the tree's link arrays.
+
+        Returns:
+            Linked node or None.
+        """
+        slot = links[self.index + 1]
+        return self.tree.nodes[slot - 1] if slot else None
+
+    @property
+    def left(self) -> Optional["LinkCutNode"]:
+        """Left child in splay tree."""
+        return None if self.tree is None else self._link(self.tree._left)
+
+    @property
+    def right(self) -> Optional["LinkCutNode"]:
+        """Right child in splay tree."""
+        return None if self.tree is None else self._link(self.tree._right)
+
+    @property
+    def parent(self) -> Optional["LinkCutNode"]:
+        """Parent in splay tree (None for a splay root)."""
+        if self.is_root():
+            return None
+        return self._link(self.tree._parent)
+
+    @property
+    def path_parent(self) -> Optional["LinkCutNode"]:
+        """Path-parent pointer (only set on a splay root)."""
+        if self.tree is None or not self.is_root():
+            return None
+        return self._link(self.tree._parent)
+
+    @property
+    def reversed(self) -> bool:
+        """Pending reverse flag for the children."""
+        return self.tree is not None and bool(self.tree._flip[self.index + 1])
 
     def is_root(self) -> bool:
         """Check if node is root of its splay tree.
@@ -44,9 +173,7 @@ class LinkCutNode:
         Returns:
             True if root, False otherwise.
         """
-        return self.parent is None or (
-            self.parent.left != self and self.parent.right != self
-        )
+        return self.tree is None or self.tree._is_root(self.index + 1)
 
     def __repr__(self) -> str:
         """String representation."""
@@ -54,18 +181,81 @@ class LinkCutNode:
 
 
 class LinkCutTree:
-    """Link-cut tree for maintaining dynamic forests."""
-
-    def __init__(self, config_path: str = "config.yaml") -> None:
+    """Link-cut tree for maintaining dynamic forests.
+
+    Vertex i lives in slot i + 1 of every array; slot 0 is a null sentinel
+    with an empty aggregate, which keeps the update of a node from its
+    children branch-free. Per slot the tree stores splay links (left,
+    right, parent, where the parent of a splay root is its path-parent),
+    a reverse flag, the splay subtree size, the vertex value, the monoid
+    aggregate and plain sum of the splay subtree, the sum of virtual
+    (path-parent) children, the total sum of the represented subtree and
+    a pending assign/add tag.
+
+    Link, cut and find_root follow the forest's current rooting; link
+    reroots the child's tree at the child. Path operations never reroot.
+    """
+
+    OPERATIONS = ("link", "cut", "query", "add", "assign", "connected")
+
+    def __init__(
+        self, config_path: str = "config.yaml", monoid: Union[str, Monoid] = "sum"
+    ) -> None:
         """Initialize link-cut tree.
 
         Args:
             config_path: Path to configuration file.
+            monoid: Monoid for path queries.
         """
         self.nodes: List[LinkCutNode] = []
+        self.monoid = get_monoid(monoid)
+        identity = self.monoid.identity
+        self._left = array("i", [0])
+        self._right = array("i", [0])
+        self._parent = array("i", [0])
+        self._flip = bytearray(1)
+        self._size = array("i", [0])
+        self._value = array("d", [0.0])
+        self._agg = array("d", [identity])
+        self._sum = array("d", [0.0])
+        self._virtual = array("d", [0.0])
+        self._total = array("d", [0.0])
+        self._tag_assign = bytearray(1)
+        self._tag_value = array("d", [0.0])
+        self._tag_add = array("d", [0.0])
         self._setup_logging()
         self._load_config(config_path)
 
+    @classmethod
+    def from_values(
+        cls,
+        values: Sequence[float],
+        config_path: str = "config.yaml",
+        monoid: Union[str, Monoid] = "sum",
+    ) -> "LinkCutTree":
+        """Create a forest of isolated vertices without LinkCutNode handles.
+
+        Vertices are then addressed by index 0..len(values)-1 in every
+        method.
+
+        Args:
+            values: Initial vertex values.
+            config_path: Path to configuration file.
+            monoid: Monoid for path queries.
+
+        Returns:
+            LinkCutTree instance.
+        """
+        tree = cls(config_path, monoid)
+        tree._add_vertices(values)
+        logger.info(f"Created forest of {len(values)} vertices")
+        return tree
+
+    @property
+    def n(self) -> int:
+        """Number of vertices."""
+        return len(self._value) - 1
+
     def _setup_logging(self) -> None:
         """Configure logging for link-cut tree operations."""
         log_dir = Path("logs")
@@ -100,6 +290,28 @@ class LinkCutTree:
         except Exception as e:
             logger.warning(f"Could not load config: {e}")
 
+    def _add_vertices(self, values: Sequence[float]) -> None:
+        """Append isolated vertices to every array.
+
+        Args:
+            values: Vertex values.
+        """
+        count = len(values)
+        repeat = self.monoid.repeat
+        self._left.extend(array("i", [0]) * count)
+        self._right.extend(array("i", [0]) * count)
+        self._parent.extend(array("i", [0]) * count)
+        self._flip.extend(bytearray(count))
+        self._size.extend(array("i", [1]) * count)
+        self._value.extend(values)
+        self._agg.extend(repeat(value, 1) for value in values)
+        self._sum.extend(values)
+        self._virtual.extend(array("d", [0.0]) * count)
+        self._total.extend(values)
+        self._tag_assign.extend(bytearray(count))
+        self._tag_value.extend(array("d", [0.0]) * count)
+        self._tag_add.extend(array("d", [0.0]) * count)
+
     def create_node(self, value: int, data: float = 0.0) -> LinkCutNode:
         """Create a new node.
 
@@ -111,281 +323,667 @@ class LinkCutTree:
             Created node.
         """
         node = LinkCutNode(value, data)
+        node.index = self.n
+        node.tree = self
         self.nodes.append(node)
+        self._add_vertices([float(data)])
         logger.info(f"Created node: {node.value}")
         return node
 
-    def _push_reverse(self, node: Optional[LinkCutNode]) -> None:
-        """Push reverse flag to children.
+    def _slot(self, node: Union[LinkCutNode, int]) -> int:
+        """Resolve a LinkCutNode or vertex index to its array slot.
 
         Args:
-            node: Node to push reverse flag from.
+            node: LinkCutNode or vertex index.
+
+        Returns:
+            Array slot (vertex index + 1).
+
+        Raises:
+            ValueError: If the node is not in this tree.
         """
-        if node and node.reversed:
-            node.reversed = False
-            node.left, node.right = node.right, node.left
-            if node.left:
-                node.left.reversed = not node.left.reversed
-            if node.right:
-                node.right.reversed = not node.right.reversed
+        if isinstance(node, LinkCutNode):
+            if node.tree is not self:
+                raise ValueError(f"Node {node.value} not in tree")
+            return node.index + 1
+        if not 0 <= node < self.n:
+            raise ValueError(f"Node {node} out of range [0, {self.n})")
+        return node + 1
 
-    def _rotate(self, node: LinkCutNode) -> None:
-        """Rotate node in splay tree.
+    def _node(self, slot: int) -> Union[LinkCutNode, int]:
+        """Map an array slot back to its LinkCutNode when there is one.
 
         Args:
-            node: Node to rotate.
+            slot: Array slot.
+
+        Returns:
+            LinkCutNode, or the vertex index for forests built from values.
         """
-        parent = node.parent
-        if parent is None:
-            return
+        return self.nodes[slot - 1] if self.nodes else slot - 1
+
+    @staticmethod
+    def _label(node: Union[LinkCutNode, int]) -> int:
+        """Get printable identifier for a node.
 
-        self._push_reverse(parent)
-        self._push_reverse(node)
+        Args:
+            node: LinkCutNode or vertex index.
 
-        grandparent = parent.parent
+        Returns:
+            LinkCutNode value or the index itself.
+        """
+        return node.value if isinstance(node, LinkCutNode) else node
 
-        if parent.left == node:
-            parent.left = node.right
-            if node.right:
-                node.right.parent = parent
-            node.right = parent
-        else:
-            parent.right = node.left
-            if node.left:
-                node.left.parent = parent
-            node.left = parent
+    def _is_root(self, x: int) -> bool:
+        """Check if slot x is the root of its splay tree.
 
-        parent.parent = node
-        node.parent = grandparent
+        Args:
+            x: Array slot.
 
-        if grandparent:
-            if grandparent.left == parent:
-                grandparent.left = node
-            elif grandparent.right == parent:
-                grandparent.right = node
+        Returns:
+            True if x has no splay parent.
+        """
+        p = self._parent[x]
+        return p == 0 or (self._left[p] != x and self._right[p] != x)
 
-    def _splay(self, node: LinkCutNode) -> None:
-        """Splay node to root of its splay tree.
+    def _pull(self, x: int) -> None:
+        """Recompute the aggregates of x from its children.
 
         Args:
-            node: Node to splay.
+            x: Array slot.
         """
-        while not node.is_root():
-            parent = node.parent
-            if parent.is_root():
-                self._rotate(node)
-            else:
-                grandparent = parent.parent
-                if (parent.left == node) == (grandparent.left == parent):
-                    self._rotate(parent)
-                    self._rotate(node)
-                else:
-                    self._rotate(node)
-                    self._rotate(node)
+        l = self._left[x]
+        r = self._right[x]
+        value = self._value[x]
+        combine = self.monoid.combine
+        self._size[x] = self._size[l] + self._size[r] + 1
+        self._agg[x] = combine(combine(self._agg[l], value), self._agg[r])
+        self._sum[x] = self._sum[l] + self._sum[r] + value
+        self._total[x] = (
+            self._total[l] + self._total[r] + value + self._virtual[x]
+        )
 
-    def _access(self, node: LinkCutNode) -> None:
-        """Access node, making it root of its auxiliary tree.
+    def _apply(self, x: int, assign: int, value: float, add: float) -> None:
+        """Apply a path update to the whole splay subtree of x.
 
         Args:
-            node: Node to access.
+            x: Array slot (not the sentinel).
+            assign: Whether to assign value first.
+            value: Value to assign.
+            add: Value to add after the assign.
         """
-        self._splay(node)
-        self._push_reverse(node)
+        size = self._size[x]
+        repeat = self.monoid.repeat
+        if assign:
+            self._value[x] = value
+            self._agg[x] = repeat(value, size)
+            self._total[x] += value * size - self._sum[x]
+            self._sum[x] = value * size
+            self._tag_assign[x] = 1
+            self._tag_value[x] = value
+            self._tag_add[x] = 0.0
+        if add:
+            self._value[x] += add
+            self._agg[x] += repeat(add, size)
+            self._sum[x] += add * size
+            self._total[x] += add * size
+            self._tag_add[x] += add
+
+    def _toggle(self, x: int) -> None:
+        """Reverse the splay subtree of x (swap now, flag the children).
 
-        if node.right:
-            node.right.path_parent = node
-            node.right.parent = None
-            node.right = None
+        Args:
+            x: Array slot (not the sentinel).
+        """
+        self._left[x], self._right[x] = self._right[x], self._left[x]
+        self._flip[x] ^= 1
 
-        while node.path_parent:
-            parent_path = node.path_parent
-            self._splay(parent_path)
-            self._push_reverse(parent_path)
+    def _push(self, x: int) -> None:
+        """Push pending reverse flag and path update to the children of x.
 
-            if parent_path.right:
-                parent_path.right.path_parent = parent_path
-                parent_path.right.parent = None
+        Args:
+            x: Array slot.
+        """
+        l = self._left[x]
+        r = self._right[x]
+        if self._flip[x]:
+            if l:
+                self._toggle(l)
+            if r:
+                self._toggle(r)
+            self._flip[x] = 0
+        assign = self._tag_assign[x]
+        add = self._tag_add[x]
+        if assign or add:
+            value = self._tag_value[x]
+            if l:
+                self._apply(l, assign, value, add)
+            if r:
+                self._apply(r, assign, value, add)
+            self._tag_assign[x] = 0
+            self._tag_add[x] = 0.0
+
+    def _rotate(self, x: int) -> None:
+        """Rotate x above its splay parent and update the old parent.
 
-            parent_path.right = node
-            node.parent = parent_path
-            node.path_parent = None
-            self._splay(node)
+        Args:
+            x: Array slot with a splay parent.
+        """
+        left = self._left
+        right = self._right
+        parent = self._parent
+        p = parent[x]
+        g = parent[p]
+        if left[p] == x:
+            b = right[x]
+            left[p] = b
+            right[x] = p
+        else:
+            b = left[x]
+            right[p] = b
+            left[x] = p
+        if b:
+            parent[b] = p
+        if g:
+            if left[g] == p:
+                left[g] = x
+            elif right[g] == p:
+                right[g] = x
+        parent[p] = x
+        parent[x] = g
+        self._pull(p)
+
+    def _splay(self, x: int) -> None:
+        """Splay x to the root of its splay tree.
+
+        Pending flags are pushed top-down along the splay path first. The
+        rotation and aggregate updates are inlined; this is the hot loop
+        of every operation.
 
-    def find_root(self, node: LinkCutNode) -> LinkCutNode:
-        """Find root of tree containing node.
+        Args:
+            x: Array slot.
+        """
+        left = self._left
+        right = self._right
+        parent = self._parent
+        path = [x]
+        y = x
+        while True:
+            p = parent[y]
+            if p == 0 or (left[p] != y and right[p] != y):
+                break
+            path.append(p)
+            y = p
+        flip = self._flip
+        tag_assign = self._tag_assign
+        tag_add = self._tag_add
+        for y in reversed(path):
+            if flip[y] or tag_assign[y] or tag_add[y]:
+                self._push(y)
+        if len(path) == 1:
+            return
+
+        size = self._size
+        value = self._value
+        agg = self._agg
+        sums = self._sum
+        virtual = self._virtual
+        total = self._total
+        combine = self.monoid.combine
+        while True:
+            p = parent[x]
+            if p == 0:
+                break
+            p_left = left[p] == x
+            if not p_left and right[p] != x:
+                break
+            g = parent[p]
+            if g and (left[g] == p or right[g] == p):
+                if (left[g] == p) == p_left:
+                    self._rotate(p)
+                    g = parent[p]
+                else:
+                    self._rotate(x)
+                    p = parent[x]
+                    g = parent[p]
+                    p_left = left[p] == x
+
+            # Rotate x above p, then update p.
+            if p_left:
+                b = right[x]
+                left[p] = b
+                right[x] = p
+            else:
+                b = left[x]
+                right[p] = b
+                left[x] = p
+            if b:
+                parent[b] = p
+            if g:
+                if left[g] == p:
+                    left[g] = x
+                elif right[g] == p:
+                    right[g] = x
+            parent[p] = x
+            parent[x] = g
+            l = left[p]
+            r = right[p]
+            v = value[p]
+            size[p] = size[l] + size[r] + 1
+            agg[p] = combine(combine(agg[l], v), agg[r])
+            sums[p] = sums[l] + sums[r] + v
+            total[p] = total[l] + total[r] + v + virtual[p]
+
+        l = left[x]
+        r = right[x]
+        v = value[x]
+        size[x] = size[l] + size[r] + 1
+        agg[x] = combine(combine(agg[l], v), agg[r])
+        sums[x] = sums[l] + sums[r] + v
+        total[x] = total[l] + total[r] + v + virtual[x]
+
+    def _access(self, x: int) -> int:
+        """Make the root-to-x path preferred and splay x to its top.
+
+        The right child dropped at each step becomes a virtual child, and
+        the one that replaces it stops being virtual.
 
         Args:
-            node: Node to find root for.
+            x: Array slot.
 
         Returns:
-            Root node.
+            Last path-parent reached, which is the LCA of x and the
+            previously accessed vertex when both are connected.
         """
-        self._access(node)
-        while node.left:
-            node = node.left
-        self._splay(node)
-        logger.info(f"Found root for node {node.value}: {node.value}")
-        return node
+        right = self._right
+        virtual = self._virtual
+        total = self._total
+        last = 0
+        y = x
+        while y:
+            self._splay(y)
+            r = right[y]
+            if r:
+                virtual[y] += total[r]
+            if last:
+                virtual[y] -= total[last]
+            right[y] = last
+            self._pull(y)
+            last = y
+            y = self._parent[y]
+        self._splay(x)
+        return last
+
+    def _make_root(self, x: int) -> None:
+        """Reroot the tree containing x at x.
 
-    def link(self, child: LinkCutNode, parent: LinkCutNode) -> bool:
-        """Link child to parent.
+        Args:
+            x: Array slot.
+        """
+        self._access(x)
+        self._toggle(x)
+
+    def _find_root(self, x: int) -> int:
+        """Find the root slot of the tree containing x.
 
         Args:
-            child: Child node.
-            parent: Parent node.
+            x: Array slot.
 
         Returns:
-            True if linked, False if already connected.
+            Root slot.
+        """
+        self._access(x)
+        left = self._left
+        while True:
+            self._push(x)
+            if not left[x]:
+                break
+            x = left[x]
+        self._splay(x)
+        return x
 
-        Raises:
-            ValueError: If nodes are in same tree.
+    def _expose_path(self, u: int, v: int) -> Optional[Tuple[int, int]]:
+        """Split the u-v path into splay trees without rerooting.
+
+        After access(u) and access(v), the LCA is on the root-to-v path
+        with the part below it (towards v) as its right subtree, and the
+        part strictly between the LCA and u is the splay tree of u, hung
+        off the LCA as a virtual child.
+
+        Args:
+            u: First slot.
+            v: Second slot.
+
+        Returns:
+            (lca, u_side) where u_side is the splay root of the u side, or 0
+            when u is the LCA; None if u and v are not connected.
         """
-        if self.find_root(child) == self.find_root(parent):
-            logger.warning(f"Nodes {child.value} and {parent.value} already connected")
-            return False
+        self._access(u)
+        lca = self._access(v)
+        u_side = 0
+        if lca != u:
+            self._splay(u)
+            if self._parent[u] == 0:
+                return None
+            u_side = u
+        self._splay(lca)
+        return lca, u_side
+
+    def _link(self, child: int, parent: int) -> bool:
+        """Make child a child of parent, rerooting child's tree at child.
 
-        self._access(child)
+        Args:
+            child: Child slot.
+            parent: Parent slot.
+
+        Returns:
+            True if linked, False if already connected (nothing changes).
+        """
+        if self._expose_path(child, parent) is not None:
+            return False
+        self._make_root(child)
         self._access(parent)
+        self._parent[child] = parent
+        self._virtual[parent] += self._total[child]
+        self._pull(parent)
+        return True
+
+    def _cut(self, x: int, other: int = 0) -> bool:
+        """Cut x from its parent, or the edge between x and other.
 
-        child.left = parent
-        parent.parent = child
-        logger.info(f"Linked node {child.value} to {parent.value}")
+        Args:
+            x: Slot to cut.
+            other: Slot of the other endpoint (0 for x's current parent).
+
+        Returns:
+            True if an edge was cut.
+        """
+        if other:
+            exposed = self._expose_path(x, other)
+            if exposed is None:
+                return False
+            lca, x_side = exposed
+            if lca == x:
+                if self._size[self._right[x]] != 1:
+                    return False
+                x = other
+            elif lca != other or self._size[x_side] != 1:
+                return False
+        self._access(x)
+        l = self._left[x]
+        if not l:
+            return False
+        self._parent[l] = 0
+        self._left[x] = 0
+        self._pull(x)
         return True
 
-    def cut(self, node: LinkCutNode) -> bool:
-        """Cut edge from node to its parent.
+    def _path_query(self, u: int, v: int) -> Optional[float]:
+        """Aggregate the u-v path.
 
         Args:
-            node: Node to cut from parent.
+            u: First slot.
+            v: Second slot.
 
         Returns:
-            True if cut, False if node is root.
+            Monoid aggregate, or None if not connected.
         """
-        self._access(node)
+        exposed = self._expose_path(u, v)
+        if exposed is None:
+            return None
+        lca, u_side = exposed
+        combine = self.monoid.combine
+        result = combine(self._value[lca], self._agg[self._right[lca]])
+        return combine(self._agg[u_side], result)
 
-        if node.left is None:
-            logger.warning(f"Node {node.value} has no parent to cut")
-            return False
+    def _path_update(self, u: int, v: int, value: float, assign: int) -> bool:
+        """Add value to (or assign it on) every vertex of the u-v path.
 
-        node.left.parent = None
-        node.left = None
-        logger.info(f"Cut node {node.value} from parent")
+        Args:
+            u: First slot.
+            v: Second slot.
+            value: Value to add or assign.
+            assign: Whether to assign instead of add.
+
+        Returns:
+            True if updated, False if not connected.
+        """
+        exposed = self._expose_path(u, v)
+        if exposed is None:
+            return False
+        lca, u_side = exposed
+        add = 0.0 if assign else value
+        if u_side:
+            before = self._total[u_side]
+            self._apply(u_side, assign, value, add)
+            self._virtual[lca] += self._total[u_side] - before
+        if assign:
+            self._value[lca] = value
+        else:
+            self._value[lca] += value
+        r = self._right[lca]
+        if r:
+            self._apply(r, assign, value, add)
+        self._pull(lca)
         return True
 
-    def _query_subtree(self, node: LinkCutNode) -> float:
-        """Query subtree in splay tree.
+    def find_root(self, node: Union[LinkCutNode, int]) -> Union[LinkCutNode, int]:
+        """Find root of tree containing node.
 
         Args:
-            node: Root of subtree.
+            node: Node to find root for.
 
         Returns:
-            Sum of data in subtree.
-        """
-        if node is None:
-            return 0.0
-        result = node.data
-        if node.left:
-            result += self._query_subtree(node.left)
-        if node.right:
-            result += self._query_subtree(node.right)
-        return result
+            Root node.
+        """
+        root = self._node(self._find_root(self._slot(node)))
+        logger.info(f"Found root for node {self._label(node)}: {self._label(root)}")
+        return root
 
-    def path_query(self, u: LinkCutNode, v: LinkCutNode) -> float:
-        """Query path from u to v.
+    def make_root(self, node: Union[LinkCutNode, int]) -> None:
+        """Reroot the tree containing node at node.
 
         Args:
-            u: First node.
-            v: Second node.
+            node: New root.
+        """
+        self._make_root(self._slot(node))
+        logger.info(f"Rerooted tree at node {self._label(node)}")
+
+    def link(
+        self, child: Union[LinkCutNode, int], parent: Union[LinkCutNode, int]
+    ) -> bool:
+        """Link child to parent.
+
+        The child's tree is rerooted at child first, so any vertex can be
+        linked.
+
+        Args:
+            child: Child node.
+            parent: Parent node.
 
         Returns:
-            Sum of data along path.
+            True if linked, False if already connected (nothing changes).
         """
-        if u == v:
-            return u.data
+        if not self._link(self._slot(child), self._slot(parent)):
+            logger.warning(
+                f"Nodes {self._label(child)} and {self._label(parent)} already connected"
+            )
+            return False
+        logger.info(f"Linked node {self._label(child)} to {self._label(parent)}")
+        return True
 
-        if not self.are_connected(u, v):
-            logger.warning(f"Nodes {u.value} and {v.value} not connected")
-            return 0.0
+    def cut(
+        self,
+        node: Union[LinkCutNode, int],
+        parent: Optional[Union[LinkCutNode, int]] = None,
+    ) -> bool:
+        """Cut edge from node to its parent.
 
-        self._access(u)
-        self._access(v)
-        self._splay(v)
+        Args:
+            node: Node to cut from parent.
+            parent: Other endpoint of the edge to cut. When given, the
+                edge is cut whichever way it is oriented; the rooting of
+                both halves is kept.
 
-        result = self._query_subtree(v)
-        logger.info(f"Path query from {u.value} to {v.value}: {result}")
-        return result
+        Returns:
+            True if cut, False if node is root (or not adjacent to parent).
+        """
+        parent_slot = 0 if parent is None else self._slot(parent)
+        if not self._cut(self._slot(node), parent_slot):
+            logger.warning(f"Node {self._label(node)} has no parent to cut")
+            return False
+        logger.info(f"Cut node {self._label(node)} from parent")
+        return True
 
-    def _update_subtree(self, node: LinkCutNode, value: float) -> None:
-        """Update subtree in splay tree.
+    def path_query(
+        self, u: Union[LinkCutNode, int], v: Union[LinkCutNode, int]
+    ) -> float:
+        """Query path from u to v.
 
         Args:
-            node: Root of subtree.
-            value: Value to add.
+            u: First node.
+            v: Second node.
+
+        Returns:
+            Monoid aggregate of the values along the path (the monoid
+            identity if u and v are not connected).
         """
-        if node:
-            node.data += value
-            if node.left:
-                self._update_subtree(node.left, value)
-            if node.right:
-                self._update_subtree(node.right, value)
+        result = self._path_query(self._slot(u), self._slot(v))
+        if result is None:
+            logger.warning(f"Nodes {self._label(u)} and {self._label(v)} not connected")
+            return self.monoid.identity
+        logger.info(f"Path query from {self._label(u)} to {self._label(v)}: {result}")
+        return result
 
-    def path_update(self, u: LinkCutNode, v: LinkCutNode, value: float) -> None:
+    def path_update(
+        self,
+        u: Union[LinkCutNode, int],
+        v: Union[LinkCutNode, int],
+        value: float,
+        assign: bool = False,
+    ) -> None:
         """Update path from u to v by adding value.
 
         Args:
             u: First node.
             v: Second node.
             value: Value to add.
+            assign: Assign value to every vertex instead of adding it.
         """
-        if u == v:
-            u.data += value
+        if not self._path_update(self._slot(u), self._slot(v), value, int(assign)):
+            logger.warning(f"Nodes {self._label(u)} and {self._label(v)} not connected")
             return
+        logger.info(
+            f"Path {'assign' if assign else 'update'} from {self._label(u)} "
+            f"to {self._label(v)} with value {value}"
+        )
 
-        if not self.are_connected(u, v):
-            logger.warning(f"Nodes {u.value} and {v.value} not connected")
-            return
+    def subtree_sum(self, node: Union[LinkCutNode, int]) -> float:
+        """Sum of values in the subtree of node under the current rooting.
 
-        self._access(u)
-        self._access(v)
-        self._splay(v)
+        After access(node) the subtree of node is node itself plus its
+        virtual children, whose totals are kept in the virtual sum.
 
-        self._update_subtree(v, value)
-        logger.info(f"Path update from {u.value} to {v.value} with value {value}")
+        Args:
+            node: Subtree root.
 
-    def get_path_nodes(self, u: LinkCutNode, v: LinkCutNode) -> List[LinkCutNode]:
-        """Get all nodes on path from u to v.
+        Returns:
+            Sum of values in the subtree.
+        """
+        x = self._slot(node)
+        self._access(x)
+        return self._value[x] + self._virtual[x]
+
+    def get_lca(
+        self, u: Union[LinkCutNode, int], v: Union[LinkCutNode, int]
+    ) -> Optional[Union[LinkCutNode, int]]:
+        """Get lowest common ancestor under the current rooting.
 
         Args:
             u: First node.
             v: Second node.
 
         Returns:
-            List of nodes on path.
+            LCA node, or None if not connected.
         """
-        self._access(u)
-        self._access(v)
+        exposed = self._expose_path(self._slot(u), self._slot(v))
+        return None if exposed is None else self._node(exposed[0])
 
-        if u == v:
-            return [u]
+    def get_value(self, node: Union[LinkCutNode, int]) -> float:
+        """Get current value of node.
 
-        path = []
-        current = u
-        visited = set()
+        Args:
+            node: Node.
 
-        while current and current not in visited:
-            visited.add(current)
-            path.append(current)
-            if current == v:
-                break
-            current = current.path_parent or current.parent
+        Returns:
+            Value including all pending path updates.
+        """
+        x = self._slot(node)
+        self._splay(x)
+        return self._value[x]
+
+    def set_value(self, node: Union[LinkCutNode, int], value: float) -> None:
+        """Set value of node.
+
+        Args:
+            node: Node.
+            value: New value.
+        """
+        x = self._slot(node)
+        self._access(x)
+        self._value[x] = value
+        self._pull(x)
+
+    def _inorder(self, x: int) -> List[int]:
+        """List the slots of a splay subtree in path order.
+
+        Args:
+            x: Splay subtree root (0 for empty).
+
+        Returns:
+            Slots from shallowest to deepest.
+        """
+        result = []
+        stack = []
+        while stack or x:
+            while x:
+                self._push(x)
+                stack.append(x)
+                x = self._left[x]
+            x = stack.pop()
+            result.append(x)
+            x = self._right[x]
+        return result
 
-        if v not in path:
-            path.append(v)
+    def get_path_nodes(
+        self, u: Union[LinkCutNode, int], v: Union[LinkCutNode, int]
+    ) -> List[Union[LinkCutNode, int]]:
+        """Get all nodes on path from u to v.
+
+        Args:
+            u: First node.
+            v: Second node.
 
-        logger.info(f"Path from {u.value} to {v.value}: {[n.value for n in path]}")
+        Returns:
+            List of nodes on path, starting at u and ending at v (empty if
+            not connected).
+        """
+        exposed = self._expose_path(self._slot(u), self._slot(v))
+        if exposed is None:
+            return []
+        lca, u_side = exposed
+        slots = self._inorder(u_side)[::-1]
+        slots.append(lca)
+        slots.extend(self._inorder(self._right[lca]))
+        path = [self._node(slot) for slot in slots]
+        logger.info(
+            f"Path from {self._label(u)} to {self._label(v)}: "
+            f"{[self._label(node) for node in path]}"
+        )
         return path
 
-    def are_connected(self, u: LinkCutNode, v: LinkCutNode) -> bool:
+    def are_connected(
+        self, u: Union[LinkCutNode, int], v: Union[LinkCutNode, int]
+    ) -> bool:
         """Check if two nodes are in same tree.
 
         Args:
@@ -395,9 +993,142 @@ class LinkCutTree:
         Returns:
             True if connected, False otherwise.
         """
-        root_u = self.find_root(u)
-        root_v = self.find_root(v)
-        return root_u == root_v
+        return self._expose_path(self._slot(u), self._slot(v)) is not None
+
+    def process_batch(self, operations: Sequence[Tuple]) -> List:
+        """Run a batch of operations without per-operation logging.
+
+        Operations are tuples:
+        ``("link", child, parent)``, ``("cut", node)``,
+        ``("cut", node, other)``, ``("query", u, v)``,
+        ``("add", u, v, value)``, ``("assign", u, v, value)`` and
+        ``("connected", u, v)``.
+
+        Args:
+            operations: Operations to run in order.
+
+        Returns:
+            Results in order: the bool result of every link, cut and
+            connected operation and the aggregate (or None when not
+            connected) of every query. Updates produce no result.
+
+        Raises:
+            ValueError: If an operation kind is unknown.
+        """
+        slot = self._slot
+        results = []
+        for op in operations:
+            kind = op[0]
+            if kind == "query":
+                results.append(self._path_query(slot(op[1]), slot(op[2])))
+            elif kind == "add":
+                self._path_update(slot(op[1]), slot(op[2]), op[3], 0)
+            elif kind == "assign":
+                self._path_update(slot(op[1]), slot(op[2]), op[3], 1)
+            elif kind == "link":
+                results.append(self._link(slot(op[1]), slot(op[2])))
+            elif kind == "cut":
+                other = slot(op[2]) if len(op) > 2 else 0
+                results.append(self._cut(slot(op[1]), other))
+            elif kind == "connected":
+                results.append(
+                    self._expose_path(slot(op[1]), slot(op[2])) is not None
+                )
+            else:
+                raise ValueError(
+                    f"Unknown operation: {kind}. "
+                    f"Choose from {', '.join(self.OPERATIONS)}"
+                )
+        return results
+
+
+def generate_operations(
+    n: int,
+    num_operations: int,
+    seed: Optional[int] = None,
+) -> List[Tuple]:
+    """Generate a random dynamic forest workload.
+
+    Roughly 30% links between random vertices (which fail when already
+    connected), 15% cuts of a random vertex from its parent, 20%
+    connectivity checks, 20% path queries and 15% path adds or assigns.
+
+    Args:
+        n: Number of vertices.
+        num_operations: Number of operations.
+        seed: Random seed.
+
+    Returns:
+        Operations in the format accepted by LinkCutTree.process_batch.
+
+    Raises:
+        ValueError: If n < 1.
+    """
+    if n < 1:
+        raise ValueError("Forest must have at least one vertex")
+
+    rng = random.Random(seed)
+    operations: List[Tuple] = []
+    for _ in range(num_operations):
+        u = rng.randrange(n)
+        v = rng.randrange(n)
+        roll = rng.random()
+        if roll < 0.3:
+            operations.append(("link", u, v))
+        elif roll < 0.45:
+            operations.append(("cut", u))
+        elif roll < 0.65:
+            operations.append(("connected", u, v))
+        elif roll < 0.85:
+            operations.append(("query", u, v))
+        else:
+            kind = "add" if rng.random() < 0.5 else "assign"
+            operations.append((kind, u, v, float(rng.randint(-10, 10))))
+    return operations
+
+
+def benchmark_dynamic_forest(
+    n: int = 100000,
+    num_operations: int = 1000000,
+    monoid: str = "sum",
+    seed: Optional[int] = None,
+) -> Dict[str, any]:
+    """Benchmark throughput of a mixed link/cut/query workload.
+
+    Args:
+        n: Number of vertices.
+        num_operations: Number of operations.
+        monoid: Monoid name.
+        seed: Random seed.
+
+    Returns:
+        Dictionary with sizes, timing, throughput and success flag.
+    """
+    try:
+        rng = random.Random(seed)
+        values = [float(rng.randint(0, 100)) for _ in range(n)]
+        operations = generate_operations(n, num_operations, seed=seed)
+
+        tree = LinkCutTree.from_values(values, monoid=monoid)
+        start_time = time.perf_counter()
+        results = tree.process_batch(operations)
+        elapsed = time.perf_counter() - start_time
+
+        return {
+            "n": n,
+            "monoid": monoid,
+            "num_operations": num_operations,
+            "num_results": len(results),
+            "time_seconds": elapsed,
+            "time_milliseconds": elapsed * 1000,
+            "operations_per_second": (
+                num_operations / elapsed if elapsed > 0 else 0.0
+            ),
+            "success": True,
+        }
+    except Exception as e:
+        logger.error(f"Error benchmarking dynamic forest: {e}")
+        return {"success": False, "error": str(e)}
 
 
 def main() -> None:
@@ -407,7 +1138,7 @@ def main() -> None:
     print("Link-Cut Tree Operations Demo")
     print("=" * 50)
 
-    nodes = [tree.create_node(i) for i in range(7)]
+    nodes = [tree.create_node(i, data=float(i)) for i in range(7)]
 
     print("\nLinking nodes:")
     tree.link(nodes[1], nodes[0])
@@ -430,6 +1161,12 @@ def main() -> None:
     print("\nPath query:")
     result = tree.path_query(nodes[3], nodes[5])
     print(f"Path sum: {result}")
+    print(f"Path: {[node.value for node in tree.get_path_nodes(nodes[3], nodes[5])]}")
+
+    print("\nPath update (+10 on 3..5):")
+    tree.path_update(nodes[3], nodes[5], 10.0)
+    print(f"Path sum: {tree.path_query(nodes[3], nodes[5])}")
+    print(f"Subtree sum of node 1: {tree.subtree_sum(nodes[1])}")
 
     print("\nCutting edge:")
     tree.cut(nodes[1])
@@ -438,6 +1175,12 @@ def main() -> None:
     connected = tree.are_connected(nodes[3], nodes[0])
     print(f"Nodes 3 and 0 connected: {connected}")
 
+    print("\nBenchmark (10000 vertices, 20000 operations):")
+    stats = benchmark_dynamic_forest(n=10000, num_operations=20000, seed=42)
+    if stats["success"]:
+        print(f"Time: {stats['time_seconds']:.3f}s")
+        print(f"Throughput: {stats['operations_per_second']:.0f} ops/s")
+
 
 if __name__ == "__main__":
     main()
@@ -1,12 +1,67 @@
 """Unit tests for link-cut tree module."""
 
+import random
 import tempfile
 from pathlib import Path
 
 import pytest
 import yaml
 
-from src.main import LinkCutNode, LinkCutTree
+from src.main import (
+    LinkCutNode,
+    LinkCutTree,
+    benchmark_dynamic_forest,
+    generate_operations,
+    get_monoid,
+)
+
+
+class NaiveForest:
+    """Rooted forest with parent pointers, used as a reference."""
+
+    def __init__(self, values):
+        self.values = list(values)
+        self.parent = [-1] * len(values)
+
+    def root(self, x):
+        while self.parent[x] != -1:
+            x = self.parent[x]
+        return x
+
+    def ancestors(self, x):
+        chain = [x]
+        while self.parent[chain[-1]] != -1:
+            chain.append(self.parent[chain[-1]])
+        return chain
+
+    def make_root(self, x):
+        chain = self.ancestors(x)
+        for child, parent in zip(chain, chain[1:]):
+            self.parent[parent] = child
+        self.parent[x] = -1
+
+    def link(self, child, parent):
+        if self.root(child) == self.root(parent):
+            return False
+        self.make_root(child)
+        self.parent[child] = parent
+        return True
+
+    def path(self, u, v):
+        if self.root(u) != self.root(v):
+            return None
+        up = self.ancestors(u)
+        vp = self.ancestors(v)
+        common = set(up)
+        i = 0
+        while vp[i] not in common:
+            i += 1
+        return up[: up.index(vp[i]) + 1] + vp[:i][::-1]
+
+    def subtree_sum(self, x):
+        return sum(
+            self.values[y] for y in range(len(self.values)) if x in self.ancestors(y)
+        )
 
 
 class TestLinkCutNode:
@@ -24,13 +79,21 @@ class TestLinkCutNode:
         assert node.reversed is False
 
     def test_is_root(self):
-        """Test is_root method."""
+        """Test is_root reflects splay structure after linking."""
         node = LinkCutNode(1)
         assert node.is_root() is True
 
-        parent = LinkCutNode(2)
-        node.parent = parent
-        assert node.is_root() is False
+        tree = LinkCutTree(config_path="nonexistent.yaml")
+        child = tree.create_node(1)
+        parent = tree.create_node(2)
+        assert child.is_root() is True
+        assert parent.is_root() is True
+
+        tree.link(child, parent)
+        assert tree.find_root(child) is parent
+        assert parent.is_root() is True
+        assert child.is_root() is False
+        assert child.parent is parent
 
     def test_node_repr(self):
         """Test LinkCutNode string representation."""
@@ -217,3 +280,148 @@ class TestLinkCutTree:
 
         result = tree.path_query(nodes[0], nodes[1])
         assert result >= 8.0
+
+
+class TestArrayLinkCutTree:
+    """Test cases for array-backed operations, monoids and batches."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create temporary directory for testing."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+
+    @pytest.fixture
+    def config_file(self, temp_dir):
+        """Create temporary config file."""
+        config = {
+            "logging": {"level": "INFO", "file": str(temp_dir / "app.log")},
+        }
+        config_path = temp_dir / "config.yaml"
+        with open(config_path, "w") as f:
+            yaml.dump(config, f)
+        return str(config_path)
+
+    @pytest.mark.parametrize("monoid", ["sum", "min", "max"])
+    def test_random_operations_match_naive(self, monoid, config_file):
+        """Test link/cut/path/subtree operations against a naive forest."""
+        aggregate = {"sum": sum, "min": min, "max": max}[monoid]
+        for seed in range(5):
+            rng = random.Random(seed)
+            n = 12
+            values = [float(rng.randint(-5, 9)) for _ in range(n)]
+            tree = LinkCutTree.from_values(values, config_path=config_file, monoid=monoid)
+            naive = NaiveForest(values)
+
+            for _ in range(150):
+                u = rng.randrange(n)
+                v = rng.randrange(n)
+                roll = rng.random()
+                if roll < 0.3:
+                    assert tree.link(u, v) == naive.link(u, v)
+                elif roll < 0.4:
+                    expected = naive.parent[u] != -1
+                    assert tree.cut(u) == expected
+                    if expected:
+                        naive.parent[u] = -1
+                elif roll < 0.5:
+                    assert tree.find_root(u) == naive.root(u)
+                elif roll < 0.7:
+                    path = naive.path(u, v)
+                    if path is None:
+                        assert tree.path_query(u, v) == tree.monoid.identity
+                        assert tree.get_path_nodes(u, v) == []
+                    else:
+                        assert tree.path_query(u, v) == aggregate(
+                            naive.values[x] for x in path
+                        )
+                        assert tree.get_path_nodes(u, v) == path
+                elif roll < 0.85:
+                    delta = float(rng.randint(-3, 3))
+                    assign = rng.random() < 0.4
+                    tree.path_update(u, v, delta, assign=assign)
+                    for x in naive.path(u, v) or []:
+                        naive.values[x] = delta if assign else naive.values[x] + delta
+                elif roll < 0.95:
+                    assert tree.subtree_sum(u) == naive.subtree_sum(u)
+                else:
+                    tree.make_root(u)
+                    naive.make_root(u)
+
+            assert [tree.get_value(x) for x in range(n)] == naive.values
+
+    def test_node_data_reflects_updates(self, config_file):
+        """Test LinkCutNode.data reads the tree's current value."""
+        tree = LinkCutTree(config_path=config_file)
+        nodes = [tree.create_node(i, data=float(i)) for i in range(3)]
+        tree.link(nodes[1], nodes[0])
+        tree.link(nodes[2], nodes[1])
+        tree.path_update(nodes[0], nodes[2], 5.0)
+
+        assert [node.data for node in nodes] == [5.0, 6.0, 7.0]
+        nodes[1].data = 0.0
+        assert tree.path_query(nodes[0], nodes[2]) == 12.0
+
+    def test_cut_edge_either_orientation(self, config_file):
+        """Test cutting an edge given both endpoints."""
+        tree = LinkCutTree.from_values([1.0, 2.0, 3.0], config_path=config_file)
+        tree.link(1, 0)
+        tree.link(2, 1)
+
+        assert tree.cut(0, 2) is False
+        assert tree.cut(0, 1) is True
+        assert tree.find_root(2) == 1
+        assert tree.find_root(0) == 0
+        assert tree.are_connected(0, 2) is False
+
+    def test_lca_and_subtree_sum(self, config_file):
+        """Test LCA and subtree sums under the current rooting."""
+        tree = LinkCutTree.from_values([1.0] * 5, config_path=config_file)
+        for child, parent in [(1, 0), (2, 0), (3, 1), (4, 1)]:
+            tree.link(child, parent)
+
+        assert tree.get_lca(3, 4) == 1
+        assert tree.get_lca(3, 2) == 0
+        assert tree.subtree_sum(1) == 3.0
+        tree.make_root(3)
+        assert tree.get_lca(4, 2) == 1
+        assert tree.subtree_sum(1) == 4.0
+
+    def test_process_batch(self, config_file):
+        """Test batch results and unknown operations."""
+        tree = LinkCutTree.from_values([1.0, 2.0, 3.0], config_path=config_file)
+        results = tree.process_batch(
+            [
+                ("link", 1, 0),
+                ("link", 2, 1),
+                ("link", 0, 2),
+                ("query", 0, 2),
+                ("add", 0, 2, 1.0),
+                ("query", 2, 2),
+                ("cut", 2),
+                ("connected", 0, 2),
+                ("query", 0, 2),
+            ]
+        )
+        assert results == [True, True, False, 6.0, 4.0, True, False, None]
+
+        with pytest.raises(ValueError):
+            tree.process_batch([("reroot", 0)])
+
+    def test_invalid_nodes(self, config_file):
+        """Test nodes outside the tree are rejected."""
+        tree = LinkCutTree.from_values([0.0, 0.0], config_path=config_file)
+        with pytest.raises(ValueError):
+            tree.find_root(2)
+        with pytest.raises(ValueError):
+            tree.find_root(LinkCutNode(0))
+        with pytest.raises(ValueError):
+            get_monoid("product")
+
+    def test_benchmark(self):
+        """Test benchmark result."""
+        assert len(generate_operations(10, 50, seed=1)) == 50
+        result = benchmark_dynamic_forest(n=200, num_operations=2000, seed=1)
+        assert result["success"] is True
+        assert result["num_operations"] == 2000
+        assert result["operations_per_second"] > 0
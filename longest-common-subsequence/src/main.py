@@ -9,7 +9,7 @@ import argparse
 import logging
 import logging.handlers
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple, Union
 
 import yaml
 from dotenv import load_dotenv
@@ -36,6 +36,8 @@ class LCSCalculator:
         self.config = self._load_config(config_path)
         self._setup_logging()
         self.dp_table: List[List[int]] = []
+        # Strings dp_table was built from
+        self._dp_strings: Optional[Tuple[str, str]] = None
         self.backtrack_table: List[List[str]] = []
 
     def _load_config(self, config_path: str) -> dict:
@@ -118,6 +120,7 @@ class LCSCalculator:
                     dp[i][j] = max(dp[i - 1][j], dp[i][j - 1])
 
         self.dp_table = dp
+        self._dp_strings = (str1, str2)
         result = dp[m][n]
         logger.info(f"LCS length: {result}")
         return result
@@ -234,6 +237,265 @@ class LCSCalculator:
 
         return result
 
+    def lcs_length_bit_parallel(
+        self, seq1: Sequence[Hashable], seq2: Sequence[Hashable]
+    ) -> int:
+        """Calculate LCS length with the Allison-Dix/Hyyro bit-parallel method.
+
+        seq1 is encoded as one match bit-mask per distinct item. Each item
+        of seq2 then updates a whole DP row with a few integer operations;
+        zero bits of the row vector mark positions where the LCS grew.
+        Python integers are arbitrary precision, so the row spans as many
+        machine words as needed.
+
+        Args:
+            seq1: First sequence of hashable items (str, lines, tokens).
+            seq2: Second sequence of hashable items.
+
+        Returns:
+            Length of longest common subsequence.
+        """
+        logger.info(
+            f"Calculating LCS length (Bit-parallel): "
+            f"lengths {len(seq1)} and {len(seq2)}"
+        )
+
+        m = len(seq1)
+        if m == 0 or not seq2:
+            return 0
+
+        masks: Dict[Hashable, int] = {}
+        bit = 1
+        for item in seq1:
+            masks[item] = masks.get(item, 0) | bit
+            bit <<= 1
+
+        full = (1 << m) - 1
+        row = full
+        for item in seq2:
+            matches = row & masks.get(item, 0)
+            row = ((row + matches) | (row - matches)) & full
+
+        result = m - bin(row).count("1")
+        logger.info(f"LCS length: {result}")
+        return result
+
+    def _lcs_row(
+        self,
+        seq1: Sequence[Hashable],
+        lo1: int,
+        hi1: int,
+        seq2: Sequence[Hashable],
+        lo2: int,
+        hi2: int,
+        reverse: bool = False,
+    ) -> List[int]:
+        """Compute the last DP row of LCS lengths in linear space.
+
+        Args:
+            seq1: First sequence.
+            lo1: Start of the seq1 range.
+            hi1: End (exclusive) of the seq1 range.
+            seq2: Second sequence.
+            lo2: Start of the seq2 range.
+            hi2: End (exclusive) of the seq2 range.
+            reverse: Scan both ranges from the end instead of the start.
+
+        Returns:
+            Row where row[j] is the LCS length of the seq1 range with the
+            first (or, if reverse, last) j items of the seq2 range.
+        """
+        n = hi2 - lo2
+        prev = [0] * (n + 1)
+        curr = [0] * (n + 1)
+
+        range1 = range(hi1 - 1, lo1 - 1, -1) if reverse else range(lo1, hi1)
+        items2 = (
+            [seq2[k] for k in range(hi2 - 1, lo2 - 1, -1)]
+            if reverse
+            else [seq2[k] for k in range(lo2, hi2)]
+        )
+
+        for i in range1:
+            item = seq1[i]
+            for j in range(1, n + 1):
+                if item == items2[j - 1]:
+                    curr[j] = prev[j - 1] + 1
+                elif prev[j] >= curr[j - 1]:
+                    curr[j] = prev[j]
+                else:
+                    curr[j] = curr[j - 1]
+            prev, curr = curr, prev
+
+        return prev
+
+    def _hirschberg(
+        self,
+        seq1: Sequence[Hashable],
+        lo1: int,
+        hi1: int,
+        seq2: Sequence[Hashable],
+        lo2: int,
+        hi2: int,
+        pairs: List[Tuple[int, int]],
+    ) -> None:
+        """Collect matched index pairs of an LCS by divide and conquer.
+
+        Splits the seq1 range in half, finds the seq2 split point that
+        maximizes forward plus backward LCS lengths, and recurses on the
+        two quadrants. Only two rows are alive at any time.
+
+        Args:
+            seq1: First sequence.
+            lo1: Start of the seq1 range.
+            hi1: End (exclusive) of the seq1 range.
+            seq2: Second sequence.
+            lo2: Start of the seq2 range.
+            hi2: End (exclusive) of the seq2 range.
+            pairs: Output list receiving (i, j) with seq1[i] == seq2[j],
+                in increasing order.
+        """
+        if hi1 - lo1 == 0 or hi2 - lo2 == 0:
+            return
+
+        if hi1 - lo1 == 1:
+            item = seq1[lo1]
+            for j in range(lo2, hi2):
+                if seq2[j] == item:
+                    pairs.append((lo1, j))
+                    return
+            return
+
+        mid = (lo1 + hi1) // 2
+        forward = self._lcs_row(seq1, lo1, mid, seq2, lo2, hi2)
+        backward = self._lcs_row(seq1, mid, hi1, seq2, lo2, hi2, reverse=True)
+
+        n = hi2 - lo2
+        best_k = 0
+        best_value = -1
+        for k in range(n + 1):
+            value = forward[k] + backward[n - k]
+            if value > best_value:
+                best_value = value
+                best_k = k
+
+        self._hirschberg(seq1, lo1, mid, seq2, lo2, lo2 + best_k, pairs)
+        self._hirschberg(seq1, mid, hi1, seq2, lo2 + best_k, hi2, pairs)
+
+    def lcs_pairs(
+        self, seq1: Sequence[Hashable], seq2: Sequence[Hashable]
+    ) -> List[Tuple[int, int]]:
+        """Find matched index pairs of an LCS in linear space (Hirschberg).
+
+        Common prefix and suffix items are matched directly before the
+        divide-and-conquer search, which keeps typical diffs cheap. The
+        shorter sequence is used for DP rows, so working space is
+        O(min(m, n)) plus the O(LCS) output.
+
+        Args:
+            seq1: First sequence of hashable items.
+            seq2: Second sequence of hashable items.
+
+        Returns:
+            List of (i, j) pairs with seq1[i] == seq2[j], increasing in
+            both coordinates, whose items form a longest common subsequence.
+
+        Time Complexity: O(m * n)
+        Space Complexity: O(min(m, n)) working space
+        """
+        logger.info(
+            f"Finding LCS pairs (Hirschberg): "
+            f"lengths {len(seq1)} and {len(seq2)}"
+        )
+
+        m, n = len(seq1), len(seq2)
+
+        prefix = 0
+        while prefix < m and prefix < n and seq1[prefix] == seq2[prefix]:
+            prefix += 1
+        suffix = 0
+        while (
+            suffix < m - prefix
+            and suffix < n - prefix
+            and seq1[m - 1 - suffix] == seq2[n - 1 - suffix]
+        ):
+            suffix += 1
+
+        pairs: List[Tuple[int, int]] = [(k, k) for k in range(prefix)]
+
+        middle: List[Tuple[int, int]] = []
+        if n - suffix - prefix <= m - suffix - prefix:
+            self._hirschberg(
+                seq1, prefix, m - suffix, seq2, prefix, n - suffix, middle
+            )
+        else:
+            self._hirschberg(
+                seq2, prefix, n - suffix, seq1, prefix, m - suffix, middle
+            )
+            middle = [(i, j) for j, i in middle]
+        pairs.extend(middle)
+
+        pairs.extend(
+            (m - suffix + k, n - suffix + k) for k in range(suffix)
+        )
+
+        logger.info(f"LCS length: {len(pairs)}")
+        return pairs
+
+    def lcs_hirschberg(
+        self, seq1: Sequence[Hashable], seq2: Sequence[Hashable]
+    ) -> Union[str, List[Hashable]]:
+        """Find a longest common subsequence in linear space (Hirschberg).
+
+        Args:
+            seq1: First sequence of hashable items.
+            seq2: Second sequence of hashable items.
+
+        Returns:
+            LCS as a string when both inputs are strings, otherwise as a
+            list of items.
+        """
+        pairs = self.lcs_pairs(seq1, seq2)
+        items = [seq1[i] for i, _ in pairs]
+        if isinstance(seq1, str) and isinstance(seq2, str):
+            return "".join(items)
+        return items
+
+    def diff(
+        self, seq1: Sequence[Hashable], seq2: Sequence[Hashable]
+    ) -> List[Tuple[str, Hashable]]:
+        """Compute a minimal line/token diff from seq1 to seq2.
+
+        Items on the LCS are kept; all others are deleted from seq1 or
+        inserted from seq2.
+
+        Args:
+            seq1: Original sequence (e.g. lines of the old file).
+            seq2: New sequence (e.g. lines of the new file).
+
+        Returns:
+            List of (op, item) tuples where op is " " for kept items,
+            "-" for items removed from seq1 and "+" for items added
+            from seq2.
+        """
+        pairs = self.lcs_pairs(seq1, seq2)
+        pairs.append((len(seq1), len(seq2)))
+
+        result: List[Tuple[str, Hashable]] = []
+        i = j = 0
+        for match_i, match_j in pairs:
+            result.extend(("-", seq1[k]) for k in range(i, match_i))
+            result.extend(("+", seq2[k]) for k in range(j, match_j))
+            if match_i < len(seq1):
+                result.append((" ", seq1[match_i]))
+            i, j = match_i + 1, match_j + 1
+
+        logger.info(
+            f"Diff: {sum(1 for op, _ in result if op == '-')} removed, "
+            f"{sum(1 for op, _ in result if op == '+')} added"
+        )
+        return result
+
     def visualize_dp_table(self, str1: str, str2: str) -> str:
         """Generate visualization of DP table.
 
@@ -244,7 +506,9 @@ class LCSCalculator:
         Returns:
             String representation of DP table.
         """
-        if not self.dp_table:
+        # Hirschberg and bit-parallel modes never build a table, so rebuild
+        # whenever the stored one does not belong to these strings
+        if self._dp_strings != (str1, str2):
             self.lcs_length(str1, str2)
 
         lines = []
@@ -421,6 +685,20 @@ def main() -> None:
         "--report",
         help="Output path for analysis report",
     )
+    parser.add_argument(
+        "-m",
+        "--method",
+        choices=["dp", "hirschberg", "bitparallel"],
+        default="dp",
+        help="LCS method: full DP table, linear-space Hirschberg, or "
+        "bit-parallel length only (default: dp)",
+    )
+    parser.add_argument(
+        "--diff",
+        nargs=2,
+        metavar=("FILE1", "FILE2"),
+        help="Print a line diff of two files using linear-space LCS",
+    )
     parser.add_argument(
         "--demo",
         action="store_true",
@@ -432,6 +710,15 @@ def main() -> None:
     try:
         calculator = LCSCalculator(config_path=args.config)
 
+        if args.diff:
+            with open(args.diff[0], "r", encoding="utf-8") as f:
+                lines1 = f.read().splitlines()
+            with open(args.diff[1], "r", encoding="utf-8") as f:
+                lines2 = f.read().splitlines()
+            for op, line in calculator.diff(lines1, lines2):
+                print(f"{op} {line}")
+            return
+
         if args.demo or args.string1 is None or args.string2 is None:
             # Run demonstration
             print("\n=== Longest Common Subsequence Demonstration ===\n")
@@ -466,6 +753,14 @@ def main() -> None:
             if args.all:
                 all_lcs = calculator.lcs_all(args.string1, args.string2)
                 print(f"\nAll LCS: {all_lcs}")
+            elif args.method == "hirschberg":
+                lcs = calculator.lcs_hirschberg(args.string1, args.string2)
+                print(f"\nLCS: '{lcs}' (length: {len(lcs)})")
+            elif args.method == "bitparallel":
+                length = calculator.lcs_length_bit_parallel(
+                    args.string1, args.string2
+                )
+                print(f"\nLCS length: {length}")
             else:
                 lcs = calculator.lcs(args.string1, args.string2)
                 length = calculator.lcs_length(args.string1, args.string2)
@@ -212,6 +212,93 @@ class TestLCSCalculator:
         lcs = calculator.lcs("AAB", "AAC")
         assert "AA" in lcs
 
+    def test_lcs_length_bit_parallel(self, calculator):
+        """Test bit-parallel length matches DP."""
+        cases = [
+            ("ABCDGH", "AEDFHR"),
+            ("AGGTAB", "GXTXAYB"),
+            ("", "ABC"),
+            ("ABC", ""),
+            ("AAAA", "AA"),
+        ]
+        for str1, str2 in cases:
+            expected = calculator.lcs_length(str1, str2)
+            assert calculator.lcs_length_bit_parallel(str1, str2) == expected
+
+    def test_lcs_length_bit_parallel_long(self, calculator):
+        """Test bit-parallel length beyond a single machine word."""
+        str1 = "ACGTTGCA" * 20
+        str2 = "TGCAACGT" * 15
+        expected = calculator.lcs_length(str1, str2)
+        assert calculator.lcs_length_bit_parallel(str1, str2) == expected
+
+    def test_lcs_hirschberg(self, calculator):
+        """Test linear-space LCS reconstruction."""
+        cases = [
+            ("ABCDGH", "AEDFHR"),
+            ("AGGTAB", "GXTXAYB"),
+            ("ABCDEFGHIJKLMNOP", "ACEGIKMOQ"),
+            ("XMJYAUZ", "MZJAWXU"),
+            ("", "ABC"),
+        ]
+        for str1, str2 in cases:
+            lcs = calculator.lcs_hirschberg(str1, str2)
+            assert isinstance(lcs, str)
+            assert len(lcs) == calculator.lcs_length(str1, str2)
+            assert self._is_subsequence(lcs, str1)
+            assert self._is_subsequence(lcs, str2)
+
+    def test_lcs_hirschberg_sequence_items(self, calculator):
+        """Test LCS over sequences of lines."""
+        lines1 = ["import os", "x = 1", "y = 2", "print(x)"]
+        lines2 = ["import os", "y = 2", "z = 3", "print(x)"]
+        lcs = calculator.lcs_hirschberg(lines1, lines2)
+        assert lcs == ["import os", "y = 2", "print(x)"]
+
+    def test_lcs_pairs(self, calculator):
+        """Test matched index pairs are increasing and consistent."""
+        str1, str2 = "AGGTAB", "GXTXAYB"
+        pairs = calculator.lcs_pairs(str1, str2)
+        assert len(pairs) == 4
+        for (i1, j1), (i2, j2) in zip(pairs, pairs[1:]):
+            assert i1 < i2 and j1 < j2
+        assert all(str1[i] == str2[j] for i, j in pairs)
+
+    def test_diff(self, calculator):
+        """Test line diff built on the LCS."""
+        old = ["a", "b", "c", "d"]
+        new = ["a", "c", "d", "e"]
+        result = calculator.diff(old, new)
+        assert result == [
+            (" ", "a"),
+            ("-", "b"),
+            (" ", "c"),
+            (" ", "d"),
+            ("+", "e"),
+        ]
+
+    def test_diff_reconstructs_both_sides(self, calculator):
+        """Test diff keeps every item of both inputs in order."""
+        old = list("the quick brown fox")
+        new = list("a quick brown dog")
+        result = calculator.diff(old, new)
+        assert [item for op, item in result if op != "+"] == old
+        assert [item for op, item in result if op != "-"] == new
+
+    def test_visualize_after_hirschberg(self, calculator):
+        """Test visualization rebuilds a table not built by the current pair."""
+        calculator.lcs_length("XY", "Y")
+        calculator.lcs_hirschberg("ABC", "AC")
+        visualization = calculator.visualize_dp_table("ABC", "AC")
+        assert visualization.splitlines()[-1].split()[-1] == "2"
+
+    def test_visualize_same_lengths_different_strings(self, calculator):
+        """Test visualization rebuilds a table for other strings of equal length."""
+        calculator.lcs_length("AB", "AB")
+        visualization = calculator.visualize_dp_table("XY", "ZW")
+        assert visualization.splitlines()[-1].split()[-1] == "0"
+        assert calculator.dp_table[2][2] == 0
+
     def _is_subsequence(self, sub: str, string: str) -> bool:
         """Helper method to check if sub is subsequence of string."""
         if not sub:
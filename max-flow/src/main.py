@@ -8,6 +8,8 @@ with edge capacities.
 
 import logging
 import logging.handlers
+import random
+import time
 from collections import deque
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
@@ -56,14 +58,55 @@ class FlowNetwork:
         if capacity < 0:
             raise ValueError("Capacity must be non-negative")
 
-        self.graph[u][v] = capacity
-        if v not in self.residual[u]:
-            self.residual[u][v] = 0
+        # Parallel edges are merged by summing their capacities
+        self.graph[u][v] = self.graph[u].get(v, 0) + capacity
         if u not in self.residual[v]:
             self.residual[v][u] = 0
-        self.residual[u][v] = capacity
+        self.residual[u][v] = self.residual[u].get(v, 0) + capacity
         logger.debug(f"Added edge ({u}, {v}) with capacity {capacity}")
 
+    @classmethod
+    def random(
+        cls,
+        num_vertices: int,
+        num_edges: int,
+        max_capacity: int = 100,
+        seed: Optional[int] = None,
+    ) -> "FlowNetwork":
+        """Generate a random flow network for benchmarking.
+
+        Args:
+            num_vertices: Number of vertices.
+            num_edges: Number of edges to draw (self-loops are skipped and
+                repeated pairs are merged).
+            max_capacity: Maximum edge capacity (default: 100).
+            seed: Optional random seed.
+
+        Returns:
+            Random FlowNetwork.
+        """
+        rng = random.Random(seed)
+        network = cls(num_vertices)
+        for _ in range(num_edges):
+            u = rng.randrange(num_vertices)
+            v = rng.randrange(num_vertices)
+            if u != v:
+                network.add_edge(u, v, rng.randint(1, max_capacity))
+        return network
+
+    def to_csr(self) -> "CSRResidualGraph":
+        """Convert network capacities to a CSR residual graph.
+
+        Returns:
+            CSRResidualGraph with one forward arc per (u, v) edge.
+        """
+        edges = [
+            (u, v, capacity)
+            for u in range(self.num_vertices)
+            for v, capacity in self.graph[u].items()
+        ]
+        return CSRResidualGraph(self.num_vertices, edges)
+
     def get_capacity(self, u: int, v: int) -> int:
         """Get capacity of edge.
 
@@ -105,9 +148,143 @@ class FlowNetwork:
             self.residual[v].pop(u, None)
 
 
+class CSRResidualGraph:
+    """Array-based residual graph in compressed sparse row (CSR) form.
+
+    Every edge (u, v, c) becomes a forward arc u->v with capacity c and a
+    reverse arc v->u with capacity 0. Arcs leaving vertex u occupy the slice
+    [offsets[u], offsets[u + 1]) of the flat arrays, and rev[a] is the index
+    of the arc paired with a, so pushing flow along an arc is two list
+    updates instead of two dictionary lookups. Parallel and anti-parallel
+    edges keep separate arcs.
+    """
+
+    def __init__(
+        self, num_vertices: int, edges: List[Tuple[int, int, int]]
+    ) -> None:
+        """Build CSR residual graph from an edge list.
+
+        Args:
+            num_vertices: Number of vertices in the graph.
+            edges: List of (u, v, capacity) tuples.
+
+        Raises:
+            ValueError: If a vertex is out of range or a capacity is negative.
+        """
+        if num_vertices < 2:
+            raise ValueError("Network must have at least 2 vertices")
+
+        degree = [0] * (num_vertices + 1)
+        for u, v, capacity in edges:
+            if u < 0 or u >= num_vertices:
+                raise ValueError(f"Invalid source vertex: {u}")
+            if v < 0 or v >= num_vertices:
+                raise ValueError(f"Invalid destination vertex: {v}")
+            if capacity < 0:
+                raise ValueError("Capacity must be non-negative")
+            degree[u + 1] += 1
+            degree[v + 1] += 1
+
+        offsets = degree
+        for i in range(num_vertices):
+            offsets[i + 1] += offsets[i]
+
+        num_arcs = offsets[num_vertices]
+        heads = [0] * num_arcs
+        capacity_list = [0] * num_arcs
+        rev = [0] * num_arcs
+        forward = [0] * len(edges)
+        position = offsets[:num_vertices]
+
+        for index, (u, v, capacity) in enumerate(edges):
+            a = position[u]
+            position[u] += 1
+            b = position[v]
+            position[v] += 1
+            heads[a] = v
+            heads[b] = u
+            capacity_list[a] = capacity
+            rev[a] = b
+            rev[b] = a
+            forward[index] = a
+
+        self.num_vertices = num_vertices
+        self.num_edges = len(edges)
+        self.offsets = offsets
+        self.heads = heads
+        self.capacity = capacity_list
+        self.original = capacity_list[:]
+        self.rev = rev
+        self.forward = forward
+        logger.info(
+            f"CSR residual graph built: {num_vertices} vertices, "
+            f"{len(edges)} edges, {num_arcs} arcs"
+        )
+
+    def reset(self) -> None:
+        """Restore all residual capacities to the original capacities."""
+        self.capacity[:] = self.original
+
+    def tail(self, arc: int) -> int:
+        """Get the vertex an arc leaves from.
+
+        Args:
+            arc: Arc index.
+
+        Returns:
+            Tail vertex of the arc.
+        """
+        return self.heads[self.rev[arc]]
+
+    def flow_dict(self) -> Dict[Tuple[int, int], int]:
+        """Compute flow dictionary from residual capacities.
+
+        Returns:
+            Dictionary mapping (u, v) to total flow over all (u, v) edges.
+        """
+        flow_dict: Dict[Tuple[int, int], int] = {}
+        heads = self.heads
+        for a in self.forward:
+            flow = self.original[a] - self.capacity[a]
+            if flow > 0:
+                key = (heads[self.rev[a]], heads[a])
+                flow_dict[key] = flow_dict.get(key, 0) + flow
+        return flow_dict
+
+    def reachable_from(self, source: int) -> List[bool]:
+        """Find vertices reachable from source in the residual graph.
+
+        Args:
+            source: Start vertex.
+
+        Returns:
+            List of flags, True where the vertex is reachable.
+        """
+        offsets, heads, capacity = self.offsets, self.heads, self.capacity
+        visited = [False] * self.num_vertices
+        visited[source] = True
+        queue = deque([source])
+        while queue:
+            u = queue.popleft()
+            for a in range(offsets[u], offsets[u + 1]):
+                v = heads[a]
+                if capacity[a] > 0 and not visited[v]:
+                    visited[v] = True
+                    queue.append(v)
+        return visited
+
+
 class MaxFlowSolver:
     """Maximum flow solver with multiple algorithms."""
 
+    ALGORITHMS = (
+        "ford_fulkerson",
+        "edmonds_karp",
+        "dinic",
+        "dinic_csr",
+        "push_relabel",
+    )
+
     def __init__(self, network: FlowNetwork) -> None:
         """Initialize max flow solver.
 
@@ -115,6 +292,7 @@ class MaxFlowSolver:
             network: Flow network to solve.
         """
         self.network = network
+        self.csr: Optional[CSRResidualGraph] = None
         logger.info("Max flow solver initialized")
 
     def ford_fulkerson(
@@ -276,6 +454,323 @@ class MaxFlowSolver:
         logger.info(f"Dinic's max flow: {max_flow}")
         return max_flow, flow_dict
 
+    def dinic_csr(
+        self, source: int, sink: int
+    ) -> Tuple[int, Dict[Tuple[int, int], int]]:
+        """Compute maximum flow using Dinic's algorithm on a CSR graph.
+
+        Runs on the array-based residual graph with a current-arc pointer
+        per vertex and an iterative DFS that keeps the path prefix after each
+        augmentation, so one descent can send flow along many paths. Time
+        complexity: O(V^2 * E), much faster in practice than dinic().
+
+        Args:
+            source: Source vertex.
+            sink: Sink vertex.
+
+        Returns:
+            Tuple of (max_flow, flow_dict) where flow_dict maps (u, v) to flow.
+        """
+        self._validate_terminals(source, sink)
+        logger.info(
+            f"Computing max flow using CSR Dinic's: source={source}, sink={sink}"
+        )
+
+        self.csr = self.network.to_csr()
+        max_flow = self._dinic_on_csr(self.csr, source, sink)
+
+        logger.info(f"CSR Dinic's max flow: {max_flow}")
+        return max_flow, self.csr.flow_dict()
+
+    def push_relabel(
+        self, source: int, sink: int
+    ) -> Tuple[int, Dict[Tuple[int, int], int]]:
+        """Compute maximum flow using highest-label push-relabel.
+
+        Active vertices are discharged from the highest label down. The gap
+        heuristic lifts vertices cut off from the sink, and periodic global
+        relabelling (reverse BFS from sink, then source) restores exact
+        distance labels. Excess that cannot reach the sink is returned to
+        the source, so the result is a valid flow. Time complexity:
+        O(V^2 * sqrt(E)).
+
+        Args:
+            source: Source vertex.
+            sink: Sink vertex.
+
+        Returns:
+            Tuple of (max_flow, flow_dict) where flow_dict maps (u, v) to flow.
+        """
+        self._validate_terminals(source, sink)
+        logger.info(
+            f"Computing max flow using push-relabel: "
+            f"source={source}, sink={sink}"
+        )
+
+        self.csr = self.network.to_csr()
+        max_flow = self._push_relabel_on_csr(self.csr, source, sink)
+
+        logger.info(f"Push-relabel max flow: {max_flow}")
+        return max_flow, self.csr.flow_dict()
+
+    def _validate_terminals(self, source: int, sink: int) -> None:
+        """Validate source and sink vertices.
+
+        Args:
+            source: Source vertex.
+            sink: Sink vertex.
+
+        Raises:
+            ValueError: If either vertex is invalid or they are equal.
+        """
+        if source < 0 or source >= self.network.num_vertices:
+            raise ValueError(f"Invalid source vertex: {source}")
+        if sink < 0 or sink >= self.network.num_vertices:
+            raise ValueError(f"Invalid sink vertex: {sink}")
+        if source == sink:
+            raise ValueError("Source and sink must be different")
+
+    def _dinic_on_csr(
+        self, csr: CSRResidualGraph, source: int, sink: int
+    ) -> int:
+        """Run Dinic's algorithm on a CSR residual graph in place.
+
+        Args:
+            csr: Residual graph, modified in place.
+            source: Source vertex.
+            sink: Sink vertex.
+
+        Returns:
+            Maximum flow value.
+        """
+        n = csr.num_vertices
+        offsets, heads, capacity, rev = (
+            csr.offsets, csr.heads, csr.capacity, csr.rev
+        )
+        max_flow = 0
+
+        while True:
+            # BFS layering; vertices at or beyond the sink's level are useless
+            level = [-1] * n
+            level[source] = 0
+            queue = deque([source])
+            while queue:
+                u = queue.popleft()
+                next_level = level[u] + 1
+                if level[sink] != -1 and next_level > level[sink]:
+                    break
+                for a in range(offsets[u], offsets[u + 1]):
+                    v = heads[a]
+                    if level[v] == -1 and capacity[a] > 0:
+                        level[v] = next_level
+                        queue.append(v)
+            if level[sink] == -1:
+                break
+
+            current = offsets[:n]
+            path: List[int] = []
+            u = source
+
+            while True:
+                if u == sink:
+                    bottleneck = min(capacity[a] for a in path)
+                    for a in path:
+                        capacity[a] -= bottleneck
+                        capacity[rev[a]] += bottleneck
+                    max_flow += bottleneck
+
+                    # Retreat to the tail of the first saturated arc
+                    for i, a in enumerate(path):
+                        if capacity[a] == 0:
+                            break
+                    del path[i:]
+                    u = heads[path[-1]] if path else source
+                    continue
+
+                a = current[u]
+                end = offsets[u + 1]
+                target_level = level[u] + 1
+                while a < end and (
+                    capacity[a] == 0 or level[heads[a]] != target_level
+                ):
+                    a += 1
+                current[u] = a
+
+                if a < end:
+                    path.append(a)
+                    u = heads[a]
+                elif not path:
+                    break
+                else:
+                    # Dead end: prune u and advance the parent's arc
+                    level[u] = -1
+                    path.pop()
+                    u = heads[path[-1]] if path else source
+                    current[u] += 1
+
+        return max_flow
+
+    def _push_relabel_on_csr(
+        self, csr: CSRResidualGraph, source: int, sink: int
+    ) -> int:
+        """Run highest-label push-relabel on a CSR residual graph in place.
+
+        Args:
+            csr: Residual graph, modified in place.
+            source: Source vertex.
+            sink: Sink vertex.
+
+        Returns:
+            Maximum flow value.
+        """
+        n = csr.num_vertices
+        offsets, heads, capacity, rev = (
+            csr.offsets, csr.heads, csr.capacity, csr.rev
+        )
+        num_arcs = len(heads)
+        max_label = 2 * n
+
+        label = [0] * n
+        excess = [0] * n
+        current = offsets[:n]
+        # active[d]: vertices with excess and label d
+        active: List[List[int]] = [[] for _ in range(max_label + 1)]
+        # members[d]: all vertices with label d < n, for the gap heuristic
+        members: List[set] = [set() for _ in range(n)]
+
+        label[source] = n
+        for a in range(offsets[source], offsets[source + 1]):
+            delta = capacity[a]
+            if delta > 0:
+                capacity[a] = 0
+                capacity[rev[a]] += delta
+                excess[heads[a]] += delta
+                excess[source] -= delta
+
+        def global_relabel() -> int:
+            """Recompute exact labels and active buckets.
+
+            Returns:
+                Highest label holding an active vertex (-1 if none).
+            """
+            for d in range(n):
+                members[d].clear()
+            for bucket in active:
+                bucket.clear()
+            for v in range(n):
+                label[v] = max_label
+            label[sink] = 0
+            label[source] = n
+
+            for root, base in ((sink, 0), (source, n)):
+                queue = deque([root])
+                while queue:
+                    v = queue.popleft()
+                    d = label[v] + 1
+                    for a in range(offsets[v], offsets[v + 1]):
+                        w = heads[a]
+                        if label[w] == max_label and capacity[rev[a]] > 0:
+                            label[w] = d
+                            queue.append(w)
+
+            highest = -1
+            for v in range(n):
+                current[v] = offsets[v]
+                d = label[v]
+                if d < n:
+                    members[d].add(v)
+                if excess[v] > 0 and v != sink and v != source:
+                    active[d].append(v)
+                    if d > highest:
+                        highest = d
+            return highest
+
+        relabel_threshold = 6 * n + num_arcs
+        work = 0
+        relabel_count = 0
+        gap_count = 0
+        highest = global_relabel()
+
+        while highest >= 0:
+            bucket = active[highest]
+            if not bucket:
+                highest -= 1
+                continue
+            u = bucket.pop()
+            d = label[u]
+
+            while excess[u] > 0:
+                a = current[u]
+                end = offsets[u + 1]
+                target = d - 1
+                while a < end:
+                    if capacity[a] > 0 and label[heads[a]] == target:
+                        v = heads[a]
+                        delta = excess[u]
+                        if capacity[a] < delta:
+                            delta = capacity[a]
+                        if excess[v] == 0 and v != sink and v != source:
+                            active[target].append(v)
+                        capacity[a] -= delta
+                        capacity[rev[a]] += delta
+                        excess[u] -= delta
+                        excess[v] += delta
+                        if excess[u] == 0:
+                            break
+                    a += 1
+                current[u] = a
+                if excess[u] == 0:
+                    break
+
+                # Relabel to one above the lowest admissible neighbour
+                new_label = max_label
+                start = offsets[u]
+                for b in range(start, end):
+                    if capacity[b] > 0 and label[heads[b]] < new_label:
+                        new_label = label[heads[b]]
+                        start = b
+                new_label = min(new_label + 1, max_label)
+                current[u] = start
+                work += 12 + end - offsets[u]
+                relabel_count += 1
+
+                if d < n:
+                    members[d].discard(u)
+                label[u] = new_label
+                if new_label < n:
+                    members[new_label].add(u)
+
+                if d < n and not members[d]:
+                    # Gap: nothing above d and below n can reach the sink
+                    gap_count += 1
+                    lifted = n + 1
+                    for level in range(d + 1, n):
+                        if members[level]:
+                            for v in members[level]:
+                                label[v] = lifted
+                                current[v] = offsets[v]
+                            members[level].clear()
+                        if active[level]:
+                            active[lifted].extend(active[level])
+                            active[level].clear()
+                    if lifted > highest and active[lifted]:
+                        highest = lifted
+
+                d = label[u]
+                if d > highest:
+                    highest = d
+
+                if work > relabel_threshold:
+                    work = 0
+                    # Rebuilding the buckets re-queues u if it still has excess
+                    highest = global_relabel()
+                    break
+
+        logger.debug(
+            f"Push-relabel: {relabel_count} relabels, {gap_count} gaps"
+        )
+        return excess[sink]
+
     def _reset_residual(self) -> None:
         """Reset residual graph to original capacities."""
         for u in range(self.network.num_vertices):
@@ -450,7 +945,8 @@ class MaxFlowSolver:
         Args:
             source: Source vertex.
             sink: Sink vertex.
-            algorithm: Algorithm to use ("ford_fulkerson", "edmonds_karp", "dinic").
+            algorithm: Algorithm to use ("ford_fulkerson", "edmonds_karp",
+                "dinic", "dinic_csr", "push_relabel").
 
         Returns:
             Tuple of (source_side, sink_side) vertex lists.
@@ -461,10 +957,20 @@ class MaxFlowSolver:
             self.edmonds_karp(source, sink)
         elif algorithm == "dinic":
             self.dinic(source, sink)
+        elif algorithm in ("dinic_csr", "push_relabel"):
+            getattr(self, algorithm)(source, sink)
+            visited = self.csr.reachable_from(source)
+            source_side = [
+                i for i in range(self.network.num_vertices) if visited[i]
+            ]
+            sink_side = [
+                i for i in range(self.network.num_vertices) if not visited[i]
+            ]
+            return source_side, sink_side
         else:
             raise ValueError(
                 f"Unknown algorithm: {algorithm}. "
-                "Use 'ford_fulkerson', 'edmonds_karp', or 'dinic'"
+                f"Use one of {', '.join(self.ALGORITHMS)}"
             )
 
         visited = [False] * self.network.num_vertices
@@ -488,9 +994,229 @@ class MaxFlowSolver:
 
         return source_side, sink_side
 
+    def compare_performance(
+        self,
+        source: int,
+        sink: int,
+        algorithms: Optional[List[str]] = None,
+        iterations: int = 1,
+    ) -> Dict[str, any]:
+        """Compare performance of max flow algorithms on this network.
+
+        Args:
+            source: Source vertex.
+            sink: Sink vertex.
+            algorithms: Algorithms to run (default: edmonds_karp, dinic,
+                dinic_csr, push_relabel). ford_fulkerson is opt-in because
+                its running time depends on the flow value.
+            iterations: Number of iterations for timing (default: 1).
+
+        Returns:
+            Dictionary containing performance data per algorithm, the CSR
+            build time, whether all flow values agree and the fastest
+            algorithm.
+
+        Raises:
+            ValueError: If an algorithm name is unknown.
+        """
+        self._validate_terminals(source, sink)
+        if algorithms is None:
+            algorithms = ["edmonds_karp", "dinic", "dinic_csr", "push_relabel"]
+        for name in algorithms:
+            if name not in self.ALGORITHMS:
+                raise ValueError(
+                    f"Unknown algorithm: {name}. "
+                    f"Use one of {', '.join(self.ALGORITHMS)}"
+                )
+
+        num_edges = sum(len(adjacent) for adjacent in self.network.graph)
+        logger.info(
+            f"Performance comparison: {self.network.num_vertices} vertices, "
+            f"{num_edges} edges, iterations={iterations}"
+        )
+
+        results: Dict[str, any] = {
+            "num_vertices": self.network.num_vertices,
+            "num_edges": num_edges,
+            "source": source,
+            "sink": sink,
+            "iterations": iterations,
+            "algorithms": list(algorithms),
+        }
+
+        try:
+            start_time = time.perf_counter()
+            for _ in range(iterations):
+                self.network.to_csr()
+            elapsed = (time.perf_counter() - start_time) / iterations
+            results["csr_build"] = {
+                "time_seconds": elapsed,
+                "time_milliseconds": elapsed * 1000,
+                "success": True,
+            }
+        except Exception as e:
+            logger.error(f"CSR build failed: {e}")
+            results["csr_build"] = {"success": False, "error": str(e)}
+
+        for name in algorithms:
+            try:
+                method = getattr(self, name)
+                start_time = time.perf_counter()
+                for _ in range(iterations):
+                    max_flow, _ = method(source, sink)
+                elapsed = (time.perf_counter() - start_time) / iterations
+                results[name] = {
+                    "max_flow": max_flow,
+                    "time_seconds": elapsed,
+                    "time_milliseconds": elapsed * 1000,
+                    "success": True,
+                }
+            except Exception as e:
+                logger.error(f"{name} failed: {e}")
+                results[name] = {"success": False, "error": str(e)}
+
+        successful = [name for name in algorithms if results[name]["success"]]
+        results["all_match"] = (
+            len({results[name]["max_flow"] for name in successful}) <= 1
+        )
+        results["fastest"] = (
+            min(successful, key=lambda name: results[name]["time_seconds"])
+            if successful
+            else None
+        )
+        return results
+
+    def generate_report(
+        self,
+        performance_data: Dict[str, any],
+        output_path: Optional[str] = None,
+    ) -> str:
+        """Generate performance report for max flow algorithms.
+
+        Args:
+            performance_data: Performance data from compare_performance().
+            output_path: Optional path to save report file.
+
+        Returns:
+            Report content as string.
+        """
+        report_lines = [
+            "=" * 80,
+            "MAXIMUM FLOW PERFORMANCE REPORT",
+            "=" * 80,
+            "",
+            f"Vertices: {performance_data['num_vertices']}",
+            f"Edges: {performance_data['num_edges']}",
+            f"Source: {performance_data['source']}, "
+            f"Sink: {performance_data['sink']}",
+            f"Iterations: {performance_data['iterations']}",
+            "",
+            "RESULTS",
+            "-" * 80,
+        ]
+
+        build_data = performance_data.get("csr_build", {})
+        if build_data.get("success", False):
+            report_lines.append(
+                f"CSR build: {build_data['time_milliseconds']:.4f} ms"
+            )
+
+        for name in performance_data["algorithms"]:
+            data = performance_data[name]
+            report_lines.append(f"\n{name}():")
+            if data.get("success", False):
+                report_lines.append(f"  Max flow: {data['max_flow']}")
+                report_lines.append(
+                    f"  Time: {data['time_milliseconds']:.4f} ms "
+                    f"({data['time_seconds']:.6f} seconds)"
+                )
+            else:
+                report_lines.append("  Status: Failed")
+                report_lines.append(f"  Error: {data.get('error', 'Unknown')}")
+
+        report_lines.extend([
+            "",
+            f"All results match: {performance_data['all_match']}",
+            f"Fastest: {performance_data['fastest']}",
+            "",
+            "ALGORITHM COMPLEXITY",
+            "-" * 80,
+            "  Ford-Fulkerson: O(E * max_flow)",
+            "  Edmonds-Karp: O(V * E^2)",
+            "  Dinic's: O(V^2 * E)",
+            "  Push-relabel (highest label): O(V^2 * sqrt(E))",
+        ])
+
+        report_content = "\n".join(report_lines)
+
+        if output_path:
+            try:
+                output_file = Path(output_path)
+                output_file.parent.mkdir(parents=True, exist_ok=True)
+                with open(output_file, "w", encoding="utf-8") as f:
+                    f.write(report_content)
+                logger.info(f"Report saved to {output_path}")
+            except (IOError, PermissionError) as e:
+                logger.error(f"Failed to save report: {e}")
+                raise
+
+        return report_content
+
 
 def main() -> None:
     """Main function to demonstrate maximum flow algorithms."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Maximum flow using Ford-Fulkerson, Edmonds-Karp, "
+        "Dinic's and push-relabel"
+    )
+    parser.add_argument(
+        "--benchmark",
+        action="store_true",
+        help="Benchmark algorithms on a random network",
+    )
+    parser.add_argument(
+        "--vertices",
+        type=int,
+        default=100000,
+        help="Vertices in benchmark network (default: 100000)",
+    )
+    parser.add_argument(
+        "--edges",
+        type=int,
+        default=1000000,
+        help="Edges in benchmark network (default: 1000000)",
+    )
+    parser.add_argument(
+        "--algorithms",
+        nargs="+",
+        choices=MaxFlowSolver.ALGORITHMS,
+        help="Algorithms to benchmark (default: edmonds_karp, dinic, "
+        "dinic_csr, push_relabel)",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=42,
+        help="Random seed for benchmark network (default: 42)",
+    )
+    parser.add_argument(
+        "-r",
+        "--report",
+        help="Output path for performance report",
+    )
+    args = parser.parse_args()
+
+    if args.benchmark:
+        network = FlowNetwork.random(args.vertices, args.edges, seed=args.seed)
+        solver = MaxFlowSolver(network)
+        performance = solver.compare_performance(
+            0, args.vertices - 1, algorithms=args.algorithms
+        )
+        print(solver.generate_report(performance, output_path=args.report))
+        return
+
     network = FlowNetwork(6)
 
     network.add_edge(0, 1, 16)
@@ -519,6 +1245,12 @@ def main() -> None:
     max_flow_dinic, flow_dict_dinic = solver.dinic(source, sink)
     logger.info(f"Dinic's: {max_flow_dinic}")
 
+    max_flow_csr, flow_dict_csr = solver.dinic_csr(source, sink)
+    logger.info(f"Dinic's (CSR, current-arc): {max_flow_csr}")
+
+    max_flow_pr, flow_dict_pr = solver.push_relabel(source, sink)
+    logger.info(f"Push-relabel: {max_flow_pr}")
+
     source_side, sink_side = solver.get_min_cut(source, sink)
     logger.info(f"Min cut - Source side: {source_side}, Sink side: {sink_side}")
 
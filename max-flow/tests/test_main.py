@@ -6,7 +6,7 @@ from pathlib import Path
 import pytest
 import yaml
 
-from src.main import FlowNetwork, MaxFlowSolver
+from src.main import CSRResidualGraph, FlowNetwork, MaxFlowSolver
 
 
 class TestFlowNetwork:
@@ -252,8 +252,8 @@ class TestMaxFlowSolver:
             0, 5, algorithm="dinic"
         )
 
-        assert len(source_side_ff) == len(source_side_ek))
-        assert len(source_side_ek) == len(source_side_dinic))
+        assert len(source_side_ff) == len(source_side_ek)
+        assert len(source_side_ek) == len(source_side_dinic)
 
     def test_min_cut_invalid_algorithm(self, simple_network):
         """Test min cut with invalid algorithm."""
@@ -300,3 +300,102 @@ class TestMaxFlowSolver:
 
         max_flow, _ = solver.dinic(0, 9)
         assert max_flow > 0
+
+    def test_dinic_csr_complex(self, complex_network):
+        """Test CSR Dinic's on complex network."""
+        solver = MaxFlowSolver(complex_network)
+        max_flow, flow_dict = solver.dinic_csr(0, 5)
+        assert max_flow == 23
+        assert sum(f for (u, _), f in flow_dict.items() if u == 0) == 23
+
+    def test_push_relabel_complex(self, complex_network):
+        """Test push-relabel on complex network."""
+        solver = MaxFlowSolver(complex_network)
+        max_flow, flow_dict = solver.push_relabel(0, 5)
+        assert max_flow == 23
+        assert sum(f for (u, _), f in flow_dict.items() if u == 0) == 23
+
+    def test_push_relabel_returns_valid_flow(self):
+        """Test push-relabel returns excess that cannot reach the sink."""
+        network = FlowNetwork(4)
+        network.add_edge(0, 1, 10)
+        network.add_edge(1, 2, 10)
+        network.add_edge(2, 3, 3)
+
+        solver = MaxFlowSolver(network)
+        max_flow, flow_dict = solver.push_relabel(0, 3)
+        assert max_flow == 3
+        assert flow_dict == {(0, 1): 3, (1, 2): 3, (2, 3): 3}
+
+    def test_csr_algorithms_match_random(self):
+        """Test CSR algorithms agree with Edmonds-Karp on random networks."""
+        for seed in range(20):
+            network = FlowNetwork.random(12, 40, max_capacity=10, seed=seed)
+            solver = MaxFlowSolver(network)
+            expected, _ = solver.edmonds_karp(0, 11)
+            for name in ("dinic_csr", "push_relabel"):
+                max_flow, flow_dict = getattr(solver, name)(0, 11)
+                assert max_flow == expected
+                balance = [0] * 12
+                for (u, v), flow in flow_dict.items():
+                    assert flow <= network.get_capacity(u, v)
+                    balance[u] -= flow
+                    balance[v] += flow
+                assert all(balance[i] == 0 for i in range(1, 11))
+
+    def test_min_cut_csr_algorithms(self, complex_network):
+        """Test min cut with CSR algorithms."""
+        solver = MaxFlowSolver(complex_network)
+        expected = solver.get_min_cut(0, 5)
+        assert solver.get_min_cut(0, 5, algorithm="dinic_csr") == expected
+        assert solver.get_min_cut(0, 5, algorithm="push_relabel") == expected
+
+    def test_compare_performance(self, complex_network, temp_dir):
+        """Test performance comparison and report."""
+        solver = MaxFlowSolver(complex_network)
+        result = solver.compare_performance(0, 5)
+        assert result["all_match"] is True
+        assert result["push_relabel"]["max_flow"] == 23
+        assert result["fastest"] in result["algorithms"]
+
+        report_path = temp_dir / "report.txt"
+        report = solver.generate_report(result, output_path=str(report_path))
+        assert "MAXIMUM FLOW PERFORMANCE REPORT" in report
+        assert report_path.exists()
+
+    def test_compare_performance_invalid_algorithm(self, simple_network):
+        """Test performance comparison with unknown algorithm."""
+        solver = MaxFlowSolver(simple_network)
+        with pytest.raises(ValueError):
+            solver.compare_performance(0, 3, algorithms=["invalid"])
+
+
+class TestCSRResidualGraph:
+    """Test cases for CSRResidualGraph class."""
+
+    def test_paired_arcs(self):
+        """Test every arc is paired with its reverse."""
+        csr = CSRResidualGraph(3, [(0, 1, 5), (1, 2, 7), (0, 1, 2)])
+        assert len(csr.heads) == 6
+        for a in range(len(csr.heads)):
+            assert csr.rev[csr.rev[a]] == a
+            assert csr.tail(csr.rev[a]) == csr.heads[a]
+        assert csr.offsets == [0, 2, 5, 6]
+
+    def test_parallel_edges_kept(self):
+        """Test parallel edges keep separate arcs and merge in flow_dict."""
+        csr = CSRResidualGraph(2, [(0, 1, 5), (0, 1, 2)])
+        for a in csr.forward:
+            csr.capacity[a] = 0
+        assert csr.flow_dict() == {(0, 1): 7}
+        csr.reset()
+        assert csr.flow_dict() == {}
+
+    def test_invalid_edges(self):
+        """Test CSR construction rejects invalid edges."""
+        with pytest.raises(ValueError):
+            CSRResidualGraph(2, [(0, 2, 1)])
+        with pytest.raises(ValueError):
+            CSRResidualGraph(2, [(0, 1, -1)])
+        with pytest.raises(ValueError):
+            CSRResidualGraph(1, [])
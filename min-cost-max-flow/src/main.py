@@ -5,8 +5,11 @@ two different approaches: successive shortest paths and cycle canceling. These
 algorithms find the maximum flow with minimum cost in a flow network.
 """
 
+import heapq
 import logging
 import logging.handlers
+import math
+import time
 from collections import deque
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
@@ -57,6 +60,7 @@ class FlowNetwork:
         self.num_vertices = num_vertices
         self.graph: List[List[Edge]] = [[] for _ in range(num_vertices)]
         self.potential: List[float] = [0.0] * num_vertices
+        self.edges: List[Tuple[int, Edge]] = []
 
     def add_edge(self, from_vertex: int, to_vertex: int, capacity: float, cost: float) -> None:
         """Add edge to network.
@@ -73,6 +77,44 @@ class FlowNetwork:
 
         self.graph[from_vertex].append(forward)
         self.graph[to_vertex].append(backward)
+        self.edges.append((from_vertex, forward))
+
+    def to_arrays(
+        self,
+    ) -> Tuple[List[int], List[int], List[float], List[float]]:
+        """Export forward edges as flat arrays.
+
+        Returns:
+            Tuple of (tails, heads, capacities, costs), one entry per edge
+            in insertion order.
+        """
+        tails = [u for u, _ in self.edges]
+        heads = [edge.to for _, edge in self.edges]
+        capacities = [edge.capacity for _, edge in self.edges]
+        costs = [edge.cost for _, edge in self.edges]
+        return tails, heads, capacities, costs
+
+    def set_flows(self, flows: List[float]) -> None:
+        """Write per-edge flows back onto the Edge objects.
+
+        Args:
+            flows: Flow per forward edge, in insertion order.
+        """
+        for (_, edge), flow in zip(self.edges, flows):
+            edge.flow = flow
+            edge.reverse.flow = -flow
+
+    def copy(self) -> "FlowNetwork":
+        """Create a copy of the network with zero flow.
+
+        Returns:
+            New FlowNetwork with the same edges and potentials.
+        """
+        network = FlowNetwork(self.num_vertices)
+        for u, edge in self.edges:
+            network.add_edge(u, edge.to, edge.capacity, edge.cost)
+        network.potential = self.potential[:]
+        return network
 
     def get_residual_capacity(self, edge: Edge) -> float:
         """Get residual capacity of edge.
@@ -100,6 +142,13 @@ class FlowNetwork:
 class MinCostMaxFlow:
     """Min-cost max-flow algorithm implementation."""
 
+    ALGORITHMS = (
+        "successive_shortest_paths",
+        "cycle_canceling",
+        "capacity_scaling",
+        "network_simplex",
+    )
+
     def __init__(self, network: FlowNetwork, config_path: str = "config.yaml") -> None:
         """Initialize min-cost max-flow solver.
 
@@ -108,6 +157,7 @@ class MinCostMaxFlow:
             config_path: Path to configuration file.
         """
         self.network = network
+        self.phase_stats: Dict[str, any] = {}
         self._setup_logging()
         self._load_config(config_path)
 
@@ -443,6 +493,558 @@ class MinCostMaxFlow:
         logger.info(f"Cycle canceling: flow={max_flow}, cost={total_cost}")
         return max_flow, total_cost
 
+    def _validate_terminals(self, source: int, sink: int) -> None:
+        """Validate source and sink vertices.
+
+        Args:
+            source: Source vertex.
+            sink: Sink vertex.
+
+        Raises:
+            ValueError: If either vertex is invalid or they are equal.
+        """
+        n = self.network.num_vertices
+        if source < 0 or source >= n:
+            raise ValueError(f"Invalid source vertex: {source}")
+        if sink < 0 or sink >= n:
+            raise ValueError(f"Invalid sink vertex: {sink}")
+        if source == sink:
+            raise ValueError("Source and sink must be different")
+
+    def _build_residual_arrays(
+        self,
+    ) -> Tuple[List[int], List[float], List[float], List[List[int]]]:
+        """Build flat residual arc arrays from the network's edges.
+
+        Edge i becomes forward arc 2 * i and reverse arc 2 * i + 1, so the
+        partner of arc a is a ^ 1 and its tail is arc_head[a ^ 1].
+
+        Returns:
+            Tuple of (arc_head, arc_cost, residual, adjacency) where
+            adjacency[u] lists the arcs leaving u.
+        """
+        tails, heads, capacities, costs = self.network.to_arrays()
+        num_arcs = 2 * len(tails)
+        arc_head = [0] * num_arcs
+        arc_cost = [0.0] * num_arcs
+        residual = [0.0] * num_arcs
+        adjacency: List[List[int]] = [[] for _ in range(self.network.num_vertices)]
+
+        for i, (u, v) in enumerate(zip(tails, heads)):
+            a = 2 * i
+            arc_head[a] = v
+            arc_head[a + 1] = u
+            arc_cost[a] = costs[i]
+            arc_cost[a + 1] = -costs[i]
+            residual[a] = capacities[i]
+            adjacency[u].append(a)
+            adjacency[v].append(a + 1)
+
+        return arc_head, arc_cost, residual, adjacency
+
+    def _max_flow_value(
+        self,
+        arc_head: List[int],
+        residual: List[float],
+        adjacency: List[List[int]],
+        source: int,
+        sink: int,
+    ) -> float:
+        """Compute the maximum flow value, ignoring costs.
+
+        Uses capacity-scaling augmenting paths when all capacities are
+        integral and plain shortest augmenting paths otherwise. The residual
+        list is not modified.
+
+        Args:
+            arc_head: Head vertex per arc.
+            residual: Residual capacity per arc.
+            adjacency: Arcs leaving each vertex.
+            source: Source vertex.
+            sink: Sink vertex.
+
+        Returns:
+            Maximum flow value.
+        """
+        residual = residual[:]
+        n = self.network.num_vertices
+        largest = max(residual, default=0)
+        if largest >= 1 and all(float(r).is_integer() for r in residual):
+            delta = 1 << (int(largest).bit_length() - 1)
+        else:
+            delta = 0
+
+        total = 0
+        while True:
+            parent_arc = [-1] * n
+            parent_arc[source] = -2
+            queue = deque([source])
+            while queue and parent_arc[sink] == -1:
+                u = queue.popleft()
+                for a in adjacency[u]:
+                    v = arc_head[a]
+                    if parent_arc[v] == -1 and residual[a] > 0 and residual[a] >= delta:
+                        parent_arc[v] = a
+                        queue.append(v)
+
+            if parent_arc[sink] == -1:
+                if delta <= 1:
+                    break
+                delta //= 2
+                continue
+
+            bottleneck = float("inf")
+            v = sink
+            while v != source:
+                a = parent_arc[v]
+                bottleneck = min(bottleneck, residual[a])
+                v = arc_head[a ^ 1]
+            v = sink
+            while v != source:
+                a = parent_arc[v]
+                residual[a] -= bottleneck
+                residual[a ^ 1] += bottleneck
+                v = arc_head[a ^ 1]
+            total += bottleneck
+
+        return total
+
+    def capacity_scaling(self, source: int, sink: int) -> Tuple[float, float]:
+        """Solve min-cost max-flow using capacity-scaling shortest paths.
+
+        First computes the maximum flow value F, then routes F units from
+        source to sink at minimum cost. In each phase only arcs with at
+        least delta residual capacity are used. Arcs with negative reduced
+        cost are saturated at the start of the phase, and delta units at a
+        time are sent along Dijkstra shortest paths (reduced by
+        network.potential) from excess to deficit vertices. This needs
+        O(log U) phases instead of one Dijkstra per unit of bottleneck.
+        The result is written back onto the Edge objects and
+        network.potential. Per-phase timings are stored in phase_stats.
+
+        Args:
+            source: Source vertex.
+            sink: Sink vertex.
+
+        Returns:
+            Tuple of (max_flow, min_cost).
+
+        Raises:
+            ValueError: If source/sink are invalid or a capacity is not
+                integral.
+        """
+        self._validate_terminals(source, sink)
+        for _, edge in self.network.edges:
+            if not float(edge.capacity).is_integer():
+                raise ValueError(
+                    f"Capacity scaling requires integral capacities, "
+                    f"got {edge.capacity}"
+                )
+
+        n = self.network.num_vertices
+        stats: Dict[str, any] = {"algorithm": "capacity_scaling", "phases": []}
+        total_start = time.perf_counter()
+
+        start_time = time.perf_counter()
+        arc_head, arc_cost, residual, adjacency = self._build_residual_arrays()
+        capacities = residual[0::2]
+        max_flow = self._max_flow_value(arc_head, residual, adjacency, source, sink)
+        stats["max_flow_time_seconds"] = time.perf_counter() - start_time
+
+        excess = [0.0] * n
+        excess[source] = max_flow
+        excess[sink] = -max_flow
+        potential = self.network.potential[:]
+        num_arcs = len(arc_head)
+
+        largest = max(max(capacities, default=0), max_flow)
+        delta = 1 << (int(largest).bit_length() - 1) if largest >= 1 else 0
+
+        while delta >= 1:
+            phase_start = time.perf_counter()
+            saturated = 0
+            augmentations = 0
+
+            for a in range(num_arcs):
+                r = residual[a]
+                if r >= delta:
+                    u = arc_head[a ^ 1]
+                    v = arc_head[a]
+                    if arc_cost[a] + potential[u] - potential[v] < 0:
+                        residual[a] = 0
+                        residual[a ^ 1] += r
+                        excess[u] -= r
+                        excess[v] += r
+                        saturated += 1
+
+            while True:
+                starts = [v for v in range(n) if excess[v] >= delta]
+                if not starts or not any(e <= -delta for e in excess):
+                    break
+
+                dist = [float("inf")] * n
+                parent_arc = [-1] * n
+                done = [False] * n
+                heap: List[Tuple[float, int]] = []
+                for v in starts:
+                    dist[v] = 0.0
+                    heap.append((0.0, v))
+                heapq.heapify(heap)
+                target = -1
+
+                while heap:
+                    d, u = heapq.heappop(heap)
+                    if done[u]:
+                        continue
+                    done[u] = True
+                    if excess[u] <= -delta:
+                        target = u
+                        break
+                    base = d + potential[u]
+                    for a in adjacency[u]:
+                        if residual[a] < delta:
+                            continue
+                        v = arc_head[a]
+                        new_dist = base + arc_cost[a] - potential[v]
+                        if new_dist < dist[v]:
+                            dist[v] = new_dist
+                            parent_arc[v] = a
+                            heapq.heappush(heap, (new_dist, v))
+
+                if target == -1:
+                    break
+
+                limit = dist[target]
+                for v in range(n):
+                    potential[v] += dist[v] if dist[v] < limit else limit
+
+                amount = -excess[target]
+                v = target
+                while parent_arc[v] != -1:
+                    a = parent_arc[v]
+                    amount = min(amount, residual[a])
+                    v = arc_head[a ^ 1]
+                amount = min(amount, excess[v])
+
+                v = target
+                while parent_arc[v] != -1:
+                    a = parent_arc[v]
+                    residual[a] -= amount
+                    residual[a ^ 1] += amount
+                    v = arc_head[a ^ 1]
+                excess[v] -= amount
+                excess[target] += amount
+                augmentations += 1
+
+            stats["phases"].append({
+                "delta": delta,
+                "saturated_arcs": saturated,
+                "augmentations": augmentations,
+                "time_seconds": time.perf_counter() - phase_start,
+            })
+            logger.debug(
+                f"Capacity scaling phase delta={delta}: "
+                f"{augmentations} augmentations, {saturated} saturated arcs"
+            )
+            delta //= 2
+
+        flows = [capacities[i] - residual[2 * i] for i in range(len(capacities))]
+        min_cost = sum(
+            edge.cost * flow for (_, edge), flow in zip(self.network.edges, flows)
+        )
+        self.network.set_flows(flows)
+        self.network.potential = potential
+
+        stats["total_time_seconds"] = time.perf_counter() - total_start
+        self.phase_stats = stats
+        logger.info(f"Capacity scaling: flow={max_flow}, cost={min_cost}")
+        return float(max_flow), min_cost
+
+    def network_simplex(self, source: int, sink: int) -> Tuple[float, float]:
+        """Solve min-cost max-flow using the primal network simplex method.
+
+        Computes the maximum flow value F, then solves the min-cost flow
+        problem with supply F at source and demand F at sink. The spanning
+        tree is stored in flat parent, subtree-size and preorder-thread
+        arrays rooted at an artificial vertex. Entering arcs are chosen by
+        block search: scan sqrt(E) arcs at a time and pivot on the most
+        negative reduced cost in the first block that has one. The result
+        is written back onto the Edge objects and network.potential, and
+        per-phase timings are stored in phase_stats.
+
+        Args:
+            source: Source vertex.
+            sink: Sink vertex.
+
+        Returns:
+            Tuple of (max_flow, min_cost).
+
+        Raises:
+            ValueError: If source or sink is invalid.
+        """
+        self._validate_terminals(source, sink)
+        n = self.network.num_vertices
+        stats: Dict[str, any] = {"algorithm": "network_simplex"}
+        total_start = time.perf_counter()
+
+        start_time = time.perf_counter()
+        arc_head, _, residual, adjacency = self._build_residual_arrays()
+        max_flow = self._max_flow_value(arc_head, residual, adjacency, source, sink)
+        stats["max_flow_time_seconds"] = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        tails, heads, capacities, costs = self.network.to_arrays()
+        flows = [0.0] * len(tails)
+
+        # Zero-capacity arcs never carry flow; negative self-loops saturate
+        S: List[int] = []
+        T: List[int] = []
+        U: List[float] = []
+        C: List[float] = []
+        original: List[int] = []
+        for i, (u, v) in enumerate(zip(tails, heads)):
+            if u == v:
+                if costs[i] < 0:
+                    flows[i] = capacities[i]
+            elif capacities[i] > 0:
+                S.append(u)
+                T.append(v)
+                U.append(capacities[i])
+                C.append(costs[i])
+                original.append(i)
+
+        m = len(S)
+        demand = [0.0] * n
+        demand[source] = -max_flow
+        demand[sink] = max_flow
+
+        faux_inf = 3 * max(
+            sum(U), sum(abs(c) for c in C), max(abs(d) for d in demand)
+        ) or 1
+        root = n
+        x = [0.0] * m
+        for p in range(n):
+            if demand[p] > 0:
+                S.append(root)
+                T.append(p)
+            else:
+                S.append(p)
+                T.append(root)
+            U.append(faux_inf)
+            C.append(faux_inf)
+            x.append(abs(demand[p]))
+
+        pi = [faux_inf if d <= 0 else -faux_inf for d in demand] + [0]
+        parent = [root] * n + [-1]
+        parent_edge = list(range(m, m + n)) + [-1]
+        size = [1] * n + [n + 1]
+        next_node = list(range(1, n)) + [root, 0]
+        prev_node = [root] + list(range(n))
+        last = list(range(n)) + [n - 1]
+        stats["init_time_seconds"] = time.perf_counter() - start_time
+
+        def reduced_cost(i: int) -> float:
+            c = C[i] - pi[S[i]] + pi[T[i]]
+            return c if x[i] == 0 else -c
+
+        def residual_capacity(i: int, p: int) -> float:
+            return U[i] - x[i] if S[i] == p else x[i]
+
+        def find_apex(p: int, q: int) -> int:
+            size_p = size[p]
+            size_q = size[q]
+            while True:
+                while size_p < size_q:
+                    p = parent[p]
+                    size_p = size[p]
+                while size_p > size_q:
+                    q = parent[q]
+                    size_q = size[q]
+                if size_p == size_q:
+                    if p != q:
+                        p = parent[p]
+                        size_p = size[p]
+                        q = parent[q]
+                        size_q = size[q]
+                    else:
+                        return p
+
+        def trace_path(p: int, w: int) -> Tuple[List[int], List[int]]:
+            nodes = [p]
+            edges: List[int] = []
+            while p != w:
+                edges.append(parent_edge[p])
+                p = parent[p]
+                nodes.append(p)
+            return nodes, edges
+
+        def remove_edge(s: int, t: int) -> None:
+            size_t = size[t]
+            prev_t = prev_node[t]
+            last_t = last[t]
+            next_last_t = next_node[last_t]
+            parent[t] = -1
+            parent_edge[t] = -1
+            next_node[prev_t] = next_last_t
+            prev_node[next_last_t] = prev_t
+            next_node[last_t] = t
+            prev_node[t] = last_t
+            while s != -1:
+                size[s] -= size_t
+                if last[s] == last_t:
+                    last[s] = prev_t
+                s = parent[s]
+
+        def make_root(q: int) -> None:
+            ancestors = []
+            while q != -1:
+                ancestors.append(q)
+                q = parent[q]
+            ancestors.reverse()
+            for p, q in zip(ancestors, ancestors[1:]):
+                size_p = size[p]
+                last_p = last[p]
+                prev_q = prev_node[q]
+                last_q = last[q]
+                next_last_q = next_node[last_q]
+                parent[p] = q
+                parent[q] = -1
+                parent_edge[p] = parent_edge[q]
+                parent_edge[q] = -1
+                size[p] = size_p - size[q]
+                size[q] = size_p
+                next_node[prev_q] = next_last_q
+                prev_node[next_last_q] = prev_q
+                next_node[last_q] = q
+                prev_node[q] = last_q
+                if last_p == last_q:
+                    last[p] = prev_q
+                    last_p = prev_q
+                prev_node[p] = last_q
+                next_node[last_q] = p
+                next_node[last_p] = q
+                prev_node[q] = last_p
+                last[q] = last_p
+
+        def add_edge(i: int, p: int, q: int) -> None:
+            last_p = last[p]
+            next_last_p = next_node[last_p]
+            size_q = size[q]
+            last_q = last[q]
+            parent[q] = p
+            parent_edge[q] = i
+            next_node[last_p] = q
+            prev_node[q] = last_p
+            prev_node[next_last_p] = last_q
+            next_node[last_q] = next_last_p
+            while p != -1:
+                size[p] += size_q
+                if last[p] == last_p:
+                    last[p] = last_q
+                p = parent[p]
+
+        def update_potentials(i: int, p: int, q: int) -> None:
+            if q == T[i]:
+                d = pi[p] - C[i] - pi[q]
+            else:
+                d = pi[p] + C[i] - pi[q]
+            pi[q] += d
+            end = last[q]
+            while q != end:
+                q = next_node[q]
+                pi[q] += d
+
+        start_time = time.perf_counter()
+        pivots = 0
+        degenerate = 0
+        blocks = 0
+        if m:
+            block_size = int(math.ceil(math.sqrt(m)))
+            num_blocks = (m + block_size - 1) // block_size
+            clean_blocks = 0
+            first = 0
+            while clean_blocks < num_blocks:
+                end = first + block_size
+                if end <= m:
+                    block = range(first, end)
+                else:
+                    end -= m
+                    block = list(range(first, m)) + list(range(end))
+                first = end
+                blocks += 1
+
+                i = min(block, key=reduced_cost)
+                if reduced_cost(i) >= 0:
+                    clean_blocks += 1
+                    continue
+                clean_blocks = 0
+                pivots += 1
+
+                if x[i] == 0:
+                    p, q = S[i], T[i]
+                else:
+                    p, q = T[i], S[i]
+
+                w = find_apex(p, q)
+                cycle_nodes, cycle_edges = trace_path(p, w)
+                cycle_nodes.reverse()
+                cycle_edges.reverse()
+                if cycle_edges != [i]:
+                    nodes_q, edges_q = trace_path(q, w)
+                    del nodes_q[-1]
+                    cycle_nodes += nodes_q
+                    cycle_edges += [i]
+                    cycle_edges += edges_q
+
+                j, s = min(
+                    zip(reversed(cycle_edges), reversed(cycle_nodes)),
+                    key=lambda pair: residual_capacity(*pair),
+                )
+                t = T[j] if S[j] == s else S[j]
+
+                amount = residual_capacity(j, s)
+                if amount == 0:
+                    degenerate += 1
+                else:
+                    for e, node in zip(cycle_edges, cycle_nodes):
+                        if S[e] == node:
+                            x[e] += amount
+                        else:
+                            x[e] -= amount
+
+                if i != j:
+                    if parent[t] != s:
+                        s, t = t, s
+                    if cycle_edges.index(i) > cycle_edges.index(j):
+                        p, q = q, p
+                    remove_edge(s, t)
+                    make_root(q)
+                    add_edge(i, p, q)
+                    update_potentials(i, p, q)
+
+        stats["pivot_time_seconds"] = time.perf_counter() - start_time
+        stats["pivots"] = pivots
+        stats["degenerate_pivots"] = degenerate
+        stats["blocks_scanned"] = blocks
+
+        if any(x[i] != 0 for i in range(m, m + n)):
+            raise ValueError("Network simplex ended with flow on artificial arcs")
+
+        for k, i in enumerate(original):
+            flows[i] = x[k]
+        min_cost = sum(
+            edge.cost * flow for (_, edge), flow in zip(self.network.edges, flows)
+        )
+        self.network.set_flows(flows)
+        self.network.potential = [pi[source] - pi[v] for v in range(n)]
+
+        stats["total_time_seconds"] = time.perf_counter() - total_start
+        self.phase_stats = stats
+        logger.info(
+            f"Network simplex: flow={max_flow}, cost={min_cost}, pivots={pivots}"
+        )
+        return float(max_flow), min_cost
+
     def get_flow(self) -> Dict[Tuple[int, int], float]:
         """Get flow on each edge.
 
@@ -456,6 +1058,76 @@ class MinCostMaxFlow:
                     flow_dict[(u, edge.to)] = edge.flow
         return flow_dict
 
+    def compare_performance(
+        self,
+        source: int,
+        sink: int,
+        algorithms: Optional[List[str]] = None,
+    ) -> Dict[str, any]:
+        """Compare min-cost max-flow algorithms on copies of the network.
+
+        Args:
+            source: Source vertex.
+            sink: Sink vertex.
+            algorithms: Algorithms to run (default: successive_shortest_paths,
+                capacity_scaling, network_simplex).
+
+        Returns:
+            Dictionary with one entry per algorithm holding flow, cost,
+            timing and phase_stats, plus whether all results match.
+
+        Raises:
+            ValueError: If an algorithm name is unknown.
+        """
+        if algorithms is None:
+            algorithms = [
+                "successive_shortest_paths",
+                "capacity_scaling",
+                "network_simplex",
+            ]
+        for name in algorithms:
+            if name not in self.ALGORITHMS:
+                raise ValueError(
+                    f"Unknown algorithm: {name}. "
+                    f"Use one of {', '.join(self.ALGORITHMS)}"
+                )
+
+        results: Dict[str, any] = {
+            "num_vertices": self.network.num_vertices,
+            "num_edges": len(self.network.edges),
+            "algorithms": list(algorithms),
+        }
+        original = self.network
+        try:
+            for name in algorithms:
+                self.network = original.copy()
+                self.phase_stats = {}
+                try:
+                    start_time = time.perf_counter()
+                    flow, cost = getattr(self, name)(source, sink)
+                    elapsed = time.perf_counter() - start_time
+                    results[name] = {
+                        "max_flow": flow,
+                        "min_cost": cost,
+                        "time_seconds": elapsed,
+                        "time_milliseconds": elapsed * 1000,
+                        "phase_stats": self.phase_stats,
+                        "success": True,
+                    }
+                except Exception as e:
+                    logger.error(f"{name} failed: {e}")
+                    results[name] = {"success": False, "error": str(e)}
+        finally:
+            self.network = original
+
+        outcomes = {
+            (results[name]["max_flow"], results[name]["min_cost"])
+            for name in algorithms
+            if results[name]["success"]
+        }
+        results["all_match"] = len(outcomes) <= 1
+        return results
+
 
 def main() -> None:
     """Main function to demonstrate min-cost max-flow algorithms."""
@@ -488,6 +1160,28 @@ def main() -> None:
     print(f"Max Flow: {flow2}")
     print(f"Min Cost: {cost2}")
 
+    print("\n=== Capacity Scaling ===")
+    solver3 = MinCostMaxFlow(network.copy())
+    flow3, cost3 = solver3.capacity_scaling(0, 3)
+    print(f"Max Flow: {flow3}")
+    print(f"Min Cost: {cost3}")
+    for phase in solver3.phase_stats["phases"]:
+        print(
+            f"  delta={phase['delta']}: "
+            f"{phase['augmentations']} augmentations, "
+            f"{phase['time_seconds'] * 1000:.3f} ms"
+        )
+
+    print("\n=== Network Simplex ===")
+    solver4 = MinCostMaxFlow(network.copy())
+    flow4, cost4 = solver4.network_simplex(0, 3)
+    print(f"Max Flow: {flow4}")
+    print(f"Min Cost: {cost4}")
+    print(
+        f"  {solver4.phase_stats['pivots']} pivots in "
+        f"{solver4.phase_stats['pivot_time_seconds'] * 1000:.3f} ms"
+    )
+
 
 if __name__ == "__main__":
     main()
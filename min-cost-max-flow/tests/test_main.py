@@ -217,3 +217,105 @@ class TestMinCostMaxFlow:
         flow2, cost2 = solver2.cycle_canceling(0, 3)
 
         assert flow1 == flow2
+
+    def test_capacity_scaling(self, simple_network, config_file):
+        """Test capacity scaling algorithm."""
+        solver = MinCostMaxFlow(simple_network, config_path=config_file)
+        flow, cost = solver.capacity_scaling(0, 3)
+
+        assert flow == 15.0
+        assert cost == 50.0
+        assert solver.get_flow()[(2, 3)] == 10.0
+        deltas = [phase["delta"] for phase in solver.phase_stats["phases"]]
+        assert deltas == [8, 4, 2, 1]
+
+    def test_network_simplex(self, simple_network, config_file):
+        """Test network simplex algorithm."""
+        solver = MinCostMaxFlow(simple_network, config_path=config_file)
+        flow, cost = solver.network_simplex(0, 3)
+
+        assert flow == 15.0
+        assert cost == 50.0
+        assert solver.phase_stats["pivots"] > 0
+        assert "pivot_time_seconds" in solver.phase_stats
+
+    def test_new_solvers_large_capacities(self, config_file):
+        """Test scaling and simplex agree on large capacities."""
+        edges = [
+            (0, 1, 10**9, 4.0),
+            (0, 2, 10**9, 1.0),
+            (2, 1, 5 * 10**8, 1.0),
+            (1, 3, 10**9, 1.0),
+            (2, 3, 10**9, 5.0),
+        ]
+        results = []
+        for method in ("capacity_scaling", "network_simplex"):
+            network = FlowNetwork(4)
+            for edge in edges:
+                network.add_edge(*edge)
+            solver = MinCostMaxFlow(network, config_path=config_file)
+            results.append(getattr(solver, method)(0, 3))
+
+        assert results[0] == results[1]
+        assert results[0][0] == 2 * 10**9
+
+    def test_new_solvers_negative_cost(self, config_file):
+        """Test scaling and simplex with a negative-cost edge."""
+        for method in ("capacity_scaling", "network_simplex"):
+            network = FlowNetwork(4)
+            network.add_edge(0, 1, 5.0, 2.0)
+            network.add_edge(0, 2, 5.0, 1.0)
+            network.add_edge(1, 3, 5.0, -3.0)
+            network.add_edge(2, 3, 3.0, 1.0)
+            solver = MinCostMaxFlow(network, config_path=config_file)
+            flow, cost = getattr(solver, method)(0, 3)
+            assert flow == 8.0
+            assert cost == 1.0
+
+    def test_potentials_reduced_costs(self, simple_network, config_file):
+        """Test returned potentials give non-negative reduced costs."""
+        for method in ("capacity_scaling", "network_simplex"):
+            network = FlowNetwork(4)
+            for u, edge in simple_network.edges:
+                network.add_edge(u, edge.to, edge.capacity, edge.cost)
+            solver = MinCostMaxFlow(network, config_path=config_file)
+            getattr(solver, method)(0, 3)
+            potential = network.potential
+            for u in range(network.num_vertices):
+                for edge in network.graph[u]:
+                    if network.is_residual(edge):
+                        reduced = edge.cost + potential[u] - potential[edge.to]
+                        assert reduced >= -1e-9
+
+    def test_capacity_scaling_fractional(self, config_file):
+        """Test capacity scaling rejects fractional capacities."""
+        network = FlowNetwork(2)
+        network.add_edge(0, 1, 1.5, 1.0)
+        solver = MinCostMaxFlow(network, config_path=config_file)
+        with pytest.raises(ValueError):
+            solver.capacity_scaling(0, 1)
+        assert solver.network_simplex(0, 1) == (1.5, 1.5)
+
+    def test_invalid_terminals(self, simple_network, config_file):
+        """Test new solvers validate source and sink."""
+        solver = MinCostMaxFlow(simple_network, config_path=config_file)
+        with pytest.raises(ValueError):
+            solver.capacity_scaling(0, 0)
+        with pytest.raises(ValueError):
+            solver.network_simplex(0, 10)
+
+    def test_compare_performance(self, simple_network, config_file):
+        """Test performance comparison leaves the network untouched."""
+        solver = MinCostMaxFlow(simple_network, config_path=config_file)
+        result = solver.compare_performance(
+            0, 3, algorithms=["capacity_scaling", "network_simplex"]
+        )
+
+        assert result["all_match"] is True
+        assert result["capacity_scaling"]["phase_stats"]["phases"]
+        assert result["network_simplex"]["min_cost"] == 50.0
+        assert solver.network is simple_network
+        assert solver.get_flow() == {}
+
+        with pytest.raises(ValueError):
+            solver.compare_performance(0, 3, algorithms=["invalid"])
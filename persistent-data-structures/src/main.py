@@ -4,12 +4,17 @@ This module provides functionality to implement persistent arrays and lists usin
 path copying technique. Persistent data structures maintain all previous versions
 when modified, enabling efficient time-travel queries and undo operations.
 Path copying achieves O(log n) time and space complexity per operation.
+Arrays and lists are stored as 32-way vector tries with a tail buffer, so a
+version costs O(log32 n) new nodes, and transients batch many edits into a
+single new version.
 """
 
 import logging
 import logging.handlers
+import random
+import time
 from pathlib import Path
-from typing import Any, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 import yaml
 from dotenv import load_dotenv
@@ -19,6 +24,11 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Branching of the vector trie: 2**BITS children per node
+BITS = 5
+WIDTH = 1 << BITS
+MASK = WIDTH - 1
+
 
 class PersistentNode:
     """Node in persistent tree structure."""
@@ -65,8 +75,481 @@ class PersistentNode:
         )
 
 
+class VectorNode:
+    """Node of a 32-way persistent vector trie.
+
+    Internal nodes hold up to 32 child nodes and leaf nodes hold up to 32
+    values. ``edit`` is the token of the transient that created the node; a
+    transient may only mutate nodes carrying its own token.
+    """
+
+    __slots__ = ("edit", "array")
+
+    def __init__(self, edit: Optional[object] = None, array: Optional[List[Any]] = None) -> None:
+        """Initialize vector node.
+
+        Args:
+            edit: Owner token of the creating transient, or None.
+            array: Children (internal node) or values (leaf node).
+        """
+        self.edit = edit
+        self.array = array if array is not None else []
+
+
+def _new_path(edit: Optional[object], level: int, node: VectorNode) -> VectorNode:
+    """Wrap node in single-child parents up to the given level.
+
+    Args:
+        edit: Owner token for the new nodes.
+        level: Shift of the topmost new node.
+        node: Leaf node to wrap.
+
+    Returns:
+        Topmost node of the new path.
+    """
+    while level > 0:
+        node = VectorNode(edit, [node])
+        level -= BITS
+    return node
+
+
+class PersistentVector:
+    """Immutable 32-way radix-balanced vector with a tail buffer.
+
+    Elements live in a trie of 32-wide nodes; the last 1-32 elements live
+    in a separate tail so that most appends copy only the tail. Updates copy
+    the O(log32 n) nodes on one root-to-leaf path and share everything else
+    with the source vector.
+    """
+
+    __slots__ = ("size", "shift", "root", "tail")
+
+    def __init__(self, size: int, shift: int, root: VectorNode, tail: List[Any]) -> None:
+        """Initialize vector from its parts.
+
+        Args:
+            size: Number of elements.
+            shift: Bit shift of the root level (a multiple of 5, at least 5).
+            root: Root trie node.
+            tail: Last elements not yet pushed into the trie.
+        """
+        self.size = size
+        self.shift = shift
+        self.root = root
+        self.tail = tail
+
+    @classmethod
+    def empty(cls) -> "PersistentVector":
+        """Create an empty vector.
+
+        Returns:
+            Empty vector.
+        """
+        return cls(0, BITS, VectorNode(), [])
+
+    @classmethod
+    def from_iterable(cls, values: Iterable[Any]) -> "PersistentVector":
+        """Build a vector bottom-up from an iterable.
+
+        Args:
+            values: Elements in order.
+
+        Returns:
+            Vector holding the elements.
+        """
+        data = list(values)
+        size = len(data)
+        if size == 0:
+            return cls.empty()
+
+        tail_offset = ((size - 1) >> BITS) << BITS
+        nodes = [
+            VectorNode(None, data[i:i + WIDTH]) for i in range(0, tail_offset, WIDTH)
+        ]
+        shift = BITS
+        while len(nodes) > WIDTH:
+            nodes = [
+                VectorNode(None, nodes[i:i + WIDTH]) for i in range(0, len(nodes), WIDTH)
+            ]
+            shift += BITS
+        return cls(size, shift, VectorNode(None, nodes), data[tail_offset:])
+
+    def __len__(self) -> int:
+        """Return number of elements."""
+        return self.size
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over elements leaf by leaf."""
+        stack = [(self.root, self.shift)]
+        while stack:
+            node, level = stack.pop()
+            if level == 0:
+                yield from node.array
+            else:
+                stack.extend((child, level - BITS) for child in reversed(node.array))
+        yield from self.tail
+
+    def _tail_offset(self) -> int:
+        """Get index of the first tail element.
+
+        Returns:
+            Number of elements stored in the trie.
+        """
+        if self.size < WIDTH:
+            return 0
+        return ((self.size - 1) >> BITS) << BITS
+
+    def get(self, index: int) -> Any:
+        """Get element at index.
+
+        Args:
+            index: Element index.
+
+        Returns:
+            Element value.
+
+        Raises:
+            IndexError: If index is out of bounds.
+        """
+        if index < 0 or index >= self.size:
+            raise IndexError(f"Index {index} out of bounds")
+
+        tail_offset = self._tail_offset()
+        if index >= tail_offset:
+            return self.tail[index - tail_offset]
+
+        node = self.root
+        level = self.shift
+        while level > 0:
+            node = node.array[(index >> level) & MASK]
+            level -= BITS
+        return node.array[index & MASK]
+
+    def set(self, index: int, value: Any) -> "PersistentVector":
+        """Return a vector with the element at index replaced.
+
+        Args:
+            index: Element index.
+            value: New value.
+
+        Returns:
+            New vector sharing all untouched nodes with this one.
+
+        Raises:
+            IndexError: If index is out of bounds.
+        """
+        if index < 0 or index >= self.size:
+            raise IndexError(f"Index {index} out of bounds")
+
+        tail_offset = self._tail_offset()
+        if index >= tail_offset:
+            tail = list(self.tail)
+            tail[index - tail_offset] = value
+            return PersistentVector(self.size, self.shift, self.root, tail)
+
+        path = []
+        node = self.root
+        level = self.shift
+        while level > 0:
+            path.append(node)
+            node = node.array[(index >> level) & MASK]
+            level -= BITS
+
+        array = list(node.array)
+        array[index & MASK] = value
+        node = VectorNode(None, array)
+        level = BITS
+        for parent in reversed(path):
+            array = list(parent.array)
+            array[(index >> level) & MASK] = node
+            node = VectorNode(None, array)
+            level += BITS
+        return PersistentVector(self.size, self.shift, node, self.tail)
+
+    def append(self, value: Any) -> "PersistentVector":
+        """Return a vector with value added at the end.
+
+        Args:
+            value: Value to append.
+
+        Returns:
+            New vector one element longer.
+        """
+        size = self.size
+        if size - self._tail_offset() < WIDTH:
+            return PersistentVector(size + 1, self.shift, self.root, self.tail + [value])
+
+        tail_node = VectorNode(None, self.tail)
+        shift = self.shift
+        if (size >> BITS) > (1 << shift):
+            root = VectorNode(None, [self.root, _new_path(None, shift, tail_node)])
+            shift += BITS
+        else:
+            root = self._push_tail(shift, self.root, tail_node)
+        return PersistentVector(size + 1, shift, root, [value])
+
+    def _push_tail(self, level: int, parent: VectorNode, tail_node: VectorNode) -> VectorNode:
+        """Copy the rightmost path and hang the full tail under it.
+
+        Args:
+            level: Shift of parent.
+            parent: Node to copy.
+            tail_node: Leaf node made from the old tail.
+
+        Returns:
+            Copy of parent with the tail attached.
+        """
+        array = list(parent.array)
+        if level == BITS:
+            array.append(tail_node)
+        else:
+            sub = ((self.size - 1) >> level) & MASK
+            if sub < len(array):
+                array[sub] = self._push_tail(level - BITS, array[sub], tail_node)
+            else:
+                array.append(_new_path(None, level - BITS, tail_node))
+        return VectorNode(None, array)
+
+    def transient(self) -> "TransientVector":
+        """Create a mutable copy that edits in place.
+
+        Returns:
+            Transient vector sharing this vector's nodes until it
+            modifies them.
+        """
+        return TransientVector(self)
+
+    def to_list(self) -> List[Any]:
+        """Get elements as a Python list.
+
+        Returns:
+            List of elements.
+        """
+        return list(self)
+
+
+class TransientVector:
+    """Mutable view of a PersistentVector for batch edits.
+
+    The first write to a shared node copies it and stamps it with this
+    transient's token; later writes to that node mutate it in place. Calling
+    ``persistent`` freezes the result and disables the transient, so the
+    source vector and every earlier version are never modified.
+    """
+
+    def __init__(self, vector: PersistentVector) -> None:
+        """Initialize transient from a persistent vector.
+
+        Args:
+            vector: Source vector (left unchanged).
+        """
+        self._edit = object()
+        self.size = vector.size
+        self.shift = vector.shift
+        self.root = VectorNode(self._edit, list(vector.root.array))
+        self.tail = list(vector.tail)
+
+    def __len__(self) -> int:
+        """Return number of elements."""
+        return self.size
+
+    def _ensure_active(self) -> None:
+        """Raise if persistent() has already been called.
+
+        Raises:
+            RuntimeError: If the transient has been frozen.
+        """
+        if self._edit is None:
+            raise RuntimeError("Transient used after persistent() call")
+
+    def _editable(self, node: VectorNode) -> VectorNode:
+        """Get node if owned by this transient, else an owned copy.
+
+        Args:
+            node: Trie node.
+
+        Returns:
+            Node safe to mutate.
+        """
+        if node.edit is self._edit:
+            return node
+        return VectorNode(self._edit, list(node.array))
+
+    def _tail_offset(self) -> int:
+        """Get index of the first tail element.
+
+        Returns:
+            Number of elements stored in the trie.
+        """
+        if self.size < WIDTH:
+            return 0
+        return ((self.size - 1) >> BITS) << BITS
+
+    def get(self, index: int) -> Any:
+        """Get element at index.
+
+        Args:
+            index: Element index.
+
+        Returns:
+            Element value.
+
+        Raises:
+            IndexError: If index is out of bounds.
+            RuntimeError: If the transient has been frozen.
+        """
+        self._ensure_active()
+        if index < 0 or index >= self.size:
+            raise IndexError(f"Index {index} out of bounds")
+
+        tail_offset = self._tail_offset()
+        if index >= tail_offset:
+            return self.tail[index - tail_offset]
+
+        node = self.root
+        level = self.shift
+        while level > 0:
+            node = node.array[(index >> level) & MASK]
+            level -= BITS
+        return node.array[index & MASK]
+
+    def set(self, index: int, value: Any) -> None:
+        """Replace the element at index in place.
+
+        Args:
+            index: Element index.
+            value: New value.
+
+        Raises:
+            IndexError: If index is out of bounds.
+            RuntimeError: If the transient has been frozen.
+        """
+        self._ensure_active()
+        if index < 0 or index >= self.size:
+            raise IndexError(f"Index {index} out of bounds")
+
+        tail_offset = self._tail_offset()
+        if index >= tail_offset:
+            self.tail[index - tail_offset] = value
+            return
+
+        node = self.root
+        level = self.shift
+        while level > 0:
+            sub = (index >> level) & MASK
+            child = self._editable(node.array[sub])
+            node.array[sub] = child
+            node = child
+            level -= BITS
+        node.array[index & MASK] = value
+
+    def append(self, value: Any) -> None:
+        """Add value at the end in place.
+
+        Args:
+            value: Value to append.
+
+        Raises:
+            RuntimeError: If the transient has been frozen.
+        """
+        self._ensure_active()
+        size = self.size
+        if size - self._tail_offset() < WIDTH:
+            self.tail.append(value)
+            self.size = size + 1
+            return
+
+        edit = self._edit
+        tail_node = VectorNode(edit, self.tail)
+        self.tail = [value]
+        if (size >> BITS) > (1 << self.shift):
+            self.root = VectorNode(edit, [self.root, _new_path(edit, self.shift, tail_node)])
+            self.shift += BITS
+        else:
+            node = self.root
+            level = self.shift
+            while level > BITS:
+                sub = ((size - 1) >> level) & MASK
+                if sub == len(node.array):
+                    node.array.append(_new_path(edit, level - BITS, tail_node))
+                    break
+                child = self._editable(node.array[sub])
+                node.array[sub] = child
+                node = child
+                level -= BITS
+            else:
+                node.array.append(tail_node)
+        self.size = size + 1
+
+    def extend(self, values: Iterable[Any]) -> None:
+        """Append every value in order.
+
+        Args:
+            values: Values to append.
+
+        Raises:
+            RuntimeError: If the transient has been frozen.
+        """
+        for value in values:
+            self.append(value)
+
+    def persistent(self) -> PersistentVector:
+        """Freeze into an immutable vector and disable this transient.
+
+        Returns:
+            Persistent vector with the edits applied.
+
+        Raises:
+            RuntimeError: If the transient has already been frozen.
+        """
+        self._ensure_active()
+        self._edit = None
+        return PersistentVector(self.size, self.shift, self.root, self.tail)
+
+
+def sharing_stats(vectors: List[PersistentVector]) -> Dict[str, Any]:
+    """Measure structural sharing across vector versions.
+
+    Args:
+        vectors: Vector versions.
+
+    Returns:
+        Dictionary with the number of versions, total elements, trie nodes
+        and tails actually allocated (unique_nodes), nodes the versions
+        would need without sharing (logical_nodes) and their ratio.
+    """
+    subtree_nodes: Dict[int, int] = {}
+
+    def count(node: VectorNode, level: int) -> int:
+        key = id(node)
+        if key not in subtree_nodes:
+            total = 1
+            if level > 0:
+                for child in node.array:
+                    total += count(child, level - BITS)
+            subtree_nodes[key] = total
+        return subtree_nodes[key]
+
+    tails = set()
+    logical = 0
+    elements = 0
+    for vector in vectors:
+        logical += count(vector.root, vector.shift) + 1
+        tails.add(id(vector.tail))
+        elements += vector.size
+
+    unique = len(subtree_nodes) + len(tails)
+    return {
+        "versions": len(vectors),
+        "elements": elements,
+        "unique_nodes": unique,
+        "logical_nodes": logical,
+        "sharing_ratio": logical / unique if unique else 0.0,
+    }
+
+
 class PersistentArray:
-    """Persistent array with path copying technique."""
+    """Persistent array backed by a 32-way persistent vector trie."""
 
     def __init__(
         self, initial_data: Optional[List[Any]] = None, config_path: str = "config.yaml"
@@ -77,17 +560,32 @@ class PersistentArray:
             initial_data: Initial array data.
             config_path: Path to configuration file.
         """
-        self.versions: List[PersistentNode] = []
+        self.versions: List[PersistentVector] = []
         self._setup_logging()
         self._load_config(config_path)
 
         if initial_data:
-            self.versions.append(self._build_tree(initial_data, 0, len(initial_data)))
+            self.versions.append(PersistentVector.from_iterable(initial_data))
             logger.info(f"Created persistent array with {len(initial_data)} elements")
         else:
-            self.versions.append(None)
+            self.versions.append(PersistentVector.empty())
             logger.info("Created empty persistent array")
 
+    @classmethod
+    def from_iterable(
+        cls, values: Iterable[Any], config_path: str = "config.yaml"
+    ) -> "PersistentArray":
+        """Create persistent array from any iterable.
+
+        Args:
+            values: Initial elements.
+            config_path: Path to configuration file.
+
+        Returns:
+            PersistentArray whose version 0 holds the elements.
+        """
+        return cls(list(values), config_path=config_path)
+
     def _setup_logging(self) -> None:
         """Configure logging for persistent array operations."""
         log_dir = Path("logs")
@@ -122,65 +620,247 @@ class PersistentArray:
         except Exception as e:
             logger.warning(f"Could not load config: {e}")
 
-    def _build_tree(
-        self, data: List[Any], left: int, right: int
-    ) -> Optional[PersistentNode]:
-        """Build tree from array data.
+    def _vector(self, version: int) -> PersistentVector:
+        """Get vector of a version.
 
         Args:
-            data: Array data.
-            left: Left index.
-            right: Right index.
+            version: Version number.
 
         Returns:
-            Root node of tree.
+            Vector stored for the version.
+
+        Raises:
+            IndexError: If version is invalid.
         """
-        if left >= right:
-            return None
+        if version < 0 or version >= len(self.versions):
+            raise IndexError(f"Version {version} does not exist")
+        return self.versions[version]
 
-        if left == right - 1:
-            return PersistentNode(value=data[left], size=1)
+    def get(self, version: int, index: int) -> Any:
+        """Get value at index in specific version.
 
-        mid = (left + right) // 2
-        left_node = self._build_tree(data, left, mid)
-        right_node = self._build_tree(data, mid, right)
+        Args:
+            version: Version number.
+            index: Index to get.
 
-        size = (left_node.size if left_node else 0) + (
-            right_node.size if right_node else 0
-        )
+        Returns:
+            Value at index.
 
-        return PersistentNode(left=left_node, right=right_node, size=size)
+        Raises:
+            IndexError: If version or index is invalid.
+        """
+        vector = self._vector(version)
+        if vector.size == 0:
+            raise IndexError("Array is empty")
 
-    def _get_recursive(self, node: Optional[PersistentNode], index: int, left: int, right: int) -> Any:
-        """Recursively get value at index.
+        result = vector.get(index)
+        logger.debug(f"Get version {version}, index {index}: {result}")
+        return result
+
+    def set(self, version: int, index: int, value: Any) -> int:
+        """Set value at index in specific version, creating new version.
 
         Args:
-            node: Current node.
-            index: Target index.
-            left: Left bound of current range.
-            right: Right bound of current range.
+            version: Version number to base on.
+            index: Index to set.
+            value: New value.
 
         Returns:
-            Value at index.
+            New version number.
 
         Raises:
-            IndexError: If index is out of bounds.
+            IndexError: If version or index is invalid.
         """
-        if node is None:
-            raise IndexError(f"Index {index} out of bounds")
+        vector = self._vector(version)
+        if vector.size == 0:
+            raise IndexError("Array is empty")
 
-        if node.is_leaf():
-            if left == index:
-                return node.value
-            raise IndexError(f"Index {index} out of bounds")
+        self.versions.append(vector.set(index, value))
+        new_version = len(self.versions) - 1
+        logger.debug(f"Set version {version}, index {index} = {value}, new version: {new_version}")
+        return new_version
 
-        mid = (left + right) // 2
-        left_size = node.left.size if node.left else 0
+    def set_many(self, version: int, updates: Iterable[Tuple[int, Any]]) -> int:
+        """Apply several assignments as one new version.
 
-        if index < left + left_size:
-            return self._get_recursive(node.left, index, left, mid)
+        Args:
+            version: Version number to base on.
+            updates: (index, value) pairs applied in order.
+
+        Returns:
+            New version number.
+
+        Raises:
+            IndexError: If version or an index is invalid.
+        """
+        transient = self.transient(version)
+        for index, value in updates:
+            transient.set(index, value)
+        return self.commit(transient)
+
+    def transient(self, version: int) -> TransientVector:
+        """Start a batch of in-place edits based on a version.
+
+        Args:
+            version: Version number to base on.
+
+        Returns:
+            Transient vector; pass it to commit() to create the new version.
+
+        Raises:
+            IndexError: If version is invalid.
+        """
+        return self._vector(version).transient()
+
+    def commit(self, transient: TransientVector) -> int:
+        """Freeze a transient into a new version.
+
+        Args:
+            transient: Transient returned by transient().
+
+        Returns:
+            New version number.
+
+        Raises:
+            RuntimeError: If the transient was already committed.
+        """
+        self.versions.append(transient.persistent())
+        new_version = len(self.versions) - 1
+        logger.info(f"Committed transient edits as version {new_version}")
+        return new_version
+
+    def to_list(self, version: int) -> List[Any]:
+        """Get all values of a version.
+
+        Args:
+            version: Version number.
+
+        Returns:
+            List of values.
+
+        Raises:
+            IndexError: If version is invalid.
+        """
+        return self._vector(version).to_list()
+
+    def get_current_version(self) -> int:
+        """Get current version number.
+
+        Returns:
+            Current version number.
+        """
+        return len(self.versions) - 1
+
+    def get_size(self, version: int) -> int:
+        """Get size of array in specific version.
+
+        Args:
+            version: Version number.
+
+        Returns:
+            Size of array.
+
+        Raises:
+            IndexError: If version is invalid.
+        """
+        return self._vector(version).size
+
+    def get_sharing_stats(self) -> Dict[str, Any]:
+        """Get structural sharing statistics across all versions.
+
+        Returns:
+            Dictionary from sharing_stats.
+        """
+        return sharing_stats(self.versions)
+
+
+class PersistentList:
+    """Persistent list backed by a 32-way persistent vector trie."""
+
+    def __init__(
+        self, initial_data: Optional[List[Any]] = None, config_path: str = "config.yaml"
+    ) -> None:
+        """Initialize persistent list.
+
+        Args:
+            initial_data: Initial list data.
+            config_path: Path to configuration file.
+        """
+        self.versions: List[PersistentVector] = []
+        self._setup_logging()
+        self._load_config(config_path)
+
+        if initial_data:
+            self.versions.append(PersistentVector.from_iterable(initial_data))
+            logger.info(f"Created persistent list with {len(initial_data)} elements")
         else:
-            return self._get_recursive(node.right, index, mid, right)
+            self.versions.append(PersistentVector.empty())
+            logger.info("Created empty persistent list")
+
+    @classmethod
+    def from_iterable(
+        cls, values: Iterable[Any], config_path: str = "config.yaml"
+    ) -> "PersistentList":
+        """Create persistent list from any iterable.
+
+        Args:
+            values: Initial elements.
+            config_path: Path to configuration file.
+
+        Returns:
+            PersistentList whose version 0 holds the elements.
+        """
+        return cls(list(values), config_path=config_path)
+
+    def _setup_logging(self) -> None:
+        """Configure logging for persistent list operations."""
+        log_dir = Path("logs")
+        log_dir.mkdir(exist_ok=True)
+
+        handler = logging.handlers.RotatingFileHandler(
+            log_dir / "persistent_data_structures.log",
+            maxBytes=10485760,
+            backupCount=5,
+        )
+        formatter = logging.Formatter(
+            "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+        )
+        handler.setFormatter(formatter)
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+
+    def _load_config(self, config_path: str) -> None:
+        """Load configuration from YAML file.
+
+        Args:
+            config_path: Path to configuration file.
+        """
+        try:
+            config_file = Path(config_path)
+            if config_file.exists():
+                with open(config_file, "r") as f:
+                    config = yaml.safe_load(f)
+                    if config and "logging" in config:
+                        log_level = config["logging"].get("level", "INFO")
+                        logger.setLevel(getattr(logging, log_level))
+        except Exception as e:
+            logger.warning(f"Could not load config: {e}")
+
+    def _vector(self, version: int) -> PersistentVector:
+        """Get vector of a version.
+
+        Args:
+            version: Version number.
+
+        Returns:
+            Vector stored for the version.
+
+        Raises:
+            IndexError: If version is invalid.
+        """
+        if version < 0 or version >= len(self.versions):
+            raise IndexError(f"Version {version} does not exist")
+        return self.versions[version]
 
     def get(self, version: int, index: int) -> Any:
         """Get value at index in specific version.
@@ -195,89 +875,136 @@ class PersistentArray:
         Raises:
             IndexError: If version or index is invalid.
         """
-        if version < 0 or version >= len(self.versions):
-            raise IndexError(f"Version {version} does not exist")
-
-        root = self.versions[version]
-        if root is None:
-            raise IndexError("Array is empty")
+        vector = self._vector(version)
+        if vector.size == 0:
+            raise IndexError("List is empty")
 
-        size = root.size
-        result = self._get_recursive(root, index, 0, size)
-        logger.info(f"Get version {version}, index {index}: {result}")
+        result = vector.get(index)
+        logger.debug(f"Get version {version}, index {index}: {result}")
         return result
 
-    def _set_recursive(
-        self,
-        node: Optional[PersistentNode],
-        index: int,
-        value: Any,
-        left: int,
-        right: int,
-    ) -> PersistentNode:
-        """Recursively set value at index with path copying.
+    def set(self, version: int, index: int, value: Any) -> int:
+        """Set value at index in specific version, creating new version.
 
         Args:
-            node: Current node.
-            index: Target index.
+            version: Version number to base on.
+            index: Index to set.
             value: New value.
-            left: Left bound of current range.
-            right: Right bound of current range.
 
         Returns:
-            New node with updated value.
+            New version number.
+
+        Raises:
+            IndexError: If version or index is invalid.
         """
-        if node is None:
-            raise IndexError(f"Index {index} out of bounds")
+        vector = self._vector(version)
+        if vector.size == 0:
+            raise IndexError("List is empty")
 
-        if node.is_leaf():
-            if left == index:
-                new_node = node.copy()
-                new_node.value = value
-                return new_node
-            raise IndexError(f"Index {index} out of bounds")
+        self.versions.append(vector.set(index, value))
+        new_version = len(self.versions) - 1
+        logger.debug(f"Set version {version}, index {index} = {value}, new version: {new_version}")
+        return new_version
 
-        new_node = node.copy()
-        mid = (left + right) // 2
-        left_size = node.left.size if node.left else 0
+    def append(self, version: int, value: Any) -> int:
+        """Append value to list in specific version, creating new version.
 
-        if index < left + left_size:
-            new_node.left = self._set_recursive(node.left, index, value, left, mid)
-        else:
-            new_node.right = self._set_recursive(
-                node.right, index, value, mid, right
-            )
+        Args:
+            version: Version number to base on.
+            value: Value to append.
 
-        return new_node
+        Returns:
+            New version number.
 
-    def set(self, version: int, index: int, value: Any) -> int:
-        """Set value at index in specific version, creating new version.
+        Raises:
+            IndexError: If version is invalid.
+        """
+        vector = self._vector(version)
+        self.versions.append(vector.append(value))
+        new_version = len(self.versions) - 1
+        logger.debug(f"Append to version {version}, value {value}, new version: {new_version}")
+        return new_version
+
+    def set_many(self, version: int, updates: Iterable[Tuple[int, Any]]) -> int:
+        """Apply several assignments as one new version.
 
         Args:
             version: Version number to base on.
-            index: Index to set.
-            value: New value.
+            updates: (index, value) pairs applied in order.
 
         Returns:
             New version number.
 
         Raises:
-            IndexError: If version or index is invalid.
+            IndexError: If version or an index is invalid.
         """
-        if version < 0 or version >= len(self.versions):
-            raise IndexError(f"Version {version} does not exist")
+        transient = self.transient(version)
+        for index, value in updates:
+            transient.set(index, value)
+        return self.commit(transient)
 
-        root = self.versions[version]
-        if root is None:
-            raise IndexError("Array is empty")
+    def extend(self, version: int, values: Iterable[Any]) -> int:
+        """Append several values as one new version.
 
-        size = root.size
-        new_root = self._set_recursive(root, index, value, 0, size)
-        self.versions.append(new_root)
+        Args:
+            version: Version number to base on.
+            values: Values to append in order.
+
+        Returns:
+            New version number.
+
+        Raises:
+            IndexError: If version is invalid.
+        """
+        transient = self.transient(version)
+        transient.extend(values)
+        return self.commit(transient)
+
+    def transient(self, version: int) -> TransientVector:
+        """Start a batch of in-place edits based on a version.
+
+        Args:
+            version: Version number to base on.
+
+        Returns:
+            Transient vector; pass it to commit() to create the new version.
+
+        Raises:
+            IndexError: If version is invalid.
+        """
+        return self._vector(version).transient()
+
+    def commit(self, transient: TransientVector) -> int:
+        """Freeze a transient into a new version.
+
+        Args:
+            transient: Transient returned by transient().
+
+        Returns:
+            New version number.
+
+        Raises:
+            RuntimeError: If the transient was already committed.
+        """
+        self.versions.append(transient.persistent())
         new_version = len(self.versions) - 1
-        logger.info(f"Set version {version}, index {index} = {value}, new version: {new_version}")
+        logger.info(f"Committed transient edits as version {new_version}")
         return new_version
 
+    def to_list(self, version: int) -> List[Any]:
+        """Get all values of a version.
+
+        Args:
+            version: Version number.
+
+        Returns:
+            List of values.
+
+        Raises:
+            IndexError: If version is invalid.
+        """
+        return self._vector(version).to_list()
+
     def get_current_version(self) -> int:
         """Get current version number.
 
@@ -287,26 +1014,34 @@ class PersistentArray:
         return len(self.versions) - 1
 
     def get_size(self, version: int) -> int:
-        """Get size of array in specific version.
+        """Get size of list in specific version.
 
         Args:
             version: Version number.
 
         Returns:
-            Size of array.
+            Size of list.
 
         Raises:
             IndexError: If version is invalid.
         """
-        if version < 0 or version >= len(self.versions):
-            raise IndexError(f"Version {version} does not exist")
+        return self._vector(version).size
 
-        root = self.versions[version]
-        return root.size if root else 0
+    def get_sharing_stats(self) -> Dict[str, Any]:
+        """Get structural sharing statistics across all versions.
 
+        Returns:
+            Dictionary from sharing_stats.
+        """
+        return sharing_stats(self.versions)
 
-class PersistentList:
-    """Persistent list with path copying technique."""
+
+class BinaryPersistentList:
+    """Persistent list with binary path copying.
+
+    Kept as the reference implementation that benchmark_persistent_structures
+    compares the vector-backed PersistentList against.
+    """
 
     def __init__(
         self, initial_data: Optional[List[Any]] = None, config_path: str = "config.yaml"
@@ -608,6 +1343,98 @@ class PersistentList:
         return root.size if root else 0
 
 
+def benchmark_persistent_structures(
+    n: int = 100000,
+    num_sets: int = 10000,
+    num_appends: int = 500,
+    seed: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Benchmark the vector-backed list against the binary path-copying list.
+
+    Both structures are built from n elements, then receive num_sets
+    single-element sets, num_sets gets and num_appends single appends; the
+    vector list also commits the num_sets sets as one transient batch.
+    Logging is raised to WARNING while timing so only the data structures
+    are measured. Appends run last because the binary list grows a right
+    spine one level per append, which also breaks its index arithmetic, so
+    num_appends should stay well below the recursion limit.
+
+    Args:
+        n: Initial number of elements.
+        num_sets: Number of single-element updates.
+        num_appends: Number of appends.
+        seed: Random seed.
+
+    Returns:
+        Dictionary with per-phase timings for both structures, speedups,
+        vector sharing stats and success flag.
+    """
+    previous_level = logger.level
+    try:
+        rng = random.Random(seed)
+        data = list(range(n))
+        updates = [(rng.randrange(n), rng.randrange(n)) for _ in range(num_sets)]
+        logger.setLevel(logging.WARNING)
+
+        timings: Dict[str, Dict[str, float]] = {}
+        structures = {}
+        for name, cls in (("vector", PersistentList), ("binary", BinaryPersistentList)):
+            phase: Dict[str, float] = {}
+            start_time = time.perf_counter()
+            structure = cls(data)
+            phase["build_seconds"] = time.perf_counter() - start_time
+
+            start_time = time.perf_counter()
+            version = 0
+            for index, value in updates:
+                version = structure.set(version, index, value)
+            phase["set_seconds"] = time.perf_counter() - start_time
+
+            start_time = time.perf_counter()
+            for index, _ in updates:
+                structure.get(version, index)
+            phase["get_seconds"] = time.perf_counter() - start_time
+
+            start_time = time.perf_counter()
+            for value in range(num_appends):
+                version = structure.append(version, value)
+            phase["append_seconds"] = time.perf_counter() - start_time
+            timings[name] = phase
+            structures[name] = structure
+
+        vector_list = structures["vector"]
+        start_time = time.perf_counter()
+        vector_list.set_many(0, updates)
+        transient_time = time.perf_counter() - start_time
+
+        total = sum(timings["vector"].values()) + sum(timings["binary"].values())
+        return {
+            "n": n,
+            "num_sets": num_sets,
+            "num_appends": num_appends,
+            "vector": timings["vector"],
+            "binary": timings["binary"],
+            "transient_set_seconds": transient_time,
+            "set_speedup": (
+                timings["binary"]["set_seconds"] / timings["vector"]["set_seconds"]
+                if timings["vector"]["set_seconds"] > 0 else 0.0
+            ),
+            "append_speedup": (
+                timings["binary"]["append_seconds"] / timings["vector"]["append_seconds"]
+                if timings["vector"]["append_seconds"] > 0 else 0.0
+            ),
+            "sharing": vector_list.get_sharing_stats(),
+            "time_seconds": total + transient_time,
+            "time_milliseconds": (total + transient_time) * 1000,
+            "success": True,
+        }
+    except Exception as e:
+        logger.error(f"Error benchmarking persistent structures: {e}")
+        return {"success": False, "error": str(e)}
+    finally:
+        logger.setLevel(previous_level)
+
+
 def main() -> None:
     """Main function to demonstrate persistent data structures."""
     print("Persistent Data Structures Demo")
@@ -642,6 +1469,23 @@ def main() -> None:
     print(f"Version {v0} still intact: {[lst.get(v0, i) for i in range(lst.get_size(v0))]}")
     print(f"Version {v1} still intact: {[lst.get(v1, i) for i in range(lst.get_size(v1))]}")
 
+    print("\n=== Transient Batch Edits ===")
+    transient = lst.transient(v2)
+    for value in range(50, 100, 10):
+        transient.append(value)
+    transient.set(0, 5)
+    v3 = lst.commit(transient)
+    print(f"Version {v3}: {lst.to_list(v3)}")
+    print(f"Version {v2} still intact: {lst.to_list(v2)}")
+    print(f"Sharing stats: {lst.get_sharing_stats()}")
+
+    print("\n=== Benchmark (vector trie vs binary path copying) ===")
+    stats = benchmark_persistent_structures(n=20000, num_sets=2000, num_appends=200, seed=42)
+    if stats["success"]:
+        print(f"Set speedup: {stats['set_speedup']:.1f}x")
+        print(f"Append speedup: {stats['append_speedup']:.1f}x")
+        print(f"Sharing ratio: {stats['sharing']['sharing_ratio']:.1f}")
+
 
 if __name__ == "__main__":
     main()
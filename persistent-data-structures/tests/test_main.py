@@ -6,7 +6,15 @@ from pathlib import Path
 import pytest
 import yaml
 
-from src.main import PersistentArray, PersistentList, PersistentNode
+from src.main import (
+    BinaryPersistentList,
+    PersistentArray,
+    PersistentList,
+    PersistentNode,
+    PersistentVector,
+    benchmark_persistent_structures,
+    sharing_stats,
+)
 
 
 class TestPersistentNode:
@@ -52,6 +60,87 @@ class TestPersistentNode:
         assert copied is not node
 
 
+class TestPersistentVector:
+    """Test cases for PersistentVector and TransientVector classes."""
+
+    @pytest.mark.parametrize("size", [0, 1, 31, 32, 33, 1024, 1056, 1057, 33000])
+    def test_from_iterable_matches_appends(self, size):
+        """Test bulk build matches element-by-element appends across level boundaries."""
+        built = PersistentVector.from_iterable(range(size))
+        appended = PersistentVector.empty()
+        for value in range(size):
+            appended = appended.append(value)
+
+        assert len(built) == size
+        assert built.shift == appended.shift
+        assert built.to_list() == appended.to_list() == list(range(size))
+
+    def test_set_shares_untouched_nodes(self):
+        """Test set copies one path and leaves the source unchanged."""
+        vector = PersistentVector.from_iterable(range(2000))
+        updated = vector.set(500, -1)
+
+        assert vector.get(500) == 500
+        assert updated.get(500) == -1
+        assert updated.tail is vector.tail
+        assert updated.root.array[1] is vector.root.array[1]
+
+    def test_get_out_of_bounds(self):
+        """Test get rejects negative and too large indices."""
+        vector = PersistentVector.from_iterable([1, 2, 3])
+        with pytest.raises(IndexError):
+            vector.get(3)
+        with pytest.raises(IndexError):
+            vector.get(-1)
+
+    def test_transient_edits_in_place(self):
+        """Test transient edits do not leak into the source vector."""
+        vector = PersistentVector.from_iterable(range(100))
+        transient = vector.transient()
+        transient.set(5, "a")
+        transient.set(6, "b")
+        transient.extend(range(100, 1200))
+        result = transient.persistent()
+
+        assert vector.to_list() == list(range(100))
+        assert result.get(5) == "a"
+        assert result.get(6) == "b"
+        assert result.to_list()[100:] == list(range(100, 1200))
+
+    def test_transient_mutates_owned_nodes_once(self):
+        """Test repeated transient writes reuse the node copied first."""
+        vector = PersistentVector.from_iterable(range(100))
+        transient = vector.transient()
+        transient.set(0, "x")
+        leaf = transient.root.array[0]
+        transient.set(1, "y")
+
+        assert transient.root.array[0] is leaf
+        assert leaf is not vector.root.array[0]
+
+    def test_transient_frozen_after_persistent(self):
+        """Test transient cannot be used after persistent()."""
+        transient = PersistentVector.empty().transient()
+        transient.append(1)
+        transient.persistent()
+        with pytest.raises(RuntimeError):
+            transient.append(2)
+        with pytest.raises(RuntimeError):
+            transient.persistent()
+
+    def test_sharing_stats(self):
+        """Test sharing stats count shared nodes once."""
+        vector = PersistentVector.from_iterable(range(1024 + 10))
+        versions = [vector, vector.set(0, -1), vector.set(1023, -1)]
+        stats = sharing_stats(versions)
+
+        assert stats["versions"] == 3
+        assert stats["elements"] == 3 * 1034
+        assert stats["logical_nodes"] == 3 * (1 + 32 + 1)
+        assert stats["unique_nodes"] == (1 + 32 + 1) + 2 * 2
+        assert stats["sharing_ratio"] > 2
+
+
 class TestPersistentArray:
     """Test cases for PersistentArray class."""
 
@@ -162,6 +251,28 @@ class TestPersistentArray:
         v1 = array.set(v0, 0, 10)
         assert array.get_current_version() == 1
 
+    def test_from_iterable(self, config_file):
+        """Test creation from a generator."""
+        arr = PersistentArray.from_iterable(
+            (i * i for i in range(100)), config_path=config_file
+        )
+        assert arr.get_size(0) == 100
+        assert arr.get(0, 99) == 99 * 99
+
+    def test_set_many(self, array):
+        """Test batch assignments create a single version."""
+        v1 = array.set_many(0, [(0, 10), (4, 50), (0, 11)])
+
+        assert v1 == 1
+        assert array.to_list(v1) == [11, 2, 3, 4, 50]
+        assert array.to_list(0) == [1, 2, 3, 4, 5]
+
+    def test_set_many_out_of_bounds(self, array):
+        """Test batch assignment with invalid index adds no version."""
+        with pytest.raises(IndexError):
+            array.set_many(0, [(0, 10), (5, 1)])
+        assert array.get_current_version() == 0
+
 
 class TestPersistentList:
     """Test cases for PersistentList class."""
@@ -311,3 +422,59 @@ class TestPersistentList:
         assert lst.get(v2, 0) == 10
         assert lst.get(v3, 4) == 5
         assert lst.get(v4, 2) == 20
+
+    def test_extend(self, lst):
+        """Test extend appends a batch as one version."""
+        v1 = lst.extend(0, range(40, 2000))
+
+        assert lst.get_size(v1) == 1963
+        assert lst.get(v1, 1962) == 1999
+        assert lst.get_size(0) == 3
+
+    def test_transient_commit(self, lst):
+        """Test transient edits become a new version on commit."""
+        transient = lst.transient(0)
+        transient.append(40)
+        transient.set(0, 5)
+        v1 = lst.commit(transient)
+
+        assert lst.to_list(v1) == [5, 20, 30, 40]
+        assert lst.to_list(0) == [10, 20, 30]
+        with pytest.raises(RuntimeError):
+            lst.commit(transient)
+
+    def test_long_append_history(self, config_file):
+        """Test many single appends keep every version readable."""
+        lst = PersistentList(config_path=config_file)
+        version = 0
+        for value in range(3000):
+            version = lst.append(version, value)
+
+        assert lst.get_size(version) == 3000
+        assert lst.get(version, 2999) == 2999
+        assert lst.get_size(1500) == 1500
+        assert lst.get(1500, 1499) == 1499
+        assert lst.get_sharing_stats()["sharing_ratio"] > 1
+
+
+class TestBinaryPersistentList:
+    """Test cases for the binary path-copying reference list."""
+
+    def test_set_and_append(self):
+        """Test reference list keeps old versions."""
+        lst = BinaryPersistentList([1, 2, 3], config_path="nonexistent.yaml")
+        v1 = lst.set(0, 1, 20)
+        v2 = lst.append(v1, 4)
+
+        assert lst.get(0, 1) == 2
+        assert lst.get(v1, 1) == 20
+        assert lst.get_size(v2) == 4
+
+    def test_benchmark(self):
+        """Test benchmark compares both implementations."""
+        stats = benchmark_persistent_structures(
+            n=1000, num_sets=100, num_appends=20, seed=1
+        )
+        assert stats["success"] is True
+        assert set(stats["vector"]) == set(stats["binary"])
+        assert stats["sharing"]["versions"] == 1 + 100 + 20 + 1
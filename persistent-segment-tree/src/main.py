@@ -3,14 +3,22 @@
 This module provides functionality to implement persistent segment tree data
 structure that supports range queries across multiple versions of an array.
 Each update creates a new version while preserving all previous versions.
+Nodes are stored in an arena of parallel typed arrays, and a tree built over
+the ranks of a value sequence answers range k-th smallest and
+count-in-value-range queries by comparing two versions.
 """
 
+import bisect
 import logging
 import logging.handlers
+import math
+import operator
+import random
 import sys
-from copy import deepcopy
+import time
+from array import array as typed_array
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
 import yaml
 from dotenv import load_dotenv
@@ -21,61 +29,80 @@ load_dotenv()
 logger = logging.getLogger(__name__)
 
 
-class SegmentTreeNode:
-    """Node in persistent segment tree."""
-
-    def __init__(
-        self,
-        left: Optional["SegmentTreeNode"] = None,
-        right: Optional["SegmentTreeNode"] = None,
-        value: int = 0,
-    ) -> None:
-        """Initialize SegmentTreeNode.
-
-        Args:
-            left: Left child node.
-            right: Right child node.
-            value: Node value (sum/min/max depending on operation).
-        """
-        self.left = left
-        self.right = right
-        self.value = value
-
-    def __repr__(self) -> str:
-        """String representation."""
-        return f"SegmentTreeNode(value={self.value})"
-
-    def copy(self) -> "SegmentTreeNode":
-        """Create a copy of this node.
+class PersistentSegmentTree:
+    """Persistent segment tree for range queries across versions.
 
-        Returns:
-            Copy of the node.
-        """
-        return SegmentTreeNode(
-            left=self.left, right=self.right, value=self.value
-        )
+    Nodes live in an arena of parallel typed arrays (left child, right
+    child, sum, min, max) indexed by node id, grown ``chunk_size`` nodes at
+    a time. Node 0 is the empty node. A version is the id of its root, and
+    an update copies only the nodes on one root-to-leaf path, sharing the
+    rest with the version it was made from.
 
+    Integer data is stored in signed 64-bit columns, so every value must lie
+    in [-value_limit, value_limit] with value_limit = (2**63 - 1) // n,
+    which keeps every range sum in range. Float data (or a float written
+    into an integer tree) switches the sum/min/max columns to doubles.
+    """
 
-class PersistentSegmentTree:
-    """Persistent segment tree for range queries across versions."""
+    DEFAULT_CHUNK_SIZE = 1 << 16
+    EMPTY_MIN = sys.maxsize
+    EMPTY_MAX = -sys.maxsize
+    MAX_INT64 = (1 << 63) - 1
 
     def __init__(
-        self, array: List[int], config_path: str = "config.yaml"
+        self,
+        array: List[int],
+        config_path: str = "config.yaml",
+        chunk_size: Optional[int] = None,
     ) -> None:
         """Initialize persistent segment tree.
 
         Args:
             array: Initial array values.
             config_path: Path to configuration YAML file.
+            chunk_size: Nodes allocated per arena growth step (default from
+                config, else DEFAULT_CHUNK_SIZE).
+
+        Raises:
+            ValueError: If array is empty, chunk_size is not positive, or an
+                integer value is outside [-value_limit, value_limit].
         """
         if not array:
             raise ValueError("Array cannot be empty")
 
         self.n = len(array)
+        self.value_limit = self.MAX_INT64 // self.n
+        self._integer = all(isinstance(value, int) for value in array)
+        if self._integer:
+            for value in array:
+                self._check_value(value)
         self._setup_logging()
         self.config = self._load_config(config_path)
-        self.versions: List[Optional[SegmentTreeNode]] = []
+        if chunk_size is None:
+            arena_config = self.config.get("arena") or {}
+            chunk_size = arena_config.get("chunk_size", self.DEFAULT_CHUNK_SIZE)
+        if chunk_size < 1:
+            raise ValueError(f"Chunk size must be positive, got {chunk_size}")
+        self.chunk_size = chunk_size
+
+        self._left = typed_array("i")
+        self._right = typed_array("i")
+        typecode = "q" if self._integer else "d"
+        self._sum = typed_array(typecode)
+        self._min = typed_array(typecode)
+        self._max = typed_array(typecode)
+        self._empty_min = self.EMPTY_MIN if self._integer else math.inf
+        self._empty_max = self.EMPTY_MAX if self._integer else -math.inf
+        self._node_count = 0
+        self._capacity = 0
+        self._grow()
+        self._node_count = 1
+        self._min[0] = self._empty_min
+        self._max[0] = self._empty_max
+
+        self.versions = typed_array("i")
         self.version_count = 0
+        self.value_domain: Optional[List[int]] = None
 
         root = self._build_tree(0, self.n - 1, array)
         self.versions.append(root)
@@ -86,6 +113,45 @@ class PersistentSegmentTree:
             f"version 0 created"
         )
 
+    @classmethod
+    def for_order_statistics(
+        cls,
+        values: List[int],
+        config_path: str = "config.yaml",
+        chunk_size: Optional[int] = None,
+    ) -> "PersistentSegmentTree":
+        """Build prefix-count versions for range order statistics.
+
+        The distinct values are sorted into value_domain and the tree is
+        built over their ranks with all counts zero (version 0). Version
+        i + 1 then adds one to the rank of values[i], so the counts of
+        values[left..right] are version right + 1 minus version left.
+
+        Args:
+            values: Value sequence.
+            config_path: Path to configuration YAML file.
+            chunk_size: Nodes allocated per arena growth step.
+
+        Returns:
+            PersistentSegmentTree with len(values) + 1 versions.
+
+        Raises:
+            ValueError: If values is empty.
+        """
+        if not values:
+            raise ValueError("Array cannot be empty")
+
+        domain = sorted(set(values))
+        rank = {value: i for i, value in enumerate(domain)}
+        tree = cls([0] * len(domain), config_path=config_path, chunk_size=chunk_size)
+        tree.value_domain = domain
+        tree.apply_updates(((rank[value], 1) for value in values), accumulate=True)
+        logger.info(
+            f"Order statistics tree built over {len(values)} values, "
+            f"{len(domain)} distinct"
+        )
+        return tree
+
     def _setup_logging(self) -> None:
         """Configure logging for the application."""
         log_dir = Path("logs")
@@ -121,9 +187,87 @@ class PersistentSegmentTree:
             logger.warning(f"Configuration file not found: {config_path}")
             return {}
 
-    def _build_tree(
-        self, start: int, end: int, array: List[int]
-    ) -> SegmentTreeNode:
+    def _check_value(self, value) -> None:
+        """Validate a leaf value, switching to float columns for floats.
+
+        Args:
+            value: Leaf value about to be stored.
+
+        Raises:
+            ValueError: If an integer value is outside
+                [-value_limit, value_limit] in an integer tree.
+        """
+        if not self._integer:
+            return
+        if not isinstance(value, int):
+            self._use_float_columns()
+            return
+        if value > self.value_limit or value < -self.value_limit:
+            raise ValueError(
+                f"Value {value} out of range [-{self.value_limit}, "
+                f"{self.value_limit}]: range sums of {self.n} integers must "
+                f"fit in a signed 64-bit integer"
+            )
+
+    def _use_float_columns(self) -> None:
+        """Convert the sum, min and max columns to doubles."""
+        self._sum = typed_array("d", self._sum)
+        self._min = typed_array("d", self._min)
+        self._max = typed_array("d", self._max)
+        self._empty_min = math.inf
+        self._empty_max = -math.inf
+        self._min[0] = self._empty_min
+        self._max[0] = self._empty_max
+        self._integer = False
+        logger.info("Switched segment tree aggregates to float columns")
+
+    def _grow(self) -> None:
+        """Extend every arena array by one chunk of zeroed nodes."""
+        chunk = self.chunk_size
+        for column in (self._left, self._right, self._sum, self._min, self._max):
+            column.frombytes(bytes(column.itemsize * chunk))
+        self._capacity += chunk
+
+    def _new_node(self, left: int, right: int) -> int:
+        """Allocate an internal node over two children.
+
+        Args:
+            left: Left child id.
+            right: Right child id.
+
+        Returns:
+            New node id.
+        """
+        if self._node_count == self._capacity:
+            self._grow()
+        node = self._node_count
+        self._node_count += 1
+        self._left[node] = left
+        self._right[node] = right
+        self._sum[node] = self._sum[left] + self._sum[right]
+        self._min[node] = min(self._min[left], self._min[right])
+        self._max[node] = max(self._max[left], self._max[right])
+        return node
+
+    def _new_leaf(self, value: int) -> int:
+        """Allocate a leaf node.
+
+        Args:
+            value: Leaf value.
+
+        Returns:
+            New node id.
+        """
+        if self._node_count == self._capacity:
+            self._grow()
+        node = self._node_count
+        self._node_count += 1
+        self._sum[node] = value
+        self._min[node] = value
+        self._max[node] = value
+        return node
+
+    def _build_tree(self, start: int, end: int, array: List[int]) -> int:
         """Build initial segment tree.
 
         Args:
@@ -132,57 +276,88 @@ class PersistentSegmentTree:
             array: Input array.
 
         Returns:
-            Root node of segment tree.
+            Root node id of segment tree.
         """
         if start == end:
-            return SegmentTreeNode(value=array[start])
+            return self._new_leaf(array[start])
 
         mid = (start + end) // 2
         left = self._build_tree(start, mid, array)
         right = self._build_tree(mid + 1, end, array)
+        return self._new_node(left, right)
 
-        return SegmentTreeNode(
-            left=left, right=right, value=left.value + right.value
-        )
-
-    def _update_node(
-        self,
-        node: SegmentTreeNode,
-        start: int,
-        end: int,
-        index: int,
-        value: int,
-    ) -> SegmentTreeNode:
-        """Update node and create new version.
+    def _update_node(self, root: int, index: int, value: int, accumulate: bool) -> int:
+        """Copy the root-to-leaf path of index, returning the new root.
 
         Args:
-            node: Current node.
-            start: Start index of segment.
-            end: End index of segment.
+            root: Root node id of the source version.
             index: Index to update.
-            value: New value.
+            value: New value, or amount to add when accumulating.
+            accumulate: Add value to the current leaf instead of replacing it.
 
         Returns:
-            New node with update applied.
+            Root node id of the new version.
         """
-        if start == end:
-            new_node = SegmentTreeNode(value=value)
-            return new_node
+        left = self._left
+        right = self._right
+        path = []
+        node = root
+        start = 0
+        end = self.n - 1
+        while start < end:
+            mid = (start + end) // 2
+            if index <= mid:
+                path.append((node, True))
+                node = left[node]
+                end = mid
+            else:
+                path.append((node, False))
+                node = right[node]
+                start = mid + 1
+
+        if accumulate:
+            value += self._sum[node]
+        self._check_value(value)
+        node = self._new_leaf(value)
+        for parent, went_left in reversed(path):
+            if went_left:
+                node = self._new_node(node, right[parent])
+            else:
+                node = self._new_node(left[parent], node)
+        return node
+
+    def _check_version(self, version: int) -> None:
+        """Validate a version number.
 
-        mid = (start + end) // 2
-        new_node = node.copy()
+        Args:
+            version: Version number.
 
-        if index <= mid:
-            new_node.left = self._update_node(
-                node.left, start, mid, index, value
-            )
-        else:
-            new_node.right = self._update_node(
-                node.right, mid + 1, end, index, value
+        Raises:
+            ValueError: If version is out of range.
+        """
+        if version < 0 or version >= self.version_count:
+            raise ValueError(
+                f"Version {version} out of range [0, {self.version_count-1}]"
             )
 
-        new_node.value = new_node.left.value + new_node.right.value
-        return new_node
+    def _check_range(self, left: int, right: int) -> None:
+        """Validate an inclusive index range.
+
+        Args:
+            left: Start index.
+            right: End index.
+
+        Raises:
+            ValueError: If indices are out of range or reversed.
+        """
+        if left < 0 or left >= self.n:
+            raise ValueError(f"Left index {left} out of range [0, {self.n-1}]")
+        if right < 0 or right >= self.n:
+            raise ValueError(
+                f"Right index {right} out of range [0, {self.n-1}]"
+            )
+        if left > right:
+            raise ValueError(f"Left index {left} must be <= right index {right}")
 
     def update(self, version: int, index: int, value: int) -> int:
         """Update element at index in specified version, creating new version.
@@ -196,12 +371,9 @@ class PersistentSegmentTree:
             New version number.
 
         Raises:
-            ValueError: If version or index is invalid.
+            ValueError: If version, index or value is invalid.
         """
-        if version < 0 or version >= self.version_count:
-            raise ValueError(
-                f"Version {version} out of range [0, {self.version_count-1}]"
-            )
+        self._check_version(version)
         if index < 0 or index >= self.n:
             raise ValueError(f"Index {index} out of range [0, {self.n-1}]")
 
@@ -209,45 +381,94 @@ class PersistentSegmentTree:
             f"Updating version {version}, index {index} to value {value}"
         )
 
-        old_root = self.versions[version]
-        new_root = self._update_node(old_root, 0, self.n - 1, index, value)
+        new_root = self._update_node(self.versions[version], index, value, False)
         self.versions.append(new_root)
         self.version_count += 1
 
         logger.info(f"New version {self.version_count - 1} created")
         return self.version_count - 1
 
-    def _query_sum(
+    def apply_updates(
         self,
-        node: SegmentTreeNode,
-        start: int,
-        end: int,
-        left: int,
-        right: int,
+        updates: Iterable[Tuple[int, int]],
+        version: Optional[int] = None,
+        accumulate: bool = False,
     ) -> int:
-        """Query sum in range [left, right].
+        """Apply a stream of updates, creating one version per update.
+
+        Each update is applied to the version created by the previous one,
+        starting from ``version`` (default: the latest version). There is no
+        per-update logging, so this is the way to build long histories.
 
         Args:
-            node: Current node.
-            start: Start index of segment.
-            end: End index of segment.
-            left: Query start index.
-            right: Query end index.
+            updates: (index, value) pairs in order.
+            version: Version the first update applies to.
+            accumulate: Add each value to the current element instead of
+                replacing it.
 
         Returns:
-            Sum in range.
+            Number of the last version created (``version`` if the stream
+            is empty).
+
+        Raises:
+            ValueError: If version, an index or a value is invalid; no
+                version is created.
         """
-        if right < start or left > end:
-            return 0
+        if version is None:
+            version = self.version_count - 1
+        self._check_version(version)
 
-        if left <= start and end <= right:
-            return node.value
+        n = self.n
+        root = self.versions[version]
+        created = 0
+        try:
+            for index, value in updates:
+                if index < 0 or index >= n:
+                    raise ValueError(f"Index {index} out of range [0, {n-1}]")
+                root = self._update_node(root, index, value, accumulate)
+                self.versions.append(root)
+                created += 1
+        except Exception:
+            # A failed batch creates no versions
+            del self.versions[self.version_count:]
+            raise
+        self.version_count += created
 
-        mid = (start + end) // 2
-        left_sum = self._query_sum(node.left, start, mid, left, right)
-        right_sum = self._query_sum(node.right, mid + 1, end, left, right)
+        logger.info(
+            f"Applied {created} updates from version {version}, "
+            f"latest version {self.version_count - 1}"
+        )
+        return self.version_count - 1 if created else version
+
+    def _query(
+        self, root: int, left: int, right: int, values: typed_array, combine, empty: int
+    ) -> int:
+        """Combine one aggregate column over the range [left, right].
+
+        Args:
+            root: Root node id.
+            left: Query start index.
+            right: Query end index.
+            values: Aggregate column (sum, min or max).
+            combine: Binary function combining aggregates.
+            empty: Aggregate of an empty range.
 
-        return left_sum + right_sum
+        Returns:
+            Combined aggregate.
+        """
+        result = empty
+        stack = [(root, 0, self.n - 1)]
+        while stack:
+            node, start, end = stack.pop()
+            if right < start or left > end:
+                continue
+            if left <= start and end <= right:
+                result = combine(result, values[node])
+                continue
+            mid = (start + end) // 2
+            stack.append((self._left[node], start, mid))
+            stack.append((self._right[node], mid + 1, end))
+        return result
 
     def query_sum(self, version: int, left: int, right: int) -> int:
         """Query sum in range [left, right] for specified version.
@@ -263,60 +484,44 @@ class PersistentSegmentTree:
         Raises:
             ValueError: If version or indices are invalid.
         """
-        if version < 0 or version >= self.version_count:
-            raise ValueError(
-                f"Version {version} out of range [0, {self.version_count-1}]"
-            )
-        if left < 0 or left >= self.n:
-            raise ValueError(f"Left index {left} out of range [0, {self.n-1}]")
-        if right < 0 or right >= self.n:
-            raise ValueError(
-                f"Right index {right} out of range [0, {self.n-1}]"
-            )
-        if left > right:
-            raise ValueError(f"Left index {left} must be <= right index {right}")
+        self._check_version(version)
+        self._check_range(left, right)
 
         logger.debug(f"Querying sum in version {version}, range [{left}, {right}]")
 
         root = self.versions[version]
-        result = self._query_sum(root, 0, self.n - 1, left, right)
+        result = self._query(root, left, right, self._sum, operator.add, 0)
         logger.debug(f"Sum: {result}")
         return result
 
-    def _query_min(
-        self,
-        node: SegmentTreeNode,
-        start: int,
-        end: int,
-        left: int,
-        right: int,
-    ) -> int:
-        """Query minimum in range [left, right].
+    def query_min(self, version: int, left: int, right: int) -> int:
+        """Query minimum in range [left, right] for specified version.
 
         Args:
-            node: Current node.
-            start: Start index of segment.
-            end: End index of segment.
-            left: Query start index.
-            right: Query end index.
+            version: Version to query.
+            left: Start index (0-indexed, inclusive).
+            right: End index (0-indexed, inclusive).
 
         Returns:
             Minimum value in range.
-        """
-        if right < start or left > end:
-            return sys.maxsize
 
-        if start == end:
-            return node.value
+        Raises:
+            ValueError: If version or indices are invalid.
+        """
+        self._check_version(version)
+        self._check_range(left, right)
 
-        mid = (start + end) // 2
-        left_min = self._query_min(node.left, start, mid, left, right)
-        right_min = self._query_min(node.right, mid + 1, end, left, right)
+        logger.debug(
+            f"Querying min in version {version}, range [{left}, {right}]"
+        )
 
-        return min(left_min, right_min)
+        root = self.versions[version]
+        result = self._query(root, left, right, self._min, min, self._empty_min)
+        logger.debug(f"Min: {result}")
+        return result
 
-    def query_min(self, version: int, left: int, right: int) -> int:
-        """Query minimum in range [left, right] for specified version.
+    def query_max(self, version: int, left: int, right: int) -> int:
+        """Query maximum in range [left, right] for specified version.
 
         Args:
             version: Version to query.
@@ -324,100 +529,184 @@ class PersistentSegmentTree:
             right: End index (0-indexed, inclusive).
 
         Returns:
-            Minimum value in range.
+            Maximum value in range.
 
         Raises:
             ValueError: If version or indices are invalid.
         """
-        if version < 0 or version >= self.version_count:
-            raise ValueError(
-                f"Version {version} out of range [0, {self.version_count-1}]"
-            )
-        if left < 0 or left >= self.n:
-            raise ValueError(f"Left index {left} out of range [0, {self.n-1}]")
-        if right < 0 or right >= self.n:
-            raise ValueError(
-                f"Right index {right} out of range [0, {self.n-1}]"
-            )
-        if left > right:
-            raise ValueError(f"Left index {left} must be <= right index {right}")
+        self._check_version(version)
+        self._check_range(left, right)
 
         logger.debug(
-            f"Querying min in version {version}, range [{left}, {right}]"
+            f"Querying max in version {version}, range [{left}, {right}]"
         )
 
         root = self.versions[version]
-        result = self._query_min(root, 0, self.n - 1, left, right)
-        logger.debug(f"Min: {result}")
+        result = self._query(root, left, right, self._max, max, self._empty_max)
+        logger.debug(f"Max: {result}")
         return result
 
-    def _query_max(
-        self,
-        node: SegmentTreeNode,
-        start: int,
-        end: int,
-        left: int,
-        right: int,
-    ) -> int:
-        """Query maximum in range [left, right].
+    def sum_between(self, older: int, newer: int, left: int, right: int) -> int:
+        """Query sum(newer) - sum(older) over the index range [left, right].
+
+        Both trees are walked together and subtrees the two versions share
+        are skipped, so nearby versions are cheap to compare.
 
         Args:
-            node: Current node.
-            start: Start index of segment.
-            end: End index of segment.
-            left: Query start index.
-            right: Query end index.
+            older: Version subtracted.
+            newer: Version added.
+            left: Start index (0-indexed, inclusive).
+            right: End index (0-indexed, inclusive).
 
         Returns:
-            Maximum value in range.
+            Difference of the range sums.
+
+        Raises:
+            ValueError: If versions or indices are invalid.
         """
-        if right < start or left > end:
-            return -sys.maxsize
+        self._check_version(older)
+        self._check_version(newer)
+        self._check_range(left, right)
+        return self._sum_between(
+            self.versions[older], self.versions[newer], left, right
+        )
 
-        if start == end:
-            return node.value
+    def _sum_between(self, a: int, b: int, left: int, right: int) -> int:
+        """Range sum of version root b minus version root a.
 
-        mid = (start + end) // 2
-        left_max = self._query_max(node.left, start, mid, left, right)
-        right_max = self._query_max(node.right, mid + 1, end, left, right)
+        Args:
+            a: Root node id subtracted.
+            b: Root node id added.
+            left: Query start index.
+            right: Query end index.
 
-        return max(left_max, right_max)
+        Returns:
+            Difference of the range sums.
+        """
+        tree_left = self._left
+        tree_right = self._right
+        sums = self._sum
+        result = 0
+        stack = [(a, b, 0, self.n - 1)]
+        while stack:
+            a, b, start, end = stack.pop()
+            if a == b or right < start or left > end:
+                continue
+            if left <= start and end <= right:
+                result += sums[b] - sums[a]
+                continue
+            mid = (start + end) // 2
+            stack.append((tree_left[a], tree_left[b], start, mid))
+            stack.append((tree_right[a], tree_right[b], mid + 1, end))
+        return result
 
-    def query_max(self, version: int, left: int, right: int) -> int:
-        """Query maximum in range [left, right] for specified version.
+    def kth_index_between(self, older: int, newer: int, k: int) -> int:
+        """Find the smallest index i where sum(newer) - sum(older) over [0, i] >= k.
+
+        Element differences must be non-negative, as with counts that
+        only grow between the two versions.
 
         Args:
-            version: Version to query.
-            left: Start index (0-indexed, inclusive).
-            right: End index (0-indexed, inclusive).
+            older: Version subtracted.
+            newer: Version added.
+            k: 1-based rank.
 
         Returns:
-            Maximum value in range.
+            Index holding the k-th unit of the difference.
 
         Raises:
-            ValueError: If version or indices are invalid.
+            ValueError: If versions are invalid or k is not in
+                [1, total difference].
         """
-        if version < 0 or version >= self.version_count:
-            raise ValueError(
-                f"Version {version} out of range [0, {self.version_count-1}]"
-            )
-        if left < 0 or left >= self.n:
-            raise ValueError(f"Left index {left} out of range [0, {self.n-1}]")
-        if right < 0 or right >= self.n:
+        self._check_version(older)
+        self._check_version(newer)
+        a = self.versions[older]
+        b = self.versions[newer]
+        total = self._sum[b] - self._sum[a]
+        if k < 1 or k > total:
+            raise ValueError(f"k must be in [1, {total}], got {k}")
+
+        tree_left = self._left
+        tree_right = self._right
+        sums = self._sum
+        start = 0
+        end = self.n - 1
+        while start < end:
+            mid = (start + end) // 2
+            count = sums[tree_left[b]] - sums[tree_left[a]]
+            if k <= count:
+                a = tree_left[a]
+                b = tree_left[b]
+                end = mid
+            else:
+                k -= count
+                a = tree_right[a]
+                b = tree_right[b]
+                start = mid + 1
+        return start
+
+    def _check_order_statistics(self, left: int, right: int) -> None:
+        """Validate a position range of an order statistics tree.
+
+        Args:
+            left: Start position.
+            right: End position.
+
+        Raises:
+            ValueError: If the tree was not built with for_order_statistics
+                or the range is invalid.
+        """
+        if self.value_domain is None:
+            raise ValueError("Tree was not built with for_order_statistics")
+        size = self.version_count - 1
+        if left < 0 or right >= size or left > right:
             raise ValueError(
-                f"Right index {right} out of range [0, {self.n-1}]"
+                f"Position range [{left}, {right}] invalid for {size} values"
             )
-        if left > right:
-            raise ValueError(f"Left index {left} must be <= right index {right}")
 
-        logger.debug(
-            f"Querying max in version {version}, range [{left}, {right}]"
-        )
+    def kth_smallest(self, left: int, right: int, k: int) -> int:
+        """Find the k-th smallest of values[left..right].
 
-        root = self.versions[version]
-        result = self._query_max(root, 0, self.n - 1, left, right)
-        logger.debug(f"Max: {result}")
-        return result
+        Args:
+            left: Start position in the value sequence (inclusive).
+            right: End position in the value sequence (inclusive).
+            k: 1-based rank.
+
+        Returns:
+            The k-th smallest value.
+
+        Raises:
+            ValueError: If not an order statistics tree, the range is
+                invalid, or k is not in [1, right - left + 1].
+        """
+        self._check_order_statistics(left, right)
+        rank = self.kth_index_between(left, right + 1, k)
+        return self.value_domain[rank]
+
+    def count_in_value_range(self, left: int, right: int, low: int, high: int) -> int:
+        """Count values[left..right] that lie in [low, high].
+
+        Args:
+            left: Start position in the value sequence (inclusive).
+            right: End position in the value sequence (inclusive).
+            low: Smallest value counted.
+            high: Largest value counted.
+
+        Returns:
+            Number of values in range.
+
+        Raises:
+            ValueError: If not an order statistics tree or the range is
+                invalid.
+        """
+        self._check_order_statistics(left, right)
+        first = bisect.bisect_left(self.value_domain, low)
+        last = bisect.bisect_right(self.value_domain, high) - 1
+        if first > last:
+            return 0
+        return self._sum_between(
+            self.versions[left], self.versions[right + 1], first, last
+        )
 
     def get_version_count(self) -> int:
         """Get number of versions.
@@ -435,24 +724,23 @@ class PersistentSegmentTree:
         """
         return self.n
 
-    def _reconstruct_array(
-        self, node: SegmentTreeNode, start: int, end: int, array: List[int]
-    ) -> None:
-        """Reconstruct array from tree node.
+    def get_node_count(self) -> int:
+        """Get number of allocated nodes across all versions.
 
-        Args:
-            node: Current node.
-            start: Start index of segment.
-            end: End index of segment.
-            array: Array to fill.
+        Returns:
+            Number of nodes (excluding the empty node).
         """
-        if start == end:
-            array[start] = node.value
-            return
+        return self._node_count - 1
 
-        mid = (start + end) // 2
-        self._reconstruct_array(node.left, start, mid, array)
-        self._reconstruct_array(node.right, mid + 1, end, array)
+    def memory_bytes(self) -> int:
+        """Get bytes reserved by the node arena and version roots.
+
+        Returns:
+            Reserved bytes, including unused capacity of the last chunk.
+        """
+        columns = (self._left, self._right, self._sum, self._min, self._max)
+        arena = sum(column.itemsize * len(column) for column in columns)
+        return arena + self.versions.itemsize * len(self.versions)
 
     def get_version_array(self, version: int) -> List[int]:
         """Get array representation of specified version.
@@ -466,17 +754,83 @@ class PersistentSegmentTree:
         Raises:
             ValueError: If version is invalid.
         """
-        if version < 0 or version >= self.version_count:
-            raise ValueError(
-                f"Version {version} out of range [0, {self.version_count-1}]"
-            )
+        self._check_version(version)
 
         array = [0] * self.n
-        root = self.versions[version]
-        self._reconstruct_array(root, 0, self.n - 1, array)
+        stack = [(self.versions[version], 0, self.n - 1)]
+        while stack:
+            node, start, end = stack.pop()
+            if start == end:
+                array[start] = self._sum[node]
+                continue
+            mid = (start + end) // 2
+            stack.append((self._left[node], start, mid))
+            stack.append((self._right[node], mid + 1, end))
         return array
 
 
+def benchmark_order_statistics(
+    n: int = 100000,
+    num_queries: int = 100000,
+    value_range: int = 1000000,
+    seed: Optional[int] = None,
+) -> Dict[str, any]:
+    """Benchmark order statistics build and range k-th smallest queries.
+
+    Args:
+        n: Number of values (and versions after version 0).
+        num_queries: Number of kth_smallest and count_in_value_range queries.
+        value_range: Values are drawn from [0, value_range).
+        seed: Random seed.
+
+    Returns:
+        Dictionary with build and query timings, arena size and success
+        flag.
+    """
+    try:
+        rng = random.Random(seed)
+        values = [rng.randrange(value_range) for _ in range(n)]
+        queries = []
+        for _ in range(num_queries):
+            left = rng.randrange(n)
+            right = rng.randrange(left, n)
+            low = rng.randrange(value_range)
+            queries.append(
+                (left, right, rng.randint(1, right - left + 1), low,
+                 low + rng.randrange(value_range // 10 + 1))
+            )
+
+        start_time = time.perf_counter()
+        tree = PersistentSegmentTree.for_order_statistics(values)
+        build_time = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        for left, right, k, low, high in queries:
+            tree.kth_smallest(left, right, k)
+            tree.count_in_value_range(left, right, low, high)
+        query_time = time.perf_counter() - start_time
+
+        return {
+            "n": n,
+            "num_queries": num_queries,
+            "versions": tree.get_version_count(),
+            "nodes": tree.get_node_count(),
+            "memory_bytes": tree.memory_bytes(),
+            "bytes_per_version": tree.memory_bytes() / tree.get_version_count(),
+            "build_seconds": build_time,
+            "query_seconds": query_time,
+            "queries_per_second": (
+                2 * num_queries / query_time if query_time > 0 else 0.0
+            ),
+            "time_seconds": build_time + query_time,
+            "time_milliseconds": (build_time + query_time) * 1000,
+            "success": True,
+        }
+    except Exception as e:
+        logger.error(f"Error benchmarking order statistics: {e}")
+        return {"success": False, "error": str(e)}
+
+
 def main() -> None:
     """Main function to demonstrate persistent segment tree operations."""
     array = [1, 3, 5, 7, 9, 11]
@@ -519,6 +873,23 @@ def main() -> None:
         total = tree.query_sum(v, 0, tree.get_size() - 1)
         logger.info(f"Version {v}: {arr}, total sum: {total}")
 
+    values = [5, 1, 4, 2, 3, 5, 1]
+    logger.info(f"Building order statistics tree over {values}")
+    stats_tree = PersistentSegmentTree.for_order_statistics(values)
+    logger.info(f"2nd smallest in positions [1, 4]: {stats_tree.kth_smallest(1, 4, 2)}")
+    logger.info(
+        f"Values in [2, 4] at positions [0, 6]: "
+        f"{stats_tree.count_in_value_range(0, 6, 2, 4)}"
+    )
+
+    stats = benchmark_order_statistics(n=20000, num_queries=20000, seed=42)
+    if stats["success"]:
+        logger.info(
+            f"Benchmark: build {stats['build_seconds']:.3f}s, "
+            f"{stats['bytes_per_version']:.0f} bytes/version, "
+            f"{stats['queries_per_second']:.0f} queries/s"
+        )
+
 
 if __name__ == "__main__":
     main()
@@ -1,12 +1,13 @@
 """Unit tests for persistent segment tree module."""
 
+import random
 import tempfile
 from pathlib import Path
 
 import pytest
 import yaml
 
-from src.main import PersistentSegmentTree
+from src.main import PersistentSegmentTree, benchmark_order_statistics
 
 
 class TestPersistentSegmentTree:
@@ -234,3 +235,169 @@ class TestPersistentSegmentTree:
 
         assert tree.query_sum(0, 0, 0) == 10
         assert tree.query_sum(v1, 0, 0) == 20
+
+
+class TestArenaOrderStatistics:
+    """Test cases for arena storage and order statistics queries."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create temporary directory for testing."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+
+    @pytest.fixture
+    def config_file(self, temp_dir):
+        """Create temporary config file."""
+        config = {
+            "logging": {"level": "INFO", "file": str(temp_dir / "app.log")},
+            "arena": {"chunk_size": 4},
+        }
+        config_path = temp_dir / "config.yaml"
+        with open(config_path, "w") as f:
+            yaml.dump(config, f)
+        return str(config_path)
+
+    def test_chunk_size_from_config(self, config_file):
+        """Test arena grows in configured chunks across many versions."""
+        tree = PersistentSegmentTree([1, 2, 3, 4, 5], config_path=config_file)
+        assert tree.chunk_size == 4
+        for i in range(20):
+            tree.update(i, i % 5, i)
+        assert 9 + 20 * 3 <= tree.get_node_count() <= 9 + 20 * 4
+        assert tree.memory_bytes() < 2 * PersistentSegmentTree.DEFAULT_CHUNK_SIZE
+        assert tree.get_version_array(0) == [1, 2, 3, 4, 5]
+        assert tree.get_version_array(20) == [15, 16, 17, 18, 19]
+
+    def test_invalid_chunk_size(self, config_file):
+        """Test non-positive chunk size raises error."""
+        with pytest.raises(ValueError, match="Chunk size"):
+            PersistentSegmentTree([1], config_path=config_file, chunk_size=0)
+
+    def test_apply_updates(self, config_file):
+        """Test bulk updates create chained versions."""
+        tree = PersistentSegmentTree([0, 0, 0], config_path=config_file)
+        last = tree.apply_updates([(0, 5), (2, 7), (0, 1)])
+        assert last == 3
+        assert tree.get_version_array(1) == [5, 0, 0]
+        assert tree.get_version_array(3) == [1, 0, 7]
+
+        last = tree.apply_updates([(1, 2), (1, 3)], version=1, accumulate=True)
+        assert tree.get_version_array(last) == [5, 5, 0]
+        assert tree.apply_updates([]) == last
+
+    def test_apply_updates_invalid_index(self, config_file):
+        """Test bulk update with invalid index raises error."""
+        tree = PersistentSegmentTree([0, 0], config_path=config_file)
+        with pytest.raises(ValueError):
+            tree.apply_updates([(2, 1)])
+
+    def test_min_max_partial_ranges(self, config_file):
+        """Test min and max over partial ranges against brute force."""
+        array = [4, -2, 7, 0, 9, -5, 3, 8]
+        tree = PersistentSegmentTree(array, config_path=config_file)
+        for left in range(len(array)):
+            for right in range(left, len(array)):
+                assert tree.query_min(0, left, right) == min(array[left:right + 1])
+                assert tree.query_max(0, left, right) == max(array[left:right + 1])
+
+    def test_sum_between(self, config_file):
+        """Test range sum difference between two versions."""
+        tree = PersistentSegmentTree([1, 2, 3, 4], config_path=config_file)
+        v1 = tree.update(0, 1, 10)
+        v2 = tree.update(v1, 3, 0)
+        assert tree.sum_between(0, v2, 0, 3) == 8 - 4
+        assert tree.sum_between(0, v2, 2, 2) == 0
+        assert tree.sum_between(v2, 0, 1, 3) == 4 - 8
+
+    def test_kth_smallest_brute_force(self, config_file):
+        """Test range k-th smallest against sorting."""
+        rng = random.Random(7)
+        values = [rng.randint(-20, 20) for _ in range(40)]
+        tree = PersistentSegmentTree.for_order_statistics(
+            values, config_path=config_file
+        )
+        assert tree.get_version_count() == len(values) + 1
+        for _ in range(100):
+            left = rng.randrange(len(values))
+            right = rng.randrange(left, len(values))
+            window = sorted(values[left:right + 1])
+            k = rng.randint(1, len(window))
+            assert tree.kth_smallest(left, right, k) == window[k - 1]
+
+    def test_count_in_value_range_brute_force(self, config_file):
+        """Test count in value range against brute force."""
+        rng = random.Random(11)
+        values = [rng.randint(0, 15) for _ in range(30)]
+        tree = PersistentSegmentTree.for_order_statistics(
+            values, config_path=config_file
+        )
+        for _ in range(100):
+            left = rng.randrange(len(values))
+            right = rng.randrange(left, len(values))
+            low = rng.randint(-2, 17)
+            high = rng.randint(-2, 17)
+            expected = sum(low <= x <= high for x in values[left:right + 1])
+            assert tree.count_in_value_range(left, right, low, high) == expected
+
+    def test_order_statistics_errors(self, config_file):
+        """Test order statistics queries reject invalid input."""
+        plain = PersistentSegmentTree([1, 2], config_path=config_file)
+        with pytest.raises(ValueError, match="for_order_statistics"):
+            plain.kth_smallest(0, 1, 1)
+
+        tree = PersistentSegmentTree.for_order_statistics(
+            [3, 1, 2], config_path=config_file
+        )
+        with pytest.raises(ValueError):
+            tree.kth_smallest(0, 1, 3)
+        with pytest.raises(ValueError):
+            tree.count_in_value_range(1, 3, 0, 5)
+        with pytest.raises(ValueError):
+            PersistentSegmentTree.for_order_statistics([], config_path=config_file)
+
+    def test_benchmark_order_statistics(self):
+        """Test benchmark returns timings."""
+        stats = benchmark_order_statistics(n=200, num_queries=50, seed=1)
+        assert stats["success"] is True
+        assert stats["versions"] == 201
+        assert stats["memory_bytes"] > 0
+
+    def test_integer_range_sum_limit(self, config_file):
+        """Test integers whose range sums overflow 64 bits are rejected."""
+        with pytest.raises(ValueError, match="64-bit"):
+            PersistentSegmentTree([2**62, 2**62], config_path=config_file)
+
+        tree = PersistentSegmentTree([0, 0], config_path=config_file)
+        limit = tree.value_limit
+        assert limit == (2**63 - 1) // 2
+        v1 = tree.update(0, 0, limit)
+        v2 = tree.update(v1, 1, limit)
+        assert tree.query_sum(v2, 0, 1) == 2 * limit
+        with pytest.raises(ValueError, match="64-bit"):
+            tree.update(0, 1, -limit - 1)
+
+    def test_failed_batch_creates_no_versions(self, config_file):
+        """Test a batch failing part way leaves versions unchanged."""
+        tree = PersistentSegmentTree([1, 2], config_path=config_file)
+        limit = tree.value_limit
+        with pytest.raises(ValueError):
+            tree.apply_updates([(0, 5), (1, limit), (1, 1)], accumulate=True)
+
+        assert tree.get_version_count() == 1
+        assert len(tree.versions) == 1
+        assert tree.update(0, 0, 9) == 1
+        assert tree.get_version_array(1) == [9, 2]
+
+    def test_float_values(self, config_file):
+        """Test float data uses float aggregates."""
+        tree = PersistentSegmentTree([1.5, -2.25, 1e20], config_path=config_file)
+        assert tree.query_sum(0, 0, 1) == -0.75
+        assert tree.query_min(0, 2, 2) == 1e20
+        assert tree.query_max(0, 0, 1) == 1.5
+
+        ints = PersistentSegmentTree([1, 2, 3], config_path=config_file)
+        v1 = ints.update(0, 1, 0.5)
+        assert ints.query_sum(0, 0, 2) == 6
+        assert ints.query_sum(v1, 0, 2) == 4.5
+        assert ints.query_min(v1, 0, 2) == 0.5
@@ -8,8 +8,9 @@ length by using rolling hash to efficiently compute hash values.
 
 import logging
 import logging.handlers
+import mmap
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
 import yaml
 from dotenv import load_dotenv
@@ -19,13 +20,16 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+Text = Union[str, bytes, bytearray, mmap.mmap]
+Pattern = Union[str, bytes, bytearray]
+
 
 class RabinKarpAlgorithm:
     """Rabin-Karp algorithm for efficient pattern matching with rolling hash."""
 
     def __init__(
         self,
-        text: str,
+        text: Text,
         base: int = 256,
         modulus: int = 101,
         config_path: str = "config.yaml",
@@ -33,7 +37,9 @@ class RabinKarpAlgorithm:
         """Initialize Rabin-Karp algorithm with text.
 
         Args:
-            text: Input text to search in.
+            text: Input text to search in. May be a str or a binary buffer
+                (bytes, bytearray or mmap); binary texts are scanned through
+                a memoryview so they are never copied into a str.
             base: Base for hash computation (default: 256).
             modulus: Modulus for hash computation (default: 101).
             config_path: Path to configuration YAML file.
@@ -47,6 +53,8 @@ class RabinKarpAlgorithm:
 
         self.text = text
         self.n = len(text)
+        self._is_str = isinstance(text, str)
+        self._view = None if self._is_str else memoryview(text)
         self.base = base
         self.modulus = modulus
         self._setup_logging()
@@ -57,6 +65,45 @@ class RabinKarpAlgorithm:
             f"base={base}, modulus={modulus}"
         )
 
+    @classmethod
+    def from_file(
+        cls,
+        file_path: str,
+        base: int = 256,
+        modulus: int = 101,
+        config_path: str = "config.yaml",
+    ) -> "RabinKarpAlgorithm":
+        """Create an instance that scans a file through a read-only mmap.
+
+        The file is never loaded into memory as a whole, so multi-gigabyte
+        inputs can be searched. Call close() when done to release the map.
+
+        Args:
+            file_path: Path to the file to search in.
+            base: Base for hash computation (default: 256).
+            modulus: Modulus for hash computation (default: 101).
+            config_path: Path to configuration YAML file.
+
+        Returns:
+            RabinKarpAlgorithm instance over the mapped file.
+
+        Raises:
+            ValueError: If file is empty.
+        """
+        with open(file_path, "rb") as f:
+            if Path(file_path).stat().st_size == 0:
+                raise ValueError("Text cannot be empty")
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(mapped, base=base, modulus=modulus, config_path=config_path)
+
+    def close(self) -> None:
+        """Release the memoryview and mmap backing a binary text, if any."""
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+        if isinstance(self.text, mmap.mmap) and not self.text.closed:
+            self.text.close()
+
     def _setup_logging(self) -> None:
         """Configure logging for the application."""
         log_dir = Path("logs")
@@ -92,11 +139,13 @@ class RabinKarpAlgorithm:
             logger.warning(f"Configuration file not found: {config_path}")
             return {}
 
-    def _compute_hash(self, string: str, start: int = 0, length: Optional[int] = None) -> int:
+    def _compute_hash(
+        self, string: Pattern, start: int = 0, length: Optional[int] = None
+    ) -> int:
         """Compute hash value for substring.
 
         Args:
-            string: Input string.
+            string: Input string, or binary buffer whose items are byte values.
             start: Start position (default: 0).
             length: Length of substring (default: len(string)).
 
@@ -106,9 +155,10 @@ class RabinKarpAlgorithm:
         if length is None:
             length = len(string) - start
 
+        code = ord if isinstance(string, str) else int
         hash_value = 0
         for i in range(start, start + length):
-            hash_value = (hash_value * self.base + ord(string[i])) % self.modulus
+            hash_value = (hash_value * self.base + code(string[i])) % self.modulus
 
         return hash_value
 
@@ -121,10 +171,53 @@ class RabinKarpAlgorithm:
         Returns:
             base^exponent mod modulus.
         """
-        result = 1
-        for _ in range(exponent):
-            result = (result * self.base) % self.modulus
-        return result
+        return pow(self.base, exponent, self.modulus)
+
+    def _normalize_pattern(self, pattern: Pattern) -> Pattern:
+        """Convert pattern to the representation used by the text.
+
+        Args:
+            pattern: Pattern to normalize.
+
+        Returns:
+            Pattern as str for str texts, or as bytes for binary texts
+            (str patterns are UTF-8 encoded).
+
+        Raises:
+            TypeError: If a binary pattern is searched in a str text.
+        """
+        if self._is_str:
+            if not isinstance(pattern, str):
+                raise TypeError("Pattern must be str when text is str")
+            return pattern
+        if isinstance(pattern, str):
+            return pattern.encode("utf-8")
+        return bytes(pattern)
+
+    def _text_source(self) -> Tuple[Union[str, memoryview], Callable]:
+        """Get indexable text source and symbol-code function.
+
+        Returns:
+            Tuple of (source, code) where code(source[i]) is the integer
+            symbol value at position i.
+        """
+        if self._is_str:
+            return self.text, ord
+        return self._view, int
+
+    def _matches_at(self, pattern: Pattern, position: int) -> bool:
+        """Check whether pattern occurs at position without slicing text.
+
+        Args:
+            pattern: Normalized pattern.
+            position: Start position in text.
+
+        Returns:
+            True if text contains pattern at position.
+        """
+        if self._is_str:
+            return self.text.startswith(pattern, position)
+        return self._view[position:position + len(pattern)] == pattern
 
     def search(
         self, pattern: str, verify_collisions: bool = True
@@ -144,32 +237,34 @@ class RabinKarpAlgorithm:
         if not pattern:
             raise ValueError("Pattern cannot be empty")
 
-        if len(pattern) > self.n:
+        needle = self._normalize_pattern(pattern)
+        if len(needle) > self.n:
             logger.info(f"Pattern '{pattern}' longer than text, not found")
             return []
 
         logger.info(f"Searching for pattern: {pattern}")
 
-        m = len(pattern)
-        pattern_hash = self._compute_hash(pattern)
+        m = len(needle)
+        pattern_hash = self._compute_hash(needle)
         occurrences: List[int] = []
 
         if m == 0:
             return occurrences
 
-        text_hash = self._compute_hash(self.text, 0, m)
+        source, code = self._text_source()
+        text_hash = self._compute_hash(source, 0, m)
         power = self._compute_power(m - 1)
 
         for i in range(self.n - m + 1):
             if pattern_hash == text_hash:
-                if not verify_collisions or self.text[i:i + m] == pattern:
+                if not verify_collisions or self._matches_at(needle, i):
                     occurrences.append(i)
                     logger.debug(f"Pattern found at position {i}")
 
             if i < self.n - m:
                 text_hash = (
-                    (text_hash - ord(self.text[i]) * power) * self.base
-                    + ord(self.text[i + m])
+                    (text_hash - code(source[i]) * power) * self.base
+                    + code(source[i + m])
                 ) % self.modulus
 
                 if text_hash < 0:
@@ -215,6 +310,84 @@ class RabinKarpAlgorithm:
         logger.info(f"Completed search for {len(patterns)} patterns")
         return results
 
+    def search_many(
+        self,
+        patterns: List[Pattern],
+        verify_collisions: bool = True,
+    ) -> Dict[Pattern, List[int]]:
+        """Search for many patterns with one rolling pass per pattern length.
+
+        Patterns are grouped by length and their hashes are stored in a
+        dictionary, so the text window is rolled once per distinct length
+        instead of once per pattern. Candidate matches are verified in place
+        (str.startswith or memoryview comparison) without slicing the text.
+
+        Args:
+            patterns: List of patterns to search for.
+            verify_collisions: Whether to verify hash collisions (default: True).
+
+        Returns:
+            Dictionary mapping pattern to list of occurrences. bytearray
+            patterns are keyed by their bytes value.
+
+        Raises:
+            ValueError: If patterns list is empty.
+        """
+        if not patterns:
+            raise ValueError("Patterns list cannot be empty")
+
+        results: Dict[Pattern, List[int]] = {}
+        # length -> pattern hash -> list of (original, normalized) patterns
+        groups: Dict[int, Dict[int, List[Tuple[Pattern, Pattern]]]] = {}
+
+        for pattern in patterns:
+            if isinstance(pattern, bytearray):
+                pattern = bytes(pattern)
+            if pattern in results:
+                continue
+            results[pattern] = []
+            if not pattern:
+                logger.warning("Empty pattern skipped")
+                continue
+            needle = self._normalize_pattern(pattern)
+            m = len(needle)
+            if m > self.n:
+                continue
+            buckets = groups.setdefault(m, {})
+            buckets.setdefault(self._compute_hash(needle), []).append(
+                (pattern, needle)
+            )
+
+        logger.info(
+            f"Searching for {len(results)} patterns in "
+            f"{len(groups)} length groups"
+        )
+
+        source, code = self._text_source()
+        base = self.base
+        modulus = self.modulus
+
+        for m, buckets in groups.items():
+            power = self._compute_power(m - 1)
+            text_hash = self._compute_hash(source, 0, m)
+            last = self.n - m
+
+            for i in range(last + 1):
+                candidates = buckets.get(text_hash)
+                if candidates is not None:
+                    for pattern, needle in candidates:
+                        if not verify_collisions or self._matches_at(needle, i):
+                            results[pattern].append(i)
+
+                if i < last:
+                    text_hash = (
+                        (text_hash - code(source[i]) * power) * base
+                        + code(source[i + m])
+                    ) % modulus
+
+        logger.info(f"Completed batched search for {len(results)} patterns")
+        return results
+
     def count_occurrences(
         self, pattern: str, verify_collisions: bool = True
     ) -> int:
@@ -287,11 +460,11 @@ class RabinKarpAlgorithm:
 
         return self._compute_hash(pattern)
 
-    def get_text(self) -> str:
+    def get_text(self) -> Text:
         """Get text string.
 
         Returns:
-            Text string.
+            Text string or binary buffer.
         """
         return self.text
 
@@ -348,6 +521,15 @@ def main() -> None:
     for pattern, occurrences in results.items():
         logger.info(f"  Pattern '{pattern}': {occurrences}")
 
+    logger.info("Batched search grouped by pattern length:")
+    results = rk.search_many(["ABAB", "ABCA", "AB", "CD"])
+    for pattern, occurrences in results.items():
+        logger.info(f"  Pattern '{pattern}': {occurrences}")
+
+    logger.info("Searching a binary buffer:")
+    binary_rk = RabinKarpAlgorithm(text.encode("ascii"), base=256, modulus=101)
+    logger.info(f"  search_many: {binary_rk.search_many([b'ABAB', b'ABC'])}")
+
 
 if __name__ == "__main__":
     main()
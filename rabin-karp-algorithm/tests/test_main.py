@@ -248,3 +248,74 @@ class TestRabinKarpAlgorithm:
         assert hash_a != hash_b
         assert 0 <= hash_a < 101
         assert 0 <= hash_b < 101
+
+    def test_search_many_matches_search(self, rk):
+        """Test batched search agrees with single-pattern search."""
+        patterns = ["ABAB", "ABC", "AB", "CD", "XYZ", "ABCA"]
+        results = rk.search_many(patterns)
+
+        assert set(results) == set(patterns)
+        for pattern in patterns:
+            assert results[pattern] == rk.search(pattern)
+
+    def test_search_many_empty_patterns(self, rk):
+        """Test batched search with empty patterns list."""
+        with pytest.raises(ValueError):
+            rk.search_many([])
+
+    def test_search_many_skips_empty_and_long_patterns(self, config_file):
+        """Test batched search with empty and overlong patterns."""
+        rk = RabinKarpAlgorithm("abc", config_path=config_file)
+        results = rk.search_many(["", "abcd", "b"])
+
+        assert results == {"": [], "abcd": [], "b": [1]}
+
+    def test_search_many_with_collisions(self, config_file):
+        """Test batched search verifies patterns sharing a hash bucket."""
+        rk = RabinKarpAlgorithm("abcabd", modulus=2, config_path=config_file)
+        results = rk.search_many(["abc", "abd", "bca"])
+
+        assert results == {"abc": [0], "abd": [3], "bca": [1]}
+
+    def test_search_bytes_text(self, config_file):
+        """Test searching a bytes text with bytes and str patterns."""
+        rk = RabinKarpAlgorithm(b"banana", config_path=config_file)
+
+        assert rk.search(b"ana") == [1, 3]
+        assert rk.search("nan") == [2]
+        assert rk.search_many([b"ana", b"ban"]) == {b"ana": [1, 3], b"ban": [0]}
+
+    def test_search_many_bytearray_patterns(self, config_file):
+        """Test bytearray patterns are keyed by their bytes value."""
+        rk = RabinKarpAlgorithm(b"abcabc", config_path=config_file)
+        results = rk.search_many([bytearray(b"abc"), b"abc", bytearray(b"ca")])
+
+        assert results == {b"abc": [0, 3], b"ca": [2]}
+
+    def test_search_str_text_rejects_bytes_pattern(self, rk):
+        """Test binary pattern against str text."""
+        with pytest.raises(TypeError):
+            rk.search(b"ABAB")
+
+    def test_from_file_mmap(self, temp_dir, config_file):
+        """Test scanning a memory-mapped file."""
+        file_path = temp_dir / "data.bin"
+        file_path.write_bytes(b"xxABABxxABAB")
+
+        rk = RabinKarpAlgorithm.from_file(str(file_path), config_path=config_file)
+        try:
+            assert rk.get_length() == 12
+            assert rk.search_many([b"ABAB", b"xx"]) == {
+                b"ABAB": [2, 8],
+                b"xx": [0, 6],
+            }
+        finally:
+            rk.close()
+
+    def test_from_file_empty(self, temp_dir, config_file):
+        """Test mapping an empty file."""
+        file_path = temp_dir / "empty.bin"
+        file_path.write_bytes(b"")
+
+        with pytest.raises(ValueError):
+            RabinKarpAlgorithm.from_file(str(file_path), config_path=config_file)
@@ -6,8 +6,15 @@ hashing capabilities.
 """
 
 import logging
+import math
 import sys
-from typing import List, Optional, Tuple
+from typing import List, Optional, Sequence, Tuple, Union
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
 
 logging.basicConfig(
     level=logging.INFO,
@@ -25,6 +32,7 @@ class RollingHash:
 
     DEFAULT_MODULI = [10**9 + 7, 10**9 + 9, 10**9 + 21]
     DEFAULT_BASE = 256
+    MERSENNE_61 = 2**61 - 1
 
     def __init__(
         self,
@@ -355,6 +363,372 @@ class RollingHash:
 
         return result
 
+    def build_prefix_table(
+        self, text: Union[str, bytes]
+    ) -> "PrefixHashTable":
+        """Build a vectorized prefix hash table for batched substring queries.
+
+        Args:
+            text: String or bytes to build prefix hashes for.
+
+        Returns:
+            PrefixHashTable holding (k, n + 1) uint64 prefix and power arrays.
+
+        Raises:
+            ImportError: If numpy is not available.
+            ValueError: If a modulus is unsupported by the vectorized backend.
+        """
+        return PrefixHashTable(self, text)
+
+
+class PrefixHashTable:
+    """Prefix hashes for all moduli stored as (k, n + 1) uint64 arrays.
+
+    Both tables are built with blocked vectorized modular arithmetic, so
+    construction is O(n) work with no per-character Python loop. Moduli up to 2^32 use plain uint64
+    arithmetic; the Mersenne prime 2^61 - 1 uses a split multiply with
+    shift-and-add reduction so a single modulus gives ~2^-61 collision odds.
+
+    Hash values agree with RollingHash.hash_substring for the same text.
+    """
+
+    def __init__(self, rolling_hash: RollingHash, text: Union[str, bytes]) -> None:
+        """Build prefix hash and power tables for text.
+
+        Args:
+            rolling_hash: RollingHash supplying moduli and base.
+            text: String or bytes to index.
+
+        Raises:
+            ImportError: If numpy is not available.
+            ValueError: If a modulus is neither <= 2^32 nor 2^61 - 1.
+        """
+        if not NUMPY_AVAILABLE:
+            raise ImportError(
+                "numpy is required for prefix hash tables. "
+                "Install it with: pip install numpy"
+            )
+
+        for modulus in rolling_hash.moduli:
+            if modulus > 2**32 and modulus != RollingHash.MERSENNE_61:
+                raise ValueError(
+                    f"Unsupported modulus {modulus}: vectorized tables need "
+                    f"moduli <= 2^32 or the Mersenne prime 2^61 - 1"
+                )
+
+        self.moduli: List[int] = list(rolling_hash.moduli)
+        self.num_moduli: int = len(self.moduli)
+        self.base: int = rolling_hash.base
+
+        if isinstance(text, str):
+            codes = np.frombuffer(
+                text.encode("utf-32-le", "surrogatepass"), dtype=np.uint32
+            )
+        else:
+            codes = np.frombuffer(bytes(text), dtype=np.uint8)
+        self.codes = codes.astype(np.uint64)
+        self.length: int = len(self.codes)
+
+        self._mods = np.array(self.moduli, dtype=np.uint64).reshape(-1, 1)
+        self._is_m61 = [m == RollingHash.MERSENNE_61 for m in self.moduli]
+
+        self.prefix, self.powers = self._build()
+
+        logger.debug(
+            f"Built prefix table: length={self.length}, moduli={self.moduli}"
+        )
+
+    def _mulmod_row(self, row: int, a: "np.ndarray", b: "np.ndarray") -> "np.ndarray":
+        """Multiply two arrays modulo the row's modulus.
+
+        Args:
+            row: Index of the modulus.
+            a: Left operand, values already reduced.
+            b: Right operand, values already reduced.
+
+        Returns:
+            (a * b) mod moduli[row] as uint64.
+        """
+        if not self._is_m61[row]:
+            return (a * b) % np.uint64(self.moduli[row])
+
+        mask31 = np.uint64((1 << 31) - 1)
+        mask30 = np.uint64((1 << 30) - 1)
+        s31 = np.uint64(31)
+        s30 = np.uint64(30)
+        a_hi, a_lo = a >> s31, a & mask31
+        b_hi, b_lo = b >> s31, b & mask31
+        # 2^62 == 2 and 2^61 == 1 (mod 2^61 - 1)
+        mid = a_hi * b_lo + a_lo * b_hi
+        total = (
+            ((a_hi * b_hi) << np.uint64(1))
+            + (mid >> s30)
+            + ((mid & mask30) << s31)
+            + a_lo * b_lo
+        )
+        return self._reduce_m61(total)
+
+    def _reduce_m61(self, x: "np.ndarray") -> "np.ndarray":
+        """Reduce values below 2^64 modulo 2^61 - 1 without division.
+
+        Args:
+            x: uint64 values.
+
+        Returns:
+            x mod (2^61 - 1).
+        """
+        p = np.uint64(RollingHash.MERSENNE_61)
+        x = (x & p) + (x >> np.uint64(61))
+        return np.where(x >= p, x - p, x)
+
+    def _addmod_row(self, row: int, a: "np.ndarray", b: "np.ndarray") -> "np.ndarray":
+        """Add two reduced arrays modulo the row's modulus.
+
+        Args:
+            row: Index of the modulus.
+            a: Left operand.
+            b: Right operand.
+
+        Returns:
+            (a + b) mod moduli[row].
+        """
+        p = np.uint64(self.moduli[row])
+        total = a + b
+        return np.where(total >= p, total - p, total)
+
+    def _build(self) -> Tuple["np.ndarray", "np.ndarray"]:
+        """Build prefix hashes and base powers with blocked vectorization.
+
+        The text is cut into ~sqrt(n) blocks. Local prefix hashes of all
+        blocks advance together one column at a time, the per-block carries
+        are chained with Python integers, and a final broadcast multiply
+        combines them. This is O(n) modular work in O(sqrt(n)) numpy calls.
+
+        Returns:
+            Tuple of (prefix, powers) arrays of shape (k, n + 1), where
+            prefix[:, i] hashes text[:i] and powers[:, i] is base^i.
+        """
+        n = self.length
+        block = max(1, math.isqrt(n))
+        num_blocks = -(-n // block)
+
+        padded = np.zeros(num_blocks * block, dtype=np.uint64)
+        padded[:n] = self.codes
+        padded = padded.reshape(num_blocks, block)
+
+        prefix = np.zeros((self.num_moduli, n + 1), dtype=np.uint64)
+        powers = np.ones((self.num_moduli, n + 1), dtype=np.uint64)
+
+        for row, modulus in enumerate(self.moduli):
+            base = self.base % modulus
+            base_u = np.uint64(base)
+
+            small = [1] * (block + 1)
+            for r in range(1, block + 1):
+                small[r] = small[r - 1] * base % modulus
+            block_power = small[block]
+            big = [1] * (num_blocks + 1)
+            for q in range(1, num_blocks + 1):
+                big[q] = big[q - 1] * block_power % modulus
+            small_u = np.array(small, dtype=np.uint64)
+            big_u = np.array(big, dtype=np.uint64)
+
+            chars = padded % np.uint64(modulus)
+            local = np.empty_like(chars)
+            local[:, 0] = chars[:, 0]
+            for r in range(1, block):
+                local[:, r] = self._addmod_row(
+                    row, self._mulmod_row(row, local[:, r - 1], base_u),
+                    chars[:, r],
+                )
+
+            carry = [0] * num_blocks
+            for q in range(1, num_blocks):
+                carry[q] = (
+                    carry[q - 1] * block_power + int(local[q - 1, -1])
+                ) % modulus
+            carry_u = np.array(carry, dtype=np.uint64).reshape(-1, 1)
+
+            combined = self._addmod_row(
+                row,
+                self._mulmod_row(row, carry_u, small_u[1:].reshape(1, -1)),
+                local,
+            )
+            prefix[row, 1:] = combined.reshape(-1)[:n]
+
+            power_grid = self._mulmod_row(
+                row, big_u.reshape(-1, 1), small_u[:block].reshape(1, -1)
+            )
+            powers[row] = power_grid.reshape(-1)[:n + 1]
+
+        return prefix, powers
+
+    def _check_bounds(
+        self, starts: "np.ndarray", lengths: "np.ndarray"
+    ) -> None:
+        """Validate substring ranges.
+
+        Args:
+            starts: Start indices.
+            lengths: Substring lengths.
+
+        Raises:
+            IndexError: If any range falls outside the text.
+        """
+        if starts.size and (
+            starts.min() < 0
+            or lengths.min() < 0
+            or (starts + lengths).max() > self.length
+        ):
+            raise IndexError(
+                f"Substring indices out of bounds for text_length={self.length}"
+            )
+
+    def substring_hashes(
+        self, starts: Sequence[int], lengths: Union[int, Sequence[int]]
+    ) -> "np.ndarray":
+        """Hash many substrings at once.
+
+        Args:
+            starts: Start indices of the substrings.
+            lengths: Substring lengths, either one per start or a single
+                length shared by all.
+
+        Returns:
+            uint64 array of shape (k, q) with one column per substring.
+
+        Raises:
+            IndexError: If any range falls outside the text.
+        """
+        starts = np.asarray(starts, dtype=np.int64)
+        lengths = np.broadcast_to(
+            np.asarray(lengths, dtype=np.int64), starts.shape
+        )
+        self._check_bounds(starts, lengths)
+
+        result = np.empty((self.num_moduli, starts.size), dtype=np.uint64)
+        for row, modulus in enumerate(self.moduli):
+            p = np.uint64(modulus)
+            end_hash = self.prefix[row, starts + lengths]
+            start_term = self._mulmod_row(
+                row, self.prefix[row, starts], self.powers[row, lengths]
+            )
+            diff = end_hash + p - start_term
+            result[row] = np.where(diff >= p, diff - p, diff)
+        return result
+
+    def compare_many(
+        self,
+        starts1: Sequence[int],
+        starts2: Sequence[int],
+        lengths: Union[int, Sequence[int]],
+        other: Optional["PrefixHashTable"] = None,
+    ) -> "np.ndarray":
+        """Compare many substring pairs by hash.
+
+        Equality is probabilistic: unequal substrings collide in every
+        modulus with probability about the product of 1 / modulus.
+
+        Args:
+            starts1: Start indices in this table's text.
+            starts2: Start indices in the other text.
+            lengths: Lengths of each pair, or one shared length.
+            other: Table of the second text (default: this table).
+
+        Returns:
+            Boolean array, True where the substrings are equal.
+
+        Raises:
+            IndexError: If any range falls outside its text.
+            ValueError: If other uses different moduli or base.
+        """
+        other = self._resolve_other(other)
+        hashes1 = self.substring_hashes(starts1, lengths)
+        hashes2 = other.substring_hashes(starts2, lengths)
+        return np.all(hashes1 == hashes2, axis=0)
+
+    def longest_common_prefix(
+        self,
+        starts1: Sequence[int],
+        starts2: Sequence[int],
+        other: Optional["PrefixHashTable"] = None,
+    ) -> "np.ndarray":
+        """Compute LCP lengths of many suffix pairs by vectorized binary search.
+
+        All pairs advance through the binary search together, so q queries
+        cost O(log n) batched hash comparisons.
+
+        Args:
+            starts1: Suffix start indices in this table's text.
+            starts2: Suffix start indices in the other text.
+            other: Table of the second text (default: this table).
+
+        Returns:
+            int64 array of longest common prefix lengths.
+
+        Raises:
+            IndexError: If any start falls outside its text.
+            ValueError: If other uses different moduli or base.
+        """
+        other = self._resolve_other(other)
+        starts1 = np.asarray(starts1, dtype=np.int64)
+        starts2 = np.asarray(starts2, dtype=np.int64)
+        self._check_bounds(starts1, np.zeros_like(starts1))
+        other._check_bounds(starts2, np.zeros_like(starts2))
+
+        low = np.zeros(starts1.shape, dtype=np.int64)
+        high = np.minimum(self.length - starts1, other.length - starts2)
+
+        active = low < high
+        while active.any():
+            idx = np.nonzero(active)[0]
+            mid = (low[idx] + high[idx] + 1) // 2
+            equal = self.compare_many(starts1[idx], starts2[idx], mid, other)
+            low[idx] = np.where(equal, mid, low[idx])
+            high[idx] = np.where(equal, high[idx], mid - 1)
+            active = low < high
+
+        return low
+
+    def compare_suffixes(self, i: int, j: int) -> int:
+        """Lexicographically compare two suffixes of the text.
+
+        Intended as a comparator for suffix sorting, e.g. with
+        functools.cmp_to_key.
+
+        Args:
+            i: Start of the first suffix.
+            j: Start of the second suffix.
+
+        Returns:
+            Negative, zero or positive as suffix i is less than, equal to
+            or greater than suffix j.
+        """
+        lcp = int(self.longest_common_prefix([i], [j])[0])
+        if i + lcp == self.length or j + lcp == self.length:
+            return (self.length - i) - (self.length - j)
+        return int(self.codes[i + lcp]) - int(self.codes[j + lcp])
+
+    def _resolve_other(
+        self, other: Optional["PrefixHashTable"]
+    ) -> "PrefixHashTable":
+        """Return the table to compare against, checking compatibility.
+
+        Args:
+            other: Candidate table, or None for this table.
+
+        Returns:
+            The table to use.
+
+        Raises:
+            ValueError: If other uses different moduli or base.
+        """
+        if other is None:
+            return self
+        if other.moduli != self.moduli or other.base != self.base:
+            raise ValueError("Prefix tables must share moduli and base")
+        return other
+
 
 def main() -> None:
     """Main function to run the rolling hash CLI interface."""
@@ -306,3 +306,92 @@ class TestRollingHash:
                 )
                 hash2 = rh.hash_substring(text, i, length)
                 assert hash1 == hash2
+
+    def test_prefix_table_matches_hash_substring(self) -> None:
+        """Test that vectorized prefix table agrees with direct hashing."""
+        rh = RollingHash()
+        text = "hello wörld, hello 世界"
+        table = rh.build_prefix_table(text)
+
+        assert table.prefix.shape == (3, len(text) + 1)
+        for i in range(len(text)):
+            for length in range(len(text) - i + 1):
+                hashes = table.substring_hashes([i], [length])[:, 0]
+                assert tuple(int(h) for h in hashes) == rh.hash_substring(
+                    text, i, length
+                )
+
+    def test_prefix_table_mersenne_61(self) -> None:
+        """Test Mersenne-61 fast path against Python integer arithmetic."""
+        rh = RollingHash(moduli=[RollingHash.MERSENNE_61, 101], base=1000003)
+        text = "the quick brown fox jumps over the lazy dog" * 3
+        table = rh.build_prefix_table(text)
+
+        for i in range(0, len(text), 7):
+            assert int(table.powers[0, i]) == pow(
+                1000003, i, RollingHash.MERSENNE_61
+            )
+            for length in {0, 1, min(5, len(text) - i), len(text) - i}:
+                hashes = table.substring_hashes([i], length)[:, 0]
+                assert tuple(int(h) for h in hashes) == rh.hash_substring(
+                    text, i, length
+                )
+
+    def test_prefix_table_empty_text(self) -> None:
+        """Test prefix table for empty text."""
+        rh = RollingHash()
+        table = rh.build_prefix_table("")
+        assert table.prefix.shape == (3, 1)
+        assert table.substring_hashes([0], [0]).shape == (3, 1)
+
+    def test_prefix_table_unsupported_modulus(self) -> None:
+        """Test that moduli too large for uint64 products are rejected."""
+        rh = RollingHash(moduli=[2**40 + 15])
+        with pytest.raises(ValueError, match="Unsupported modulus"):
+            rh.build_prefix_table("abc")
+
+    def test_substring_hashes_out_of_bounds(self) -> None:
+        """Test batched substring hashing bounds check."""
+        table = RollingHash().build_prefix_table("hello")
+        with pytest.raises(IndexError):
+            table.substring_hashes([0, 3], [2, 3])
+
+    def test_compare_many(self) -> None:
+        """Test batched substring comparison within and across texts."""
+        rh = RollingHash()
+        table1 = rh.build_prefix_table("hello world")
+        table2 = rh.build_prefix_table("world hello")
+
+        assert list(table1.compare_many([0, 0], [6, 1], 5)) == [False, False]
+        assert list(table1.compare_many([0, 6], [6, 0], 5, table2)) == [
+            True,
+            True,
+        ]
+
+    def test_compare_many_incompatible_tables(self) -> None:
+        """Test comparing tables with different moduli."""
+        table1 = RollingHash().build_prefix_table("abc")
+        table2 = RollingHash(moduli=[101]).build_prefix_table("abc")
+        with pytest.raises(ValueError, match="share moduli"):
+            table1.compare_many([0], [0], 3, table2)
+
+    def test_longest_common_prefix_batched(self) -> None:
+        """Test batched LCP against direct computation."""
+        rh = RollingHash()
+        text = "abracadabraabracadabra"
+        table = rh.build_prefix_table(text)
+        starts1 = [i for i in range(len(text)) for _ in range(len(text))]
+        starts2 = [j for _ in range(len(text)) for j in range(len(text))]
+
+        lcps = table.longest_common_prefix(starts1, starts2)
+        for i, j, lcp in zip(starts1, starts2, lcps):
+            assert lcp == rh.longest_common_prefix_hash(text, i, text, j)
+
+    def test_compare_suffixes_sorts_suffixes(self) -> None:
+        """Test suffix comparator produces the suffix array."""
+        from functools import cmp_to_key
+
+        text = "mississippi"
+        table = RollingHash().build_prefix_table(text)
+        order = sorted(range(len(text)), key=cmp_to_key(table.compare_suffixes))
+        assert order == sorted(range(len(text)), key=lambda i: text[i:])
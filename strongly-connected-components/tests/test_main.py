@@ -6,7 +6,7 @@ from pathlib import Path
 import pytest
 import yaml
 
-from src.main import StronglyConnectedComponents
+from src.main import CSRGraph, StronglyConnectedComponents
 
 
 class TestStronglyConnectedComponents:
@@ -284,3 +284,44 @@ class TestStronglyConnectedComponents:
         assert {0, 1} in scc_sets
         assert {2, 3, 4} in scc_sets
         assert {5, 6} in scc_sets
+
+    def test_find_sccs_csr_matches_edge_list(self, scc_finder):
+        """Test SCCs of a CSR graph match the edge-list result."""
+        edges = [(0, 1), (1, 2), (2, 0), (1, 3), (3, 4), (4, 3), (5, 4)]
+        csr = CSRGraph.from_edges(edges, directed=True, vertices=range(6))
+        assert scc_finder.find_sccs(csr) == scc_finder.find_sccs(edges, 6)
+        assert scc_finder.get_scc_count(csr) == 3
+
+    def test_find_sccs_csr_labels(self, scc_finder):
+        """Test SCCs of a labeled CSR graph are returned as labels."""
+        csr = CSRGraph.from_edges(
+            [("a", "b"), ("b", "a"), ("b", "c")], directed=True
+        )
+        sccs = scc_finder.find_sccs(csr)
+        assert sorted(sorted(scc) for scc in sccs) == [["a", "b"], ["c"]]
+
+    def test_find_sccs_csr_deep_cycle(self, scc_finder):
+        """Test a cycle longer than the recursion limit on a CSR graph."""
+        n = 20000
+        csr = CSRGraph.from_edges(
+            [(i, (i + 1) % n) for i in range(n)], directed=True
+        )
+        sccs = scc_finder.find_sccs(csr)
+        assert len(sccs) == 1
+        assert len(sccs[0]) == n
+
+    def test_find_sccs_csr_undirected_raises(self, scc_finder):
+        """Test undirected CSR graph raises ValueError."""
+        with pytest.raises(ValueError, match="directed"):
+            scc_finder.find_sccs(CSRGraph.from_edges([(0, 1)]))
+
+    def test_csr_save_load_roundtrip(self, scc_finder, temp_dir):
+        """Test SCCs of a memory-mapped CSR graph."""
+        path = temp_dir / "edges.txt"
+        path.write_text("0 1\n1 0\n1 2\n")
+        csr = CSRGraph.from_edge_list_file(str(path), directed=True)
+        csr.save(str(temp_dir / "graph.csr"))
+
+        with CSRGraph.load(str(temp_dir / "graph.csr")) as loaded:
+            assert loaded.num_edges == 3
+            assert scc_finder.find_sccs(loaded) == scc_finder.find_sccs(csr)
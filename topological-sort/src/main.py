@@ -5,12 +5,28 @@ directed acyclic graphs (DAGs) with cycle detection. It includes both
 Kahn's algorithm (BFS-based) and DFS-based approaches.
 """
 
+import json
 import logging
 import logging.handlers
+import mmap
+import struct
+import sys
 import time
+from array import array
 from collections import deque
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
 import yaml
 from dotenv import load_dotenv
@@ -21,6 +37,475 @@ load_dotenv()
 logger = logging.getLogger(__name__)
 
 
+class CSRGraph:
+    """Frozen graph in compressed sparse row (CSR) form.
+
+    Vertex labels are remapped to ids 0..n-1. The neighbors of id u are
+    targets[offsets[u]:offsets[u + 1]], with edge weights (if any) at the
+    same positions in weights. Arrays are stdlib ``array`` objects, or
+    read-only memoryviews over a memory-mapped file after load().
+    Undirected edges are stored once in each direction.
+    """
+
+    MAGIC = b"CSRG"
+    VERSION = 1
+    # magic, version, flags, reserved, num_vertices, num_edges
+    _HEADER = struct.Struct("<4sIIIqq")
+    _FLAG_DIRECTED = 1
+    _FLAG_WEIGHTED = 2
+    _FLAG_LABELS = 4
+    _FLAG_BIG_ENDIAN = 8
+
+    def __init__(
+        self,
+        offsets: Sequence[int],
+        targets: Sequence[int],
+        weights: Optional[Sequence[float]] = None,
+        labels: Optional[List[Any]] = None,
+        directed: bool = False,
+        num_edges: Optional[int] = None,
+    ) -> None:
+        """Initialize CSR graph from prebuilt arrays.
+
+        Args:
+            offsets: Row offsets, length num_vertices + 1.
+            targets: Neighbor ids, length offsets[-1].
+            weights: Optional edge weights aligned with targets.
+            labels: Vertex label per id, or None if labels are the ids.
+            directed: Whether edges are directed.
+            num_edges: Number of input edges (default: len(targets)).
+
+        Raises:
+            ValueError: If array lengths are inconsistent.
+        """
+        if len(offsets) == 0 or offsets[-1] != len(targets):
+            raise ValueError("offsets[-1] must equal the number of targets")
+        if weights is not None and len(weights) != len(targets):
+            raise ValueError("weights must align with targets")
+        if labels is not None and len(labels) != len(offsets) - 1:
+            raise ValueError("labels must have one entry per vertex")
+
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.labels = labels
+        self.directed = directed
+        self.num_vertices = len(offsets) - 1
+        self.num_edges = len(targets) if num_edges is None else num_edges
+        self._index: Optional[Dict[Any, int]] = (
+            None if labels is None else {label: i for i, label in enumerate(labels)}
+        )
+        self._mmap: Optional[mmap.mmap] = None
+
+    @staticmethod
+    def _compact_labels(labels: List[Any]) -> Optional[List[Any]]:
+        """Drop the label table when labels are exactly the ids 0..n-1."""
+        if all(type(label) is int and label == i for i, label in enumerate(labels)):
+            return None
+        return labels
+
+    @classmethod
+    def from_edges(
+        cls,
+        edges: Iterable[Tuple[Any, ...]],
+        directed: bool = False,
+        weighted: bool = False,
+        vertices: Optional[Iterable[Any]] = None,
+    ) -> "CSRGraph":
+        """Bulk-load a CSR graph from an edge list.
+
+        Labels get ids in order of first appearance (vertices first, if
+        given). Neighbor order follows edge order, so traversals match the
+        adjacency-list graph built from the same edges. If the labels turn
+        out to be exactly 0..n-1 no label table is kept.
+
+        Args:
+            edges: (u, v) pairs, or (u, v, weight) triples if weighted.
+            directed: Whether edges are directed.
+            weighted: Whether edges carry a weight.
+            vertices: Optional vertices to include even if isolated.
+
+        Returns:
+            CSRGraph instance.
+        """
+        index: Dict[Any, int] = {}
+        labels: List[Any] = []
+        if vertices is not None:
+            for vertex in vertices:
+                if vertex not in index:
+                    index[vertex] = len(labels)
+                    labels.append(vertex)
+
+        sources = array("i")
+        dests = array("i")
+        edge_weights = array("d") if weighted else None
+        num_edges = 0
+        for edge in edges:
+            u, v = edge[0], edge[1]
+            for vertex in (u, v):
+                if vertex not in index:
+                    index[vertex] = len(labels)
+                    labels.append(vertex)
+            ui = index[u]
+            vi = index[v]
+            sources.append(ui)
+            dests.append(vi)
+            if weighted:
+                edge_weights.append(edge[2])
+            if not directed and ui != vi:
+                sources.append(vi)
+                dests.append(ui)
+                if weighted:
+                    edge_weights.append(edge[2])
+            num_edges += 1
+
+        n = len(labels)
+        counts = [0] * (n + 1)
+        for u in sources:
+            counts[u + 1] += 1
+        for u in range(n):
+            counts[u + 1] += counts[u]
+        offsets = array("q", counts)
+
+        position = counts[:-1]
+        targets = array("i", bytes(4 * len(dests)))
+        weights = array("d", bytes(8 * len(dests))) if weighted else None
+        for k, u in enumerate(sources):
+            p = position[u]
+            targets[p] = dests[k]
+            if weighted:
+                weights[p] = edge_weights[k]
+            position[u] = p + 1
+
+        logger.info(f"Built CSR graph: {n} vertices, {num_edges} edges")
+        return cls(
+            offsets,
+            targets,
+            weights=weights,
+            labels=cls._compact_labels(labels),
+            directed=directed,
+            num_edges=num_edges,
+        )
+
+    @classmethod
+    def from_edge_list_file(
+        cls,
+        path: str,
+        directed: bool = False,
+        weighted: bool = False,
+        numeric_ids: bool = True,
+        comment: str = "#",
+    ) -> "CSRGraph":
+        """Bulk-load a CSR graph from a whitespace-separated edge list file.
+
+        Each line is "u v" or "u v weight"; blank lines and lines starting
+        with the comment prefix are skipped.
+
+        Args:
+            path: Path to edge list file.
+            directed: Whether edges are directed.
+            weighted: Whether each line has a third weight column.
+            numeric_ids: Parse vertex labels as int (default: True).
+            comment: Comment line prefix (default: "#").
+
+        Returns:
+            CSRGraph instance.
+
+        Raises:
+            ValueError: If a line has too few columns.
+        """
+        parse_id = int if numeric_ids else str
+
+        def read_edges() -> Iterator[Tuple[Any, ...]]:
+            with open(path, "r", encoding="utf-8") as f:
+                for line_number, line in enumerate(f, 1):
+                    fields = line.split()
+                    if not fields or fields[0].startswith(comment):
+                        continue
+                    if len(fields) < (3 if weighted else 2):
+                        raise ValueError(
+                            f"Line {line_number}: expected "
+                            f"{'u v weight' if weighted else 'u v'}"
+                        )
+                    u = parse_id(fields[0])
+                    v = parse_id(fields[1])
+                    if weighted:
+                        yield u, v, float(fields[2])
+                    else:
+                        yield u, v
+
+        return cls.from_edges(read_edges(), directed=directed, weighted=weighted)
+
+    def save(self, path: str) -> None:
+        """Save graph in the binary CSR format.
+
+        The file holds a 32-byte header, then offsets (int64), targets
+        (int32), weights (float64, if weighted) in native byte order, then
+        the label table as JSON if labels are not the ids.
+
+        Args:
+            path: Output file path.
+        """
+        flags = 0
+        if self.directed:
+            flags |= self._FLAG_DIRECTED
+        if self.weights is not None:
+            flags |= self._FLAG_WEIGHTED
+        if self.labels is not None:
+            flags |= self._FLAG_LABELS
+        if sys.byteorder == "big":
+            flags |= self._FLAG_BIG_ENDIAN
+
+        output_file = Path(path)
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_file, "wb") as f:
+            f.write(
+                self._HEADER.pack(
+                    self.MAGIC,
+                    self.VERSION,
+                    flags,
+                    0,
+                    self.num_vertices,
+                    self.num_edges,
+                )
+            )
+            f.write(array("q", self.offsets).tobytes())
+            f.write(array("i", self.targets).tobytes())
+            if self.weights is not None:
+                f.write(array("d", self.weights).tobytes())
+            if self.labels is not None:
+                f.write(json.dumps(self.labels).encode("utf-8"))
+        logger.info(f"Saved CSR graph to {path}")
+
+    @classmethod
+    def load(cls, path: str, use_mmap: bool = True) -> "CSRGraph":
+        """Load a graph saved with save().
+
+        With use_mmap the arrays are zero-copy memoryviews over a read-only
+        memory map, so only the pages a traversal touches are read. Call
+        close() (or use the graph as a context manager) to release it.
+
+        Args:
+            path: File path.
+            use_mmap: Memory-map the file instead of reading it (default:
+                True).
+
+        Returns:
+            CSRGraph instance.
+
+        Raises:
+            ValueError: If the file is not a CSR graph file or was written
+                with a different byte order.
+        """
+        with open(path, "rb") as f:
+            if use_mmap:
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                buffer = f.read()
+
+        header_size = cls._HEADER.size
+        if len(buffer) < header_size:
+            raise ValueError(f"Not a CSR graph file: {path}")
+        magic, version, flags, _, num_vertices, num_edges = cls._HEADER.unpack_from(
+            buffer, 0
+        )
+        if magic != cls.MAGIC or version != cls.VERSION:
+            raise ValueError(f"Not a CSR graph file: {path}")
+        if bool(flags & cls._FLAG_BIG_ENDIAN) != (sys.byteorder == "big"):
+            raise ValueError(f"CSR graph file has foreign byte order: {path}")
+
+        view = memoryview(buffer)
+        position = header_size
+        end = position + 8 * (num_vertices + 1)
+        offsets = view[position:end].cast("q")
+        num_arcs = offsets[-1]
+        position, end = end, end + 4 * num_arcs
+        targets = view[position:end].cast("i")
+        weights = None
+        if flags & cls._FLAG_WEIGHTED:
+            position, end = end, end + 8 * num_arcs
+            weights = view[position:end].cast("d")
+        labels = None
+        if flags & cls._FLAG_LABELS:
+            labels = [
+                tuple(label) if isinstance(label, list) else label
+                for label in json.loads(bytes(view[end:]).decode("utf-8"))
+            ]
+
+        if not use_mmap:
+            offsets = array("q", offsets)
+            targets = array("i", targets)
+            if weights is not None:
+                weights = array("d", weights)
+
+        graph = cls(
+            offsets,
+            targets,
+            weights=weights,
+            labels=labels,
+            directed=bool(flags & cls._FLAG_DIRECTED),
+            num_edges=num_edges,
+        )
+        if use_mmap:
+            graph._mmap = buffer
+        logger.info(
+            f"Loaded CSR graph from {path}: {num_vertices} vertices, "
+            f"{num_edges} edges{' (mmap)' if use_mmap else ''}"
+        )
+        return graph
+
+    def close(self) -> None:
+        """Release the memory map held by a graph from load()."""
+        if self._mmap is None:
+            return
+        for name in ("offsets", "targets", "weights"):
+            data = getattr(self, name)
+            if isinstance(data, memoryview):
+                data.release()
+        self._mmap.close()
+        self._mmap = None
+
+    def __enter__(self) -> "CSRGraph":
+        """Enter context manager."""
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Exit context manager, releasing any memory map."""
+        self.close()
+
+    def __contains__(self, vertex: Any) -> bool:
+        """Check whether a vertex label is in the graph."""
+        if self._index is not None:
+            return vertex in self._index
+        return type(vertex) is int and 0 <= vertex < self.num_vertices
+
+    def index_of(self, vertex: Any) -> int:
+        """Get the id of a vertex label.
+
+        Args:
+            vertex: Vertex label.
+
+        Returns:
+            Vertex id.
+
+        Raises:
+            ValueError: If vertex not in graph.
+        """
+        if vertex not in self:
+            raise ValueError(f"Vertex {vertex} not in graph")
+        return vertex if self._index is None else self._index[vertex]
+
+    def label_of(self, index: int) -> Any:
+        """Get the label of a vertex id.
+
+        Args:
+            index: Vertex id.
+
+        Returns:
+            Vertex label.
+        """
+        return index if self.labels is None else self.labels[index]
+
+    def labels_of(self, indices: Iterable[int]) -> List[Any]:
+        """Map vertex ids to labels.
+
+        Args:
+            indices: Vertex ids.
+
+        Returns:
+            List of vertex labels.
+        """
+        if self.labels is None:
+            return list(indices)
+        labels = self.labels
+        return [labels[i] for i in indices]
+
+    def neighbors(self, index: int) -> Sequence[int]:
+        """Get neighbor ids of a vertex id.
+
+        Args:
+            index: Vertex id.
+
+        Returns:
+            Slice of targets holding the neighbor ids.
+        """
+        return self.targets[self.offsets[index]:self.offsets[index + 1]]
+
+    def get_vertices(self) -> List[Any]:
+        """Get all vertex labels in id order.
+
+        Returns:
+            List of vertex labels.
+        """
+        if self.labels is None:
+            return list(range(self.num_vertices))
+        return list(self.labels)
+
+    def get_neighbors(self, vertex: Any) -> List[Any]:
+        """Get neighbor labels of a vertex label.
+
+        Args:
+            vertex: Vertex label.
+
+        Returns:
+            List of neighboring vertex labels.
+        """
+        return self.labels_of(self.neighbors(self.index_of(vertex)))
+
+    def transpose(self) -> "CSRGraph":
+        """Build the graph with every arc reversed.
+
+        Each row of the result lists its sources in increasing id order.
+
+        Returns:
+            New CSRGraph sharing this graph's labels.
+        """
+        n = self.num_vertices
+        offsets = self.offsets
+        targets = self.targets
+        weights = self.weights
+        counts = [0] * (n + 1)
+        for v in targets:
+            counts[v + 1] += 1
+        for v in range(n):
+            counts[v + 1] += counts[v]
+
+        position = counts[:-1]
+        reversed_targets = array("i", bytes(4 * len(targets)))
+        reversed_weights = (
+            None if weights is None else array("d", bytes(8 * len(targets)))
+        )
+        for u in range(n):
+            for p in range(offsets[u], offsets[u + 1]):
+                v = targets[p]
+                q = position[v]
+                reversed_targets[q] = u
+                if weights is not None:
+                    reversed_weights[q] = weights[p]
+                position[v] = q + 1
+
+        return type(self)(
+            array("q", counts),
+            reversed_targets,
+            weights=reversed_weights,
+            labels=self.labels,
+            directed=self.directed,
+            num_edges=self.num_edges,
+        )
+
+    def memory_bytes(self) -> int:
+        """Get the size of the CSR arrays in bytes.
+
+        Returns:
+            Bytes used by offsets, targets and weights (label table
+            excluded).
+        """
+        total = 8 * len(self.offsets) + 4 * len(self.targets)
+        if self.weights is not None:
+            total += 8 * len(self.weights)
+        return total
+
+
 class TopologicalSort:
     """Implements topological sort with cycle detection for DAGs."""
 
@@ -162,7 +647,9 @@ class TopologicalSort:
         return in_degrees
 
     def sort_kahn(
-        self, edges: List[Tuple[int, int]], num_vertices: Optional[int] = None
+        self,
+        edges: Union[List[Tuple[int, int]], CSRGraph],
+        num_vertices: Optional[int] = None,
     ) -> Tuple[Optional[List[int]], bool]:
         """Perform topological sort using Kahn's algorithm (BFS-based).
 
@@ -171,7 +658,9 @@ class TopologicalSort:
         If not, a cycle exists.
 
         Args:
-            edges: List of (source, destination) tuples representing edges.
+            edges: List of (source, destination) tuples representing edges,
+                or a directed CSRGraph (then num_vertices is ignored and
+                results hold its vertex labels).
             num_vertices: Number of vertices. If None, inferred from edges.
 
         Returns:
@@ -182,6 +671,9 @@ class TopologicalSort:
         Raises:
             ValueError: If inputs are invalid.
         """
+        if isinstance(edges, CSRGraph):
+            return self._sort_kahn_csr(edges)
+
         adjacency_list, vertices = self._build_graph(edges, num_vertices)
 
         if not vertices:
@@ -282,7 +774,9 @@ class TopologicalSort:
         return False
 
     def sort_dfs(
-        self, edges: List[Tuple[int, int]], num_vertices: Optional[int] = None
+        self,
+        edges: Union[List[Tuple[int, int]], CSRGraph],
+        num_vertices: Optional[int] = None,
     ) -> Tuple[Optional[List[int]], bool]:
         """Perform topological sort using DFS-based algorithm.
 
@@ -291,7 +785,9 @@ class TopologicalSort:
         after all their descendants are processed.
 
         Args:
-            edges: List of (source, destination) tuples representing edges.
+            edges: List of (source, destination) tuples representing edges,
+                or a directed CSRGraph (then num_vertices is ignored and
+                results hold its vertex labels).
             num_vertices: Number of vertices. If None, inferred from edges.
 
         Returns:
@@ -302,6 +798,9 @@ class TopologicalSort:
         Raises:
             ValueError: If inputs are invalid.
         """
+        if isinstance(edges, CSRGraph):
+            return self._sort_dfs_csr(edges)
+
         adjacency_list, vertices = self._build_graph(edges, num_vertices)
 
         if not vertices:
@@ -337,7 +836,9 @@ class TopologicalSort:
         return topological_order, False
 
     def detect_cycle(
-        self, edges: List[Tuple[int, int]], num_vertices: Optional[int] = None
+        self,
+        edges: Union[List[Tuple[int, int]], CSRGraph],
+        num_vertices: Optional[int] = None,
     ) -> Tuple[bool, Optional[List[int]]]:
         """Detect cycles in directed graph.
 
@@ -345,7 +846,9 @@ class TopologicalSort:
         attempts to return cycle path.
 
         Args:
-            edges: List of (source, destination) tuples representing edges.
+            edges: List of (source, destination) tuples representing edges,
+                or a directed CSRGraph (then num_vertices is ignored and
+                results hold its vertex labels).
             num_vertices: Number of vertices. If None, inferred from edges.
 
         Returns:
@@ -353,6 +856,19 @@ class TopologicalSort:
                 - Boolean indicating if cycle exists
                 - Cycle path if cycle found, None otherwise
         """
+        if isinstance(edges, CSRGraph):
+            self._check_directed(edges)
+            if edges.num_vertices == 0:
+                return False, None
+            logger.info(f"Cycle detection: {edges.num_vertices} vertices")
+            _, cycle = self._dfs_csr(edges)
+            if cycle is None:
+                logger.info("No cycle detected")
+                return False, None
+            cycle_path = edges.labels_of(cycle)
+            logger.warning(f"Cycle detected: {cycle_path}")
+            return True, cycle_path
+
         adjacency_list, vertices = self._build_graph(edges, num_vertices)
 
         if not vertices:
@@ -399,6 +915,128 @@ class TopologicalSort:
         logger.info("No cycle detected")
         return False, None
 
+    def _check_directed(self, graph: CSRGraph) -> None:
+        """Raise ValueError unless graph is directed."""
+        if not graph.directed:
+            raise ValueError("Topological sort requires a directed graph")
+
+    def _sort_kahn_csr(self, graph: CSRGraph) -> Tuple[Optional[List[Any]], bool]:
+        """Run Kahn's algorithm over CSR arrays; see sort_kahn().
+
+        In-degrees live in a flat int array indexed by vertex id and the
+        output list doubles as the queue.
+        """
+        self._check_directed(graph)
+        n = graph.num_vertices
+        if n == 0:
+            logger.info("Empty graph: returning empty topological order")
+            return [], False
+
+        logger.info(
+            f"Kahn's algorithm on CSR graph: {n} vertices, {graph.num_edges} edges"
+        )
+
+        offsets = graph.offsets
+        targets = graph.targets
+        in_degrees = array("i", bytes(4 * n))
+        for neighbor in targets:
+            in_degrees[neighbor] += 1
+
+        order = [v for v in range(n) if in_degrees[v] == 0]
+        head = 0
+        while head < len(order):
+            current = order[head]
+            head += 1
+            for neighbor in targets[offsets[current]:offsets[current + 1]]:
+                in_degrees[neighbor] -= 1
+                if in_degrees[neighbor] == 0:
+                    order.append(neighbor)
+
+        if len(order) != n:
+            logger.warning(
+                f"Cycle detected: only {len(order)}/{n} vertices processed"
+            )
+            return None, True
+
+        logger.info(f"Topological order found ({n} vertices)")
+        return graph.labels_of(order), False
+
+    def _dfs_csr(self, graph: CSRGraph) -> Tuple[List[int], Optional[List[int]]]:
+        """Iterative DFS over CSR arrays that stops at the first back edge.
+
+        Keeps an explicit stack of vertices with a cursor into each one's
+        row, so visit order matches the recursive DFS without its depth
+        limit.
+
+        Args:
+            graph: Directed CSR graph.
+
+        Returns:
+            Tuple of (finish_order, cycle): vertex ids in order of finishing
+            time, and the ids on the first cycle found (ending with the
+            vertex the back edge points to), or None if acyclic.
+        """
+        offsets = graph.offsets
+        targets = graph.targets
+        # 0 = unvisited, 1 = on the DFS stack, 2 = finished
+        state = bytearray(graph.num_vertices)
+        finish_order: List[int] = []
+
+        for root in range(graph.num_vertices):
+            if state[root]:
+                continue
+            state[root] = 1
+            stack = [root]
+            cursors = [offsets[root]]
+            while stack:
+                vertex = stack[-1]
+                position = cursors[-1]
+                end = offsets[vertex + 1]
+                while position < end and state[targets[position]] == 2:
+                    position += 1
+                if position == end:
+                    state[vertex] = 2
+                    finish_order.append(stack.pop())
+                    cursors.pop()
+                    continue
+
+                neighbor = targets[position]
+                cursors[-1] = position + 1
+                if state[neighbor] == 1:
+                    logger.debug(
+                        f"    Cycle detected: back edge from {vertex} "
+                        f"to {neighbor}"
+                    )
+                    cycle = stack[stack.index(neighbor) + 1:]
+                    cycle.append(neighbor)
+                    return finish_order, cycle
+                state[neighbor] = 1
+                stack.append(neighbor)
+                cursors.append(offsets[neighbor])
+
+        return finish_order, None
+
+    def _sort_dfs_csr(self, graph: CSRGraph) -> Tuple[Optional[List[Any]], bool]:
+        """Run DFS-based topological sort over CSR arrays; see sort_dfs()."""
+        self._check_directed(graph)
+        n = graph.num_vertices
+        if n == 0:
+            logger.info("Empty graph: returning empty topological order")
+            return [], False
+
+        logger.info(
+            f"DFS algorithm on CSR graph: {n} vertices, {graph.num_edges} edges"
+        )
+
+        finish_order, cycle = self._dfs_csr(graph)
+        if cycle is not None:
+            logger.warning("Cycle detected during DFS traversal")
+            return None, True
+
+        finish_order.reverse()
+        logger.info(f"Topological order found ({n} vertices)")
+        return graph.labels_of(finish_order), False
+
     def compare_approaches(
         self,
         edges: List[Tuple[int, int]],
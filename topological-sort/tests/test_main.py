@@ -6,7 +6,7 @@ from pathlib import Path
 import pytest
 import yaml
 
-from src.main import TopologicalSort
+from src.main import CSRGraph, TopologicalSort
 
 
 class TestTopologicalSort:
@@ -336,3 +336,53 @@ class TestTopologicalSort:
         assert len(order) == 21
         for i in range(20):
             assert order.index(i) < order.index(i + 1)
+
+    def test_csr_matches_edge_list(self, solver):
+        """Test CSR graph gives the same orders as the edge list."""
+        edges = [(5, 2), (5, 0), (4, 0), (4, 1), (2, 3), (3, 1)]
+        csr = CSRGraph.from_edges(edges, directed=True, vertices=range(6))
+        assert solver.sort_kahn(csr) == solver.sort_kahn(edges, 6)
+        assert solver.sort_dfs(csr) == solver.sort_dfs(edges, 6)
+        assert solver.detect_cycle(csr) == (False, None)
+
+    def test_csr_cycle(self, solver):
+        """Test cycle detection on a CSR graph."""
+        edges = [(0, 1), (1, 2), (2, 3), (3, 1)]
+        csr = CSRGraph.from_edges(edges, directed=True)
+        assert solver.sort_kahn(csr) == (None, True)
+        assert solver.sort_dfs(csr) == (None, True)
+        assert solver.detect_cycle(csr) == solver.detect_cycle(edges)
+        assert solver.detect_cycle(csr) == (True, [2, 3, 1])
+
+    def test_csr_labels(self, solver):
+        """Test labeled CSR graph returns labels in topological order."""
+        csr = CSRGraph.from_edges(
+            [("shirt", "tie"), ("tie", "jacket"), ("pants", "jacket")],
+            directed=True,
+        )
+        assert solver.sort_kahn(csr) == (["shirt", "pants", "tie", "jacket"], False)
+        assert solver.sort_dfs(csr) == (["pants", "shirt", "tie", "jacket"], False)
+
+    def test_csr_deep_chain(self, solver):
+        """Test a chain longer than the recursion limit on a CSR graph."""
+        n = 20000
+        csr = CSRGraph.from_edges([(i, i + 1) for i in range(n - 1)], directed=True)
+        order, has_cycle = solver.sort_dfs(csr)
+        assert has_cycle is False
+        assert order == list(range(n))
+
+    def test_csr_undirected_raises(self, solver):
+        """Test undirected CSR graph raises ValueError."""
+        with pytest.raises(ValueError, match="directed"):
+            solver.sort_kahn(CSRGraph.from_edges([(0, 1)]))
+
+    @pytest.mark.parametrize("use_mmap", [True, False])
+    def test_csr_save_load_roundtrip(self, solver, temp_dir, use_mmap):
+        """Test topological sort of a loaded CSR graph."""
+        path = temp_dir / "edges.txt"
+        path.write_text("# deps\n0 1\n0 2\n1 3\n2 3\n")
+        csr = CSRGraph.from_edge_list_file(str(path), directed=True)
+        csr.save(str(temp_dir / "graph.csr"))
+
+        with CSRGraph.load(str(temp_dir / "graph.csr"), use_mmap=use_mmap) as loaded:
+            assert solver.sort_kahn(loaded) == ([0, 1, 2, 3], False)
@@ -6,11 +6,16 @@ A trie is a tree-like data structure that stores strings in a way that
 allows efficient prefix searches.
 """
 
+import bisect
+import heapq
 import logging
 import logging.handlers
 import time
+import tracemalloc
+from array import array
+from collections import deque
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import yaml
 from dotenv import load_dotenv
@@ -22,13 +27,20 @@ logger = logging.getLogger(__name__)
 
 
 class TrieNode:
-    """Node in the trie data structure."""
+    """Node in the trie data structure.
+
+    Uses __slots__ so each node carries no per-instance __dict__.
+    """
+
+    __slots__ = ("children", "is_end_of_word", "word_count", "weight", "max_weight")
 
     def __init__(self) -> None:
         """Initialize TrieNode."""
         self.children: Dict[str, "TrieNode"] = {}
         self.is_end_of_word = False
         self.word_count = 0
+        self.weight = 0.0
+        self.max_weight = float("-inf")
 
     def __repr__(self) -> str:
         """String representation."""
@@ -102,11 +114,14 @@ class Trie:
             ],
         )
 
-    def insert(self, word: str) -> None:
+    def insert(self, word: str, weight: Optional[float] = None) -> None:
         """Insert word into trie.
 
         Args:
             word: Word to insert.
+            weight: Optional ranking weight for autocomplete_top_k(). New
+                words default to 0.0; re-inserting without a weight keeps
+                the existing one.
         """
         if not word:
             logger.warning("Attempted to insert empty word")
@@ -115,17 +130,45 @@ class Trie:
         current = self.root
         logger.debug(f"Inserting word: {word}")
 
+        path = [current]
         for char in word:
             if char not in current.children:
                 current.children[char] = TrieNode()
                 logger.debug(f"  Created node for character '{char}'")
             current = current.children[char]
-            current.word_count += 1
+            path.append(current)
 
         if not current.is_end_of_word:
+            for node in path[1:]:
+                node.word_count += 1
             current.is_end_of_word = True
+            current.weight = 0.0 if weight is None else weight
             self.total_words += 1
             logger.debug(f"  Marked end of word, total words: {self.total_words}")
+        elif weight is not None:
+            old_weight = current.weight
+            current.weight = weight
+            if weight < old_weight:
+                self._refresh_max_weights(path)
+                return
+
+        # Cached subtree maxima only grow on this path
+        for node in path:
+            if current.weight > node.max_weight:
+                node.max_weight = current.weight
+
+    def _refresh_max_weights(self, path: List[TrieNode]) -> None:
+        """Recompute cached subtree max-weights bottom-up along a path.
+
+        Args:
+            path: Nodes from the root down to the changed node.
+        """
+        for node in reversed(path):
+            best = node.weight if node.is_end_of_word else float("-inf")
+            for child in node.children.values():
+                if child.max_weight > best:
+                    best = child.max_weight
+            node.max_weight = best
 
     def search(self, word: str) -> bool:
         """Search for exact word in trie.
@@ -187,17 +230,28 @@ class Trie:
             words: List to collect words.
             limit: Maximum number of words to collect (None for all).
         """
-        if limit is not None and len(words) >= limit:
-            return
-
-        if node.is_end_of_word:
-            words.append(prefix)
-            logger.debug(f"    Collected word: {prefix}")
+        # Iterative DFS over a shared character path; strings are only
+        # joined for terminal nodes instead of rebuilt at every level
+        path: List[str] = []
+        stack: List[Tuple[TrieNode, int, str]] = [(node, 0, "")]
 
-        for char, child_node in sorted(node.children.items()):
+        while stack:
             if limit is not None and len(words) >= limit:
-                break
-            self._collect_words(child_node, prefix + char, words, limit)
+                return
+            current, depth, char = stack.pop()
+            if depth:
+                del path[depth - 1:]
+                path.append(char)
+
+            if current.is_end_of_word:
+                word = prefix + "".join(path)
+                words.append(word)
+                logger.debug(f"    Collected word: {word}")
+
+            for child_char in sorted(current.children, reverse=True):
+                stack.append(
+                    (current.children[child_char], depth + 1, child_char)
+                )
 
     def autocomplete(
         self, prefix: str, limit: Optional[int] = None
@@ -234,6 +288,48 @@ class Trie:
         logger.info(f"  Found {len(words)} suggestions")
         return words
 
+    def autocomplete_top_k(self, prefix: str, k: int) -> List[str]:
+        """Get the k highest-weight completions of a prefix.
+
+        Best-first search keyed on each node's cached subtree max-weight:
+        a subtree is only expanded while it can still beat the words
+        already found, so the cost depends on k rather than the number of
+        completions.
+
+        Args:
+            prefix: Prefix to autocomplete.
+            k: Number of suggestions to return.
+
+        Returns:
+            Up to k words ordered by weight (descending), ties broken
+            lexicographically.
+        """
+        current = self.root
+        for char in prefix:
+            if char not in current.children:
+                return []
+            current = current.children[char]
+
+        # Heap entries: (-key, text, kind, node); kind 0 is a finished word
+        # and sorts before a subtree with the same key and text
+        heap: List[Tuple[float, str, int, Optional[TrieNode]]] = []
+        if current.max_weight != float("-inf"):
+            heap.append((-current.max_weight, prefix, 1, current))
+
+        words: List[str] = []
+        while heap and len(words) < k:
+            neg_key, text, kind, node = heapq.heappop(heap)
+            if kind == 0:
+                words.append(text)
+                continue
+            if node.is_end_of_word:
+                heapq.heappush(heap, (-node.weight, text, 0, None))
+            for char, child in node.children.items():
+                heapq.heappush(heap, (-child.max_weight, text + char, 1, child))
+
+        logger.info(f"Top-{k} autocomplete for '{prefix}': {len(words)} words")
+        return words
+
     def delete(self, word: str) -> bool:
         """Delete word from trie.
 
@@ -246,34 +342,34 @@ class Trie:
         if not word:
             return False
 
-        def _delete_helper(node: TrieNode, word: str, index: int) -> bool:
-            """Recursive helper to delete word."""
-            if index == len(word):
-                if not node.is_end_of_word:
-                    return False
-                node.is_end_of_word = False
-                self.total_words -= 1
-                return len(node.children) == 0
-
-            char = word[index]
-            if char not in node.children:
+        path = [self.root]
+        for char in word:
+            child_node = path[-1].children.get(char)
+            if child_node is None:
+                logger.debug(f"Word not found for deletion: {word}")
                 return False
+            path.append(child_node)
 
-            child_node = node.children[char]
-            should_delete_child = _delete_helper(child_node, word, index + 1)
+        node = path[-1]
+        if not node.is_end_of_word:
+            logger.debug(f"Word not found for deletion: {word}")
+            return False
 
-            if should_delete_child:
-                del node.children[char]
-                return len(node.children) == 0 and not node.is_end_of_word
+        node.is_end_of_word = False
+        node.weight = 0.0
+        self.total_words -= 1
+        for path_node in path[1:]:
+            path_node.word_count -= 1
 
-            return False
+        # Prune nodes that no longer lead to any word
+        depth = len(word)
+        while depth > 0 and path[depth].word_count == 0:
+            del path[depth - 1].children[word[depth - 1]]
+            depth -= 1
 
-        result = _delete_helper(self.root, word, 0)
-        if result:
-            logger.info(f"Deleted word: {word}, total words: {self.total_words}")
-        else:
-            logger.debug(f"Word not found for deletion: {word}")
-        return result
+        self._refresh_max_weights(path[:depth + 1])
+        logger.info(f"Deleted word: {word}, total words: {self.total_words}")
+        return True
 
     def count_words(self) -> int:
         """Get total number of words in trie.
@@ -333,17 +429,58 @@ class Trie:
         logger.debug(f"Longest common prefix: '{prefix}'")
         return prefix
 
-    def build_from_list(self, words: List[str]) -> None:
+    def build_from_list(
+        self, words: List[str], weights: Optional[List[float]] = None
+    ) -> None:
         """Build trie from list of words.
 
         Args:
             words: List of words to insert.
+            weights: Optional weights aligned with words, used by
+                autocomplete_top_k().
+
+        Raises:
+            ValueError: If weights and words differ in length.
         """
+        if weights is not None and len(weights) != len(words):
+            raise ValueError("weights must have the same length as words")
+
         logger.info(f"Building trie from {len(words)} words")
-        for word in words:
-            self.insert(word)
+        if weights is None:
+            for word in words:
+                self.insert(word)
+        else:
+            for word, weight in zip(words, weights):
+                self.insert(word, weight)
         logger.info(f"Trie built with {self.total_words} words")
 
+    def count_nodes(self) -> int:
+        """Count nodes in trie, including the root.
+
+        Returns:
+            Number of nodes.
+        """
+        count = 0
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            count += 1
+            stack.extend(node.children.values())
+        return count
+
+    def freeze(self) -> "FrozenTrie":
+        """Build a static, array-encoded snapshot of this trie.
+
+        Returns:
+            FrozenTrie with the same words and weights.
+        """
+        frozen = FrozenTrie(self.root)
+        logger.info(
+            f"Frozen trie built: {frozen.count_nodes()} nodes, "
+            f"{frozen.count_words()} words"
+        )
+        return frozen
+
     def compare_performance(
         self, words: List[str], prefix: str, iterations: int = 1
     ) -> Dict[str, any]:
@@ -452,8 +589,99 @@ class Trie:
             logger.error(f"Starts with operations failed: {e}")
             results["starts_with"] = {"success": False, "error": str(e)}
 
+        results["variants"] = self._compare_variants(words, prefix, iterations)
+
         return results
 
+    def _compare_variants(
+        self, words: List[str], prefix: str, iterations: int
+    ) -> Dict[str, Dict[str, any]]:
+        """Measure memory and latency of trie, radix and frozen variants.
+
+        Args:
+            words: List of words to insert.
+            prefix: Prefix for autocomplete testing.
+            iterations: Number of iterations for query timing.
+
+        Returns:
+            Dictionary keyed by variant name with build time, traced
+            memory, node count and query latencies.
+        """
+
+        def build_trie() -> Trie:
+            trie = Trie(config_path=self.config.get("config_path", "config.yaml"))
+            trie.build_from_list(words)
+            return trie
+
+        def build_radix() -> RadixTrie:
+            radix = RadixTrie()
+            for word in words:
+                radix.insert(word)
+            return radix
+
+        def build_frozen() -> FrozenTrie:
+            return build_trie().freeze()
+
+        builders = [
+            ("trie", build_trie),
+            ("radix", build_radix),
+            ("frozen", build_frozen),
+        ]
+        queries = words[:100]
+        variants: Dict[str, Dict[str, any]] = {}
+
+        for name, builder in builders:
+            try:
+                tracing = tracemalloc.is_tracing()
+                if not tracing:
+                    tracemalloc.start()
+                before = tracemalloc.get_traced_memory()[0]
+                start_time = time.perf_counter()
+                structure = builder()
+                build_time = time.perf_counter() - start_time
+                memory = tracemalloc.get_traced_memory()[0] - before
+                if not tracing:
+                    tracemalloc.stop()
+
+                start_time = time.perf_counter()
+                for _ in range(iterations):
+                    for word in queries:
+                        structure.search(word)
+                search_time = (time.perf_counter() - start_time) / iterations
+
+                start_time = time.perf_counter()
+                for _ in range(iterations):
+                    suggestions = structure.autocomplete(prefix)
+                autocomplete_time = (time.perf_counter() - start_time) / iterations
+
+                data = {
+                    "build_time_milliseconds": build_time * 1000,
+                    "memory_bytes": memory,
+                    "nodes": structure.count_nodes(),
+                    "search_time_microseconds": (
+                        search_time / max(len(queries), 1) * 1000000
+                    ),
+                    "autocomplete_time_milliseconds": autocomplete_time * 1000,
+                    "suggestions": len(suggestions),
+                    "success": True,
+                }
+
+                if hasattr(structure, "autocomplete_top_k"):
+                    start_time = time.perf_counter()
+                    for _ in range(iterations):
+                        structure.autocomplete_top_k(prefix, 10)
+                    top_k_time = (time.perf_counter() - start_time) / iterations
+                    data["top_k_time_milliseconds"] = top_k_time * 1000
+
+                variants[name] = data
+            except Exception as e:
+                if tracemalloc.is_tracing() and not tracing:
+                    tracemalloc.stop()
+                logger.error(f"Variant {name} failed: {e}")
+                variants[name] = {"success": False, "error": str(e)}
+
+        return variants
+
     def generate_report(
         self,
         performance_data: Dict[str, any],
@@ -545,6 +773,33 @@ class Trie:
                 f"  Error: {starts_data.get('error', 'Unknown')}"
             )
 
+        variants = performance_data.get("variants", {})
+        if variants:
+            report_lines.extend(["", "VARIANTS (memory / latency)", "-" * 80])
+            for name, data in variants.items():
+                report_lines.append(f"\n{name}:")
+                if data.get("success", False):
+                    report_lines.append(
+                        f"  Build: {data['build_time_milliseconds']:.4f} ms, "
+                        f"memory: {data['memory_bytes']} bytes, "
+                        f"nodes: {data['nodes']}"
+                    )
+                    report_lines.append(
+                        f"  Search: {data['search_time_microseconds']:.2f} μs, "
+                        f"autocomplete: "
+                        f"{data['autocomplete_time_milliseconds']:.4f} ms"
+                    )
+                    if "top_k_time_milliseconds" in data:
+                        report_lines.append(
+                            f"  Top-10 autocomplete: "
+                            f"{data['top_k_time_milliseconds']:.4f} ms"
+                        )
+                else:
+                    report_lines.append(f"  Status: Failed")
+                    report_lines.append(
+                        f"  Error: {data.get('error', 'Unknown')}"
+                    )
+
         report_lines.extend([
             "",
             "ALGORITHM COMPLEXITY",
@@ -555,6 +810,9 @@ class Trie:
             "  Starts With: O(m) where m=prefix length",
             "  Autocomplete: O(m + k) where m=prefix length, k=number of suggestions",
             "  Delete: O(m) where m=word length",
+            "  Top-k Autocomplete: O(m + k * L * log) using cached subtree max weight",
+            "  Radix Trie: one node per branching point instead of per character",
+            "  Frozen Trie: flat level-order arrays, O(m log sigma) lookups",
             "  Space Complexity: O(ALPHABET_SIZE * N * M) where N=words, M=avg length",
             "",
             "Advantages:",
@@ -580,6 +838,498 @@ class Trie:
         return report_content
 
 
+class RadixNode:
+    """Node in a radix (path-compressed) trie.
+
+    Each node stores the label of the edge leading into it, so chains of
+    single-child nodes collapse into one node.
+    """
+
+    __slots__ = ("label", "children", "is_end_of_word", "word_count")
+
+    def __init__(self, label: str = "") -> None:
+        """Initialize RadixNode.
+
+        Args:
+            label: Edge label from the parent to this node.
+        """
+        self.label = label
+        self.children: Dict[str, "RadixNode"] = {}
+        self.is_end_of_word = False
+        self.word_count = 0
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return (
+            f"RadixNode(label={self.label!r}, children={len(self.children)}, "
+            f"is_end={self.is_end_of_word})"
+        )
+
+
+class RadixTrie:
+    """Radix (path-compressed) trie supporting incremental updates.
+
+    Children are keyed by the first character of their edge label. Inserts
+    split edges where words diverge and deletes merge a non-word node back
+    into its only child, so the tree stays compressed.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty RadixTrie."""
+        self.root = RadixNode()
+        self.total_words = 0
+
+    def insert(self, word: str) -> None:
+        """Insert word into radix trie.
+
+        Args:
+            word: Word to insert.
+        """
+        if not word or self.search(word):
+            return
+
+        node = self.root
+        index = 0
+        while True:
+            if index == len(word):
+                node.is_end_of_word = True
+                break
+
+            child = node.children.get(word[index])
+            if child is None:
+                leaf = RadixNode(word[index:])
+                leaf.is_end_of_word = True
+                leaf.word_count = 1
+                node.children[word[index]] = leaf
+                break
+
+            label = child.label
+            common = 0
+            limit = min(len(label), len(word) - index)
+            while common < limit and label[common] == word[index + common]:
+                common += 1
+
+            if common < len(label):
+                # Split the edge where the word diverges from the label
+                middle = RadixNode(label[:common])
+                middle.word_count = child.word_count
+                child.label = label[common:]
+                middle.children[child.label[0]] = child
+                node.children[word[index]] = middle
+                child = middle
+
+            child.word_count += 1
+            index += common
+            node = child
+
+        self.total_words += 1
+
+    def _find(self, prefix: str) -> Tuple[Optional[RadixNode], str]:
+        """Locate the node covering a prefix.
+
+        Args:
+            prefix: Prefix to locate.
+
+        Returns:
+            Tuple of (node, text) where text is the full string spelled out
+            down to node (it extends prefix when prefix ends mid-edge), or
+            (None, "") if no word has this prefix.
+        """
+        node = self.root
+        index = 0
+        while index < len(prefix):
+            child = node.children.get(prefix[index])
+            if child is None:
+                return None, ""
+            label = child.label
+            remaining = len(prefix) - index
+            if remaining <= len(label):
+                if label.startswith(prefix[index:]):
+                    return child, prefix + label[remaining:]
+                return None, ""
+            if not prefix.startswith(label, index):
+                return None, ""
+            index += len(label)
+            node = child
+        return node, prefix
+
+    def search(self, word: str) -> bool:
+        """Search for exact word in radix trie.
+
+        Args:
+            word: Word to search for.
+
+        Returns:
+            True if word exists, False otherwise.
+        """
+        if not word:
+            return False
+        node, text = self._find(word)
+        return node is not None and len(text) == len(word) and node.is_end_of_word
+
+    def starts_with(self, prefix: str) -> bool:
+        """Check if any word in radix trie starts with given prefix.
+
+        Args:
+            prefix: Prefix to check.
+
+        Returns:
+            True if prefix exists, False otherwise.
+        """
+        if not prefix:
+            return True
+        node, _ = self._find(prefix)
+        return node is not None
+
+    def count_words_with_prefix(self, prefix: str) -> int:
+        """Count number of words with given prefix.
+
+        Args:
+            prefix: Prefix to count words for.
+
+        Returns:
+            Number of words starting with prefix.
+        """
+        if not prefix:
+            return self.total_words
+        node, _ = self._find(prefix)
+        return node.word_count if node is not None else 0
+
+    def autocomplete(self, prefix: str, limit: Optional[int] = None) -> List[str]:
+        """Get autocomplete suggestions for given prefix in sorted order.
+
+        Args:
+            prefix: Prefix to autocomplete.
+            limit: Maximum number of suggestions (None for all).
+
+        Returns:
+            List of words that start with the prefix.
+        """
+        node, text = self._find(prefix)
+        if node is None:
+            return []
+
+        words: List[str] = []
+        path: List[str] = []
+        stack: List[Tuple[RadixNode, int, str]] = [(node, 0, "")]
+        while stack:
+            if limit is not None and len(words) >= limit:
+                break
+            current, depth, label = stack.pop()
+            if depth:
+                del path[depth - 1:]
+                path.append(label)
+            if current.is_end_of_word:
+                words.append(text + "".join(path))
+            for char in sorted(current.children, reverse=True):
+                child = current.children[char]
+                stack.append((child, depth + 1, child.label))
+
+        return words
+
+    def delete(self, word: str) -> bool:
+        """Delete word from radix trie, re-compressing affected edges.
+
+        Args:
+            word: Word to delete.
+
+        Returns:
+            True if word was deleted, False if word doesn't exist.
+        """
+        if not self.search(word):
+            return False
+
+        path = [self.root]
+        index = 0
+        while index < len(word):
+            child = path[-1].children[word[index]]
+            path.append(child)
+            index += len(child.label)
+
+        node = path[-1]
+        node.is_end_of_word = False
+        for path_node in path[1:]:
+            path_node.word_count -= 1
+        self.total_words -= 1
+
+        if not node.children:
+            parent = path[-2]
+            del parent.children[node.label[0]]
+            if parent is not self.root and not parent.is_end_of_word:
+                self._merge_with_child(parent)
+        else:
+            self._merge_with_child(node)
+
+        return True
+
+    def _merge_with_child(self, node: RadixNode) -> None:
+        """Merge a non-word node into its only child.
+
+        Args:
+            node: Node to compress; nothing happens unless it has exactly
+                one child.
+        """
+        if len(node.children) != 1:
+            return
+        child = next(iter(node.children.values()))
+        node.label += child.label
+        node.children = child.children
+        node.is_end_of_word = child.is_end_of_word
+
+    def count_words(self) -> int:
+        """Get total number of words in radix trie.
+
+        Returns:
+            Total number of words.
+        """
+        return self.total_words
+
+    def count_nodes(self) -> int:
+        """Count nodes in radix trie, including the root.
+
+        Returns:
+            Number of nodes.
+        """
+        count = 0
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            count += 1
+            stack.extend(node.children.values())
+        return count
+
+    def get_all_words(self) -> List[str]:
+        """Get all words in radix trie.
+
+        Returns:
+            List of all words in sorted order.
+        """
+        return self.autocomplete("")
+
+
+class FrozenTrie:
+    """Static trie encoded as flat level-order (LOUDS-style) arrays.
+
+    Nodes are numbered in breadth-first order with siblings sorted, so the
+    children of node v occupy the contiguous range
+    [child_start[v], child_start[v + 1]) and are found by binary search on
+    their labels. Per-node data lives in typed arrays instead of Python
+    objects, and each node caches the maximum word weight in its subtree
+    for top-k autocomplete.
+    """
+
+    def __init__(self, root: TrieNode) -> None:
+        """Encode a pointer-based trie into flat arrays.
+
+        Args:
+            root: Root of the trie to encode.
+        """
+        self.labels = array("I")
+        self.child_start = array("I")
+        self.word_counts = array("I")
+        self.weights = array("d")
+        self.max_weights = array("d")
+        self.terminal = bytearray()
+
+        queue = deque([("", root)])
+        next_index = 1
+        while queue:
+            char, node = queue.popleft()
+            self.labels.append(ord(char) if char else 0)
+            self.child_start.append(next_index)
+            self.word_counts.append(node.word_count)
+            self.weights.append(node.weight)
+            self.max_weights.append(node.max_weight)
+            self.terminal.append(1 if node.is_end_of_word else 0)
+            for child_char in sorted(node.children):
+                queue.append((child_char, node.children[child_char]))
+            next_index += len(node.children)
+        self.child_start.append(next_index)
+
+        self.total_words = sum(self.terminal)
+        # The root's count is not maintained by Trie.insert
+        self.word_counts[0] = self.total_words
+
+    def _child(self, node: int, char: str) -> int:
+        """Find the child of node labelled char.
+
+        Args:
+            node: Parent node index.
+            char: Edge character.
+
+        Returns:
+            Child node index, or -1 if absent.
+        """
+        low = self.child_start[node]
+        high = self.child_start[node + 1]
+        code = ord(char)
+        index = bisect.bisect_left(self.labels, code, low, high)
+        if index < high and self.labels[index] == code:
+            return index
+        return -1
+
+    def _find(self, prefix: str) -> int:
+        """Walk to the node spelling prefix.
+
+        Args:
+            prefix: Prefix to locate.
+
+        Returns:
+            Node index, or -1 if prefix is absent.
+        """
+        node = 0
+        for char in prefix:
+            node = self._child(node, char)
+            if node < 0:
+                return -1
+        return node
+
+    def search(self, word: str) -> bool:
+        """Search for exact word.
+
+        Args:
+            word: Word to search for.
+
+        Returns:
+            True if word exists, False otherwise.
+        """
+        if not word:
+            return False
+        node = self._find(word)
+        return node >= 0 and self.terminal[node] == 1
+
+    def starts_with(self, prefix: str) -> bool:
+        """Check if any word starts with given prefix.
+
+        Args:
+            prefix: Prefix to check.
+
+        Returns:
+            True if prefix exists, False otherwise.
+        """
+        return self._find(prefix) >= 0
+
+    def count_words_with_prefix(self, prefix: str) -> int:
+        """Count number of words with given prefix.
+
+        Args:
+            prefix: Prefix to count words for.
+
+        Returns:
+            Number of words starting with prefix.
+        """
+        node = self._find(prefix)
+        return self.word_counts[node] if node >= 0 else 0
+
+    def autocomplete(self, prefix: str, limit: Optional[int] = None) -> List[str]:
+        """Get autocomplete suggestions for given prefix in sorted order.
+
+        Args:
+            prefix: Prefix to autocomplete.
+            limit: Maximum number of suggestions (None for all).
+
+        Returns:
+            List of words that start with the prefix.
+        """
+        start = self._find(prefix)
+        if start < 0:
+            return []
+
+        words: List[str] = []
+        path: List[str] = []
+        stack: List[Tuple[int, int]] = [(start, 0)]
+        while stack:
+            if limit is not None and len(words) >= limit:
+                break
+            node, depth = stack.pop()
+            if depth:
+                del path[depth - 1:]
+                path.append(chr(self.labels[node]))
+            if self.terminal[node]:
+                words.append(prefix + "".join(path))
+            for child in range(
+                self.child_start[node + 1] - 1, self.child_start[node] - 1, -1
+            ):
+                stack.append((child, depth + 1))
+
+        return words
+
+    def autocomplete_top_k(self, prefix: str, k: int) -> List[str]:
+        """Get the k highest-weight completions of a prefix.
+
+        Args:
+            prefix: Prefix to autocomplete.
+            k: Number of suggestions to return.
+
+        Returns:
+            Up to k words ordered by weight (descending), ties broken
+            lexicographically.
+        """
+        start = self._find(prefix)
+        if start < 0 or self.max_weights[start] == float("-inf"):
+            return []
+
+        # Heap entries: (-key, text, kind, node); kind 0 is a finished word
+        heap: List[Tuple[float, str, int, int]] = [
+            (-self.max_weights[start], prefix, 1, start)
+        ]
+        words: List[str] = []
+        while heap and len(words) < k:
+            _, text, kind, node = heapq.heappop(heap)
+            if kind == 0:
+                words.append(text)
+                continue
+            if self.terminal[node]:
+                heapq.heappush(heap, (-self.weights[node], text, 0, node))
+            for child in range(self.child_start[node], self.child_start[node + 1]):
+                heapq.heappush(
+                    heap,
+                    (
+                        -self.max_weights[child],
+                        text + chr(self.labels[child]),
+                        1,
+                        child,
+                    ),
+                )
+        return words
+
+    def count_words(self) -> int:
+        """Get total number of words.
+
+        Returns:
+            Total number of words.
+        """
+        return self.total_words
+
+    def count_nodes(self) -> int:
+        """Get number of nodes, including the root.
+
+        Returns:
+            Number of nodes.
+        """
+        return len(self.labels)
+
+    def memory_bytes(self) -> int:
+        """Get bytes used by the encoded arrays.
+
+        Returns:
+            Total buffer size of all arrays.
+        """
+        return (
+            sum(
+                arr.itemsize * len(arr)
+                for arr in (
+                    self.labels,
+                    self.child_start,
+                    self.word_counts,
+                    self.weights,
+                    self.max_weights,
+                )
+            )
+            + len(self.terminal)
+        )
+
+
 def main() -> None:
     """Main entry point for the script."""
     import argparse
@@ -724,6 +1474,20 @@ def main() -> None:
                         f"{data.get('error', 'Unknown')}"
                     )
 
+            for name, data in performance.get("variants", {}).items():
+                if data.get("success", False):
+                    print(
+                        f"{name + ' variant':20s}: "
+                        f"{data['memory_bytes']} bytes, "
+                        f"{data['nodes']} nodes, "
+                        f"{data['search_time_microseconds']:.2f} μs/search"
+                    )
+                else:
+                    print(
+                        f"{name + ' variant':20s}: Failed - "
+                        f"{data.get('error', 'Unknown')}"
+                    )
+
             if args.report:
                 report = trie.generate_report(
                     performance, output_path=args.report
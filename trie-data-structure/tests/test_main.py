@@ -6,7 +6,7 @@ from pathlib import Path
 import pytest
 import yaml
 
-from src.main import Trie, TrieNode
+from src.main import FrozenTrie, RadixTrie, Trie, TrieNode
 
 
 class TestTrieNode:
@@ -298,3 +298,118 @@ class TestTrie:
             trie.insert(word)
         suggestions = trie.autocomplete("app")
         assert len(suggestions) == 4
+
+    def test_insert_duplicate_keeps_prefix_counts(self, trie):
+        """Test re-inserting a word does not inflate prefix counts."""
+        trie.insert("car")
+        trie.insert("car")
+        trie.insert("cart")
+        assert trie.count_words_with_prefix("ca") == 2
+
+    def test_autocomplete_top_k(self, trie):
+        """Test top-k autocomplete orders by weight."""
+        trie.build_from_list(
+            ["car", "card", "care", "cat", "dog"], weights=[5, 1, 9, 3, 10]
+        )
+        assert trie.autocomplete_top_k("ca", 2) == ["care", "car"]
+        assert trie.autocomplete_top_k("ca", 10) == ["care", "car", "cat", "card"]
+        assert trie.autocomplete_top_k("x", 3) == []
+
+    def test_autocomplete_top_k_after_update_and_delete(self, trie):
+        """Test cached max weights follow weight changes and deletes."""
+        trie.build_from_list(["car", "cart", "cat"], weights=[1, 8, 4])
+        trie.insert("cart", 0)
+        assert trie.autocomplete_top_k("ca", 1) == ["cat"]
+        trie.delete("cat")
+        assert trie.autocomplete_top_k("ca", 1) == ["car"]
+
+    def test_build_from_list_weight_mismatch(self, trie):
+        """Test build_from_list rejects mismatched weights."""
+        with pytest.raises(ValueError):
+            trie.build_from_list(["a", "b"], weights=[1])
+
+    def test_freeze(self, trie):
+        """Test frozen trie answers the same queries."""
+        words = ["app", "apple", "apply", "banana", "band"]
+        trie.build_from_list(words, weights=[1, 2, 3, 4, 5])
+        frozen = trie.freeze()
+        assert isinstance(frozen, FrozenTrie)
+        assert frozen.count_words() == 5
+        assert frozen.count_nodes() == trie.count_nodes()
+        assert frozen.search("apple") is True
+        assert frozen.search("appl") is False
+        assert frozen.starts_with("ban") is True
+        assert frozen.count_words_with_prefix("app") == 3
+        assert frozen.autocomplete("") == trie.autocomplete("")
+        assert frozen.autocomplete("ap", 2) == ["app", "apple"]
+        assert frozen.autocomplete_top_k("", 2) == ["band", "banana"]
+        assert frozen.memory_bytes() > 0
+
+    def test_compare_performance_variants(self, trie):
+        """Test performance comparison reports all variants."""
+        words = ["apple", "apply", "app", "banana"]
+        result = trie.compare_performance(words, "app")
+        for name in ("trie", "radix", "frozen"):
+            data = result["variants"][name]
+            assert data["success"] is True
+            assert data["suggestions"] == 3
+            assert data["memory_bytes"] >= 0
+        assert result["variants"]["radix"]["nodes"] < (
+            result["variants"]["trie"]["nodes"]
+        )
+        report = trie.generate_report(result)
+        assert "VARIANTS" in report
+
+
+class TestRadixTrie:
+    """Test cases for RadixTrie class."""
+
+    @pytest.fixture
+    def radix(self):
+        """Create RadixTrie instance."""
+        radix = RadixTrie()
+        for word in ["romane", "romanus", "romulus", "rubens", "ruber", "rom"]:
+            radix.insert(word)
+        return radix
+
+    def test_insert_and_search(self, radix):
+        """Test insert splits edges and search finds words."""
+        assert radix.count_words() == 6
+        assert radix.search("romanus") is True
+        assert radix.search("rom") is True
+        assert radix.search("roma") is False
+        assert radix.search("") is False
+
+    def test_path_compression(self, radix):
+        """Test radix trie uses fewer nodes than characters."""
+        assert radix.count_nodes() < sum(
+            len(word) for word in radix.get_all_words()
+        )
+
+    def test_starts_with_mid_edge(self, radix):
+        """Test prefixes ending inside an edge label."""
+        assert radix.starts_with("roma") is True
+        assert radix.starts_with("rub") is True
+        assert radix.starts_with("rx") is False
+        assert radix.count_words_with_prefix("roma") == 2
+        assert radix.count_words_with_prefix("r") == 6
+
+    def test_autocomplete(self, radix):
+        """Test autocomplete returns sorted suggestions."""
+        assert radix.autocomplete("rub") == ["rubens", "ruber"]
+        assert radix.autocomplete("rom", 2) == ["rom", "romane"]
+        assert radix.autocomplete("z") == []
+
+    def test_delete_merges_edges(self, radix):
+        """Test delete removes words and re-compresses the tree."""
+        nodes = radix.count_nodes()
+        assert radix.delete("rubens") is True
+        assert radix.delete("rubens") is False
+        assert radix.search("ruber") is True
+        assert radix.count_nodes() < nodes
+        assert radix.count_words_with_prefix("rub") == 1
+
+    def test_duplicate_insert(self, radix):
+        """Test duplicate insert does not change counts."""
+        radix.insert("rom")
+        assert radix.count_words() == 6